@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark the single-pass report HTML sanitizer against the previous
+per-pattern regex passes on the reports in src/robeco/Example Output/.
+
+Old path: _clean_slide_html (8 re.sub passes) + _convert_markdown_to_html (5 regexes + count calls)
+New path: report_html_sanitizer (one precompiled tokenizer pattern per function)
+
+Each report is run as-is and with leaked markdown injected (every 5th
+<strong> turned into **bold**, bullets and a header per slide) so the
+conversion branches are exercised as well.
+"""
+import importlib.util
+import re
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SANITIZER_PATH = PROJECT_ROOT / "src" / "robeco" / "backend" / "report_html_sanitizer.py"
+
+# Load the module directly so the benchmark doesn't need API keys / full package init
+spec = importlib.util.spec_from_file_location("robeco_report_html_sanitizer", SANITIZER_PATH)
+sanitizer = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(sanitizer)
+
+
+def old_clean_slide_html(content):
+    """The per-pattern cleanup the sanitizer replaced"""
+    clean = content.strip()
+    clean = re.sub(r'<!DOCTYPE[^>]*>', '', clean, flags=re.IGNORECASE)
+    clean = re.sub(r'</?html[^>]*>', '', clean, flags=re.IGNORECASE)
+    clean = re.sub(r'</?head[^>]*>', '', clean, flags=re.IGNORECASE)
+    clean = re.sub(r'</?body[^>]*>', '', clean, flags=re.IGNORECASE)
+    clean = re.sub(r'<style[^>]*>.*?</style>', '', clean, flags=re.IGNORECASE | re.DOTALL)
+    clean = re.sub(r'```html\s*', '', clean, flags=re.IGNORECASE)
+    clean = re.sub(r'```\s*', '', clean, flags=re.IGNORECASE)
+    first_div = clean.find('<div')
+    if first_div > 0:
+        clean = clean[first_div:]
+    return clean.strip()
+
+
+def old_convert_markdown_to_html(content):
+    """The per-pattern markdown conversion the sanitizer replaced"""
+    content = re.sub(r'\*\*\*(.*?)\*\*\*', r'<strong><em>\1</em></strong>', content)
+    content = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', content)
+    content = re.sub(r'(?<!\*)\*([^*\n]+?)\*(?!\*)', r'<em>\1</em>', content)
+    if re.findall(r'^#{1,6}\s+(.+)$', content, re.MULTILINE):
+        content = re.sub(r'^#{1,6}\s+(.+)$', r'<h4>\1</h4>', content, flags=re.MULTILINE)
+    if re.findall(r'^\s*-\s+(.+)$', content, re.MULTILINE):
+        content = re.sub(r'^\s*-\s+(.+)$', r'<li>\1</li>', content, flags=re.MULTILINE)
+        content = re.sub(r'(<li>.*?</li>(?:\s*<li>.*?</li>)*)', r'<ul>\1</ul>', content, flags=re.DOTALL)
+    return content
+
+
+def with_leaked_markdown(html):
+    """Report with markdown the model sometimes leaks into slides"""
+    count = 0
+
+    def to_markdown(match):
+        nonlocal count
+        count += 1
+        return f"**{match.group(1)}**" if count % 5 == 0 else match.group(0)
+
+    html = re.sub(r'<strong>([^<\n]*)</strong>', to_markdown, html)
+    return html.replace(
+        '<div class="slide',
+        '\n## Key points\n- first *point*\n- second **point**\n<div class="slide'
+    )
+
+
+def time_it(func, content, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(content)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def old_path(content):
+    return old_clean_slide_html(old_convert_markdown_to_html(content))
+
+
+def new_path(content):
+    converted, _ = sanitizer.convert_markdown_to_html(content)
+    return sanitizer.clean_slide_html(converted)
+
+
+def main():
+    reports = sorted((PROJECT_ROOT / "src" / "robeco" / "Example Output").glob("*.html"))
+    reports = [report for report in reports if report.stat().st_size > 100_000]
+    if not reports:
+        print("⚠️ No example reports found")
+        return
+
+    repeat = 10
+    print(f"{'report':<42}{'chars':>9}{'old ms':>9}{'new ms':>9}{'speedup':>9}{'same':>6}")
+    totals = [0.0, 0.0]
+    for report in reports:
+        html = report.read_text(encoding="utf-8", errors="ignore")
+        for label, content in ((report.name, html), (report.name + " +md", with_leaked_markdown(html))):
+            old_ms = time_it(old_path, content, repeat)
+            new_ms = time_it(new_path, content, repeat)
+            totals[0] += old_ms
+            totals[1] += new_ms
+            # Outputs differ only where the old passes were wrong: they stripped <header> tags
+            # and wrapped every existing <li> of the report in an extra <ul>
+            same = "yes" if old_path(content) == new_path(content) else "no"
+            print(f"{label:<42}{len(content):>9,}{old_ms:>9.2f}{new_ms:>9.2f}{old_ms / new_ms:>8.1f}x{same:>6}")
+
+    print(f"\n{'total':<42}{'':>9}{totals[0]:>9.2f}{totals[1]:>9.2f}{totals[0] / totals[1]:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
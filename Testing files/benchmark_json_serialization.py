@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark the JSON serialization layer against the previous stdlib path
+on a full report payload (largest HTML in src/robeco/Example Output/).
+
+Old path: clean_nan_values() pass + json.dumps() to measure size + json.dumps() again to send
+New path: one SerializedMessage (orjson when installed, stdlib fallback otherwise)
+"""
+import importlib.util
+import json
+import math
+import time
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SERIALIZATION_PATH = PROJECT_ROOT / "src" / "robeco" / "core" / "serialization.py"
+
+# Load the module directly so the benchmark doesn't need API keys / full package init
+spec = importlib.util.spec_from_file_location("robeco_serialization", SERIALIZATION_PATH)
+serialization = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(serialization)
+
+
+def clean_nan_values(obj):
+    """The per-endpoint cleaner the serialization layer replaced"""
+    if isinstance(obj, dict):
+        return {k: clean_nan_values(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [clean_nan_values(item) for item in obj]
+    elif isinstance(obj, float):
+        if math.isnan(obj) or math.isinf(obj):
+            return None
+        return obj
+    return obj
+
+
+def build_payload():
+    """final_complete-style message with the largest example report plus stock data"""
+    reports = sorted((PROJECT_ROOT / "src" / "robeco" / "Example Output").glob("*.html"), key=lambda p: p.stat().st_size)
+    html = reports[-1].read_text(encoding="utf-8", errors="ignore") if reports else "<html></html>" * 50000
+
+    price_history = {
+        column: {f"2020-01-{i % 28 + 1:02d}#{i}": (float("nan") if i % 97 == 0 else 100.0 + i * 0.01) for i in range(1250)}
+        for column in ("Open", "High", "Low", "Close", "Volume")
+    }
+    return {
+        "type": "report_generation_streaming",
+        "data": {
+            "status": "final_complete",
+            "accumulated_html": html,
+            "report_file": reports[-1].name if reports else None,
+            "stock_data": {"price_history_5y": price_history, "pe_ratio": float("nan")},
+            "timestamp": datetime.now().isoformat()
+        }
+    }, len(html)
+
+
+def time_it(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    payload, html_size = build_payload()
+    repeat = 20
+    print(f"📦 Payload: {html_size:,} chars of HTML + 5x1,250 price points")
+
+    def old_path():
+        cleaned = clean_nan_values(payload)
+        size = len(json.dumps(cleaned))
+        return json.dumps(cleaned), size
+
+    results = {"stdlib (old path)": time_it(old_path, repeat)}
+
+    for backend in ("json", "orjson"):
+        if serialization.set_backend(backend) != backend:
+            print(f"⚠️ {backend} backend not available, skipped")
+            continue
+
+        def new_path():
+            message = serialization.SerializedMessage(payload)
+            return message.text, message.size
+
+        results[f"{backend} (serialize once)"] = time_it(new_path, repeat)
+
+    baseline = results["stdlib (old path)"]
+    print(f"\n{'path':<28}{'ms/message':>12}{'speedup':>10}")
+    for name, ms in results.items():
+        print(f"{name:<28}{ms:>12.2f}{baseline / ms:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Benchmark the streaming HTML-to-Word converter against the previous
+BeautifulSoup path on the reports in src/robeco/Example Output/.
+
+Old path: BeautifulSoup tree + find/find_all per slide (_convert_with_soup)
+New path: one lxml event pass with a class dispatch table (word_stream_converter)
+
+Every measurement is one conversion in a fresh process, so both paths pay
+the same one-off chart rasterization. Memory is the process's peak RSS,
+since the soup, lxml and python-docx trees all live partly in C.
+Image downloads are switched off so network latency doesn't drown out the
+converters. The slides of the largest report are also repeated 1x-8x to
+show how both paths scale.
+
+Text parity: every non-empty paragraph (table cells included) the old path
+writes must also appear in the streamed document ("lost"), and so must
+every text run of the report's slides outside scripts, footers and charts
+("unwritten"), since the old path drops some prose itself. The first few
+misses of each kind are listed below the table.
+"""
+import asyncio
+import copy
+import importlib.util
+import json
+import logging
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import types
+from pathlib import Path
+
+import lxml.html
+from docx import Document
+from docx.oxml.ns import qn
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+BACKEND_DIR = PROJECT_ROOT / "src" / "robeco" / "backend"
+
+# Slide content that is not written as text (page numbers are left to Word, charts become images)
+UNWRITTEN_TAGS = {"head", "script", "style", "noscript", "template", "footer", "canvas", "svg"}
+
+
+def load_generator():
+    """Word generator module, loaded under bare packages so no API keys / full package init are needed"""
+    for package, path in (("robeco", BACKEND_DIR.parent), ("robeco.backend", BACKEND_DIR)):
+        module = types.ModuleType(package)
+        module.__path__ = [str(path)]
+        sys.modules.setdefault(package, module)
+
+    spec = importlib.util.spec_from_file_location("robeco.backend.word_report_generator",
+                                                  BACKEND_DIR / "word_report_generator.py")
+    word = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = word
+    spec.loader.exec_module(word)
+
+    def offline(*args, **kwargs):
+        raise word.requests.ConnectionError("image downloads disabled for the benchmark")
+
+    word.requests.get = offline
+    logging.disable(logging.CRITICAL)
+    return word
+
+
+def run_single(report, mode, copies):
+    """Child process: convert one report and print elapsed ms, peak RSS and the written text as JSON"""
+    word = load_generator()
+    html = repeated(Path(report).read_text(encoding="utf-8", errors="ignore"), copies)
+    generator = word.RobecoWordReportGenerator()
+    generator.streaming_conversion = mode == "stream"
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        output_path = str(Path(output_dir) / "report.docx")
+        start = time.perf_counter()
+        asyncio.run(generator.convert_html_to_word(html, "Benchmark", "BENCH", output_path))
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        paragraphs = paragraph_texts(output_path)
+
+    print(json.dumps({"ms": elapsed_ms, "mb": peak_mb, "chars": len(html), "paragraphs": paragraphs,
+                      "unwritten": unwritten_texts(html, paragraphs)}))
+
+
+def paragraph_texts(docx_path):
+    """Whitespace-normalised text of every non-empty paragraph in the document, table cells included"""
+    body = Document(docx_path).element.body
+    texts = []
+    for paragraph in body.iter(qn("w:p")):
+        text = " ".join("".join(node.text or "" for node in paragraph.iter(qn("w:t"))).split())
+        if text:
+            texts.append(text)
+    return texts
+
+
+def unwritten_texts(html, paragraphs):
+    """Text runs (element text and tails) of the report's slides that are missing from the document"""
+    document = "".join("".join(text.split()) for text in paragraphs)
+    root = lxml.html.fromstring(html)
+    runs = []
+
+    def collect(element):
+        if not isinstance(element.tag, str) or element.tag in UNWRITTEN_TAGS:
+            return
+        runs.append(element.text)
+        for child in element:
+            collect(child)
+            runs.append(child.tail)
+
+    for slide in root.xpath('//div[contains(concat(" ", normalize-space(@class), " "), " slide ")]'):
+        collect(slide)
+    return [" ".join(text.split()) for text in runs if text and text.strip() and "".join(text.split()) not in document]
+
+
+def lost_paragraphs(old, new):
+    """Paragraphs of the old path's document whose text is missing from the streamed one (spacing ignored)"""
+    streamed = "".join("".join(text.split()) for text in new["paragraphs"])
+    return [text for text in old["paragraphs"] if "".join(text.split()) not in streamed]
+
+
+def measure(report, mode, copies=1):
+    output = subprocess.run([sys.executable, __file__, "--single", str(report), mode, str(copies)],
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def repeated(html, copies):
+    """The report with its slides repeated ``copies`` times (ids made unique, the old path drops duplicates)"""
+    if copies == 1:
+        return html
+    root = lxml.html.fromstring(html)
+    containers = root.xpath('//div[contains(concat(" ", normalize-space(@class), " "), " presentation-container ")]')
+    container = containers[0] if containers else root.find('body')
+    slides = list(container)
+    for copy_number in range(2, copies + 1):
+        for slide in slides:
+            duplicate = copy.deepcopy(slide)
+            for element in duplicate.iter():
+                if element.get('id'):
+                    element.set('id', f"{element.get('id')}-{copy_number}")
+            container.append(duplicate)
+    return lxml.html.tostring(root, encoding='unicode', doctype='<!DOCTYPE html>')
+
+
+def main():
+    example_dir = PROJECT_ROOT / "src" / "robeco" / "Example Output"
+    reports = sorted(p for p in example_dir.iterdir() if p.suffix.lower() == ".html" and p.stat().st_size > 100_000)
+    if not reports:
+        print("⚠️ No example reports found")
+        return
+
+    print(f"{'report':<42}{'chars':>9}{'old ms':>9}{'new ms':>9}{'speedup':>9}{'old MB':>9}{'new MB':>9}{'lost':>6}{'unwritten':>11}")
+    totals = [0.0, 0.0]
+    misses = {}
+    for report in reports:
+        old, new = measure(report, "soup"), measure(report, "stream")
+        totals[0] += old["ms"]
+        totals[1] += new["ms"]
+        lost = lost_paragraphs(old, new)
+        misses[report.name] = (lost, new["unwritten"])
+        print(f"{report.name:<42}{old['chars']:>9,}{old['ms']:>9.0f}{new['ms']:>9.0f}{old['ms'] / new['ms']:>8.1f}x"
+              f"{old['mb']:>9.0f}{new['mb']:>9.0f}{len(lost):>6}{len(new['unwritten']):>11}")
+    print(f"\n{'total':<42}{'':>9}{totals[0]:>9.0f}{totals[1]:>9.0f}{totals[0] / totals[1]:>8.1f}x")
+
+    for name, (lost, unwritten) in misses.items():
+        for label, texts in (("old-path paragraphs", lost), ("slide text runs", unwritten)):
+            if texts:
+                print(f"\n⚠️ {name}: {len(texts)} {label} missing from the streamed document")
+                for text in texts[:3]:
+                    print(f"   - {text[:100]}")
+
+    largest = max(reports, key=lambda p: p.stat().st_size)
+    print(f"\nScaling ({largest.name} repeated)")
+    print(f"{'copies':<8}{'chars':>11}{'old ms':>9}{'new ms':>9}{'old MB':>9}{'new MB':>9}")
+    for copies in (1, 2, 4, 8):
+        old, new = measure(largest, "soup", copies), measure(largest, "stream", copies)
+        print(f"{copies:<8}{old['chars']:>11,}{old['ms']:>9.0f}{new['ms']:>9.0f}{old['mb']:>9.0f}{new['mb']:>9.0f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 5 and sys.argv[1] == "--single":
+        run_single(sys.argv[2], sys.argv[3], int(sys.argv[4]))
+    else:
+        main()
@@ -213,9 +213,9 @@ class ProfessionalInvestmentAnalyst(BaseAgent):
             if not financial_data:
                 # Try to get basic info for industry detection
                 try:
-                    import yfinance as yf
-                    ticker_obj = yf.Ticker(context.ticker)
-                    financial_data = {"info": ticker_obj.info}
+                    from ..data.market_data_service import market_data_service
+                    snapshot = market_data_service.get_snapshot(context.ticker)
+                    financial_data = {"info": await snapshot.fetch("info")}
                 except Exception:
                     financial_data = {}
             
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Document Conversion Queue
+Background Word / PDF export jobs with progress notifications
+
+Converting a report used to run inside the request handler: Word building
+is CPU-bound python-docx work and the PDF path waited on Puppeteer, so
+every export stalled the event loop and with it all live analysis streams.
+Conversions are now submitted as jobs and the caller gets a job id
+straight away. Word documents are built in worker processes
+(word_worker.py). PDFs render on
+the shared browser pool (pdf_render_pool). Each job reports its progress
+through an optional callback (the server forwards it over the session's
+WebSocket) and can be polled and downloaded by id once it completes.
+
+Environment:
+    ROBECO_CONVERT_WORD_WORKERS   processes building Word documents (default 2)
+    ROBECO_CONVERT_MAX_JOBS       conversions running at once (default 4)
+    ROBECO_CONVERT_JOB_TTL        seconds a finished job stays listed (default 3600)
+    ROBECO_CONVERT_WORD_TIMEOUT   seconds before a Word worker job is killed (default 300)
+"""
+
+import asyncio
+import logging
+import os
+import tempfile
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+try:
+    from .enhanced_pdf_service import EnhancedPdfService
+    from .word_report_generator import convert_html_to_word_file
+    from .word_worker import WordWorkerError, WordWorkerPool
+except ImportError:
+    from robeco.backend.enhanced_pdf_service import EnhancedPdfService
+    from robeco.backend.word_report_generator import convert_html_to_word_file
+    from robeco.backend.word_worker import WordWorkerError, WordWorkerPool
+
+logger = logging.getLogger(__name__)
+
+CONVERSION_FORMATS = ("word", "pdf")
+
+MEDIA_TYPES = {
+    "word": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "pdf": "application/pdf",
+}
+
+
+@dataclass
+class ConversionJob:
+    """State of one export; ``to_dict`` is what clients see"""
+    job_id: str
+    format: str
+    ticker: str
+    company_name: str
+    status: str = "queued"  # queued | running | completed | failed
+    progress: int = 0
+    message: str = ""
+    file_path: Optional[str] = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("completed", "failed")
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["elapsed_seconds"] = round((self.finished_at or time.time()) - (self.started_at or self.created_at), 2)
+        data["queued_seconds"] = round((self.started_at or time.time()) - self.created_at, 2)
+        data["download_url"] = f"/api/professional/convert/jobs/{self.job_id}/download" if self.status == "completed" else None
+        data["timestamp"] = datetime.now().isoformat()
+        return data
+
+
+ProgressCallback = Callable[[ConversionJob], Awaitable[None]]
+
+
+class DocumentConversionQueue:
+    """
+    Job queue for report exports
+
+    Usage:
+        job = document_conversion_queue.submit("pdf", html, "Arista Networks", "ANET", on_progress=notify)
+        job = await document_conversion_queue.wait(job.job_id)
+    """
+
+    def __init__(self, word_workers: int = 2, max_concurrent_jobs: int = 4, job_ttl: float = 3600.0,
+                 max_jobs: int = 200, word_timeout: float = 300.0):
+        self.word_workers = word_workers
+        self.max_concurrent_jobs = max_concurrent_jobs
+        self.job_ttl = job_ttl
+        self.max_jobs = max_jobs
+        self.jobs: Dict[str, ConversionJob] = {}
+        self._events: Dict[str, asyncio.Event] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._word_workers = WordWorkerPool(word_workers, job_timeout=word_timeout)
+        # Thread fallback shares the module's Word generator, so it converts one document at a time
+        self._thread_lock = threading.Lock()
+        self.stats = {"submitted": 0, "completed": 0, "failed": 0, "process_fallbacks": 0}
+
+    def _job_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent_jobs)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    def submit(self, format: str, html_content: str, company_name: str, ticker: str,
+               on_progress: Optional[ProgressCallback] = None) -> ConversionJob:
+        """Queue a conversion and return its job immediately (must be called on the event loop)"""
+        format = format.lower()
+        if format not in CONVERSION_FORMATS:
+            raise ValueError(f"Invalid format '{format}'. Use 'word' or 'pdf'")
+        if not html_content:
+            raise ValueError("No HTML content provided for conversion")
+
+        self._prune()
+        job = ConversionJob(
+            job_id=uuid.uuid4().hex[:12], format=format, ticker=ticker, company_name=company_name,
+            message=f"📋 {format.upper()} conversion queued for {ticker}"
+        )
+        self.jobs[job.job_id] = job
+        self._events[job.job_id] = asyncio.Event()
+        self._tasks[job.job_id] = asyncio.create_task(self._run(job, html_content, on_progress))
+        self.stats["submitted"] += 1
+        logger.info(f"📥 Conversion job {job.job_id} queued: {format.upper()} for {ticker}")
+        return job
+
+    def get(self, job_id: str) -> Optional[ConversionJob]:
+        return self.jobs.get(job_id)
+
+    def list_jobs(self) -> List[ConversionJob]:
+        return sorted(self.jobs.values(), key=lambda job: job.created_at, reverse=True)
+
+    async def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[ConversionJob]:
+        """Wait until a job has completed or failed"""
+        event = self._events.get(job_id)
+        if event is not None:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        return self.jobs.get(job_id)
+
+    async def _update(self, job: ConversionJob, on_progress: Optional[ProgressCallback], **changes):
+        for name, value in changes.items():
+            setattr(job, name, value)
+        if on_progress is not None:
+            try:
+                await on_progress(job)
+            except Exception as e:
+                # A closed browser tab must never fail the conversion itself
+                logger.warning(f"⚠️ Conversion progress notification failed for job {job.job_id}: {e}")
+
+    async def _run(self, job: ConversionJob, html_content: str, on_progress: Optional[ProgressCallback]):
+        await self._update(job, on_progress)
+        try:
+            async with self._job_semaphore():
+                await self._update(job, on_progress, status="running", progress=10, started_at=time.time(),
+                                   message=f"🔄 Converting report for {job.company_name} to {job.format.upper()}...")
+                if job.format == "word":
+                    file_path = await self._convert_word(job, html_content, on_progress)
+                else:
+                    file_path = await self._convert_pdf(job, html_content, on_progress)
+
+            self.stats["completed"] += 1
+            await self._update(job, on_progress, status="completed", progress=100, file_path=file_path,
+                               finished_at=time.time(),
+                               message=f"✅ {job.format.upper()} document generated successfully for {job.company_name}")
+            logger.info(f"✅ Conversion job {job.job_id} completed in {job.finished_at - job.started_at:.2f}s: {file_path}")
+        except Exception as e:
+            self.stats["failed"] += 1
+            logger.error(f"❌ Conversion job {job.job_id} failed: {e}")
+            await self._update(job, on_progress, status="failed", error=str(e), finished_at=time.time(),
+                               message=f"❌ {job.format.upper()} conversion failed: {str(e)[:100]}")
+        finally:
+            self._tasks.pop(job.job_id, None)
+            event = self._events.get(job.job_id)
+            if event is not None:
+                event.set()
+
+    async def _convert_word(self, job: ConversionJob, html_content: str, on_progress: Optional[ProgressCallback]) -> str:
+        await self._update(job, on_progress, progress=20, message="🔍 Parsing HTML and building the Word document...")
+        try:
+            return await asyncio.to_thread(
+                self._word_workers.convert, html_content, job.company_name, job.ticker
+            )
+        except WordWorkerError as e:
+            # No usable worker processes (e.g. a restricted container): convert on a thread instead
+            logger.warning(f"⚠️ Word worker unavailable ({e}), converting job {job.job_id} on a thread")
+            self.stats["process_fallbacks"] += 1
+            return await asyncio.to_thread(self._convert_word_locked, html_content, job.company_name, job.ticker)
+
+    def _convert_word_locked(self, html_content: str, company_name: str, ticker: str) -> str:
+        with self._thread_lock:
+            return convert_html_to_word_file(html_content, company_name, ticker)
+
+    async def _convert_pdf(self, job: ConversionJob, html_content: str, on_progress: Optional[ProgressCallback]) -> str:
+        await self._update(job, on_progress, progress=20, message="🖨️ Rendering PDF...")
+        pdf_data = await EnhancedPdfService.generate_pdf_from_html_async(
+            html_content=html_content, project_id=job.ticker, settings=None
+        )
+        await self._update(job, on_progress, progress=90, message="💾 Saving PDF...")
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        safe_ticker = job.ticker.replace('.', '_').replace(':', '_')
+        output_path = os.path.join(tempfile.gettempdir(), f"{safe_ticker}_Investment_Report_{timestamp}_{job.job_id}.pdf")
+        await asyncio.to_thread(self._write_file, output_path, pdf_data)
+        return output_path
+
+    @staticmethod
+    def _write_file(path: str, data: bytes):
+        with open(path, 'wb') as output:
+            output.write(data)
+
+    def _prune(self):
+        """Forget finished jobs past their TTL, and the oldest finished ones beyond ``max_jobs``"""
+        now = time.time()
+        finished = [job for job in self.list_jobs() if job.done]
+        expired = [job for job in finished if now - (job.finished_at or job.created_at) > self.job_ttl]
+        overflow = max(0, len(self.jobs) - len(expired) - self.max_jobs)
+        remaining = [job for job in finished if job not in expired]
+        expired.extend(remaining[max(0, len(remaining) - overflow):] if overflow else [])
+        for job in expired:
+            self.jobs.pop(job.job_id, None)
+            self._events.pop(job.job_id, None)
+
+    def shutdown(self):
+        for task in list(self._tasks.values()):
+            task.cancel()
+        self._word_workers.shutdown()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        statuses: Dict[str, int] = {}
+        for job in self.jobs.values():
+            statuses[job.status] = statuses.get(job.status, 0) + 1
+        return {
+            **self.stats,
+            "jobs": statuses,
+            "word_workers": self._word_workers.get_stats(),
+            "max_concurrent_jobs": self.max_concurrent_jobs,
+        }
+
+
+def create_document_conversion_queue_from_env() -> DocumentConversionQueue:
+    return DocumentConversionQueue(
+        word_workers=max(1, int(os.getenv("ROBECO_CONVERT_WORD_WORKERS", "2"))),
+        max_concurrent_jobs=max(1, int(os.getenv("ROBECO_CONVERT_MAX_JOBS", "4"))),
+        job_ttl=float(os.getenv("ROBECO_CONVERT_JOB_TTL", "3600")),
+        word_timeout=float(os.getenv("ROBECO_CONVERT_WORD_TIMEOUT", "300"))
+    )
+
+
+# Shared by the convert endpoints and the WebSocket Word export
+document_conversion_queue = create_document_conversion_queue_from_env()
@@ -1,4 +1,5 @@
 import os
+import asyncio
 import tempfile
 import subprocess
 import base64
@@ -7,6 +8,11 @@ import logging
 import time
 from datetime import datetime
 
+try:
+    from .pdf_render_pool import PdfRenderError, pdf_render_pool
+except ImportError:
+    from robeco.backend.pdf_render_pool import PdfRenderError, pdf_render_pool
+
 logger = logging.getLogger(__name__)
 
 class EnhancedPdfService:
@@ -98,18 +104,72 @@ class EnhancedPdfService:
             return pdf_data
             
         finally:
-            # Clean up temporary files
-            logger.info("🗑️ Cleaning up temporary files...")
+            EnhancedPdfService._cleanup_temp_files(temp_html_path, temp_pdf_path)
+    
+    @staticmethod
+    async def generate_pdf_from_html_async(html_content, project_id=None, settings=None):
+        """
+        Generate PDF from HTML on the shared warm browser pool and return PDF binary data
+        Falls back to a one-off Puppeteer process (off the event loop) when the pool is unavailable
+        """
+        start_time = time.time()
+        logger.info("🚀 Starting PDF generation from HTML (browser pool)")
+        logger.info(f"📋 Project ID: {project_id}")
+        logger.info(f"📝 HTML content length: {len(html_content) if html_content else 0} characters")
+        
+        a4_settings = EnhancedPdfService.A4_LANDSCAPE_SETTINGS
+        content_settings = EnhancedPdfService.CONTENT_16_9_SETTINGS
+        
+        temp_html_path = EnhancedPdfService._create_a4_optimized_html(
+            html_content, content_settings, a4_settings
+        )
+        temp_pdf_path = tempfile.mktemp(suffix='.pdf')
+        
+        try:
+            try:
+                await pdf_render_pool.render(
+                    temp_html_path, temp_pdf_path,
+                    EnhancedPdfService._a4_pdf_options(a4_settings)
+                )
+                method_used = "A4 Puppeteer (browser pool)"
+            except PdfRenderError as e:
+                logger.warning(f"⚠️ Browser pool render failed ({e}), launching a one-off Puppeteer process")
+                pdf_generated, method_used = await asyncio.to_thread(
+                    EnhancedPdfService._generate_with_a4_puppeteer, temp_html_path, temp_pdf_path, a4_settings
+                )
+                if not pdf_generated:
+                    raise Exception("Puppeteer PDF generation failed")
+            
+            with open(temp_pdf_path, 'rb') as pdf_file:
+                pdf_data = pdf_file.read()
+            
+            logger.info(f"✅ PDF generation complete: {len(pdf_data)} bytes in {time.time() - start_time:.2f} seconds ({method_used})")
+            return pdf_data
+            
+        finally:
+            EnhancedPdfService._cleanup_temp_files(temp_html_path, temp_pdf_path)
+    
+    @staticmethod
+    def _a4_pdf_options(a4_settings):
+        """Puppeteer page.pdf options for the custom format"""
+        return {
+            'width': f"{a4_settings['width_px']}px",
+            'height': f"{a4_settings['height_px']}px",
+            'margin': {'top': '0', 'right': '0', 'bottom': '0', 'left': '0'},
+            'printBackground': True
+        }
+    
+    @staticmethod
+    def _cleanup_temp_files(*paths):
+        """Remove temporary HTML / PDF files"""
+        logger.info("🗑️ Cleaning up temporary files...")
+        for path in paths:
             try:
-                if os.path.exists(temp_html_path):
-                    os.unlink(temp_html_path)
-                    logger.info(f"🗑️ Removed temp HTML: {temp_html_path}")
-                if os.path.exists(temp_pdf_path):
-                    os.unlink(temp_pdf_path)
-                    logger.info(f"🗑️ Removed temp PDF: {temp_pdf_path}")
+                if os.path.exists(path):
+                    os.unlink(path)
+                    logger.info(f"🗑️ Removed temp file: {path}")
             except Exception as cleanup_error:
                 logger.warning(f"⚠️ Cleanup error: {cleanup_error}")
-                pass
     
     @staticmethod
     def _create_a4_optimized_html(html_content, content_settings, a4_settings):
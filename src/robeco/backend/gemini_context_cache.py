@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Gemini Context Cache
+Serve the shared report prompt prefix from Gemini cached contents
+
+Every report call starts with the same system instruction and the
+company-independent base Robeco prompt (role, methodology, writing and
+formatting rules; see report.base.shared). Instead of sending that material
+as fresh input tokens on every call, it is stored once per API key and model
+as a Gemini cached content and referenced by name, so all reports share one
+entry and only the company-specific remainder of the prompt is sent.
+Entries are refreshed before their TTL runs out and recreated when they
+expire. Creating and refreshing entries are network calls and run on a
+worker thread, never on the event loop. They are serialised per entry only:
+the shared lock guards lookups, so calls for other prefixes or API keys
+never wait on someone else's round-trip. When creating an entry fails, the
+prefix is sent in full without retrying the create until a backoff window
+has passed.
+
+LocalContextCache is an in-process stand-in with the same interface: it
+keeps the bookkeeping (hits, refreshes, characters served from cache) but
+always sends the full prompt, for tests and offline runs.
+
+Environment:
+    ROBECO_GEMINI_CONTEXT_CACHE   gemini | local | off (default gemini)
+    ROBECO_GEMINI_CACHE_TTL       cached content TTL in seconds (default 3600)
+    ROBECO_GEMINI_CACHE_BACKOFF   seconds before retrying a failed create (default 300)
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from google.genai import types
+
+logger = logging.getLogger(__name__)
+
+# Smaller prefixes are not worth a cache entry (Gemini also enforces a minimum token count)
+MIN_CACHED_PREFIX_CHARS = 8000
+MAX_CACHE_ENTRIES = 64
+
+CacheKey = Tuple[str, str, str]
+
+
+@dataclass
+class CachedContext:
+    """A prefix stored as a cached content for one API key and model"""
+    name: str
+    expires_at: float
+    prefix_chars: int
+    hits: int = 0
+
+
+def _user_content(text: str) -> types.Content:
+    return types.Content(role="user", parts=[types.Part.from_text(text=text)])
+
+
+class GeminiContextCache:
+    """Creates, refreshes and references Gemini cached contents for prompt prefixes"""
+
+    def __init__(self, ttl_seconds: int = 3600, refresh_margin_seconds: int = 300,
+                 min_prefix_chars: int = MIN_CACHED_PREFIX_CHARS, failure_backoff_seconds: float = 300.0):
+        self.ttl_seconds = ttl_seconds
+        self.refresh_margin_seconds = min(refresh_margin_seconds, ttl_seconds // 2)
+        self.min_prefix_chars = min_prefix_chars
+        self.failure_backoff_seconds = failure_backoff_seconds
+        self._entries: Dict[CacheKey, CachedContext] = {}
+        # Held only for bookkeeping; remote calls run under the key's own lock
+        self._lock = threading.Lock()
+        self._key_locks: Dict[CacheKey, threading.Lock] = {}
+        # key -> time before which a failed create is not retried
+        self._failed_until: Dict[CacheKey, float] = {}
+        self.stats = {"created": 0, "refreshed": 0, "hits": 0, "fallbacks": 0, "create_failures": 0,
+                      "skipped_after_failure": 0, "cached_chars_served": 0}
+
+    @staticmethod
+    def _key(api_key: str, model: str, system_instruction: str, prefix: str) -> CacheKey:
+        # Cached contents belong to the API key's project, so keys rotate separately
+        account = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12]
+        digest = hashlib.sha256(f"{system_instruction}\x00{prefix}".encode("utf-8")).hexdigest()
+        return account, model, digest
+
+    async def prepare_request(
+        self,
+        client,
+        api_key: str,
+        model: str,
+        prompt: str,
+        system_instruction: str,
+        tools: Optional[List[Any]] = None,
+        cached_prefix: Optional[str] = None,
+        **config_kwargs
+    ) -> Tuple[List[types.Content], types.GenerateContentConfig]:
+        """
+        Contents and config for a generate_content call
+
+        When ``prompt`` starts with ``cached_prefix``, the prefix, system
+        instruction and tools come from a cached context and only the rest of
+        the prompt is sent. Any caching error falls back to the full request.
+        """
+        if cached_prefix and len(cached_prefix) >= self.min_prefix_chars and prompt.startswith(cached_prefix):
+            key = self._key(api_key, model, system_instruction, cached_prefix)
+            if self._failed_recently(key):
+                self.stats["fallbacks"] += 1
+                self.stats["skipped_after_failure"] += 1
+            else:
+                try:
+                    entry = await asyncio.to_thread(
+                        self._get_or_create, client, key, model, system_instruction, cached_prefix, tools
+                    )
+                    self.stats["cached_chars_served"] += entry.prefix_chars
+                    return self._cached_request(entry, prompt, cached_prefix, system_instruction, tools, config_kwargs)
+                except Exception as e:
+                    self.stats["fallbacks"] += 1
+                    logger.warning(f"⚠️ Context cache unavailable, sending full prompt: {e}")
+
+        config = types.GenerateContentConfig(system_instruction=system_instruction, tools=tools, **config_kwargs)
+        return [_user_content(prompt)], config
+
+    def _cached_request(self, entry: CachedContext, prompt: str, prefix: str, system_instruction: str,
+                        tools, config_kwargs) -> Tuple[List[types.Content], types.GenerateContentConfig]:
+        # System instruction and tools live in the cached content and must not be repeated
+        config = types.GenerateContentConfig(cached_content=entry.name, **config_kwargs)
+        return [_user_content(prompt[len(prefix):])], config
+
+    def _failed_recently(self, key: CacheKey) -> bool:
+        with self._lock:
+            return time.time() < self._failed_until.get(key, 0.0)
+
+    def _fresh_entry(self, key: CacheKey) -> Optional[CachedContext]:
+        """The entry when it needs no refresh, counted as a hit (call with ``_lock`` held)"""
+        entry = self._entries.get(key)
+        if entry and time.time() < entry.expires_at - self.refresh_margin_seconds:
+            entry.hits += 1
+            self.stats["hits"] += 1
+            return entry
+        return None
+
+    def _get_or_create(self, client, key: CacheKey, model: str, system_instruction: str,
+                       prefix: str, tools) -> CachedContext:
+        with self._lock:
+            entry = self._fresh_entry(key)
+            if entry:
+                return entry
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # One remote call per entry; concurrent callers for it wait and reuse the result
+        with key_lock:
+            with self._lock:
+                # Another caller may have created or refreshed it while this one waited
+                entry = self._fresh_entry(key)
+                if entry:
+                    return entry
+                if time.time() < self._failed_until.get(key, 0.0):
+                    raise RuntimeError("cached context creation failed recently")
+                entry = self._entries.get(key)
+
+            if entry and time.time() < entry.expires_at:
+                try:
+                    self._refresh(client, entry)
+                    with self._lock:
+                        entry.hits += 1
+                        self.stats["hits"] += 1
+                    return entry
+                except Exception as e:
+                    logger.info(f"♻️ Cached context refresh failed, recreating: {e}")
+
+            try:
+                entry = self._create(client, model, system_instruction, prefix, tools, key[2])
+            except Exception:
+                with self._lock:
+                    self._failed_until[key] = time.time() + self.failure_backoff_seconds
+                    self.stats["create_failures"] += 1
+                logger.warning(f"⚠️ Cached context creation failed; sending full prompts for "
+                               f"{self.failure_backoff_seconds:.0f}s")
+                raise
+
+            with self._lock:
+                self._entries[key] = entry
+                self._failed_until.pop(key, None)
+                if len(self._entries) > MAX_CACHE_ENTRIES:
+                    oldest = min(self._entries, key=lambda k: self._entries[k].expires_at)
+                    self._entries.pop(oldest)
+                    self._key_locks.pop(oldest, None)
+            return entry
+
+    def _create(self, client, model: str, system_instruction: str, prefix: str, tools, digest: str) -> CachedContext:
+        cached = client.caches.create(
+            model=model,
+            config=types.CreateCachedContentConfig(
+                display_name=f"robeco-report-{digest[:16]}",
+                system_instruction=system_instruction,
+                contents=[_user_content(prefix)],
+                tools=tools,
+                ttl=f"{self.ttl_seconds}s"
+            )
+        )
+        self.stats["created"] += 1
+        logger.info(f"🗄️ Cached report prefix ({len(prefix):,} chars) as {cached.name} for {self.ttl_seconds}s")
+        return CachedContext(name=cached.name, expires_at=time.time() + self.ttl_seconds, prefix_chars=len(prefix))
+
+    def _refresh(self, client, entry: CachedContext):
+        client.caches.update(
+            name=entry.name,
+            config=types.UpdateCachedContentConfig(ttl=f"{self.ttl_seconds}s")
+        )
+        entry.expires_at = time.time() + self.ttl_seconds
+        self.stats["refreshed"] += 1
+        logger.info(f"♻️ Refreshed cached context {entry.name}")
+
+    def discard(self, name: Optional[str]):
+        """Forget an entry the API rejected (deleted or expired server-side)"""
+        if not name:
+            return
+        with self._lock:
+            for key in [k for k, entry in self._entries.items() if entry.name == name]:
+                self._entries.pop(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._failed_until.clear()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "entries": len(self._entries), "ttl_seconds": self.ttl_seconds}
+
+
+class LocalContextCache(GeminiContextCache):
+    """
+    In-process stand-in for GeminiContextCache
+
+    Tracks entries and TTL refreshes exactly like the Gemini-backed cache but
+    makes no API calls and always sends the full prompt.
+    """
+
+    def _create(self, client, model: str, system_instruction: str, prefix: str, tools, digest: str) -> CachedContext:
+        self.stats["created"] += 1
+        return CachedContext(name=f"local/{digest[:16]}", expires_at=time.time() + self.ttl_seconds, prefix_chars=len(prefix))
+
+    def _refresh(self, client, entry: CachedContext):
+        entry.expires_at = time.time() + self.ttl_seconds
+        self.stats["refreshed"] += 1
+
+    def _cached_request(self, entry: CachedContext, prompt: str, prefix: str, system_instruction: str,
+                        tools, config_kwargs) -> Tuple[List[types.Content], types.GenerateContentConfig]:
+        config = types.GenerateContentConfig(system_instruction=system_instruction, tools=tools, **config_kwargs)
+        return [_user_content(prompt)], config
+
+
+class DisabledContextCache(GeminiContextCache):
+    """Always sends the full prompt (ROBECO_GEMINI_CONTEXT_CACHE=off)"""
+
+    async def prepare_request(self, client, api_key, model, prompt, system_instruction, tools=None,
+                              cached_prefix=None, **config_kwargs):
+        return await super().prepare_request(client, api_key, model, prompt, system_instruction, tools, None,
+                                             **config_kwargs)
+
+
+def create_context_cache_from_env() -> GeminiContextCache:
+    mode = os.getenv("ROBECO_GEMINI_CONTEXT_CACHE", "gemini").lower()
+    ttl = int(os.getenv("ROBECO_GEMINI_CACHE_TTL", "3600"))
+    backoff = float(os.getenv("ROBECO_GEMINI_CACHE_BACKOFF", "300"))
+    if mode == "local":
+        return LocalContextCache(ttl_seconds=ttl, failure_backoff_seconds=backoff)
+    if mode == "off":
+        return DisabledContextCache(ttl_seconds=ttl)
+    if mode != "gemini":
+        logger.warning(f"⚠️ Unknown ROBECO_GEMINI_CONTEXT_CACHE '{mode}', using Gemini context caching")
+    return GeminiContextCache(ttl_seconds=ttl, failure_backoff_seconds=backoff)
+
+
+# Shared by all report generations in the process
+report_context_cache = create_context_cache_from_env()
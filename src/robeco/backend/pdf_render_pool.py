@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+PDF Render Pool
+Long-lived Node.js worker holding a warm headless browser for PDF export
+
+Spawning ``node`` and launching Puppeteer for every PDF costs seconds of
+browser cold start before any rendering happens. The pool starts
+pdf_render_worker.js once. The worker keeps one browser and a fixed number
+of pages open and renders queued jobs on them, so a PDF only costs its
+render time and throughput scales with the number of pages. Jobs and
+results travel as JSON lines over the worker's stdin/stdout pipes. The
+worker is restarted on the next job if it dies.
+
+A page is printed once it is ready rather than after a fixed delay: the
+worker waits for network idle and web fonts, then (bounded by the ready
+timeout) for every scripted chart container to hold its drawn chart and
+for the DOM to stop changing. Only a short settle follows.
+
+Environment:
+    ROBECO_PDF_POOL                on | off (default on)
+    ROBECO_PDF_POOL_SIZE           pages rendering concurrently (default 2)
+    ROBECO_PDF_RENDER_TIMEOUT      seconds per PDF job (default 150)
+    ROBECO_PDF_READY_TIMEOUT_MS    longest wait for charts to be drawn (default 5000)
+    ROBECO_PDF_SETTLE_MS           settle time once the page is ready (default 100)
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+WORKER_SCRIPT = Path(__file__).resolve().parent / "pdf_render_worker.js"
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+
+# After a failed start, one-off Puppeteer processes are used for this long before retrying
+RESTART_BACKOFF_SECONDS = 60.0
+
+
+class PdfRenderError(RuntimeError):
+    """The pool could not render a job (worker unavailable, crashed or timed out)"""
+
+
+class PdfRenderPool:
+    """
+    Client side of the PDF render worker
+
+    Usage:
+        result = await pdf_render_pool.render(html_path, pdf_path, {"format": "A4", "landscape": True})
+    """
+
+    def __init__(self, pool_size: int = 2, job_timeout: float = 150.0, start_timeout: float = 60.0,
+                 enabled: bool = True, worker_script: Path = WORKER_SCRIPT, project_root: Path = PROJECT_ROOT,
+                 ready_timeout_ms: int = 5000, settle_ms: int = 100):
+        self.pool_size = pool_size
+        self.job_timeout = job_timeout
+        self.ready_timeout_ms = ready_timeout_ms
+        self.settle_ms = settle_ms
+        self.start_timeout = start_timeout
+        self.enabled = enabled
+        self.worker_script = Path(worker_script)
+        self.project_root = Path(project_root)
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._start_lock: Optional[asyncio.Lock] = None
+        # job id -> (worker process, future); a dying worker only fails its own jobs
+        self._pending: Dict[int, Tuple[asyncio.subprocess.Process, asyncio.Future]] = {}
+        self._job_ids = itertools.count(1)
+        self._tasks = []
+        self._retry_after = 0.0
+        self.stats = {"jobs": 0, "failed": 0, "worker_starts": 0, "render_seconds": 0.0}
+
+    def _worker_env(self) -> Dict[str, str]:
+        env = os.environ.copy()
+        node_paths = [str(self.project_root / "node_modules")]
+        if env.get("NODE_PATH"):
+            node_paths.append(env["NODE_PATH"])
+        env["NODE_PATH"] = os.pathsep.join(node_paths)
+        env.setdefault("PUPPETEER_CACHE_DIR", str(self.project_root / ".cache" / "puppeteer"))
+        env["ROBECO_PDF_POOL_SIZE"] = str(self.pool_size)
+        return env
+
+    def _worker_alive(self) -> bool:
+        return (self._process is not None and self._process.returncode is None
+                and self._loop is asyncio.get_running_loop())
+
+    async def _ensure_worker(self):
+        if self._worker_alive():
+            return
+        if not self.enabled:
+            raise PdfRenderError("PDF browser pool disabled")
+        if time.monotonic() < self._retry_after:
+            raise PdfRenderError("PDF render worker unavailable (recent start failed)")
+
+        loop = asyncio.get_running_loop()
+        if self._start_lock is None or self._loop is not loop:
+            # Pipes and futures belong to one event loop; a new loop gets a new worker
+            self._start_lock = asyncio.Lock()
+            self._process = None
+            self._loop = loop
+
+        async with self._start_lock:
+            if self._worker_alive():
+                return
+            try:
+                await self._start_worker()
+            except Exception as e:
+                self._retry_after = time.monotonic() + RESTART_BACKOFF_SECONDS
+                await self._kill_worker()
+                raise PdfRenderError(f"PDF render worker failed to start: {e}") from e
+
+    async def _start_worker(self):
+        started = time.time()
+        logger.info(f"🖨️ Starting PDF render worker ({self.pool_size} pages)")
+        self._process = await asyncio.create_subprocess_exec(
+            "node", str(self.worker_script),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=str(self.project_root),
+            env=self._worker_env()
+        )
+        self._tasks = [asyncio.create_task(self._log_stderr(self._process))]
+
+        line = await asyncio.wait_for(self._process.stdout.readline(), timeout=self.start_timeout)
+        if not line or not json.loads(line).get("ready"):
+            raise RuntimeError("worker exited before the browser was ready")
+
+        self._tasks.append(asyncio.create_task(self._read_results(self._process)))
+        self.stats["worker_starts"] += 1
+        logger.info(f"✅ PDF render worker ready in {time.time() - started:.2f}s")
+
+    async def _read_results(self, process: asyncio.subprocess.Process):
+        while True:
+            line = await process.stdout.readline()
+            if not line:
+                break
+            try:
+                result = json.loads(line)
+            except ValueError:
+                logger.warning(f"⚠️ Unexpected PDF worker output: {line[:200]!r}")
+                continue
+            # A job that already timed out on this side has no entry any more
+            _, future = self._pending.pop(result.get("id"), (None, None))
+            if future is not None and not future.done():
+                future.set_result(result)
+
+        if process is self._process:
+            logger.warning("⚠️ PDF render worker exited")
+        for job_id, (job_process, future) in list(self._pending.items()):
+            if job_process is process:
+                del self._pending[job_id]
+                if not future.done():
+                    future.set_exception(PdfRenderError("PDF render worker exited"))
+
+    @staticmethod
+    async def _log_stderr(process: asyncio.subprocess.Process):
+        while True:
+            line = await process.stderr.readline()
+            if not line:
+                break
+            logger.info(f"🖨️ {line.decode('utf-8', errors='replace').rstrip()}")
+
+    async def render(self, html_path: str, pdf_path: str, pdf_options: Dict[str, Any],
+                     wait_ms: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Render ``html_path`` to ``pdf_path`` on a pooled page
+
+        Args:
+            html_path: HTML file to load
+            pdf_path: Where the PDF is written
+            pdf_options: Puppeteer ``page.pdf`` options (format, width, margin, ...)
+            wait_ms: Settle time once fonts and charts are ready (default: the pool's ``settle_ms``)
+
+        Returns:
+            Worker result: ``elapsed_ms`` and the number of slides rendered
+
+        Raises:
+            PdfRenderError: when the worker is unavailable, the job fails or times out
+        """
+        await self._ensure_worker()
+
+        job_id = next(self._job_ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[job_id] = (self._process, future)
+        job = {
+            "id": job_id,
+            "html_path": str(html_path),
+            "pdf_path": str(pdf_path),
+            "pdf": pdf_options,
+            "wait_ms": self.settle_ms if wait_ms is None else wait_ms,
+            "ready_timeout_ms": self.ready_timeout_ms,
+            "timeout_ms": int(self.job_timeout * 1000),
+        }
+
+        started = time.time()
+        self.stats["jobs"] += 1
+        try:
+            self._process.stdin.write((json.dumps(job) + "\n").encode("utf-8"))
+            await self._process.stdin.drain()
+            # Queue wait counts too, so allow for a full job ahead on every page
+            result = await asyncio.wait_for(future, timeout=self.job_timeout * 2)
+        except asyncio.TimeoutError:
+            self.stats["failed"] += 1
+            raise PdfRenderError(f"PDF render timed out after {time.time() - started:.0f}s")
+        except (BrokenPipeError, ConnectionResetError) as e:
+            self.stats["failed"] += 1
+            raise PdfRenderError(f"PDF render worker unavailable: {e}")
+        finally:
+            self._pending.pop(job_id, None)
+
+        if not result.get("ok"):
+            self.stats["failed"] += 1
+            raise PdfRenderError(result.get("error", "PDF render failed"))
+
+        self.stats["render_seconds"] += time.time() - started
+        logger.info(f"🖨️ PDF rendered in {time.time() - started:.2f}s "
+                    f"(worker {result.get('elapsed_ms', 0) / 1000:.2f}s, {result.get('slides', 0)} slides)")
+        return result
+
+    async def _kill_worker(self):
+        process, self._process = self._process, None
+        if process is not None and process.returncode is None:
+            process.kill()
+            await process.wait()
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+
+    async def close(self):
+        """Stop the worker; closing its stdin lets it shut the browser down cleanly"""
+        process, self._process = self._process, None
+        if process is None or process.returncode is not None:
+            return
+        process.stdin.close()
+        try:
+            await asyncio.wait_for(process.wait(), timeout=10)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+        logger.info("🛑 PDF render worker stopped")
+
+    def get_stats(self) -> Dict[str, Any]:
+        running = self._process is not None and self._process.returncode is None
+        return {**self.stats, "pool_size": self.pool_size, "worker_running": running, "pending_jobs": len(self._pending)}
+
+
+def create_pdf_render_pool_from_env() -> PdfRenderPool:
+    return PdfRenderPool(
+        pool_size=max(1, int(os.getenv("ROBECO_PDF_POOL_SIZE", "2"))),
+        job_timeout=float(os.getenv("ROBECO_PDF_RENDER_TIMEOUT", "150")),
+        enabled=os.getenv("ROBECO_PDF_POOL", "on").lower() not in ("off", "false", "0"),
+        ready_timeout_ms=max(0, int(os.getenv("ROBECO_PDF_READY_TIMEOUT_MS", "5000"))),
+        settle_ms=max(0, int(os.getenv("ROBECO_PDF_SETTLE_MS", "100")))
+    )
+
+
+# Shared by the PDF services of the streaming server and the professional API
+pdf_render_pool = create_pdf_render_pool_from_env()
@@ -0,0 +1,212 @@
+/*
+ * Robeco PDF Render Worker
+ * Long-lived headless browser with a pool of pages for HTML -> PDF jobs
+ *
+ * Started once by pdf_render_pool.py. Jobs arrive as JSON lines on stdin:
+ *     {"id": 1, "html_path": "...", "pdf_path": "...", "pdf": {...page.pdf options},
+ *      "ready_timeout_ms": 5000, "wait_ms": 100, "timeout_ms": 120000}
+ * and every job is answered with one JSON line on stdout:
+ *     {"id": 1, "ok": true, "elapsed_ms": 812, "slides": 15}
+ *     {"id": 1, "ok": false, "error": "...", "elapsed_ms": 120004}
+ * The first line on stdout is {"ready": true, "pool_size": N} once the browser is up.
+ * Logging goes to stderr. Closing stdin shuts the browser down and exits.
+ *
+ * A page is printed once it is ready: network idle, web fonts loaded, and
+ * (for at most ready_timeout_ms) every chart container holding its drawn
+ * chart with the DOM no longer changing. wait_ms is a short settle after that.
+ *
+ * Environment:
+ *     ROBECO_PDF_POOL_SIZE   pages rendering concurrently (default 2)
+ */
+
+const readline = require('readline');
+const { pathToFileURL } = require('url');
+
+let puppeteer;
+try {
+    puppeteer = require('puppeteer');
+} catch (error) {
+    console.error(`❌ Cannot find puppeteer module: ${error.message}`);
+    process.exit(1);
+}
+
+const POOL_SIZE = Math.max(1, parseInt(process.env.ROBECO_PDF_POOL_SIZE || '2', 10) || 2);
+
+const LAUNCH_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-accelerated-2d-canvas',
+    '--disable-gpu',
+    '--disable-web-security',
+    '--disable-features=VizDisplayCompositor',
+    '--run-all-compositor-stages-before-draw',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding'
+];
+
+// Report charts are drawn by page scripts after load (D3 line charts); a container
+// is done once it holds the drawn chart. Scripts put "Loading Chart..." placeholders
+// and error messages in <p> elements, so those do not count: a chart that never
+// draws is printed as it stands once ready_timeout_ms runs out.
+const CHART_CONTAINERS = '[id$="-chart"]';
+const CHART_DRAWN = 'svg, canvas';
+// Debounced redraws replace a chart after it first appears
+const DOM_QUIET_MS = 150;
+
+function log(message) {
+    console.error(`[pdf-worker] ${message}`);
+}
+
+function reply(message) {
+    process.stdout.write(JSON.stringify(message) + '\n');
+}
+
+// One browser for the worker's lifetime; relaunched if it crashes
+let browserPromise = null;
+
+function getBrowser() {
+    if (!browserPromise) {
+        browserPromise = puppeteer.launch({ headless: true, args: LAUNCH_ARGS }).then(browser => {
+            browser.on('disconnected', () => {
+                log('⚠️ Browser disconnected, relaunching on next job');
+                browserPromise = null;
+                for (const slot of slots) {
+                    slot.page = null;
+                }
+            });
+            return browser;
+        });
+        browserPromise.catch(() => { browserPromise = null; });
+    }
+    return browserPromise;
+}
+
+async function newPage() {
+    const browser = await getBrowser();
+    const page = await browser.newPage();
+    page.on('pageerror', error => log(`❌ Page script error: ${error.message}`));
+    return page;
+}
+
+async function waitForReady(page, readyTimeout) {
+    const deadline = Date.now() + readyTimeout;
+    try {
+        await page.waitForFunction(
+            (containers, drawn) => [...document.querySelectorAll(containers)].every(el => el.querySelector(drawn)),
+            { timeout: readyTimeout }, CHART_CONTAINERS, CHART_DRAWN
+        );
+        await page.evaluate((quietMs, limitMs) => new Promise(resolve => {
+            let quiet = setTimeout(done, quietMs);
+            const limit = setTimeout(done, limitMs);
+            const observer = new MutationObserver(() => {
+                clearTimeout(quiet);
+                quiet = setTimeout(done, quietMs);
+            });
+            function done() {
+                observer.disconnect();
+                clearTimeout(quiet);
+                clearTimeout(limit);
+                resolve();
+            }
+            observer.observe(document.body, { childList: true, subtree: true, attributes: true });
+        }), DOM_QUIET_MS, Math.max(0, deadline - Date.now()));
+    } catch (error) {
+        if (error.name !== 'TimeoutError') {
+            throw error;
+        }
+        log(`⚠️ Charts not drawn within ${readyTimeout} ms, printing anyway`);
+    }
+}
+
+// Each slot owns one page and renders one job at a time
+const slots = Array.from({ length: POOL_SIZE }, (_, index) => ({ index, page: null }));
+const freeSlots = [...slots];
+const queue = [];
+
+function pump() {
+    while (queue.length && freeSlots.length) {
+        const slot = freeSlots.pop();
+        const job = queue.shift();
+        render(slot, job).finally(() => {
+            freeSlots.push(slot);
+            pump();
+        });
+    }
+}
+
+async function render(slot, job) {
+    const started = Date.now();
+    const timeout = job.timeout_ms || 120000;
+    try {
+        if (!slot.page || slot.page.isClosed()) {
+            slot.page = await newPage();
+        }
+        const page = slot.page;
+        page.setDefaultTimeout(timeout);
+        page.setDefaultNavigationTimeout(timeout);
+
+        await page.goto(pathToFileURL(job.html_path).href, { timeout, waitUntil: 'networkidle2' });
+        await page.evaluate(() => document.fonts.ready);
+        if (job.ready_timeout_ms) {
+            await waitForReady(page, job.ready_timeout_ms);
+        }
+        if (job.wait_ms) {
+            await new Promise(resolve => setTimeout(resolve, job.wait_ms));
+        }
+        const slides = await page.evaluate(() => document.querySelectorAll('.slide, .slide-container').length);
+        await page.pdf({ ...(job.pdf || {}), path: job.pdf_path, timeout });
+
+        // Drop the report's DOM so an idle page holds no memory
+        await page.goto('about:blank');
+        reply({ id: job.id, ok: true, elapsed_ms: Date.now() - started, slides });
+    } catch (error) {
+        log(`❌ Job ${job.id} failed on page ${slot.index}: ${error.message}`);
+        if (slot.page) {
+            slot.page.close().catch(() => {});
+            slot.page = null;
+        }
+        reply({ id: job.id, ok: false, error: error.message, elapsed_ms: Date.now() - started });
+    }
+}
+
+const input = readline.createInterface({ input: process.stdin });
+
+input.on('line', line => {
+    if (!line.trim()) {
+        return;
+    }
+    let job;
+    try {
+        job = JSON.parse(line);
+    } catch (error) {
+        log(`❌ Invalid job line: ${error.message}`);
+        return;
+    }
+    queue.push(job);
+    pump();
+});
+
+input.on('close', async () => {
+    log('🛑 Input closed, shutting down');
+    try {
+        if (browserPromise) {
+            const browser = await browserPromise;
+            await browser.close();
+        }
+    } finally {
+        process.exit(0);
+    }
+});
+
+(async () => {
+    try {
+        const started = Date.now();
+        await getBrowser();
+        log(`✅ Browser ready in ${Date.now() - started} ms (pool of ${POOL_SIZE} pages)`);
+        reply({ ready: true, pool_size: POOL_SIZE });
+    } catch (error) {
+        log(`❌ Browser launch failed: ${error.message}`);
+        process.exit(1);
+    }
+})();
@@ -4,6 +4,7 @@ Converts HTML investment reports to high-quality PDF documents with perfect layo
 """
 
 import os
+import asyncio
 import tempfile
 import subprocess
 import logging
@@ -11,6 +12,11 @@ import time
 from typing import Optional
 from datetime import datetime
 
+try:
+    from .pdf_render_pool import PdfRenderError, pdf_render_pool
+except ImportError:
+    from robeco.backend.pdf_render_pool import PdfRenderError, pdf_render_pool
+
 logger = logging.getLogger(__name__)
 
 class RobecoPdfReportGenerator:
@@ -125,8 +131,21 @@ class RobecoPdfReportGenerator:
             temp_html_path = temp_html.name
         
         try:
-            # Generate Puppeteer script
-            success = await self._generate_with_puppeteer_script(temp_html_path, output_path)
+            # Render on the shared warm browser; a one-off Puppeteer process is the fallback
+            try:
+                await pdf_render_pool.render(
+                    temp_html_path, output_path,
+                    {
+                        'format': 'A4',
+                        'landscape': True,
+                        'margin': {'top': '0', 'right': '0', 'bottom': '0', 'left': '0'},
+                        'printBackground': True
+                    }
+                )
+                success = True
+            except PdfRenderError as e:
+                logger.warning(f"⚠️ Browser pool render failed ({e}), launching a one-off Puppeteer process")
+                success = await self._generate_with_puppeteer_script(temp_html_path, output_path)
             
             if not success:
                 raise RuntimeError("Puppeteer PDF generation failed")
@@ -301,7 +320,8 @@ const fs = require('fs');
         try:
             logger.info("🚀 Starting Node.js Puppeteer subprocess...")
             
-            result = subprocess.run(
+            result = await asyncio.to_thread(
+                subprocess.run,
                 ['node', temp_script_path], 
                 capture_output=True, 
                 text=True, 
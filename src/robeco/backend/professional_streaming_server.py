@@ -8,7 +8,7 @@ import asyncio
 import json
 import logging
 from datetime import datetime
-from typing import Dict, Set, Any
+from typing import Dict, Set, Any, Optional, Tuple
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, UploadFile, File, Form, HTTPException
 from fastapi.responses import HTMLResponse, JSONResponse
 from pydantic import BaseModel
@@ -18,7 +18,6 @@ import uvicorn
 import sys
 import os
 from pathlib import Path
-import yfinance as yf
 import pandas as pd
 
 # Add project root to path and set working directory
@@ -32,16 +31,23 @@ from robeco.backend.ultra_sophisticated_multi_agent_engine import (
     AnalysisPhase
 )
 
+# Shared per-ticker market data snapshot
+from robeco.data.market_data_service import market_data_service, watchlist_from_env
+from robeco.core.serialization import dumps, dumps_bytes, to_jsonable, SerializedMessage, as_text
+# Importing the registry from the sections module registers the report.* sections
+from robeco.prompts.report_prompt_sections import prompt_registry
+
 # Import bulk file processor
 from robeco.backend.bulk_file_processor import bulk_processor, BulkAnalysisSession
 
 # Import template report generator
 from robeco.backend.template_report_generator import template_report_generator
+from robeco.backend.report_assets import report_assets
+from robeco.backend.report_archive import report_archive
 
-# Import Word report generator
-from robeco.backend.word_report_generator import word_report_generator
-# Import Enhanced PDF service
-from robeco.backend.enhanced_pdf_service import EnhancedPdfService
+# Background Word / PDF conversion jobs (Word in worker processes, PDF on the browser pool)
+from robeco.backend.document_conversion_queue import ConversionJob, MEDIA_TYPES, document_conversion_queue
+from robeco.backend.pdf_render_pool import pdf_render_pool
 
 # Import for chat functionality
 try:
@@ -57,11 +63,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+class RobecoJSONResponse(JSONResponse):
+    """JSON responses rendered through the shared serialization layer (NaN -> null)"""
+    
+    def render(self, content: Any) -> bytes:
+        return dumps_bytes(content)
+
 # Create FastAPI application
 app = FastAPI(
     title="Robeco Ultra-Sophisticated Professional Streaming Server",
     description="Sequential Intelligence Multi-Agent Architecture with cross-agent synthesis",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=RobecoJSONResponse
 )
 
 # Mount static files
@@ -77,10 +90,38 @@ connection_counter = 0
 chat_sessions: Dict[str, Dict] = {}  # session_id -> {analyst -> chat_history}
 session_projects: Dict[str, Dict] = {}  # session_id -> project_data
 session_analyses: Dict[str, Dict] = {}  # session_id -> {analysis_id -> analysis_data}
-session_reports: Dict[str, Dict] = {}  # session_id -> {report_content, status, progress}
-
-async def send_websocket_safe(websocket: WebSocket, message_data: dict) -> bool:
-    """Safely send WebSocket message, handling disconnections gracefully"""
+session_reports: Dict[str, Dict] = {}  # session_id -> {archive_id, status, progress} (content only if archiving failed)
+
+# Background watchlist warm-up (ROBECO_WATCHLIST), started with the server
+watchlist_task: Optional[asyncio.Task] = None
+
+@app.on_event("startup")
+async def start_watchlist_warmup():
+    """Warm the configured coverage list into the market data cache without delaying startup"""
+    global watchlist_task
+    tickers, refresh_seconds = watchlist_from_env()
+    if tickers:
+        refresh = f", refreshed every {refresh_seconds:.0f}s" if refresh_seconds > 0 else ""
+        logger.info(f"📦 Scheduling watchlist warm-up for {len(tickers)} tickers{refresh}")
+        watchlist_task = asyncio.create_task(market_data_service.run_watchlist_schedule(tickers, refresh_seconds))
+
+@app.on_event("shutdown")
+async def stop_watchlist_warmup():
+    if watchlist_task is not None and not watchlist_task.done():
+        watchlist_task.cancel()
+
+@app.on_event("shutdown")
+async def stop_pdf_render_pool():
+    """Shut down the shared headless browser so no Chromium outlives the server"""
+    await pdf_render_pool.close()
+
+@app.on_event("shutdown")
+async def stop_document_conversions():
+    """Cancel running exports and stop the Word worker processes"""
+    document_conversion_queue.shutdown()
+
+async def send_websocket_safe(websocket: WebSocket, message_data: Any) -> bool:
+    """Safely send WebSocket message (dict or SerializedMessage), handling disconnections gracefully"""
     if not websocket:
         return False
     
@@ -90,7 +131,7 @@ async def send_websocket_safe(websocket: WebSocket, message_data: dict) -> bool:
             logger.warning("⚠️ WebSocket not connected, skipping message")
             return False
             
-        await websocket.send_text(json.dumps(message_data))
+        await websocket.send_text(as_text(message_data))
         return True
     except Exception as e:
         # Log the error but don't crash the generation process
@@ -103,18 +144,7 @@ class DocumentConversionRequest(BaseModel):
     company_name: str
     ticker: str
     format: str  # "word" or "pdf"
-
-# Enhanced PDF service - no lazy loading needed (static methods)
-def get_pdf_generator():
-    """Return the EnhancedPdfService for PDF generation"""
-    try:
-        # EnhancedPdfService uses static methods, so just return the class
-        logger.info("✅ PDF generator initialized successfully")
-        logger.info("📍 Using PDF engine: Enhanced Puppeteer Service")
-        return EnhancedPdfService
-    except Exception as e:
-        logger.error(f"❌ PDF generator initialization failed: {e}")
-        raise RuntimeError(f"PDF generation unavailable: {e}")
+    session_id: Optional[str] = None  # progress is pushed to this session's WebSocket
 
 @app.get("/favicon.ico")
 async def get_favicon():
@@ -198,7 +228,7 @@ async def websocket_endpoint(websocket: WebSocket):
     logger.info(f"🔗 New professional connection: {temp_connection_id} (waiting for session init)")
     
     # Send initial connection confirmation
-    await websocket.send_text(json.dumps({
+    await websocket.send_text(dumps({
         "type": "connection_established",
         "data": {
             "connection_id": connection_id,
@@ -246,7 +276,7 @@ async def websocket_endpoint(websocket: WebSocket):
                     logger.info(f"🆔 Session {session_id} initialized for connection {connection_id}")
                     
                     # Send confirmation
-                    await websocket.send_text(json.dumps({
+                    await websocket.send_text(dumps({
                         "type": "session_confirmed",
                         "data": {
                             "session_id": session_id,
@@ -269,7 +299,7 @@ async def websocket_endpoint(websocket: WebSocket):
             # IMMEDIATE ACKNOWLEDGMENT for generate_report
             if message_type == 'generate_report':
                 logger.info(f"🎯 GENERATE_REPORT MESSAGE RECEIVED! Sending immediate acknowledgment...")
-                await websocket.send_text(json.dumps({
+                await websocket.send_text(dumps({
                     "type": "generate_report_acknowledged", 
                     "data": {
                         "message": "📝 Report generation request received and processing...",
@@ -308,7 +338,7 @@ async def websocket_endpoint(websocket: WebSocket):
             
             elif message_type == 'ping':
                 # Handle ping for connection health
-                await websocket.send_text(json.dumps({
+                await websocket.send_text(dumps({
                     "type": "pong",
                     "data": {"timestamp": datetime.now().isoformat()}
                 }))
@@ -336,59 +366,24 @@ async def websocket_endpoint(websocket: WebSocket):
 async def fetch_stock_data_internal(ticker: str) -> Dict:
     """Internal function to fetch stock data for agent analysis"""
     try:
-        # This reuses the same logic as the API endpoint but returns the data directly
-        import yfinance as yf
-        import pandas as pd
-        
+        # Resolved through the shared snapshot so the agents, the report
+        # generator and /api/stock reuse the same Yahoo responses
         logger.info(f"🔍 Fetching stock data for: {ticker}")
         
-        # Clean and format ticker symbol for different exchanges
         original_ticker = ticker
-        ticker_formats = [ticker.upper()]
-        
-        # Try different exchange suffixes for international markets
-        if '.' not in ticker:
-            ticker_formats.extend([
-                f"{ticker}.SI",  # Singapore Exchange  
-                f"{ticker}.HK",  # Hong Kong Exchange
-                f"{ticker}.TO",  # Toronto Stock Exchange
-                f"{ticker}.L",   # London Stock Exchange
-            ])
+        stock, ticker_formats = await market_data_service.aresolve_snapshot(ticker)
         
-        logger.info(f"📊 Trying ticker formats: {ticker_formats}")
-        
-        stock = None
-        working_ticker = None
-        
-        # Try each ticker format until one works
-        for ticker_format in ticker_formats:
-            try:
-                logger.info(f"🎯 Testing ticker format: {ticker_format}")
-                test_stock = yf.Ticker(ticker_format)
-                test_info = test_stock.info
-                
-                # Check if we got valid data
-                if test_info and len(test_info) > 10 and 'regularMarketPrice' in test_info:
-                    stock = test_stock
-                    working_ticker = ticker_format
-                    logger.info(f"✅ Success with ticker format: {working_ticker}")
-                    break
-                else:
-                    logger.info(f"⚠️ No data for format: {ticker_format}")
-                    
-            except Exception as e:
-                logger.info(f"❌ Failed format {ticker_format}: {str(e)[:100]}")
-                continue
-        
-        if not stock or not working_ticker:
+        if stock is None:
             return {
                 "success": False, 
                 "message": f"No valid data found for ticker {original_ticker} across all exchange formats",
                 "ticker": original_ticker
             }
         
+        working_ticker = stock.symbol
+        
         # Get comprehensive stock information
-        info = stock.info
+        info = await stock.fetch("info")
         
         # Prepare comprehensive data structure (same as API endpoint)
         # [Include the same data structure as the existing API endpoint]
@@ -454,89 +449,29 @@ async def fetch_stock_data_internal(ticker: str) -> Dict:
         try:
             logger.info(f"📊 Fetching complete 3-statements for {working_ticker}")
             
-            # Income Statement (annual and quarterly)
-            try:
-                income_stmt_annual = stock.financials  # Annual income statement
-                income_stmt_quarterly = stock.quarterly_financials  # Quarterly income statement
-                
-                if not income_stmt_annual.empty:
-                    # Convert Timestamp columns to strings for JSON serialization
-                    income_annual_dict = income_stmt_annual.to_dict()
-                    income_annual_clean = {}
-                    for date_key, values in income_annual_dict.items():
-                        date_str = date_key.strftime('%Y-%m-%d') if hasattr(date_key, 'strftime') else str(date_key)
-                        income_annual_clean[date_str] = values
-                    stock_data["income_statement_annual"] = income_annual_clean
-                    logger.info(f"✅ Annual Income Statement: {len(income_stmt_annual.columns)} periods, {len(income_stmt_annual.index)} line items")
-                
-                if not income_stmt_quarterly.empty:
-                    # Convert Timestamp columns to strings for JSON serialization
-                    income_quarterly_dict = income_stmt_quarterly.to_dict()
-                    income_quarterly_clean = {}
-                    for date_key, values in income_quarterly_dict.items():
-                        date_str = date_key.strftime('%Y-%m-%d') if hasattr(date_key, 'strftime') else str(date_key)
-                        income_quarterly_clean[date_str] = values
-                    stock_data["income_statement_quarterly"] = income_quarterly_clean
-                    logger.info(f"✅ Quarterly Income Statement: {len(income_stmt_quarterly.columns)} periods, {len(income_stmt_quarterly.index)} line items")
-                    
-            except Exception as e:
-                logger.warning(f"⚠️ Income Statement fetch failed: {e}")
-            
-            # Balance Sheet (annual and quarterly)
-            try:
-                balance_sheet_annual = stock.balance_sheet  # Annual balance sheet
-                balance_sheet_quarterly = stock.quarterly_balance_sheet  # Quarterly balance sheet
-                
-                if not balance_sheet_annual.empty:
-                    # Convert Timestamp columns to strings for JSON serialization
-                    balance_annual_dict = balance_sheet_annual.to_dict()
-                    balance_annual_clean = {}
-                    for date_key, values in balance_annual_dict.items():
-                        date_str = date_key.strftime('%Y-%m-%d') if hasattr(date_key, 'strftime') else str(date_key)
-                        balance_annual_clean[date_str] = values
-                    stock_data["balance_sheet_annual"] = balance_annual_clean
-                    logger.info(f"✅ Annual Balance Sheet: {len(balance_sheet_annual.columns)} periods, {len(balance_sheet_annual.index)} line items")
-                
-                if not balance_sheet_quarterly.empty:
-                    # Convert Timestamp columns to strings for JSON serialization
-                    balance_quarterly_dict = balance_sheet_quarterly.to_dict()
-                    balance_quarterly_clean = {}
-                    for date_key, values in balance_quarterly_dict.items():
-                        date_str = date_key.strftime('%Y-%m-%d') if hasattr(date_key, 'strftime') else str(date_key)
-                        balance_quarterly_clean[date_str] = values
-                    stock_data["balance_sheet_quarterly"] = balance_quarterly_clean
-                    logger.info(f"✅ Quarterly Balance Sheet: {len(balance_sheet_quarterly.columns)} periods, {len(balance_sheet_quarterly.index)} line items")
-                    
-            except Exception as e:
-                logger.warning(f"⚠️ Balance Sheet fetch failed: {e}")
+            statement_sources = [
+                ("Income Statement", "financials", "quarterly_financials", "income_statement"),
+                ("Balance Sheet", "balance_sheet", "quarterly_balance_sheet", "balance_sheet"),
+                ("Cash Flow", "cashflow", "quarterly_cashflow", "cashflow"),
+            ]
             
-            # Cash Flow Statement (annual and quarterly)
-            try:
-                cashflow_annual = stock.cashflow  # Annual cash flow statement
-                cashflow_quarterly = stock.quarterly_cashflow  # Quarterly cash flow statement
-                
-                if not cashflow_annual.empty:
-                    # Convert Timestamp columns to strings for JSON serialization
-                    cashflow_annual_dict = cashflow_annual.to_dict()
-                    cashflow_annual_clean = {}
-                    for date_key, values in cashflow_annual_dict.items():
-                        date_str = date_key.strftime('%Y-%m-%d') if hasattr(date_key, 'strftime') else str(date_key)
-                        cashflow_annual_clean[date_str] = values
-                    stock_data["cashflow_annual"] = cashflow_annual_clean
-                    logger.info(f"✅ Annual Cash Flow: {len(cashflow_annual.columns)} periods, {len(cashflow_annual.index)} line items")
-                
-                if not cashflow_quarterly.empty:
-                    # Convert Timestamp columns to strings for JSON serialization
-                    cashflow_quarterly_dict = cashflow_quarterly.to_dict()
-                    cashflow_quarterly_clean = {}
-                    for date_key, values in cashflow_quarterly_dict.items():
-                        date_str = date_key.strftime('%Y-%m-%d') if hasattr(date_key, 'strftime') else str(date_key)
-                        cashflow_quarterly_clean[date_str] = values
-                    stock_data["cashflow_quarterly"] = cashflow_quarterly_clean
-                    logger.info(f"✅ Quarterly Cash Flow: {len(cashflow_quarterly.columns)} periods, {len(cashflow_quarterly.index)} line items")
-                    
-            except Exception as e:
-                logger.warning(f"⚠️ Cash Flow Statement fetch failed: {e}")
+            for label, annual_attr, quarterly_attr, output_key in statement_sources:
+                try:
+                    for period, attr in (("annual", annual_attr), ("quarterly", quarterly_attr)):
+                        statement = await stock.fetch(attr)
+                        if statement is None or statement.empty:
+                            continue
+                        
+                        # Convert Timestamp columns to strings for JSON serialization
+                        statement_clean = {}
+                        for date_key, values in statement.to_dict().items():
+                            date_str = date_key.strftime('%Y-%m-%d') if hasattr(date_key, 'strftime') else str(date_key)
+                            statement_clean[date_str] = values
+                        stock_data[f"{output_key}_{period}"] = statement_clean
+                        logger.info(f"✅ {period.title()} {label}: {len(statement.columns)} periods, {len(statement.index)} line items")
+                        
+                except Exception as e:
+                    logger.warning(f"⚠️ {label} fetch failed: {e}")
             
             # Additional financial metrics - handle deprecation warnings
             try:
@@ -580,7 +515,7 @@ async def fetch_stock_data_internal(ticker: str) -> Dict:
             # Historical price data for comprehensive analysis
             try:
                 # 5-year historical data
-                hist_5y = stock.history(period="5y")
+                hist_5y = await stock.fetch_history("5y", "1d")
                 if not hist_5y.empty:
                     # Convert Timestamp index to strings for JSON serialization
                     hist_5y_dict = hist_5y.to_dict()
@@ -603,21 +538,7 @@ async def fetch_stock_data_internal(ticker: str) -> Dict:
             logger.error(f"❌ Error fetching 3-statements: {e}")
         
         # Clean NaN values before JSON serialization
-        def clean_nan_values(obj):
-            """Recursively clean NaN/inf values from nested dictionaries and lists"""
-            import math
-            if isinstance(obj, dict):
-                return {k: clean_nan_values(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [clean_nan_values(item) for item in obj]
-            elif isinstance(obj, float):
-                if math.isnan(obj) or math.isinf(obj):
-                    return None
-                return obj
-            else:
-                return obj
-        
-        clean_stock_data = clean_nan_values(stock_data)
+        clean_stock_data = to_jsonable(stock_data)
         return {"success": True, "data": clean_stock_data}
         
     except Exception as e:
@@ -651,7 +572,7 @@ async def handle_streaming_analysis(websocket: WebSocket, connection_id: str, me
             logger.error(f"❌ Error fetching stock data for agents: {e}")
         
         # Send analysis started confirmation
-        await websocket.send_text(json.dumps({
+        await websocket.send_text(dumps({
             "type": "streaming_analysis_started",
             "data": {
                 "analyst_type": analyst_type,
@@ -678,7 +599,7 @@ async def handle_streaming_analysis(websocket: WebSocket, connection_id: str, me
             
             # Format update for frontend
             if update['type'] == 'status_update':
-                await websocket.send_text(json.dumps({
+                await websocket.send_text(dumps({
                     "type": "streaming_status_update",
                     "data": {
                         "progress": update['data']['progress'],
@@ -689,7 +610,7 @@ async def handle_streaming_analysis(websocket: WebSocket, connection_id: str, me
                 }))
                 
             elif update['type'] == 'research_source':
-                await websocket.send_text(json.dumps({
+                await websocket.send_text(dumps({
                     "type": "streaming_research_source", 
                     "data": update['data']
                 }))
@@ -711,18 +632,18 @@ async def handle_streaming_analysis(websocket: WebSocket, connection_id: str, me
                             # Split large chunks
                             for i in range(0, len(safe_chunk), 50000):
                                 sub_chunk = safe_chunk[i:i+50000]
-                                await websocket.send_text(json.dumps({
+                                await websocket.send_text(dumps({
                                     "type": "streaming_ai_content",
                                     "data": {"content_chunk": sub_chunk}
                                 }))
                         else:
-                            await websocket.send_text(json.dumps({
+                            await websocket.send_text(dumps({
                                 "type": "streaming_ai_content",
                                 "data": {"content_chunk": safe_chunk}
                             }))
                     else:
                         # Send empty chunk to maintain flow
-                        await websocket.send_text(json.dumps({
+                        await websocket.send_text(dumps({
                             "type": "streaming_ai_content", 
                             "data": content_data
                         }))
@@ -741,7 +662,7 @@ async def handle_streaming_analysis(websocket: WebSocket, connection_id: str, me
                         # Clean any potentially problematic characters
                         safe_chunk = chunk_content.replace('\x00', '').replace('\ufffd', '')
                         
-                        await websocket.send_text(json.dumps({
+                        await websocket.send_text(dumps({
                             "type": "streaming_ai_content",
                             "data": {"content_chunk": safe_chunk}
                         }))
@@ -814,9 +735,10 @@ async def handle_streaming_analysis(websocket: WebSocket, connection_id: str, me
                         logger.info(f"   📄 Original length: {len(content_complete)}, Safe length: {len(safe_content)}")
                         logger.info(f"   📄 Content cleaning removed: {len(content_complete) - len(safe_content)} chars")
                     
-                    # Test JSON serialization first
-                    json_string = json.dumps(safe_message)
-                    message_size = len(json_string)
+                    # Serialize once: the same encoding is measured, inspected and sent
+                    serialized_message = SerializedMessage(safe_message)
+                    json_string = serialized_message.text
+                    message_size = serialized_message.size
                     logger.info(f"📏 WEBSOCKET: Message size: {message_size} bytes")
                     
                     # WebSocket limit handling with chunked delivery for large content
@@ -854,7 +776,7 @@ async def handle_streaming_analysis(websocket: WebSocket, connection_id: str, me
                                 "chunk_id": f"citations_{int(datetime.now().timestamp())}"
                             }
                         }
-                        await websocket.send_text(json.dumps(chunk_header))
+                        await websocket.send_text(dumps(chunk_header))
                         
                         # Send each chunk
                         for chunk_idx, chunk in enumerate(content_chunks):
@@ -867,7 +789,7 @@ async def handle_streaming_analysis(websocket: WebSocket, connection_id: str, me
                                     "chunk_id": chunk_header['data']['chunk_id']
                                 }
                             }
-                            await websocket.send_text(json.dumps(chunk_message))
+                            await websocket.send_text(dumps(chunk_message))
                             logger.info(f"📦 WEBSOCKET: Sent chunk {chunk_idx + 1}/{len(content_chunks)}")
                             
                             # Small delay between chunks to prevent overwhelming
@@ -884,7 +806,7 @@ async def handle_streaming_analysis(websocket: WebSocket, connection_id: str, me
                                 "assembly_mode": "chunked"
                             }
                         }
-                        await websocket.send_text(json.dumps(final_assembly))
+                        await websocket.send_text(dumps(final_assembly))
                         logger.info(f"✅ WEBSOCKET: Chunked delivery completed ({len(content_chunks)} chunks, {message_size} total bytes)")
                         logger.info(f"   📚 Chunked delivery sent {total_chunked_citations} citations to frontend")
                         logger.info(f"🔍 *** WEBSOCKET STREAMING SERVER DEBUG TRACE END (CHUNKED) ***")
@@ -921,38 +843,38 @@ async def handle_streaming_analysis(websocket: WebSocket, connection_id: str, me
                                 "replace_content": True
                             }
                         }
-                        await websocket.send_text(json.dumps(error_message))
+                        await websocket.send_text(dumps(error_message))
                         logger.info("📤 WEBSOCKET: Sent error fallback message")
                     except Exception as fallback_error:
                         logger.error(f"❌ WEBSOCKET: Even fallback message failed: {fallback_error}")
                 
             elif update['type'] == 'streaming_analysis_completed':
-                await websocket.send_text(json.dumps({
+                await websocket.send_text(dumps({
                     "type": "streaming_analysis_completed",
                     "data": update['data']
                 }))
                 
             elif update['type'] == 'analysis_error':
-                await websocket.send_text(json.dumps({
+                await websocket.send_text(dumps({
                     "type": "streaming_analysis_error",
                     "data": update['data']
                 }))
                 
             elif update['type'] == 'agent_deployed':
-                await websocket.send_text(json.dumps({
+                await websocket.send_text(dumps({
                     "type": "agent_deployed",
                     "data": update['data']
                 }))
                 
             elif update['type'] == 'error_notification':
                 # Handle retry and error notifications for frontend popup
-                await websocket.send_text(json.dumps({
+                await websocket.send_text(dumps({
                     "type": "error_notification",
                     "data": update['data']
                 }))
                 
             elif update['type'] == 'agent_completed':
-                await websocket.send_text(json.dumps({
+                await websocket.send_text(dumps({
                     "type": "agent_completed", 
                     "data": update['data']
                 }))
@@ -979,7 +901,7 @@ async def handle_streaming_analysis(websocket: WebSocket, connection_id: str, me
         
         # Send clear error message to client - but only if WebSocket is still open
         try:
-            await websocket.send_text(json.dumps({
+            await websocket.send_text(dumps({
                 "type": "streaming_analysis_error",
                 "data": {
                     "error": user_message,
@@ -1086,7 +1008,7 @@ Respond with institutional-level sophistication:"""
             logger.info(f"🔍 CHAT [{analyst_type}]: Starting chat API key system")
             
             # Send debug to frontend that we're starting
-            await websocket.send_text(json.dumps({
+            await websocket.send_text(dumps({
                 "type": "chat_debug",
                 "data": {
                     "message": f"🔍 Starting chat system for {analyst_type}...",
@@ -1099,7 +1021,7 @@ Respond with institutional-level sophistication:"""
             logger.info(f"✅ CHAT [{analyst_type}]: Successfully imported API key system")
             
             # Send debug to frontend about successful import
-            await websocket.send_text(json.dumps({
+            await websocket.send_text(dumps({
                 "type": "chat_debug",
                 "data": {
                     "message": f"✅ API key system imported successfully",
@@ -1120,7 +1042,7 @@ Respond with institutional-level sophistication:"""
             logger.info(f"🔄 CHAT [{analyst_type}]: Starting retry loop with max {max_attempts} attempts")
             
             # Send debug to frontend that retry loop is starting
-            await websocket.send_text(json.dumps({
+            await websocket.send_text(dumps({
                 "type": "chat_debug",
                 "data": {
                     "message": f"🔄 Starting API key retry loop (max {max_attempts} attempts)",
@@ -1140,7 +1062,7 @@ Respond with institutional-level sophistication:"""
                     logger.info(f"🔑 CHAT [{analyst_type}]: Got API key {api_key[:8]}...{api_key[-4:]} | Key info: {key_info}")
                     
                     # Send debug info to frontend user
-                    await websocket.send_text(json.dumps({
+                    await websocket.send_text(dumps({
                         "type": "chat_debug",
                         "data": {
                             "message": f"🔑 Using API key {api_key[:8]}...{api_key[-4:]} (attempt {attempt})",
@@ -1155,7 +1077,7 @@ Respond with institutional-level sophistication:"""
                     logger.info(f"✅ CHAT [{analyst_type}]: Client created successfully with API key {api_key[:8]}...{api_key[-4:]}")
                     
                     # Send success debug to frontend
-                    await websocket.send_text(json.dumps({
+                    await websocket.send_text(dumps({
                         "type": "chat_debug",
                         "data": {
                             "message": f"✅ Client created successfully with {key_info.get('source', 'unknown')} key",
@@ -1170,7 +1092,7 @@ Respond with institutional-level sophistication:"""
                     logger.warning(f"🔄 CHAT Key failed (attempt {attempt}), trying next: {error_msg[:100]}...")
                     
                     # Send API key failure debug to frontend user
-                    await websocket.send_text(json.dumps({
+                    await websocket.send_text(dumps({
                         "type": "chat_debug",
                         "data": {
                             "message": f"🔄 API key failed (attempt {attempt}): {error_msg[:50]}... Trying next key...",
@@ -1188,7 +1110,7 @@ Respond with institutional-level sophistication:"""
                 logger.error(f"❌ {error_msg}")
                 
                 # Notify frontend user about API key problem
-                await websocket.send_text(json.dumps({
+                await websocket.send_text(dumps({
                     "type": "chat_debug",
                     "data": {
                         "message": f"🚨 All {max_attempts} API keys failed! Please add working keys to primary_gemini_key.txt",
@@ -1233,7 +1155,7 @@ Respond with institutional-level sophistication:"""
                 })
                 
                 # Send chat response
-                await websocket.send_text(json.dumps({
+                await websocket.send_text(dumps({
                     "type": "chat_response",
                     "data": {
                         "response": response.text,
@@ -1251,7 +1173,7 @@ Respond with institutional-level sophistication:"""
             # No fallback - require working API
             logger.error(f"❌ Chat API failed: {api_error}")
             
-            await websocket.send_text(json.dumps({
+            await websocket.send_text(dumps({
                 "type": "chat_error",
                 "data": {
                     "error": f"🚨 Chat API Key System Failure: All 100 retry attempts exhausted. Please check API key configuration and quota limits.",
@@ -1264,7 +1186,7 @@ Respond with institutional-level sophistication:"""
         logger.error(f"❌ Chat handling error for {connection_id}: {e}")
         
         # Send error message
-        await websocket.send_text(json.dumps({
+        await websocket.send_text(dumps({
             "type": "chat_error",
             "data": {
                 "error": f"Chat failed: {str(e)}",
@@ -1285,7 +1207,7 @@ async def handle_get_chat_history(websocket: WebSocket, connection_id: str, mess
             chat_history = []
             logger.info(f"📜 No chat history found for {analyst_type}")
         
-        await websocket.send_text(json.dumps({
+        await websocket.send_text(dumps({
             "type": "chat_history",
             "data": {
                 "analyst": analyst_type,
@@ -1296,7 +1218,7 @@ async def handle_get_chat_history(websocket: WebSocket, connection_id: str, mess
         
     except Exception as e:
         logger.error(f"❌ Error getting chat history: {e}")
-        await websocket.send_text(json.dumps({
+        await websocket.send_text(dumps({
             "type": "chat_error",
             "data": {
                 "error": f"Failed to get chat history: {str(e)}",
@@ -1317,7 +1239,7 @@ async def handle_clear_chat_history(websocket: WebSocket, connection_id: str, me
         else:
             logger.info(f"🗑️ No chat history to clear for {analyst_type}")
         
-        await websocket.send_text(json.dumps({
+        await websocket.send_text(dumps({
             "type": "chat_history_cleared",
             "data": {
                 "analyst": analyst_type,
@@ -1327,7 +1249,7 @@ async def handle_clear_chat_history(websocket: WebSocket, connection_id: str, me
         
     except Exception as e:
         logger.error(f"❌ Error clearing chat history: {e}")
-        await websocket.send_text(json.dumps({
+        await websocket.send_text(dumps({
             "type": "chat_error",
             "data": {
                 "error": f"Failed to clear chat history: {str(e)}",
@@ -1391,65 +1313,21 @@ async def api_status():
 async def get_stock_data(ticker: str):
     """Get real-time stock data from yfinance with chart data"""
     try:
-        # Clean and format ticker symbol for different exchanges
         original_ticker = ticker
-        ticker = ticker.upper().strip()
-        
-        # Handle different ticker formats
-        formatted_tickers = [ticker]
-        
-        # Singapore Exchange (SGX) formatting
-        if "SGX:" in ticker:
-            sgx_ticker = ticker.replace("SGX:", "").strip()
-            formatted_tickers = [
-                f"{sgx_ticker}.SI",  # Singapore format
-                sgx_ticker,
-                f"{sgx_ticker}.SG"
-            ]
-        # Hong Kong Exchange (HKG) formatting  
-        elif "HKG:" in ticker:
-            hkg_ticker = ticker.replace("HKG:", "").strip()
-            formatted_tickers = [
-                f"{hkg_ticker}.HK",  # Hong Kong format
-                f"0{hkg_ticker}.HK" if len(hkg_ticker) < 4 else f"{hkg_ticker}.HK",
-                hkg_ticker
-            ]
-        # Other exchange formats
-        elif ":" in ticker:
-            exchange, symbol = ticker.split(":", 1)
-            symbol = symbol.strip()
-            if exchange == "NYSE" or exchange == "NASDAQ":
-                formatted_tickers = [symbol]
-            else:
-                formatted_tickers = [f"{symbol}.{exchange}", symbol]
-        
         logger.info(f"🔍 Fetching stock data for: {original_ticker}")
-        logger.info(f"📊 Trying ticker formats: {formatted_tickers}")
         
-        stock = None
-        info = {}
-        hist_5d = None
-        hist_5y = None
+        # Resolve through the shared snapshot (same cache as the agents and reports)
+        stock, formatted_tickers = await market_data_service.aresolve_snapshot(ticker)
         
-        # Try different ticker formats
-        for test_ticker in formatted_tickers:
+        hist_5y = None
+        hist_5d = None
+        if stock is not None:
             try:
-                logger.info(f"🎯 Testing ticker format: {test_ticker}")
-                test_stock = yf.Ticker(test_ticker)
-                test_info = test_stock.info
-                test_hist = test_stock.history(period="5d")
-                
-                if not test_hist.empty and test_info and test_info.get('regularMarketPrice') is not None:
-                    logger.info(f"✅ Success with ticker format: {test_ticker}")
-                    stock = test_stock
-                    info = test_info
-                    hist_5d = test_hist
-                    ticker = test_ticker  # Update to working format
-                    break
-                    
+                hist_5y = await stock.fetch_history("5y", "1d")
+                logger.info(f"📈 Retrieved 5-year history: {len(hist_5y)} data points")
+                hist_5d = hist_5y.tail(5)
             except Exception as e:
-                logger.warning(f"⚠️ Failed ticker format {test_ticker}: {e}")
-                continue
+                logger.warning(f"⚠️ Could not get 5-year data: {e}")
         
         if stock is None or hist_5d is None or hist_5d.empty:
             return {
@@ -1458,13 +1336,8 @@ async def get_stock_data(ticker: str):
                 "ticker": original_ticker
             }
         
-        # Get 5-year history for chart
-        try:
-            hist_5y = stock.history(period="5y")
-            logger.info(f"📈 Retrieved 5-year history: {len(hist_5y)} data points")
-        except Exception as e:
-            logger.warning(f"⚠️ Could not get 5-year data: {e}")
-            hist_5y = hist_5d
+        ticker = stock.symbol  # Update to working format
+        info = await stock.fetch("info")
         
         # Get current price (last close)
         current_price = round(float(hist_5d['Close'].iloc[-1]), 4)
@@ -1601,21 +1474,7 @@ async def get_stock_data(ticker: str):
         }
         
         # Clean NaN values before returning
-        def clean_nan_values(obj):
-            """Recursively clean NaN/inf values from nested dictionaries and lists"""
-            import math
-            if isinstance(obj, dict):
-                return {k: clean_nan_values(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [clean_nan_values(item) for item in obj]
-            elif isinstance(obj, float):
-                if math.isnan(obj) or math.isinf(obj):
-                    return None
-                return obj
-            else:
-                return obj
-        
-        clean_stock_data = clean_nan_values(stock_data)
+        clean_stock_data = to_jsonable(stock_data)
         logger.info(f"✅ Successfully fetched data for {ticker}: ${current_price}")
         return clean_stock_data
         
@@ -1767,68 +1626,96 @@ async def cleanup_upload_session(session_id: str):
 
 @app.post("/api/professional/convert")
 async def convert_html_to_document(request: DocumentConversionRequest):
-    """Convert HTML report to Word document or PDF"""
+    """
+    Queue conversion of an HTML report to a Word document or PDF
+    
+    Returns a job id immediately; progress is pushed to the session's WebSocket as
+    document_conversion_progress messages, and the document is downloaded from the
+    job's download_url once it has completed.
+    """
     try:
-        logger.info(f"🔄 Converting HTML to {request.format.upper()}: {request.ticker}")
-        
-        if request.format.lower() == "word":
-            # Convert to Word document
-            output_path = await word_report_generator.convert_html_to_word(
-                html_content=request.html_content,
-                company_name=request.company_name,
-                ticker=request.ticker
+        logger.info(f"🔄 Queueing HTML to {request.format.upper()} conversion: {request.ticker}")
+        
+        async def notify(job: ConversionJob):
+            websocket = active_connections.get(request.session_id) if request.session_id else None
+            if websocket:
+                await send_websocket_safe(websocket, {"type": "document_conversion_progress", "data": job.to_dict()})
+        
+        try:
+            job = document_conversion_queue.submit(
+                request.format, request.html_content, request.company_name, request.ticker, on_progress=notify
             )
-            
-            return {
-                "status": "success",
-                "format": "word",
-                "file_path": output_path,
-                "message": f"Word document generated successfully for {request.ticker}",
-                "download_available": True
-            }
-            
-        elif request.format.lower() == "pdf":
-            # Convert to PDF document using EnhancedPdfService
-            try:
-                pdf_gen = get_pdf_generator()  # Returns EnhancedPdfService class
-                
-                # Generate PDF using the EnhancedPdfService static method
-                pdf_data = pdf_gen.generate_pdf_from_html(
-                    html_content=request.html_content,
-                    project_id=request.ticker,
-                    settings=None
-                )
-                
-                # Save PDF to temporary file for download
-                import tempfile
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                safe_ticker = request.ticker.replace('.', '_').replace(':', '_')
-                filename = f"{safe_ticker}_Investment_Report_{timestamp}.pdf"
-                output_path = os.path.join(tempfile.gettempdir(), filename)
-                
-                with open(output_path, 'wb') as f:
-                    f.write(pdf_data)
-                
-            except RuntimeError as e:
-                raise HTTPException(
-                    status_code=503,
-                    detail=str(e)
-                )
-            
-            return {
-                "status": "success", 
-                "format": "pdf",
-                "file_path": output_path,
-                "message": f"PDF document generated successfully for {request.ticker}",
-                "download_available": True
-            }
-        else:
-            raise HTTPException(status_code=400, detail="Invalid format. Use 'word' or 'pdf'")
-            
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        return {
+            "status": "queued",
+            "job_id": job.job_id,
+            "format": job.format,
+            "status_url": f"/api/professional/convert/jobs/{job.job_id}",
+            "message": f"{job.format.upper()} conversion queued for {request.ticker}",
+            "job": job.to_dict()
+        }
+        
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Document conversion failed: {e}")
         raise HTTPException(status_code=500, detail=f"Conversion failed: {str(e)}")
 
+@app.get("/api/professional/convert/jobs")
+async def list_conversion_jobs():
+    """
+    Conversion jobs, newest first
+    """
+    try:
+        return {
+            "success": True,
+            "jobs": [job.to_dict() for job in document_conversion_queue.list_jobs()],
+            "queue": document_conversion_queue.get_cache_stats(),
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        logger.error(f"❌ Conversion job listing failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/professional/convert/jobs/{job_id}")
+async def get_conversion_job(job_id: str):
+    """
+    Status and progress of one conversion job
+    """
+    job = document_conversion_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Conversion job not found")
+    return job.to_dict()
+
+@app.get("/api/professional/convert/jobs/{job_id}/download")
+async def download_conversion_job(job_id: str):
+    """
+    Download the document produced by a completed conversion job
+    """
+    try:
+        from fastapi.responses import FileResponse
+        
+        job = document_conversion_queue.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Conversion job not found")
+        if job.status != "completed":
+            raise HTTPException(status_code=409, detail=f"Conversion job is {job.status}")
+        if not job.file_path or not os.path.exists(job.file_path):
+            raise HTTPException(status_code=404, detail="File not found")
+        
+        filename = os.path.basename(job.file_path)
+        logger.info(f"📥 Serving {job.format.upper()} document download: {filename}")
+        
+        return FileResponse(path=job.file_path, filename=filename, media_type=MEDIA_TYPES[job.format])
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Conversion download failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Download failed: {e}")
+
 @app.get("/api/download/word")
 async def download_word_document(file_path: str):
     """
@@ -1871,6 +1758,40 @@ async def download_word_document(file_path: str):
             detail=f"Download failed: {e}"
         )
 
+@app.get("/api/reports/archive")
+async def list_archived_reports(ticker: str = None, rating: str = None, since: str = None, limit: int = 50):
+    """
+    List archived reports (newest first), optionally by ticker, rating or ISO date
+    """
+    try:
+        reports = report_archive.list_reports(ticker=ticker, rating=rating, since=since, limit=min(max(limit, 1), 500))
+        return {
+            "success": True,
+            "reports": [report.to_dict() for report in reports],
+            "count": len(reports),
+            "archive": report_archive.get_cache_stats(),
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        logger.error(f"❌ Report archive listing failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/reports/archive/{report_id}", response_class=HTMLResponse)
+async def get_archived_report(report_id: int):
+    """
+    Archived report HTML, served without regenerating it
+    """
+    try:
+        html = await asyncio.to_thread(report_archive.get, report_id)
+        if html is None:
+            raise HTTPException(status_code=404, detail="Report not found")
+        return HTMLResponse(content=html)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Archived report fetch failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/api/download/pdf")
 async def download_pdf_document(file_path: str):
     """
@@ -1924,7 +1845,7 @@ async def handle_bulk_analysis_streaming(websocket: WebSocket, connection_id: st
         company_ticker = message.get('company_ticker', '')
         
         if not files_data or not company_ticker:
-            await websocket.send_text(json.dumps({
+            await websocket.send_text(dumps({
                 "type": "bulk_analysis_error",
                 "data": {"error": "Missing files or company ticker"}
             }))
@@ -1935,7 +1856,7 @@ async def handle_bulk_analysis_streaming(websocket: WebSocket, connection_id: st
         # Note: API key validation now handled by intelligent key system in bulk processor
         
         # Send initial confirmation
-        await websocket.send_text(json.dumps({
+        await websocket.send_text(dumps({
             "type": "bulk_analysis_initiated",
             "data": {
                 "connection_id": connection_id,
@@ -1970,7 +1891,7 @@ async def handle_bulk_analysis_streaming(websocket: WebSocket, connection_id: st
         session = await bulk_processor.get_session_status(session_id)
         if session and session.status == "failed":
             # Analysis failed, send error instead of completion
-            await websocket.send_text(json.dumps({
+            await websocket.send_text(dumps({
                 "type": "bulk_analysis_error",
                 "data": {
                     "error": session.error_message or "Analysis failed with unknown error",
@@ -1980,7 +1901,7 @@ async def handle_bulk_analysis_streaming(websocket: WebSocket, connection_id: st
             }))
         else:
             # Send completion
-            await websocket.send_text(json.dumps({
+            await websocket.send_text(dumps({
                 "type": "bulk_analysis_completed",
                 "data": {
                     "session_id": session_id,
@@ -1991,7 +1912,7 @@ async def handle_bulk_analysis_streaming(websocket: WebSocket, connection_id: st
         
     except Exception as e:
         logger.error(f"❌ Bulk analysis streaming error for {connection_id}: {e}")
-        await websocket.send_text(json.dumps({
+        await websocket.send_text(dumps({
             "type": "bulk_analysis_error",
             "data": {
                 "error": f"Bulk analysis failed: {str(e)}",
@@ -2006,7 +1927,13 @@ async def _build_enhanced_report_prompt(
     template_content: str,
     report_focus: str = "comprehensive"
 ) -> str:
-    """Build enhanced prompt with all analyst outputs and template example"""
+    """
+    Build enhanced prompt with all analyst outputs and template example
+
+    The CSS rules and the one-shot template form a company-independent
+    prefix (rendered once per template through the prompt registry) so it
+    can be referenced as a cached context; company and analyst content follow.
+    """
     
     # Extract analysis content from each agent
     agent_analyses = []
@@ -2018,40 +1945,16 @@ async def _build_enhanced_report_prompt(
                 'timestamp': analysis.get('timestamp', '')
             })
     
-    # Build comprehensive prompt with template example and all analyst outputs
-    prompt = f"""
-# ROBECO INVESTMENT REPORT CONTENT GENERATION
-
-You are generating ONLY THE CONTENT PART of a professional investment report for **{company_name} ({ticker})**.
+    # Shared prefix: fixed CSS rules + one-shot template example
+    prompt = prompt_registry.render("report.content_generation", template_content)
 
-## CRITICAL: CSS IS 100% FIXED - NO STYLING ALLOWED
-
-We already have 100% fixed CSS code at 'Report Example/CSScode.txt'. 
-**ABSOLUTELY NO CSS, STYLING, OR INLINE STYLES ALLOWED.**
-**GENERATE ONLY PURE HTML CONTENT WITH CLASS NAMES - NO STYLE ATTRIBUTES.**
-
-**FORBIDDEN - DO NOT GENERATE:**
-- NO `style="..."` attributes anywhere
-- NO CSS styling code
-- NO color definitions  
-- NO inline styling
-- NO `<style>` tags
-- NO styling properties
-
-**ALLOWED - ONLY GENERATE:**
-- Pure HTML content with class names
-- Text content and data
-- HTML structure using existing classes
-
-## ONE-SHOT TEMPLATE EXAMPLE
-
-Here is the complete Robeco Investment Case Template showing the structure you should follow for content organization:
+    # Company-specific part and all analyst outputs
+    prompt += f"""
+## TARGET COMPANY: {company_name} ({ticker})
 
-```html
-{template_content}
-```
+You are generating ONLY THE CONTENT PART of a professional investment report for **{company_name} ({ticker})**.
 
-**EXTRACT ONLY THE CONTENT STRUCTURE** from this template (ignore all CSS/styling) and generate similar content for {company_name}.
+**EXTRACT ONLY THE CONTENT STRUCTURE** from the template above (ignore all CSS/styling) and generate similar content for {company_name}.
 
 ## ALL SPECIALIST ANALYST OUTPUTS
 
@@ -2174,6 +2077,7 @@ async def handle_report_generation(websocket: WebSocket, connection_id: str, mes
         investment_objective = data.get('investment_objective', '')
         user_query = data.get('user_query', '')
         data_sources = data.get('data_sources', {})
+        call_mode = data.get('call_mode')  # sequential / prerated / speculative / slides (default ROBECO_REPORT_CALL_MODE)
         
         logger.info(f"📊 Starting report generation for {company} ({ticker}) - Focus: {report_focus}")
         logger.info(f"📋 Received analyses data: {list(analyses_data.keys()) if analyses_data else 'NONE'}")
@@ -2189,13 +2093,17 @@ async def handle_report_generation(websocket: WebSocket, connection_id: str, mes
         # Check if there's an existing report for this session
         if session_id in session_reports:
             existing_report = session_reports[session_id]
+            existing_content = None
             if existing_report.get('status') == 'completed':
+                existing_content = existing_report.get('content') or await asyncio.to_thread(report_archive.get, existing_report.get('archive_id'))
+            if existing_content:
                 logger.info(f"🔄 Found completed report for session {session_id}, sending existing content")
                 await send_websocket_safe(websocket, {
                     "type": "report_generation_complete",
                     "data": {
                         "status": "completed",
-                        "report_content": existing_report['content'],
+                        "report_content": existing_content,
+                        "archive_id": existing_report.get('archive_id'),
                         "message": "✅ Report restored from previous generation",
                         "progress": 100,
                         "connection_id": connection_id,
@@ -2232,15 +2140,10 @@ async def handle_report_generation(websocket: WebSocket, connection_id: str, mes
             # Use existing analyses data to generate template-based report with enhanced prompt
             logger.info(f"📋 Using {len(analyses_data)} stored analyses for report generation")
             
-            # Load the Robeco template as one-shot example
+            # Load the Robeco template as one-shot example (shared, loaded once per file version)
             template_content = ""
             try:
-                # Use relative path from project root
-                current_file = Path(__file__)
-                project_root = current_file.parent.parent.parent.parent  # Go up from backend/src/robeco/ to root
-                template_path = project_root / "Report Example" / "Robeco_InvestmentCase_Template.txt"
-                with open(template_path, 'r', encoding='utf-8') as f:
-                    template_content = f.read()
+                template_content = report_assets.template()
                 logger.info(f"✅ Loaded Robeco template: {len(template_content)} characters")
             except Exception as e:
                 logger.warning(f"⚠️ Could not load template file: {e}")
@@ -2256,7 +2159,7 @@ async def handle_report_generation(websocket: WebSocket, connection_id: str, mes
             )
             
             # Generate report using the template system with streaming updates
-            report_content = await generate_report_with_streaming(
+            report_content, archive_id = await generate_report_with_streaming(
                 websocket=websocket,
                 connection_id=connection_id,
                 company_name=company,
@@ -2265,7 +2168,8 @@ async def handle_report_generation(websocket: WebSocket, connection_id: str, mes
                 report_focus=report_focus,
                 investment_objective=investment_objective,
                 user_query=user_query,
-                data_sources=data_sources
+                data_sources=data_sources,
+                call_mode=call_mode
             )
             
         else:
@@ -2273,7 +2177,7 @@ async def handle_report_generation(websocket: WebSocket, connection_id: str, mes
             logger.info(f"🏗️ No stored analyses found - generating comprehensive investment report for {company} using financial data")
             
             # Send progress update
-            await websocket.send_text(json.dumps({
+            await websocket.send_text(dumps({
                 "type": "report_generation_progress",
                 "data": {
                     "status": "ai_generating",
@@ -2286,18 +2190,14 @@ async def handle_report_generation(websocket: WebSocket, connection_id: str, mes
             # Load the Robeco template for comprehensive report structure
             template_content = ""
             try:
-                current_file = Path(__file__)
-                project_root = current_file.parent.parent.parent.parent
-                template_path = project_root / "Report Example" / "Robeco_InvestmentCase_Template.txt"
-                with open(template_path, 'r', encoding='utf-8') as f:
-                    template_content = f.read()
+                template_content = report_assets.template()
                 logger.info(f"✅ Loaded Robeco template for comprehensive report: {len(template_content)} characters")
             except Exception as e:
                 logger.warning(f"⚠️ Could not load template file: {e}")
                 template_content = "Template not available"
             
             # Generate report using the same system, just with empty analyses data
-            report_content = await generate_report_with_streaming(
+            report_content, archive_id = await generate_report_with_streaming(
                 websocket=websocket,
                 connection_id=connection_id,
                 company_name=company,
@@ -2306,7 +2206,8 @@ async def handle_report_generation(websocket: WebSocket, connection_id: str, mes
                 report_focus=report_focus,
                 investment_objective=investment_objective,
                 user_query=user_query,
-                data_sources=data_sources
+                data_sources=data_sources,
+                call_mode=call_mode
             )
         
         # The template_report_generator already returns complete HTML with CSS
@@ -2317,22 +2218,24 @@ async def handle_report_generation(websocket: WebSocket, connection_id: str, mes
         logger.info(f"🔍 DEBUG: report_content length: {len(report_content) if report_content else 'None'}")
         logger.info(f"🔍 DEBUG: final_report_html length: {len(final_report_html) if final_report_html else 'None'}")
         
-        # Save completed report to session state
+        # Save completed report to session state - the generator archived it, so only its id is kept
         if session_id in session_reports:
             session_reports[session_id].update({
                 "status": "completed",
-                "content": final_report_html,
-                "raw_content": report_content,
+                "archive_id": archive_id,
+                "content": None if archive_id else final_report_html,
                 "completion_time": datetime.now().isoformat(),
                 "progress": 100
             })
-            logger.info(f"💾 Saved completed report for session {session_id}")
+            logger.info(f"💾 Saved completed report for session {session_id} (archive #{archive_id})")
         
         await send_websocket_safe(websocket, {
             "type": "report_generation_completed",
             "data": {
+                # report_html is also the raw content (the generator returns the complete HTML),
+                # so the 150K+ document is sent once
                 "report_html": final_report_html,
-                "raw_content": report_content,
+                "archive_id": archive_id,
                 "ticker": ticker,
                 "company_name": company,
                 "template_used": "Robeco Professional Template",
@@ -2353,7 +2256,7 @@ async def handle_report_generation(websocket: WebSocket, connection_id: str, mes
         logger.error(f"❌ Full traceback: {traceback.format_exc()}")
         
         # Send error message
-        await websocket.send_text(json.dumps({
+        await websocket.send_text(dumps({
             "type": "report_generation_error",
             "data": {
                 "error": f"Report generation failed: {str(e)}",
@@ -2489,9 +2392,10 @@ async def generate_report_with_streaming(
     report_focus: str = "comprehensive",
     investment_objective: str = None,
     user_query: str = None,
-    data_sources: Dict = None
-) -> str:
-    """Generate report with real-time streaming updates to frontend"""
+    data_sources: Dict = None,
+    call_mode: str = None
+) -> Tuple[str, Optional[int]]:
+    """Generate report with real-time streaming updates to frontend; returns the HTML and its archive id"""
     
     from robeco.backend.template_report_generator import RobecoTemplateReportGenerator
     
@@ -2500,7 +2404,7 @@ async def generate_report_with_streaming(
     total_chunks = 0
     
     # Send initial status
-    await websocket.send_text(json.dumps({
+    await websocket.send_text(dumps({
         "type": "report_generation_progress",
         "data": {
             "status": "initializing",
@@ -2516,7 +2420,7 @@ async def generate_report_with_streaming(
         generator = RobecoTemplateReportGenerator()
         
         # Send template loading status
-        await websocket.send_text(json.dumps({
+        await websocket.send_text(dumps({
             "type": "report_generation_progress",
             "data": {
                 "status": "template_loading",
@@ -2530,7 +2434,7 @@ async def generate_report_with_streaming(
         # Fetch yfinance data for the company
         financial_data = {}
         try:
-            await websocket.send_text(json.dumps({
+            await websocket.send_text(dumps({
                 "type": "report_generation_progress",
                 "data": {
                     "status": "fetching_data",
@@ -2541,47 +2445,15 @@ async def generate_report_with_streaming(
                 }
             }))
             
-            stock = yf.Ticker(ticker)
-            
-            # Get financial statements in the correct format for the template generator
-            financials_df = stock.financials if hasattr(stock, 'financials') else None
-            balance_sheet_df = stock.balance_sheet if hasattr(stock, 'balance_sheet') else None
-            cashflow_df = stock.cashflow if hasattr(stock, 'cashflow') else None
-            
-            # Convert DataFrames to the expected annual format with proper date keys
-            income_statement_annual = {}
-            balance_sheet_annual = {}
-            cashflow_annual = {}
-            
-            if financials_df is not None and not financials_df.empty:
-                for date_col in financials_df.columns:
-                    date_str = date_col.strftime('%Y-%m-%d') if hasattr(date_col, 'strftime') else str(date_col)
-                    income_statement_annual[date_str] = financials_df[date_col].to_dict()
-            
-            if balance_sheet_df is not None and not balance_sheet_df.empty:
-                for date_col in balance_sheet_df.columns:
-                    date_str = date_col.strftime('%Y-%m-%d') if hasattr(date_col, 'strftime') else str(date_col)
-                    balance_sheet_annual[date_str] = balance_sheet_df[date_col].to_dict()
-                    
-            if cashflow_df is not None and not cashflow_df.empty:
-                for date_col in cashflow_df.columns:
-                    date_str = date_col.strftime('%Y-%m-%d') if hasattr(date_col, 'strftime') else str(date_col)
-                    cashflow_annual[date_str] = cashflow_df[date_col].to_dict()
-            
-            financial_data = {
-                'info': stock.info,
-                'history': stock.history(period="5y", interval="1mo").to_dict() if hasattr(stock, 'history') else {},
-                'income_statement_annual': income_statement_annual,
-                'balance_sheet_annual': balance_sheet_annual,
-                'cashflow_annual': cashflow_annual
-            }
+            # Shared snapshot: statements already pulled for the analysis are reused
+            financial_data = await generator.fetch_financial_data(ticker)
             logger.info(f"✅ Fetched yfinance data for {ticker}: {len(str(financial_data)):,} characters")
         except Exception as e:
             logger.warning(f"⚠️ Could not fetch yfinance data for {ticker}: {e}")
             financial_data = {"error": f"Could not fetch data: {e}"}
 
         # Send AI generation start
-        await websocket.send_text(json.dumps({
+        await websocket.send_text(dumps({
             "type": "report_generation_progress",
             "data": {
                 "status": "ai_generating",
@@ -2605,7 +2477,8 @@ async def generate_report_with_streaming(
             financial_data=financial_data,
             investment_objective=investment_objective,
             user_query=user_query,
-            data_sources=data_sources
+            data_sources=data_sources,
+            call_mode=call_mode
         )
         
         logger.info(f"🔍 DEBUG: generate_report_with_websocket_streaming completed, content length: {len(report_content) if report_content else 'None'}")
@@ -2623,13 +2496,13 @@ async def generate_report_with_streaming(
         })
         
         logger.info(f"✅ Streaming report generation completed: {len(report_content):,} characters in {total_chunks} chunks")
-        return report_content
+        return report_content, generator.last_archive_id
         
     except Exception as e:
         logger.error(f"❌ Streaming report generation failed: {e}")
         
         # Send error status
-        await websocket.send_text(json.dumps({
+        await websocket.send_text(dumps({
             "type": "report_generation_progress",
             "data": {
                 "status": "error",
@@ -2643,7 +2516,7 @@ async def generate_report_with_streaming(
 
 
 async def handle_word_report_generation(websocket: WebSocket, connection_id: str, message: Dict):
-    """Handle Word document generation from HTML report"""
+    """Queue Word document generation from HTML report; progress is streamed as word_generation_* messages"""
     
     try:
         # Extract parameters
@@ -2654,69 +2527,28 @@ async def handle_word_report_generation(websocket: WebSocket, connection_id: str
         
         logger.info(f"📄 Starting Word report generation for {company_name} ({ticker})")
         
-        if not html_content:
-            raise ValueError("No HTML content provided for Word conversion")
-        
-        # Send start notification
-        await websocket.send_text(json.dumps({
-            "type": "word_generation_started",
-            "data": {
-                "ticker": ticker,
-                "company_name": company_name,
-                "message": f"📄 Converting HTML report to Word document for {company_name}...",
-                "timestamp": datetime.now().isoformat()
-            }
-        }))
-        
-        # Send progress update
-        await websocket.send_text(json.dumps({
-            "type": "word_generation_progress",
-            "data": {
-                "status": "parsing_html",
-                "message": "🔍 Parsing HTML content and extracting structure...",
-                "progress": 20,
-                "timestamp": datetime.now().isoformat()
-            }
-        }))
-        
-        # Generate Word document
-        output_path = await word_report_generator.convert_html_to_word(
-            html_content=html_content,
-            company_name=company_name,
-            ticker=ticker
-        )
-        
-        # Send progress update
-        await websocket.send_text(json.dumps({
-            "type": "word_generation_progress", 
-            "data": {
-                "status": "converting_styles",
-                "message": "🎨 Converting CSS styles to Word formatting...",
-                "progress": 60,
-                "timestamp": datetime.now().isoformat()
-            }
-        }))
-        
-        # Send completion notification
-        await websocket.send_text(json.dumps({
-            "type": "word_generation_completed",
-            "data": {
-                "ticker": ticker,
-                "company_name": company_name,
-                "file_path": output_path,
-                "message": f"✅ Word document generated successfully for {company_name}",
-                "download_url": f"/api/download/word?file_path={output_path}",
-                "timestamp": datetime.now().isoformat()
-            }
-        }))
+        async def notify(job: ConversionJob):
+            job_data = job.to_dict()
+            if job.status == "queued":
+                message_type = "word_generation_started"
+                job_data["message"] = f"📄 Converting HTML report to Word document for {company_name}..."
+            elif job.status == "completed":
+                message_type = "word_generation_completed"
+            elif job.status == "failed":
+                message_type = "word_generation_error"
+            else:
+                message_type = "word_generation_progress"
+            await send_websocket_safe(websocket, {"type": message_type, "data": job_data})
         
-        logger.info(f"✅ Word document generated: {output_path}")
+        # Returns at once: the conversion runs in the background, so this connection keeps streaming
+        job = document_conversion_queue.submit("word", html_content, company_name, ticker, on_progress=notify)
+        logger.info(f"📄 Word conversion job {job.job_id} queued for {ticker}")
         
     except Exception as e:
         logger.error(f"❌ Word generation failed: {e}")
         
         # Send error notification
-        await websocket.send_text(json.dumps({
+        await websocket.send_text(dumps({
             "type": "word_generation_error",
             "data": {
                 "error": str(e),
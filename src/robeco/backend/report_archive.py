@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Report Archive
+Versioned store of generated reports with a SQLite index
+
+Every finished report is kept as a gzip-compressed blob named by its
+content hash (identical reports share one blob) and indexed in SQLite by
+ticker, version, creation time, investment rating and prompt version.
+Past reports can be listed and loaded without regenerating them; the most
+recently used ones are held in memory. Storage is bounded: once the blobs
+exceed the size limit the oldest reports are dropped, but the latest
+report of every ticker is always kept.
+
+Environment:
+    ROBECO_REPORT_ARCHIVE_DIR      archive directory (default <project>/reports/archive)
+    ROBECO_REPORT_ARCHIVE_MAX_MB   compressed storage limit in MB (default 512)
+    ROBECO_REPORT_ARCHIVE_CACHE    reports kept in memory (default 16)
+"""
+
+import gzip
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ARCHIVE_DIR = Path(__file__).resolve().parent.parent.parent.parent / "reports" / "archive"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ticker TEXT NOT NULL,
+    company_name TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    rating TEXT,
+    prompt_version TEXT,
+    content_hash TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    compressed_size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_reports_ticker ON reports (ticker, version);
+CREATE INDEX IF NOT EXISTS idx_reports_created ON reports (created_at);
+CREATE INDEX IF NOT EXISTS idx_reports_hash ON reports (content_hash);
+"""
+
+_COLUMNS = "id, ticker, company_name, version, created_at, rating, prompt_version, content_hash, size, compressed_size"
+
+
+@dataclass(frozen=True)
+class ArchivedReport:
+    """Index entry of an archived report"""
+    id: int
+    ticker: str
+    company_name: str
+    version: int
+    created_at: str
+    rating: Optional[str]
+    prompt_version: Optional[str]
+    content_hash: str
+    size: int
+    compressed_size: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def content_hash(html: str) -> str:
+    return hashlib.sha256(html.encode("utf-8")).hexdigest()
+
+
+class ReportArchive:
+    """
+    SQLite-indexed, compressed report store with an in-memory LRU of hot reports
+
+    Usage:
+        entry = report_archive.save(html, "Arista Networks", "ANET", rating="OVERWEIGHT")
+        report_archive.list_reports(ticker="ANET")
+        html = report_archive.get(entry.id)
+    """
+
+    def __init__(self, base_dir: Path = DEFAULT_ARCHIVE_DIR, max_bytes: int = 512 * 1024 * 1024,
+                 max_cached_reports: int = 16):
+        self.base_dir = Path(base_dir)
+        self.blob_dir = self.base_dir / "blobs"
+        self.index_path = self.base_dir / "index.sqlite3"
+        self.max_bytes = max_bytes
+        self.max_cached_reports = max_cached_reports
+        self._hot: "OrderedDict[int, str]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._db: Optional[sqlite3.Connection] = None
+        self.stats = {"saved": 0, "hits": 0, "loads": 0, "pruned": 0}
+
+    def _connection(self) -> sqlite3.Connection:
+        # Opened on first use so importing the module never touches the disk
+        if self._db is None:
+            self.blob_dir.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.index_path), check_same_thread=False)
+            self._db.executescript(_SCHEMA)
+        return self._db
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.blob_dir / f"{digest}.html.gz"
+
+    @staticmethod
+    def _entry(row) -> ArchivedReport:
+        return ArchivedReport(*row)
+
+    def save(self, html: str, company_name: str, ticker: str, rating: Optional[str] = None,
+             prompt_version: Optional[str] = None) -> ArchivedReport:
+        """Archive a report as the next version for ``ticker``"""
+        digest = content_hash(html)
+        blob_path = self._blob_path(digest)
+        data = html.encode("utf-8")
+
+        with self._lock:
+            db = self._connection()
+            if not blob_path.exists():
+                # Write then rename, so a crash never leaves a truncated blob behind
+                temp_path = blob_path.with_suffix(".tmp")
+                temp_path.write_bytes(gzip.compress(data, compresslevel=6))
+                os.replace(temp_path, blob_path)
+            compressed_size = blob_path.stat().st_size
+
+            ticker = ticker.upper()
+            version = db.execute("SELECT COALESCE(MAX(version), 0) + 1 FROM reports WHERE ticker = ?", (ticker,)).fetchone()[0]
+            with db:
+                cursor = db.execute(
+                    "INSERT INTO reports (ticker, company_name, version, created_at, rating, prompt_version, "
+                    "content_hash, size, compressed_size) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (ticker, company_name, version, datetime.now().isoformat(timespec="seconds"), rating,
+                     prompt_version, digest, len(data), compressed_size)
+                )
+            entry = self.get_entry(cursor.lastrowid)
+            self._remember(entry.id, html)
+            self.stats["saved"] += 1
+            logger.info(f"🗄️ Archived {ticker} report v{version} (#{entry.id}): {len(data):,} bytes -> {compressed_size:,} compressed")
+
+            self.prune()
+            return entry
+
+    def get_entry(self, report_id: int) -> Optional[ArchivedReport]:
+        with self._lock:
+            row = self._connection().execute(f"SELECT {_COLUMNS} FROM reports WHERE id = ?", (report_id,)).fetchone()
+        return self._entry(row) if row else None
+
+    def get(self, report_id: int) -> Optional[str]:
+        """Report HTML, from memory when recently used"""
+        with self._lock:
+            html = self._hot.get(report_id)
+            if html is not None:
+                self._hot.move_to_end(report_id)
+                self.stats["hits"] += 1
+                return html
+
+            entry = self.get_entry(report_id)
+            if entry is None:
+                return None
+            try:
+                html = gzip.decompress(self._blob_path(entry.content_hash).read_bytes()).decode("utf-8")
+            except FileNotFoundError:
+                logger.warning(f"⚠️ Archived report #{report_id} has no blob ({entry.content_hash[:12]})")
+                return None
+            self._remember(report_id, html)
+            self.stats["loads"] += 1
+            return html
+
+    def _remember(self, report_id: int, html: str):
+        self._hot[report_id] = html
+        self._hot.move_to_end(report_id)
+        while len(self._hot) > self.max_cached_reports:
+            self._hot.popitem(last=False)
+
+    def list_reports(self, ticker: Optional[str] = None, rating: Optional[str] = None,
+                     since: Optional[str] = None, limit: int = 50) -> List[ArchivedReport]:
+        """Index entries, newest first, filtered by ticker / rating / ISO date"""
+        clauses, params = [], []
+        if ticker:
+            clauses.append("ticker = ?")
+            params.append(ticker.upper())
+        if rating:
+            clauses.append("rating = ?")
+            params.append(rating.upper())
+        if since:
+            clauses.append("created_at >= ?")
+            params.append(since)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._connection().execute(
+                f"SELECT {_COLUMNS} FROM reports {where} ORDER BY id DESC LIMIT ?", (*params, limit)
+            ).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def latest(self, ticker: str) -> Optional[ArchivedReport]:
+        reports = self.list_reports(ticker=ticker, limit=1)
+        return reports[0] if reports else None
+
+    def find_by_content(self, html: str) -> Optional[ArchivedReport]:
+        """Newest archived report with exactly this HTML"""
+        with self._lock:
+            row = self._connection().execute(
+                f"SELECT {_COLUMNS} FROM reports WHERE content_hash = ? ORDER BY id DESC LIMIT 1", (content_hash(html),)
+            ).fetchone()
+        return self._entry(row) if row else None
+
+    def prune(self) -> int:
+        """Drop the oldest reports (never a ticker's latest) until blobs fit in ``max_bytes``"""
+        with self._lock:
+            db = self._connection()
+            total = db.execute(
+                "SELECT COALESCE(SUM(compressed_size), 0) FROM (SELECT DISTINCT content_hash, compressed_size FROM reports)"
+            ).fetchone()[0]
+            if total <= self.max_bytes:
+                return 0
+
+            candidates = db.execute(
+                "SELECT id, content_hash, compressed_size FROM reports "
+                "WHERE id NOT IN (SELECT MAX(id) FROM reports GROUP BY ticker) ORDER BY id"
+            ).fetchall()
+            removed = 0
+            for report_id, digest, compressed_size in candidates:
+                if total <= self.max_bytes:
+                    break
+                with db:
+                    db.execute("DELETE FROM reports WHERE id = ?", (report_id,))
+                self._hot.pop(report_id, None)
+                removed += 1
+                # A blob shared with a newer report stays
+                if not db.execute("SELECT 1 FROM reports WHERE content_hash = ? LIMIT 1", (digest,)).fetchone():
+                    self._blob_path(digest).unlink(missing_ok=True)
+                    total -= compressed_size
+
+            self.stats["pruned"] += removed
+            logger.info(f"🧹 Report archive pruned {removed} old reports ({total:,} bytes kept)")
+            return removed
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            db = self._connection()
+            reports = db.execute("SELECT COUNT(*) FROM reports").fetchone()[0]
+            stored = db.execute(
+                "SELECT COALESCE(SUM(compressed_size), 0) FROM (SELECT DISTINCT content_hash, compressed_size FROM reports)"
+            ).fetchone()[0]
+        return {**self.stats, "reports": reports, "compressed_bytes": stored, "hot_reports": len(self._hot)}
+
+
+def create_report_archive_from_env() -> ReportArchive:
+    return ReportArchive(
+        base_dir=Path(os.getenv("ROBECO_REPORT_ARCHIVE_DIR", str(DEFAULT_ARCHIVE_DIR))),
+        max_bytes=int(float(os.getenv("ROBECO_REPORT_ARCHIVE_MAX_MB", "512")) * 1024 * 1024),
+        max_cached_reports=int(os.getenv("ROBECO_REPORT_ARCHIVE_CACHE", "16"))
+    )
+
+
+# Shared by the report generator and the streaming server
+report_archive = create_report_archive_from_env()
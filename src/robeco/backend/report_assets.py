@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Report Template Assets
+Load the Robeco report template and fixed CSS once per file version
+
+The one-shot template (Robeco_InvestmentCase_Template.txt) and the fixed CSS
+document (CSScode.txt) are read, parsed and indexed once and handed out as
+shared strings, together with the pieces the report pipeline slices out of
+them (the <style> block streamed to the client and the document head used
+to wrap the generated slides). A file is re-read only when its mtime or
+size changes, so edits under Report Example/ apply without a restart.
+"""
+
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+REPORT_EXAMPLE_DIR = Path(__file__).resolve().parent.parent.parent.parent / "Report Example"
+TEMPLATE_FILENAME = "Robeco_InvestmentCase_Template.txt"
+CSS_FILENAME = "CSScode.txt"
+
+
+@dataclass(frozen=True)
+class CssAsset:
+    """CSScode.txt and the parts sliced out of it"""
+    document: str      # Full HTML document with the fixed CSS
+    style_block: str   # "<style>...</style>" sent to the client before slides stream
+    head_section: str  # Everything up to and including <body>
+
+
+def _parse_css_document(document: str) -> CssAsset:
+    css_start = document.find('<style>') + len('<style>')
+    css_end = document.find('</style>')
+    if css_start > len('<style>') - 1 and css_end != -1:
+        style_block = f"<style>\n{document[css_start:css_end].strip()}\n</style>"
+    else:
+        style_block = "<style>\n/* CSS extraction failed */\n</style>"
+
+    body_start = document.find('<body>')
+    return CssAsset(document=document, style_block=style_block, head_section=document[:body_start + 6])
+
+
+class ReportAssetRegistry:
+    """Caches parsed report assets keyed on file mtime"""
+
+    def __init__(self, base_dir: Path = REPORT_EXAMPLE_DIR):
+        self.template_path = Path(base_dir) / TEMPLATE_FILENAME
+        self.css_path = Path(base_dir) / CSS_FILENAME
+        self._assets: Dict[Path, Tuple[Tuple[int, int], Any]] = {}
+        self._lock = threading.Lock()
+        self.stats = {"loads": 0, "hits": 0}
+
+    def _get(self, path: Path, parse: Callable[[str], Any]) -> Any:
+        stat = os.stat(path)  # raises if the file is missing, like open() did
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._assets.get(path)
+        if cached and cached[0] == version:
+            self.stats["hits"] += 1
+            return cached[1]
+
+        with self._lock:
+            cached = self._assets.get(path)
+            if cached and cached[0] == version:
+                return cached[1]
+            with open(path, 'r', encoding='utf-8') as f:
+                asset = parse(f.read())
+            self._assets[path] = (version, asset)
+            self.stats["loads"] += 1
+            logger.info(f"📄 Loaded report asset {path.name} ({stat.st_size:,} bytes)")
+            return asset
+
+    def template(self) -> str:
+        """The one-shot Robeco investment case template"""
+        return self._get(self.template_path, str)
+
+    def css(self) -> CssAsset:
+        """The fixed CSS document and its parsed parts"""
+        return self._get(self.css_path, _parse_css_document)
+
+    def head_section(self, company_name: str, ticker: str) -> str:
+        """Document head (through <body>) with the template company swapped for ``company_name``"""
+        return self.css().head_section.replace(
+            'Robeco - IHI Investment Analysis',
+            f'Robeco - {company_name} Investment Analysis'
+        ).replace(
+            'IHI Corporation', company_name
+        ).replace(
+            '7013 JT', ticker
+        )
+
+    def clear(self):
+        with self._lock:
+            self._assets.clear()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "cached_assets": [path.name for path in self._assets]}
+
+
+# Shared by the report generator and the streaming server
+report_assets = ReportAssetRegistry()
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Report Chart Rasterizer
+In-process PNG rendering of the report's stock price chart SVG
+
+The Word export used to start Node and a headless browser for every chart
+just to screenshot an SVG that _pre_calculate_chart_svg and the report
+template generated themselves: axes and grid lines, a price polyline, a
+current price marker and text labels. This module draws exactly that subset
+(line, polyline, polygon, rect, circle and text, with stroke / fill colours,
+stroke widths, dash arrays and text anchors) with Pillow and returns the
+PNG bytes in memory. There are no subprocesses or temp files. Drawing is
+supersampled and then downscaled, so the lines are anti-aliased. Rendered
+images are cached by the hash of the SVG markup, so exporting the same
+report again reuses its chart.
+
+An SVG containing anything outside that subset (paths, transforms,
+embedded images) raises ChartRasterizeError so callers can fall back.
+
+Environment:
+    ROBECO_CHART_IMAGE_WIDTH   PNG width in pixels (default 1000)
+    ROBECO_CHART_IMAGE_CACHE   rendered charts kept in memory (default 64)
+"""
+
+import hashlib
+import html
+import io
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+
+logger = logging.getLogger(__name__)
+
+# Drawn at this multiple of the output size, then downscaled for anti-aliasing
+SUPERSAMPLE = 3
+
+# Browser defaults (sans-serif, Arial) first, then fonts found on most Linux hosts
+_FONT_FILES = {
+    False: ("arial.ttf", "Arial.ttf", "LiberationSans-Regular.ttf", "DejaVuSans.ttf"),
+    True: ("arialbd.ttf", "Arial Bold.ttf", "LiberationSans-Bold.ttf", "DejaVuSans-Bold.ttf"),
+}
+
+_SVG_OPEN = re.compile(r'<svg\b(?P<attrs>[^>]*)>', re.IGNORECASE)
+_COMMENT = re.compile(r'<!--.*?-->', re.DOTALL)
+_ELEMENT = re.compile(
+    r'<(?P<tag>[a-zA-Z][\w:-]*)\b(?P<attrs>[^>]*?)/?>(?:(?<!/>)(?P<text>[^<]*)</(?P=tag)\s*>)?'
+)
+_ATTRIBUTE = re.compile(r'(?P<name>[\w:-]+)\s*=\s*(?:"(?P<dq>[^"]*)"|\'(?P<sq>[^\']*)\')')
+_NUMBER = re.compile(r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+
+_SHAPES = {"line", "polyline", "polygon", "rect", "circle", "text"}
+# Structure that draws nothing by itself
+_IGNORED = {"svg", "g", "title", "desc", "defs", "tspan"}
+
+
+class ChartRasterizeError(ValueError):
+    """The SVG uses something the rasterizer cannot draw"""
+
+
+def _attributes(raw: str) -> Dict[str, str]:
+    # bs4's html.parser lowercases names (viewBox -> viewbox), so compare in lower case
+    attrs = {m.group('name').lower(): html.unescape(m.group('dq') if m.group('dq') is not None else m.group('sq'))
+             for m in _ATTRIBUTE.finditer(raw)}
+    # Inline style declarations override presentation attributes, as in a browser
+    for declaration in attrs.pop('style', '').split(';'):
+        name, _, value = declaration.partition(':')
+        if value.strip():
+            attrs[name.strip().lower()] = value.strip()
+    return attrs
+
+
+def _numbers(value: Optional[str]) -> List[float]:
+    return [float(number) for number in _NUMBER.findall(value or '')]
+
+
+def _number(attrs: Dict[str, str], name: str, default: float = 0.0) -> float:
+    numbers = _numbers(attrs.get(name))
+    return numbers[0] if numbers else default
+
+
+def _colour(value: Optional[str], default: Optional[str]) -> Optional[Tuple[int, int, int]]:
+    value = (value or default or 'none').strip()
+    if value.lower() in ('none', 'transparent'):
+        return None
+    try:
+        return ImageColor.getrgb(value)[:3]
+    except ValueError:
+        logger.debug(f"📊 Unknown SVG colour '{value}', using {default}")
+        return ImageColor.getrgb(default)[:3] if default and default != 'none' else None
+
+
+@lru_cache(maxsize=32)
+def _font(size: int, bold: bool):
+    for name in _FONT_FILES[bold]:
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    try:
+        return ImageFont.load_default(size)
+    except TypeError:  # Pillow < 10.1 has only the fixed-size bitmap font
+        return ImageFont.load_default()
+
+
+def _dashed(start: Tuple[float, float], end: Tuple[float, float], pattern: List[float]):
+    """Yield the drawn segments of a dashed straight line"""
+    (x1, y1), (x2, y2) = start, end
+    length = ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
+    if length == 0 or not pattern or sum(pattern) <= 0:
+        yield start, end
+        return
+    if len(pattern) % 2:
+        pattern = pattern * 2
+    position, index = 0.0, 0
+    while position < length:
+        segment_end = min(position + pattern[index % len(pattern)], length)
+        if index % 2 == 0:
+            yield ((x1 + (x2 - x1) * position / length, y1 + (y2 - y1) * position / length),
+                   (x1 + (x2 - x1) * segment_end / length, y1 + (y2 - y1) * segment_end / length))
+        position, index = segment_end, index + 1
+
+
+class _Canvas:
+    """Maps SVG user units onto a supersampled Pillow image"""
+
+    def __init__(self, view_box: Tuple[float, float, float, float], width: int):
+        self.min_x, self.min_y, view_width, view_height = view_box
+        self.width = width
+        self.height = max(1, round(width * view_height / view_width))
+        self.scale = width * SUPERSAMPLE / view_width
+        self.image = Image.new('RGB', (self.width * SUPERSAMPLE, self.height * SUPERSAMPLE), 'white')
+        self.draw = ImageDraw.Draw(self.image)
+
+    def point(self, x: float, y: float) -> Tuple[float, float]:
+        return (x - self.min_x) * self.scale, (y - self.min_y) * self.scale
+
+    def stroke_width(self, attrs: Dict[str, str]) -> int:
+        return max(1, round(_number(attrs, 'stroke-width', 1.0) * self.scale))
+
+    def polyline(self, points: List[Tuple[float, float]], attrs: Dict[str, str], closed: bool = False):
+        fill = _colour(attrs.get('fill'), 'black' if closed else 'none')
+        if closed and fill and len(points) >= 3:
+            self.draw.polygon([self.point(*p) for p in points], fill=fill)
+        stroke = _colour(attrs.get('stroke'), 'none')
+        if stroke is None or len(points) < 2:
+            return
+        if closed:
+            points = points + points[:1]
+        width = self.stroke_width(attrs)
+        dashes = _numbers(attrs.get('stroke-dasharray'))
+        if dashes:
+            for start, end in zip(points, points[1:]):
+                for a, b in _dashed(start, end, dashes):
+                    self.draw.line([self.point(*a), self.point(*b)], fill=stroke, width=width)
+        else:
+            self.draw.line([self.point(*p) for p in points], fill=stroke, width=width, joint='curve')
+
+    def rect(self, attrs: Dict[str, str]):
+        x, y = _number(attrs, 'x'), _number(attrs, 'y')
+        width, height = _number(attrs, 'width'), _number(attrs, 'height')
+        if width <= 0 or height <= 0:
+            return
+        fill = _colour(attrs.get('fill'), 'black')
+        stroke = _colour(attrs.get('stroke'), 'none')
+        self.draw.rectangle([self.point(x, y), self.point(x + width, y + height)], fill=fill, outline=stroke,
+                            width=self.stroke_width(attrs) if stroke else 0)
+
+    def circle(self, attrs: Dict[str, str]):
+        cx, cy = self.point(_number(attrs, 'cx'), _number(attrs, 'cy'))
+        radius = _number(attrs, 'r') * self.scale
+        if radius <= 0:
+            return
+        fill = _colour(attrs.get('fill'), 'black')
+        stroke = _colour(attrs.get('stroke'), 'none')
+        self.draw.ellipse([cx - radius, cy - radius, cx + radius, cy + radius], fill=fill, outline=stroke,
+                          width=self.stroke_width(attrs) if stroke else 0)
+
+    def text(self, attrs: Dict[str, str], content: str):
+        content = ' '.join(html.unescape(content).split())
+        if not content:
+            return
+        fill = _colour(attrs.get('fill'), 'black')
+        if fill is None:
+            return
+        size = max(1, round(_number(attrs, 'font-size', 16.0) * self.scale))
+        weight = attrs.get('font-weight', 'normal').lower()
+        font = _font(size, weight == 'bold' or (weight.isdigit() and int(weight) >= 600))
+        x, y = self.point(_number(attrs, 'x'), _number(attrs, 'y'))
+
+        anchor = {'middle': 'm', 'end': 'r'}.get(attrs.get('text-anchor', 'start').lower(), 'l')
+        if isinstance(font, ImageFont.FreeTypeFont):
+            # SVG text is positioned on its baseline
+            self.draw.text((x, y), content, font=font, fill=fill, anchor=anchor + 's')
+            return
+        left, top, right, bottom = self.draw.textbbox((0, 0), content, font=font)
+        offset = {'l': 0, 'm': (right - left) / 2, 'r': right - left}[anchor]
+        self.draw.text((x - offset, y - bottom), content, font=font, fill=fill)
+
+    def png(self) -> bytes:
+        image = self.image.resize((self.width, self.height), Image.LANCZOS)
+        output = io.BytesIO()
+        image.save(output, format='PNG', optimize=True)
+        return output.getvalue()
+
+
+def _view_box(svg_attrs: Dict[str, str]) -> Tuple[float, float, float, float]:
+    numbers = _numbers(svg_attrs.get('viewbox'))
+    if len(numbers) == 4 and numbers[2] > 0 and numbers[3] > 0:
+        return tuple(numbers)
+    # No viewBox: width / height in user units ("100%" is not usable)
+    width, height = _number(svg_attrs, 'width'), _number(svg_attrs, 'height')
+    if '%' in svg_attrs.get('width', '') or '%' in svg_attrs.get('height', '') or width <= 0 or height <= 0:
+        raise ChartRasterizeError("SVG has neither a viewBox nor an absolute width and height")
+    return 0.0, 0.0, width, height
+
+
+def render_chart_png(svg_markup: str, width: int = 1000) -> bytes:
+    """
+    Rasterize a report chart SVG to PNG bytes
+
+    Args:
+        svg_markup: The ``<svg>`` element, e.g. ``str()`` of a BeautifulSoup tag
+        width: Output width in pixels; the height follows the viewBox aspect ratio
+
+    Raises:
+        ChartRasterizeError: when the SVG contains elements that cannot be drawn
+    """
+    markup = _COMMENT.sub('', svg_markup)
+    svg_open = _SVG_OPEN.search(markup)
+    if svg_open is None:
+        raise ChartRasterizeError("No <svg> element found")
+    canvas = _Canvas(_view_box(_attributes(svg_open.group('attrs'))), width)
+
+    shapes = 0
+    for element in _ELEMENT.finditer(markup, svg_open.end()):
+        tag = element.group('tag').lower()
+        attrs = _attributes(element.group('attrs'))
+        if tag in _IGNORED:
+            continue
+        if tag not in _SHAPES:
+            raise ChartRasterizeError(f"Unsupported SVG element <{tag}>")
+        if 'transform' in attrs:
+            raise ChartRasterizeError(f"Unsupported transform on <{tag}>")
+
+        if tag == 'line':
+            canvas.polyline([(_number(attrs, 'x1'), _number(attrs, 'y1')), (_number(attrs, 'x2'), _number(attrs, 'y2'))],
+                            {'stroke': 'black', **attrs})
+        elif tag in ('polyline', 'polygon'):
+            numbers = _numbers(attrs.get('points'))
+            canvas.polyline(list(zip(numbers[0::2], numbers[1::2])), attrs, closed=tag == 'polygon')
+        elif tag == 'rect':
+            canvas.rect(attrs)
+        elif tag == 'circle':
+            canvas.circle(attrs)
+        else:
+            canvas.text(attrs, element.group('text') or '')
+        shapes += 1
+
+    if not shapes:
+        raise ChartRasterizeError("SVG contains nothing to draw")
+    return canvas.png()
+
+
+class ChartRasterizer:
+    """
+    Renders chart SVGs to PNG with an LRU cache keyed by the SVG's hash
+
+    Usage:
+        png = chart_rasterizer.rasterize(str(svg_tag))
+        run.add_picture(io.BytesIO(png), width=Inches(4.0))
+    """
+
+    def __init__(self, width: int = 1000, max_cached_images: int = 64):
+        self.width = width
+        self.max_cached_images = max_cached_images
+        self._images: "OrderedDict[str, bytes]" = OrderedDict()
+        # Word conversions may run on worker threads
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "errors": 0}
+
+    def rasterize(self, svg_markup: str) -> bytes:
+        key = hashlib.sha256(f"{self.width}:{svg_markup}".encode("utf-8")).hexdigest()
+        with self._lock:
+            png = self._images.get(key)
+            if png is not None:
+                self._images.move_to_end(key)
+                self.stats["hits"] += 1
+                return png
+
+        try:
+            png = render_chart_png(svg_markup, self.width)
+        except ChartRasterizeError:
+            self.stats["errors"] += 1
+            raise
+        with self._lock:
+            self.stats["misses"] += 1
+            self._images[key] = png
+            while len(self._images) > self.max_cached_images:
+                self._images.popitem(last=False)
+        return png
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self.stats, "cached_images": len(self._images),
+                    "cached_bytes": sum(len(png) for png in self._images.values())}
+
+
+def create_chart_rasterizer_from_env() -> ChartRasterizer:
+    return ChartRasterizer(
+        width=max(100, int(os.getenv("ROBECO_CHART_IMAGE_WIDTH", "1000"))),
+        max_cached_images=max(1, int(os.getenv("ROBECO_CHART_IMAGE_CACHE", "64")))
+    )
+
+
+# Shared by the Word export (in every conversion worker process)
+chart_rasterizer = create_chart_rasterizer_from_env()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Report HTML Sanitizer
+Single-pass cleanup of generated slide HTML
+
+Generated slides need two kinds of cleanup: document wrappers the model
+adds around the slides (DOCTYPE, <html>/<head>/<body> tags, <style> blocks,
+markdown code fences) and markdown formatting that leaks into the HTML
+(***bold italic***, **bold**, *italic*, # headers, - bullets). Instead of a
+separate regex pass (plus ``count`` calls) per pattern, every construct is
+an alternative of one precompiled tokenizer pattern and the content is
+rewritten in a single scan.
+
+<style> blocks are matched as a whole, so CSS selectors such as ``*`` are
+never mistaken for emphasis. Only the <html>, <head> and <body> tags are
+stripped - <header> elements are kept.
+"""
+
+import re
+from typing import Tuple
+
+# Every alternative starts with a literal ("<", "`", "*" or a newline for line-start
+# constructs), so the regex engine can skip straight to candidate positions
+_EMPHASIS_PATTERN = (
+    r'\*(?:\*\*(?P<bold_italic>[^\n]*?)\*\*\*'
+    r'|\*(?P<bold>[^\n]*?)\*\*'
+    r'|(?<!\*\*)(?P<italic>[^*\n]+?)\*(?!\*))'
+)
+
+_STYLE_PATTERN = r'<(?P<style>(?i:style\b[^>]*>[^<]*(?:<(?!/style>)[^<]*)*</style>))'
+_WRAPPER_PATTERN = (
+    r'|<(?P<wrapper>(?i:!DOCTYPE[^>]*>|/?(?:html|head|body)\b[^>]*>))'
+    r'|`(?P<fence>``(?i:html)?\s*)'
+)
+_MARKDOWN_PATTERN = (
+    r'|\n(?:(?P<bullets>[ \t]*-[ \t]+[^\n]+(?:\n[ \t]*-[ \t]+[^\n]+)*)'
+    r'|#{1,6}[ \t]+(?P<header_text>[^\n]+))'
+    r'|' + _EMPHASIS_PATTERN
+)
+
+# (strip_wrappers, convert_markdown) -> tokenizer; <style> blocks are always matched
+# whole so that CSS is neither searched for markdown nor partially stripped
+_TOKENS = {
+    (True, True): re.compile(_STYLE_PATTERN + _WRAPPER_PATTERN + _MARKDOWN_PATTERN),
+    (True, False): re.compile(_STYLE_PATTERN + _WRAPPER_PATTERN),
+    (False, True): re.compile(_STYLE_PATTERN + _MARKDOWN_PATTERN),
+}
+
+# Emphasis only, for the text of converted headers and bullets
+_EMPHASIS = re.compile(_EMPHASIS_PATTERN)
+
+_BULLET_PREFIX = re.compile(r'^[ \t]*-[ \t]+')
+
+
+def _emphasis(match: re.Match) -> str:
+    if match.group('bold_italic') is not None:
+        return f"<strong><em>{match.group('bold_italic')}</em></strong>"
+    if match.group('bold') is not None:
+        return f"<strong>{match.group('bold')}</strong>"
+    return f"<em>{match.group('italic')}</em>"
+
+
+def sanitize_report_html(content: str, strip_wrappers: bool = True, convert_markdown: bool = True) -> Tuple[str, int]:
+    """
+    Strip document wrappers and / or convert leaked markdown in one scan
+
+    Returns:
+        tuple: (sanitized content, number of markdown constructs converted)
+    """
+    if not (strip_wrappers or convert_markdown):
+        return content, 0
+    conversions = 0
+
+    def replace(match: re.Match) -> str:
+        nonlocal conversions
+        if match.group('style') is not None:
+            return '' if strip_wrappers else match.group(0)
+        if match.lastgroup in ('wrapper', 'fence'):
+            return ''
+
+        bullets = match.group('bullets')
+        if bullets is not None:
+            items = [_BULLET_PREFIX.sub('', line) for line in bullets.split('\n')]
+            conversions += len(items)
+            return '\n<ul>' + '\n'.join(f"<li>{_EMPHASIS.sub(_emphasis, item)}</li>" for item in items) + '</ul>'
+        conversions += 1
+        if match.group('header_text') is not None:
+            return f"\n<h4>{_EMPHASIS.sub(_emphasis, match.group('header_text'))}</h4>"
+        return _emphasis(match)
+
+    # Leading newline so a header or bullet on the first line is matched like any other line
+    sanitized = _TOKENS[strip_wrappers, convert_markdown].sub(replace, '\n' + content)
+    return sanitized[1:], conversions
+
+
+def clean_slide_html(content: str) -> str:
+    """Strip document wrappers, <style> blocks, markdown fences and leading text from generated slides"""
+    clean, _ = sanitize_report_html(content.strip(), strip_wrappers=True, convert_markdown=False)
+    # Remove any stray text before the first <div> tag
+    first_div = clean.find('<div')
+    if first_div > 0:
+        clean = clean[first_div:]
+    return clean.strip()
+
+
+def convert_markdown_to_html(content: str) -> Tuple[str, int]:
+    """Convert leaked markdown formatting to HTML tags; returns (content, conversions)"""
+    return sanitize_report_html(content, strip_wrappers=False, convert_markdown=True)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Report Slide Prompts
+Per-slide sections cut out of the Call 1 / Call 2 report prompts
+
+Slide-level generation sends one request per slide. Every request shares
+the same report context (base mandate, company data, slide rules), which
+is served from a cached context, and ends with the parts of the call
+prompt that describe that one slide: its HTML template and its
+requirement sections. Cutting them out of the built call prompts keeps
+the substituted metrics, chart and splice markers.
+
+Every slide template ends with a ``Page N / 15`` footer, and requirement
+sections are headed ``**SLIDE N ...**`` or ``### SLIDE N ...``.
+"""
+
+import re
+from typing import List
+
+# <div class="slide"> / <div class="slide report-prose"> but not <div class="slide-logo">
+_SLIDE_OPEN = re.compile(r'<div class="slide(?:\s[^"]*)?"')
+# Requirement sections end at the next slide heading, markdown heading or code fence
+_SECTION_END = re.compile(r'^(?:\*\*SLIDES? \d|#{2,3} |```)', re.MULTILINE)
+
+
+def page_marker(slide_number: int) -> str:
+    return f"Page {slide_number} / 15"
+
+
+def slide_template(prompt: str, slide_number: int) -> str:
+    """HTML template of one slide: the first slide block ending with its page footer"""
+    footer = prompt.find(page_marker(slide_number))
+    if footer == -1:
+        return ""
+    starts = [match.start() for match in _SLIDE_OPEN.finditer(prompt, 0, footer)]
+    if not starts:
+        return ""
+    footer_end = prompt.find("</footer>", footer)
+    end = prompt.find("</div>", footer_end) if footer_end != -1 else -1
+    if end == -1:
+        return ""
+    return prompt[starts[-1]:end + len("</div>")]
+
+
+def slide_requirements(prompt: str, slide_number: int) -> str:
+    """Requirement sections written for one slide (template headings without text are skipped)"""
+    heading = re.compile(rf'^(?:\*\*|### )SLIDE {slide_number}(?!\d)[^\n]*$', re.MULTILINE)
+    sections: List[str] = []
+    for match in heading.finditer(prompt):
+        end = _SECTION_END.search(prompt, match.end())
+        body = prompt[match.end():end.start() if end else len(prompt)].strip()
+        if body:
+            sections.append(f"{match.group(0)}\n{body}")
+    return "\n\n".join(sections)
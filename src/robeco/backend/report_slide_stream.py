@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Report Slide Stream
+Slide-level diffs of the streamed report instead of the whole document
+
+The legacy stream sends the full accumulated HTML with every chunk, so a
+170K character report costs tens of megabytes on the WebSocket and the
+client re-parses everything each time. ReportSlideStream splits the
+generated HTML on slide boundaries and emits only what changed: a new or
+rewritten slide as ``html``, a slide that is still being written as an
+``append`` delta on top of what the client already has. After the last
+call a manifest lists the final slides (index, length, hash) so the client
+can drop stale slides and check that it holds the complete report.
+
+Slides are addressed by their report page (1-15): the "Page N / 15" footer
+when the slide has one, otherwise the position after the previous slide of
+the same phase.
+
+Environment:
+    ROBECO_REPORT_STREAM_MODE   full | slides (default full)
+"""
+
+import hashlib
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+try:
+    from .report_stream_scanner import PAGE_MARKER, SLIDE_OPEN
+except ImportError:
+    from robeco.backend.report_stream_scanner import PAGE_MARKER, SLIDE_OPEN
+
+REPORT_STREAM_MODES = ("full", "slides")
+REPORT_STREAM_MODE = os.getenv("ROBECO_REPORT_STREAM_MODE", "full").lower()
+
+# A slide still being written is re-sent once it has grown by at least this much
+MIN_APPEND_CHARS = 1024
+
+
+def slide_hash(html: str) -> str:
+    return hashlib.sha256(html.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class _PhaseCursor:
+    """Where the slide currently being written starts in a phase's output"""
+    start: int = -1
+    last_index: int = 0
+
+
+class ReportSlideStream:
+    """
+    Per-report slide diff state
+
+    Usage:
+        stream = ReportSlideStream()
+        updates = stream.update("call1", accumulated_html)   # per chunk
+        updates = stream.update("final", combined_slides, final=True)
+        manifest = stream.manifest()
+
+    Each phase's output only grows, so a phase is scanned from the start of
+    its unfinished slide and per-chunk cost stays bounded by the slide size.
+    A rerun (retry, continuation, the cleaned final content) uses a new
+    phase name, or restarts the phase, and re-sends only the slides whose
+    HTML differs.
+    """
+
+    def __init__(self, min_append_chars: int = MIN_APPEND_CHARS):
+        self.min_append_chars = min_append_chars
+        self.sent: Dict[int, str] = {}
+        self.final_indices: List[int] = []
+        self._cursors: Dict[str, _PhaseCursor] = {}
+        self._first_index: Dict[str, int] = {}
+        self.stats = {"updates": 0, "appends": 0, "chars_sent": 0}
+
+    def set_first_index(self, phase: str, index: int):
+        """Report page of the first slide ``phase`` produces (e.g. a continuation)"""
+        self._first_index[phase] = index
+
+    def restart_phase(self, phase: str):
+        """Forget the scan position of ``phase`` before its output is generated again"""
+        self._cursors.pop(phase, None)
+
+    def _phase_first_index(self, phase: str) -> int:
+        if phase in self._first_index:
+            return self._first_index[phase]
+        if phase.startswith("call2"):
+            return 8
+        if phase.startswith("slide") and phase[5:].isdigit():
+            return int(phase[5:])
+        return 1
+
+    def update(self, phase: str, html: str, final: bool = False) -> List[Dict[str, Any]]:
+        """
+        Slide updates for the latest output of ``phase``
+
+        With ``final`` the last slide is treated as complete and sent without
+        throttling; for phase "final" the slides also become the manifest.
+        """
+        cursor = self._cursors.setdefault(phase, _PhaseCursor(last_index=self._phase_first_index(phase) - 1))
+        if cursor.start < 0:
+            cursor.start = html.find(SLIDE_OPEN)
+            if cursor.start < 0:
+                return []
+
+        updates = []
+        while True:
+            next_start = html.find(SLIDE_OPEN, cursor.start + len(SLIDE_OPEN))
+            if next_start < 0:
+                break
+            self._emit(updates, phase, cursor, html[cursor.start:next_start], complete=True)
+            cursor.start = next_start
+
+        self._emit(updates, phase, cursor, html[cursor.start:], complete=final)
+        return updates
+
+    def _emit(self, updates: List[Dict[str, Any]], phase: str, cursor: _PhaseCursor, piece: str, complete: bool):
+        if complete:
+            match = PAGE_MARKER.search(piece)
+            index = int(match.group(1)) if match else cursor.last_index + 1
+            cursor.last_index = index
+            if phase == "final":
+                self.final_indices.append(index)
+        else:
+            index = cursor.last_index + 1
+
+        sent = self.sent.get(index)
+        if sent == piece:
+            return
+        if sent is not None and piece.startswith(sent):
+            delta = piece[len(sent):]
+            if not complete and len(delta) < self.min_append_chars:
+                return
+            update = {"slide_index": index, "append": delta, "offset": len(sent), "complete": complete}
+            self.stats["appends"] += 1
+            self.stats["chars_sent"] += len(delta)
+        else:
+            if not complete and len(piece) < self.min_append_chars:
+                return
+            update = {"slide_index": index, "html": piece, "complete": complete}
+            self.stats["chars_sent"] += len(piece)
+
+        self.sent[index] = piece
+        self.stats["updates"] += 1
+        updates.append(update)
+
+    def manifest(self) -> Dict[str, Any]:
+        """Final slide list; slides the client holds outside it are stale"""
+        indices = self.final_indices or sorted(self.sent)
+        slides = [
+            {"slide_index": index, "length": len(self.sent[index]), "hash": slide_hash(self.sent[index])}
+            for index in indices
+        ]
+        return {
+            "slides": slides,
+            "total_slides": len(slides),
+            "total_chars": sum(slide["length"] for slide in slides),
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "slides": len(self.sent)}
+
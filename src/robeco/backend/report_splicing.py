@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Report Block Splicing
+Deterministic pre-rendered HTML spliced into generated slides
+
+The metrics grid (slide 1), the 5-year price chart (slide 1) and the
+income / balance sheet / cash flow tables (slides 8-10) are computed
+exactly from market data. Instead of asking Gemini to copy them token by
+token, the prompt asks for a marker such as ``[[INCOME_TABLE]]`` and the
+pre-rendered HTML is substituted after generation. This saves output
+tokens and removes transcription errors.
+
+Markers use square brackets so they survive the ``str.format`` passes the
+report prompts go through.
+
+Environment:
+    ROBECO_REPORT_SPLICE_BLOCKS   on | off (default off)
+"""
+
+import logging
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SPLICE_ENABLED = os.getenv("ROBECO_REPORT_SPLICE_BLOCKS", "off").lower() in ("on", "true", "1")
+
+# Marker name -> what it stands for (used in the prompt directive)
+SPLICE_BLOCKS = {
+    "METRICS_GRID": "the complete slide 1 metrics grid (<section class=\"metrics-grid\">)",
+    "PRICE_CHART": "the complete slide 1 5-year stock price chart container",
+    "INCOME_TABLE": "the complete slide 8 income statement table",
+    "BALANCE_TABLE": "the complete slide 9 balance sheet table",
+    "CASHFLOW_TABLE": "the complete slide 10 cash flow table",
+}
+
+# A marker, optionally wrapped in the <p> the model likes to put around loose text
+_MARKER_PATTERN = re.compile(r'(?:<p[^>]*>\s*)?\[\[([A-Z_]+)\]\](?:\s*</p>)?')
+_HTML_COMMENT = re.compile(r'<!--.*?-->', re.DOTALL)
+
+
+def marker(name: str) -> str:
+    return f"[[{name}]]"
+
+
+def find_block(text: str, start_token: str, end_token: str, after_token: Optional[str] = None) -> Optional[Tuple[int, int]]:
+    """
+    Span of the first block starting at ``start_token`` and ending after ``end_token``
+
+    With ``after_token`` the block ends at the first ``end_token`` following
+    the first ``after_token`` (e.g. the ``</div>`` after ``</svg>``).
+    """
+    start = text.find(start_token)
+    if start == -1:
+        return None
+    search_from = start
+    if after_token:
+        search_from = text.find(after_token, start)
+        if search_from == -1:
+            return None
+    end = text.find(end_token, search_from)
+    if end == -1:
+        return None
+    return start, end + len(end_token)
+
+
+def strip_html_comments(html: str) -> str:
+    """Drop the prompt's instruction comments from a block before it is spliced"""
+    return re.sub(r'\n\s*\n', '\n', _HTML_COMMENT.sub('', html)).strip()
+
+
+def splice_directive(names: List[str]) -> str:
+    """Prompt section telling the model which markers to emit"""
+    lines = "\n".join(f"- `{marker(name)}` = {SPLICE_BLOCKS[name]}" for name in names)
+    return f"""
+
+**🧩 PRE-RENDERED BLOCKS - OUTPUT MARKERS, NOT HTML:**
+The following blocks are rendered by the system from exact market data and inserted after generation.
+Where the templates show these markers, output the marker EXACTLY as written (on its own line) and do NOT write the block yourself:
+{lines}
+Use the numbers in these blocks (see the data provided above) in your analysis as usual.
+"""
+
+
+def splice_blocks(content: str, blocks: Dict[str, str]) -> Tuple[str, List[str]]:
+    """
+    Replace every known marker in ``content`` with its pre-rendered HTML
+
+    Returns:
+        tuple: (spliced content, names of the blocks that were spliced)
+    """
+    if not content or not blocks or '[[' not in content:
+        return content, []
+
+    spliced = []
+
+    def substitute(match: re.Match) -> str:
+        name = match.group(1)
+        if name not in blocks:
+            return match.group(0)
+        spliced.append(name)
+        return blocks[name]
+
+    result = _MARKER_PATTERN.sub(substitute, content)
+    if spliced:
+        logger.info(f"🧩 Spliced pre-rendered blocks: {', '.join(spliced)}")
+    return result, spliced
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Report Stream Scanner
+Incremental slide / page / completion tracking for streamed report HTML
+
+The report stream is 150K+ characters. Re-scanning the whole accumulated
+response on every chunk (slide count, "Page N / 15" markers, </html> and
+</body>) makes per-chunk work grow with the output. The scanner looks only
+at the new chunk plus a short overlap with the previous text, long enough
+that no marker split across two chunks is missed, so per-chunk cost stays
+constant however much has been generated.
+"""
+
+import re
+from typing import Iterable, List, NamedTuple, Set
+
+SLIDE_OPEN = '<div class="slide'
+PAGE_MARKER = re.compile(r'Page (\d{1,2}) / 15')
+PAGE_MARKER_MAX_CHARS = len("Page 15 / 15")
+HTML_END = '</html>'
+BODY_END = '</body>'
+
+
+class ScanUpdate(NamedTuple):
+    """What a single chunk added"""
+    new_slides: int
+    new_pages: List[int]
+    new_terms: List[str]
+
+
+class ReportStreamScanner:
+    """
+    Tracks slide starts, page markers, document end tags and watched terms
+    across streamed chunks
+
+    Usage:
+        scanner = ReportStreamScanner(watch_terms=("Operating Cash Flow",))
+        update = scanner.feed(chunk.text)
+        if update.new_slides: ...
+        scanner.slide_count, scanner.last_page, scanner.has_html_end
+    """
+
+    def __init__(self, watch_terms: Iterable[str] = ()):
+        self.watch_terms = tuple(watch_terms)
+        self.slide_count = 0
+        self.pages_seen: Set[int] = set()
+        self.last_page = 0
+        self.has_html_end = False
+        self.has_body_end = False
+        self.terms_seen: Set[str] = set()
+        self.chars = 0
+
+        # Enough trailing context to complete any marker that started in earlier chunks
+        longest = max([len(SLIDE_OPEN), PAGE_MARKER_MAX_CHARS, len(HTML_END), len(BODY_END)]
+                      + [len(term) for term in self.watch_terms])
+        self._overlap = longest - 1
+        self._tail = ""
+
+    def feed(self, text: str) -> ScanUpdate:
+        """Scan one chunk; cost depends only on the chunk and overlap size"""
+        if not text:
+            return ScanUpdate(0, [], [])
+
+        window = self._tail + text
+        self.chars += len(text)
+
+        # Only count matches that end in the new text (earlier ones were counted already)
+        new_slides = window.count(SLIDE_OPEN, max(0, len(self._tail) - len(SLIDE_OPEN) + 1))
+        self.slide_count += new_slides
+
+        new_pages = []
+        for match in PAGE_MARKER.finditer(window):
+            page = int(match.group(1))
+            if page not in self.pages_seen:
+                self.pages_seen.add(page)
+                new_pages.append(page)
+        if new_pages:
+            self.last_page = max(self.last_page, *new_pages)
+        new_pages.sort()
+
+        if not (self.has_html_end and self.has_body_end):
+            lowered = window.lower()
+            self.has_html_end = self.has_html_end or HTML_END in lowered
+            self.has_body_end = self.has_body_end or BODY_END in lowered
+
+        new_terms = []
+        for term in self.watch_terms:
+            if term not in self.terms_seen and term in window:
+                self.terms_seen.add(term)
+                new_terms.append(term)
+
+        self._tail = window[-self._overlap:]
+        return ScanUpdate(new_slides, new_pages, new_terms)
+
+    def seen(self, term: str) -> bool:
+        return term in self.terms_seen
@@ -5,8 +5,8 @@ Collects analysis from all agents and generates formatted reports following Robe
 """
 
 import logging
-import json
 import asyncio
+import re
 import sys
 import os
 import pandas as pd
@@ -22,16 +22,89 @@ from google.genai import Client, types
 from google.genai.types import Tool, GoogleSearch
 from api_key.gemini_api_key import get_intelligent_api_key
 
+# Shared per-ticker snapshot so report building reuses the server's Yahoo responses
+try:
+    from ..data.market_data_service import market_data_service
+    from ..core.serialization import dumps
+    from ..prompts.prompt_registry import current_month
+    # Importing the registry from the sections module registers the report.* sections
+    from ..prompts.report_prompt_sections import prompt_registry
+    from .gemini_context_cache import report_context_cache
+    from .report_assets import report_assets
+    from .report_stream_scanner import ReportStreamScanner
+    from .report_slide_stream import REPORT_STREAM_MODE, REPORT_STREAM_MODES, ReportSlideStream
+    from .report_html_sanitizer import clean_slide_html, convert_markdown_to_html
+    from .report_archive import report_archive
+    from .report_splicing import SPLICE_ENABLED, find_block, marker, splice_blocks, splice_directive, strip_html_comments
+    from .report_slide_prompts import page_marker, slide_requirements, slide_template
+except ImportError:
+    from robeco.data.market_data_service import market_data_service
+    from robeco.core.serialization import dumps
+    from robeco.prompts.prompt_registry import current_month
+    from robeco.prompts.report_prompt_sections import prompt_registry
+    from robeco.backend.gemini_context_cache import report_context_cache
+    from robeco.backend.report_assets import report_assets
+    from robeco.backend.report_stream_scanner import ReportStreamScanner
+    from robeco.backend.report_slide_stream import REPORT_STREAM_MODE, REPORT_STREAM_MODES, ReportSlideStream
+    from robeco.backend.report_html_sanitizer import clean_slide_html, convert_markdown_to_html
+    from robeco.backend.report_archive import report_archive
+    from robeco.backend.report_splicing import SPLICE_ENABLED, find_block, marker, splice_blocks, splice_directive, strip_html_comments
+    from robeco.backend.report_slide_prompts import page_marker, slide_requirements, slide_template
+
 logger = logging.getLogger(__name__)
 
+REPORT_MODEL = 'gemini-2.5-flash'
+
+# How Call 1 (slides 1-7) and Call 2 (slides 8-15) are scheduled:
+#   sequential  - Call 2 starts after Call 1, with the rating extracted from Call 1
+#   prerated    - a small rating call runs first, then both calls stream concurrently
+#   speculative - both calls start at once with the analysts' consensus rating;
+#                 Call 2 is restarted as soon as Call 1 streams a different rating
+#   slides      - every slide is its own call, run concurrently with a pre-decided rating
+REPORT_CALL_MODES = ("sequential", "prerated", "speculative", "slides")
+REPORT_CALL_MODE = os.getenv("ROBECO_REPORT_CALL_MODE", "sequential").lower()
+INVESTMENT_RATINGS = ("OVERWEIGHT", "NEUTRAL", "UNDERWEIGHT")
+# Rating badge in the slide header - Call 1 streams it within the first slide
+RATING_BADGE = re.compile(r'class="[^"]*\brating\b[^"]*"[^>]*>\s*(OVERWEIGHT|NEUTRAL|UNDERWEIGHT)\b', re.IGNORECASE)
+
+# Slide-level generation: slide number -> title; Call 1 prompt covers 1-7, Call 2 prompt 8-15
+REPORT_SLIDES = {
+    1: "Company Overview & Key Metrics",
+    2: "Investment Summary & Thesis",
+    3: "Investment Highlights",
+    4: "Catalysts & Developments",
+    5: "Company Analysis",
+    6: "Industry Analysis & Market Position",
+    7: "Competitive Advantage Analysis",
+    8: "Income Statement Analysis",
+    9: "Balance Sheet Analysis",
+    10: "Cash Flow Analysis",
+    11: "Financial Ratios Analysis",
+    12: "Valuation Analysis",
+    13: "Bull/Bear Analysis",
+    14: "Scenario Analysis",
+    15: "Investment Conclusion",
+}
+SLIDE_CONCURRENCY = int(os.getenv("ROBECO_REPORT_SLIDE_CONCURRENCY", "8"))
+SLIDE_MAX_RETRIES = 2
+
+# Incomplete Call 2 recovery: "continuation" keeps the complete slides and asks only
+# for the missing ones, "regenerate" reruns all of slides 8-15
+CALL2_RECOVERY_MODE = os.getenv("ROBECO_CALL2_RECOVERY", "continuation").lower()
+
 class RobecoTemplateReportGenerator:
     """Generate comprehensive investment reports following Robeco template structure"""
     
     def __init__(self):
-        # Use relative paths from the current file location
-        base_dir = Path(__file__).parent.parent.parent.parent  # Go to project root
-        self.template_path = base_dir / "Report Example" / "Robeco_InvestmentCase_Template.txt"
-        self.css_path = base_dir / "Report Example" / "CSScode.txt"
+        # Template and CSS are loaded once (and on change) by the shared asset registry
+        self.template_path = report_assets.template_path
+        self.css_path = report_assets.css_path
+        # Pre-rendered HTML blocks per ticker, spliced into the generated slides (ROBECO_REPORT_SPLICE_BLOCKS)
+        self.prerendered_blocks: Dict[str, Dict[str, str]] = {}
+        # Slide diff state per connection when streaming slide updates (ROBECO_REPORT_STREAM_MODE=slides)
+        self.slide_streams: Dict[str, ReportSlideStream] = {}
+        # Archive id of the last generated report (None if archiving failed)
+        self.last_archive_id: Optional[int] = None
         logger.info("🏗️ Robeco Template Report Generator initialized")
     
     async def _send_websocket_safe(self, websocket, message_data: dict) -> bool:
@@ -45,13 +118,60 @@ class RobecoTemplateReportGenerator:
                 logger.warning("⚠️ WebSocket not connected, skipping message")
                 return False
                 
-            await websocket.send_text(json.dumps(message_data))
+            await websocket.send_text(dumps(message_data))
             return True
         except Exception as e:
             # Log the error but don't crash the generation process
             logger.warning(f"WebSocket streaming failed: {e}")
             return False
     
+    async def _send_slide_updates(self, websocket, connection_id: str, call_phase: str, updates: List[Dict[str, Any]],
+                                  status: str, progress: int, message: str) -> bool:
+        """Send new / changed slides (slide stream mode) instead of the accumulated HTML"""
+        return await self._send_websocket_safe(websocket, {
+            "type": "report_slide_update",
+            "data": {
+                "status": status,
+                "call_phase": call_phase,
+                "slides": updates,
+                "progress": progress,
+                "message": message,
+                "connection_id": connection_id,
+                "timestamp": datetime.now().isoformat()
+            }
+        })
+    
+    async def fetch_financial_data(self, ticker: str) -> Dict[str, Any]:
+        """
+        Fetch everything report preparation reads from Yahoo in one place
+        
+        Company info, annual statements and 5 years of monthly prices come
+        from the shared snapshot (statements already pulled for the analysis
+        are reused) and every request runs off the event loop. The prompt
+        and table builders only read the returned dictionary.
+        """
+        stock = market_data_service.get_snapshot(ticker)
+        
+        # Convert statement DataFrames to the annual format with date keys, most recent year first
+        statements = {}
+        for name, key in (('financials', 'income_statement_annual'),
+                          ('balance_sheet', 'balance_sheet_annual'),
+                          ('cashflow', 'cashflow_annual')):
+            frame = await stock.fetch(name)
+            annual = {}
+            if frame is not None and not frame.empty:
+                for date_col in frame.columns:
+                    date_str = date_col.strftime('%Y-%m-%d') if hasattr(date_col, 'strftime') else str(date_col)
+                    annual[date_str] = frame[date_col].to_dict()
+            statements[key] = annual
+        
+        return {
+            'ticker': stock.symbol,
+            'info': await stock.fetch("info"),
+            'history': (await stock.fetch_history("5y", "1mo")).to_dict(),
+            **statements
+        }
+    
     async def generate_report_from_analyses(
         self, 
         company_name: str,
@@ -76,7 +196,9 @@ class RobecoTemplateReportGenerator:
         financial_data: Dict = None,
         investment_objective: str = None,
         user_query: str = None,
-        data_sources: Dict = None
+        data_sources: Dict = None,
+        call_mode: str = None,
+        stream_mode: str = None
     ) -> str:
         """
         Generate comprehensive report from collected agent analyses
@@ -86,6 +208,8 @@ class RobecoTemplateReportGenerator:
             ticker: Stock ticker symbol
             analyses_data: Dictionary containing all agent analysis results
             report_focus: Type of report focus
+            call_mode: sequential / prerated / speculative / slides (default ROBECO_REPORT_CALL_MODE)
+            stream_mode: full / slides (default ROBECO_REPORT_STREAM_MODE)
         
         Returns:
             str: Generated HTML report following Robeco template
@@ -97,26 +221,34 @@ class RobecoTemplateReportGenerator:
         self.investment_objective = investment_objective or "comprehensive investment analysis"
         
         try:
+            # Prompt and table builders never call Yahoo; fetch here if the caller didn't
+            if not financial_data or not any(key in financial_data for key in ('info', 'error')):
+                try:
+                    financial_data = {**(financial_data or {}), **await self.fetch_financial_data(ticker)}
+                except Exception as e:
+                    logger.warning(f"⚠️ Could not fetch yfinance data for {ticker}: {e}")
+                    financial_data = {"error": f"Could not fetch data: {e}"}
+            
             # 🎯 IMPLEMENTING 2-CALL ARCHITECTURE
-            logger.info("🚀 Starting 2-Call Architecture Report Generation")
+            call_mode = (call_mode or REPORT_CALL_MODE).lower()
+            if call_mode not in REPORT_CALL_MODES:
+                logger.warning(f"⚠️ Unknown report call mode '{call_mode}', running calls sequentially")
+                call_mode = "sequential"
+            logger.info(f"🚀 Starting 2-Call Architecture Report Generation ({call_mode})")
+            
+            stream_mode = (stream_mode or REPORT_STREAM_MODE).lower()
+            if stream_mode not in REPORT_STREAM_MODES:
+                logger.warning(f"⚠️ Unknown report stream mode '{stream_mode}', streaming the full HTML")
+                stream_mode = "full"
+            slide_stream = None
+            if websocket and connection_id and stream_mode == "slides":
+                slide_stream = self.slide_streams[connection_id] = ReportSlideStream()
             
             # Send CSS template content at the very start
             if websocket:
                 try:
-                    # Load only the CSS styles (not full HTML structure)
-                    with open(self.css_path, 'r', encoding='utf-8') as f:
-                        full_css_template = f.read()
-                    
-                    # Extract ONLY the CSS content inside <style> tags (without <style> wrapper)
-                    css_start = full_css_template.find('<style>') + len('<style>')
-                    css_end = full_css_template.find('</style>')
-                    if css_start > len('<style>') - 1 and css_end != -1:
-                        # Get pure CSS content without <style> tags
-                        css_content_only = full_css_template[css_start:css_end].strip()
-                        # Wrap in minimal style tags for display
-                        css_styles_only = f"<style>\n{css_content_only}\n</style>"
-                    else:
-                        css_styles_only = "<style>\n/* CSS extraction failed */\n</style>"
+                    # Only the CSS styles (not full HTML structure), pre-extracted from CSScode.txt
+                    css_styles_only = report_assets.css().style_block
                     
                     # Send only CSS styles (not full HTML structure)
                     await self._send_websocket_safe(websocket, {
@@ -127,6 +259,8 @@ class RobecoTemplateReportGenerator:
                             "accumulated_html": css_styles_only,
                             "message": "📄 CSS Styles loaded from CSScode.txt",
                             "progress": 10,
+                            "concurrent_calls": call_mode != "sequential",
+                            "stream_mode": "slides" if slide_stream else "full",
                             "connection_id": connection_id,
                             "timestamp": datetime.now().isoformat()
                         }
@@ -135,107 +269,68 @@ class RobecoTemplateReportGenerator:
                 except Exception as e:
                     logger.warning(f"⚠️ Could not load CSS template: {e}")
             
-            # Send progress update for Call 1
-            if websocket:
-                await self._send_websocket_safe(websocket, {
-                    "type": "report_generation_progress",
-                    "data": {
-                        "status": "call1_starting", 
-                        "message": "📊 CALL 1: Generating overview, company & industry analysis (slides 1-7)...",
-                        "progress": 20,
-                        "connection_id": connection_id,
-                        "timestamp": datetime.now().isoformat()
-                    }
-                })
-            
-            # CALL 1: Generate slides 1-7 (Overview, Company, Industry Analysis)
-            call1_content = await self._generate_combined_overview_and_analysis_section(
-                company_name, ticker, analyses_data, financial_data, websocket, connection_id, data_sources
-            )
-            
-            if not call1_content:
-                raise Exception("Call 1 failed to generate content")
-            
-            # CRITICAL: Validate Call 1 completion before proceeding
-            call1_validation = self._validate_call1_completion(call1_content)
-            if not call1_validation:
-                # Send failure signal if Call 1 is incomplete
+            if call_mode == "sequential":
+                # Send progress update for Call 1
                 if websocket:
                     await self._send_websocket_safe(websocket, {
-                        "type": "report_generation_streaming", 
+                        "type": "report_generation_progress",
                         "data": {
-                            "status": "call1_incomplete",
-                            "call_phase": "call1",
-                            "accumulated_html": call1_content,
-                            "message": "⚠️ CALL 1 INCOMPLETE: Missing slide 7 - please retry generation",
-                            "progress": 40,
+                            "status": "call1_starting", 
+                            "message": "📊 CALL 1: Generating overview, company & industry analysis (slides 1-7)...",
+                            "progress": 20,
                             "connection_id": connection_id,
                             "timestamp": datetime.now().isoformat()
                         }
                     })
-                logger.error(f"🚨 CALL 1 VALIDATION FAILED - proceeding anyway for debugging")
-                # Note: Not raising exception to allow debugging, but this should be fixed
             
-            # Send Call 1 completion signal with its content
-            if websocket:
-                logger.info(f"📤 Sending Call 1 completion: {len(call1_content):,} chars")
-                await self._send_websocket_safe(websocket, {
-                    "type": "report_generation_streaming",
-                    "data": {
-                        "status": "call1_complete",
-                        "call_phase": "call1",
-                        "accumulated_html": call1_content,
-                        "message": "✅ CALL 1 COMPLETE: Overview & analysis (slides 1-7) generated",
-                        "progress": 50,
-                        "connection_id": connection_id,
-                        "timestamp": datetime.now().isoformat()
-                    }
-                })
+                # CALL 1: Generate slides 1-7 (Overview, Company, Industry Analysis)
+                call1_content = await self._generate_combined_overview_and_analysis_section(
+                    company_name, ticker, analyses_data, financial_data, websocket, connection_id, data_sources
+                )
             
-            # Extract key insights from Call 1 for Call 2 context
-            extracted_rating = self._extract_rating_from_call1(call1_content)
-            call1_context = {
-                'content_summary': 'Strong fundamentals and growth potential',
-                'investment_rating': extracted_rating,
-                'generated_content': call1_content[:1000]  # First 1000 chars as context
-            }
+                if not call1_content:
+                    raise Exception("Call 1 failed to generate content")
             
-            # Send progress update for Call 2  
-            if websocket:
-                await self._send_websocket_safe(websocket, {
-                    "type": "report_generation_progress",
-                    "data": {
-                        "status": "call2_starting",
-                        "message": "📊 CALL 2: Generating financial analysis & valuation (slides 8-15)...", 
-                        "progress": 60,
-                        "connection_id": connection_id,
-                        "timestamp": datetime.now().isoformat()
-                    }
-                })
+                await self._report_call1_completion(call1_content, websocket, connection_id)
             
-            # CALL 2: Generate slides 8-15 (Financial Analysis & Valuation)
-            call2_content = await self._generate_industry_and_financial_section(
-                company_name, ticker, analyses_data, financial_data, call1_context, websocket, connection_id, data_sources
-            )
+                # Extract key insights from Call 1 for Call 2 context
+                extracted_rating = self._extract_rating_from_call1(call1_content)
+                call1_context = {
+                    'content_summary': 'Strong fundamentals and growth potential',
+                    'investment_rating': extracted_rating,
+                    'generated_content': call1_content[:1000]  # First 1000 chars as context
+                }
             
-            if not call2_content:
-                raise Exception("Call 2 failed to generate content")
+                # Send progress update for Call 2  
+                if websocket:
+                    await self._send_websocket_safe(websocket, {
+                        "type": "report_generation_progress",
+                        "data": {
+                            "status": "call2_starting",
+                            "message": "📊 CALL 2: Generating financial analysis & valuation (slides 8-15)...", 
+                            "progress": 60,
+                            "connection_id": connection_id,
+                            "timestamp": datetime.now().isoformat()
+                        }
+                    })
             
-            # Send Call 2 completion signal
-            if websocket:
-                logger.info(f"📤 Sending Call 2 completion: {len(call2_content):,} chars")
-                await self._send_websocket_safe(websocket, {
-                    "type": "report_generation_streaming",
-                    "data": {
-                        "status": "call2_complete",
-                        "call_phase": "call2", 
-                        "accumulated_html": call2_content,
-                        "message": "✅ CALL 2 COMPLETE: Financial analysis (slides 8-15) generated",
-                        "progress": 80,
-                        "connection_id": connection_id,
-                        "timestamp": datetime.now().isoformat()
-                    }
-                })
+                # CALL 2: Generate slides 8-15 (Financial Analysis & Valuation)
+                call2_content = await self._generate_industry_and_financial_section(
+                    company_name, ticker, analyses_data, financial_data, call1_context, websocket, connection_id, data_sources
+                )
+            
+                if not call2_content:
+                    raise Exception("Call 2 failed to generate content")
+            
+                await self._report_call2_completion(call2_content, websocket, connection_id)
+            elif call_mode == "slides":
+                call1_content, call2_content = await self._generate_slides_in_parallel(
+                    company_name, ticker, analyses_data, financial_data, websocket, connection_id, data_sources
+                )
+            else:
+                call1_content, call2_content = await self._generate_calls_concurrently(
+                    company_name, ticker, analyses_data, financial_data, websocket, connection_id, data_sources, call_mode
+                )
             
             # Send progress update for combining
             if websocket:
@@ -256,11 +351,31 @@ class RobecoTemplateReportGenerator:
             # Combine with fixed CSS template
             final_report_html = self._combine_css_with_slides(company_name, ticker, combined_slides_content)
             
-            # Save the complete report as HTML file
-            self._save_report_to_file(final_report_html, company_name, ticker)
+            # Archive the complete report as the ticker's next version
+            self.last_archive_id = await self._archive_report(
+                final_report_html, company_name, ticker, self._extract_rating_from_call1(call1_content)
+            )
             
+            # Slide stream: send the slides that changed in the final content, then the manifest
+            if slide_stream:
+                await self._send_slide_updates(
+                    websocket, connection_id, "final", slide_stream.update("final", combined_slides_content, final=True),
+                    "final_slides", 100, "🎉 REPORT COMPLETE: 15-slide Robeco investment analysis generated"
+                )
+                manifest = slide_stream.manifest()
+                logger.info(f"📤 Sending slide manifest: {manifest['total_slides']} slides, {manifest['total_chars']:,} chars "
+                            f"({slide_stream.get_stats()['chars_sent']:,} chars streamed)")
+                await self._send_websocket_safe(websocket, {
+                    "type": "report_slide_manifest",
+                    "data": {
+                        **manifest,
+                        "archive_id": self.last_archive_id,
+                        "connection_id": connection_id,
+                        "timestamp": datetime.now().isoformat()
+                    }
+                })
             # Send final completion signal with complete report
-            if websocket:
+            elif websocket:
                 logger.info(f"📤 Sending final completion: {len(final_report_html):,} chars")
                 await self._send_websocket_safe(websocket, {
                     "type": "report_generation_streaming",
@@ -268,6 +383,7 @@ class RobecoTemplateReportGenerator:
                         "status": "final_complete",
                         "call_phase": "final",
                         "accumulated_html": final_report_html,
+                        "archive_id": self.last_archive_id,
                         "message": "🎉 REPORT COMPLETE: 15-slide Robeco investment analysis generated",
                         "progress": 100,
                         "connection_id": connection_id,
@@ -281,8 +397,421 @@ class RobecoTemplateReportGenerator:
         except Exception as e:
             logger.error(f"❌ Report generation failed: {e}")
             raise e
+        finally:
+            self.slide_streams.pop(connection_id, None)
+    
+    
+    async def _report_call1_completion(self, call1_content: str, websocket=None, connection_id: str = None):
+        """Validate Call 1 and send its completion (or incomplete) signal"""
+        # CRITICAL: Validate Call 1 completion before proceeding
+        call1_validation = self._validate_call1_completion(call1_content)
+        slide_stream = self.slide_streams.get(connection_id) if websocket else None
+        if not call1_validation:
+            # Send failure signal if Call 1 is incomplete
+            if slide_stream:
+                await self._send_slide_updates(
+                    websocket, connection_id, "call1", [], "call1_incomplete", 40,
+                    "⚠️ CALL 1 INCOMPLETE: Missing slide 7 - please retry generation"
+                )
+            elif websocket:
+                await self._send_websocket_safe(websocket, {
+                    "type": "report_generation_streaming", 
+                    "data": {
+                        "status": "call1_incomplete",
+                        "call_phase": "call1",
+                        "accumulated_html": call1_content,
+                        "message": "⚠️ CALL 1 INCOMPLETE: Missing slide 7 - please retry generation",
+                        "progress": 40,
+                        "connection_id": connection_id,
+                        "timestamp": datetime.now().isoformat()
+                    }
+                })
+            logger.error(f"🚨 CALL 1 VALIDATION FAILED - proceeding anyway for debugging")
+            # Note: Not raising exception to allow debugging, but this should be fixed
+        
+        # Send Call 1 completion signal with its content (only the changed slides in slide stream mode)
+        if slide_stream:
+            await self._send_slide_updates(
+                websocket, connection_id, "call1", slide_stream.update("call1_complete", call1_content, final=True),
+                "call1_complete", 50, "✅ CALL 1 COMPLETE: Overview & analysis (slides 1-7) generated"
+            )
+        elif websocket:
+            logger.info(f"📤 Sending Call 1 completion: {len(call1_content):,} chars")
+            await self._send_websocket_safe(websocket, {
+                "type": "report_generation_streaming",
+                "data": {
+                    "status": "call1_complete",
+                    "call_phase": "call1",
+                    "accumulated_html": call1_content,
+                    "message": "✅ CALL 1 COMPLETE: Overview & analysis (slides 1-7) generated",
+                    "progress": 50,
+                    "connection_id": connection_id,
+                    "timestamp": datetime.now().isoformat()
+                }
+            })
+    
+    async def _report_call2_completion(self, call2_content: str, websocket=None, connection_id: str = None):
+        """Send the Call 2 completion signal"""
+        # Send Call 2 completion signal
+        slide_stream = self.slide_streams.get(connection_id) if websocket else None
+        if slide_stream:
+            await self._send_slide_updates(
+                websocket, connection_id, "call2", slide_stream.update("call2_complete", call2_content, final=True),
+                "call2_complete", 80, "✅ CALL 2 COMPLETE: Financial analysis (slides 8-15) generated"
+            )
+        elif websocket:
+            logger.info(f"📤 Sending Call 2 completion: {len(call2_content):,} chars")
+            await self._send_websocket_safe(websocket, {
+                "type": "report_generation_streaming",
+                "data": {
+                    "status": "call2_complete",
+                    "call_phase": "call2", 
+                    "accumulated_html": call2_content,
+                    "message": "✅ CALL 2 COMPLETE: Financial analysis (slides 8-15) generated",
+                    "progress": 80,
+                    "connection_id": connection_id,
+                    "timestamp": datetime.now().isoformat()
+                }
+            })
+    
+    async def _generate_calls_concurrently(
+        self,
+        company_name: str,
+        ticker: str,
+        analyses_data: Dict[str, Any],
+        financial_data: Dict = None,
+        websocket=None,
+        connection_id: str = None,
+        data_sources: Dict = None,
+        call_mode: str = "prerated"
+    ) -> tuple:
+        """
+        Run Call 1 (slides 1-7) and Call 2 (slides 8-15) at the same time
+        
+        Call 2 only needs the investment rating from Call 1. In "prerated" mode
+        a small rating call decides it up front and both calls are told to use
+        it; in "speculative" mode Call 2 starts with the analysts' consensus
+        rating and is restarted as soon as Call 1 streams a different rating
+        badge. If the finished Call 1 still disagrees with the rating Call 2
+        was written with, Call 2 is regenerated with the Call 1 context (the
+        sequential result).
+        
+        Returns:
+            tuple: (call1_content, call2_content)
+        """
+        if call_mode == "prerated":
+            rating = await self._pre_decide_rating(company_name, ticker, analyses_data)
+        else:
+            rating = self._consensus_rating(analyses_data)
+        logger.info(f"⚡ CONCURRENT CALLS ({call_mode}): starting Call 1 + Call 2 with rating {rating}")
+        
+        if websocket:
+            await self._send_websocket_safe(websocket, {
+                "type": "report_generation_progress",
+                "data": {
+                    "status": "calls_starting",
+                    "message": f"📊 CALL 1 + CALL 2: Generating slides 1-7 and 8-15 concurrently ({rating})...",
+                    "progress": 20,
+                    "connection_id": connection_id,
+                    "timestamp": datetime.now().isoformat()
+                }
+            })
+        
+        def start_call2(call2_rating: str, call1_content: str = '') -> asyncio.Task:
+            return asyncio.create_task(self._generate_industry_and_financial_section(
+                company_name, ticker, analyses_data, financial_data, {
+                    'content_summary': 'Strong fundamentals and growth potential',
+                    'investment_rating': call2_rating,
+                    'generated_content': call1_content[:1000]
+                }, websocket, connection_id, data_sources
+            ))
+        
+        rating_seen = asyncio.get_running_loop().create_future() if call_mode == "speculative" else None
+        call1_task = asyncio.create_task(self._generate_combined_overview_and_analysis_section(
+            company_name, ticker, analyses_data, financial_data, websocket, connection_id, data_sources,
+            investment_rating=rating if call_mode == "prerated" else None, rating_seen=rating_seen
+        ))
+        call2_task = start_call2(rating)
+        try:
+            if rating_seen:
+                # Speculative: as soon as Call 1 commits to a rating, drop a Call 2 written with another one
+                await asyncio.wait({rating_seen, call1_task}, return_when=asyncio.FIRST_COMPLETED)
+                if rating_seen.done() and rating_seen.result() != rating:
+                    streamed_rating = rating_seen.result()
+                    logger.warning(f"🔁 Rating mismatch: Call 1 streamed {streamed_rating} vs Call 2 {rating} - restarting Call 2")
+                    call2_task.cancel()
+                    await asyncio.gather(call2_task, return_exceptions=True)
+                    if websocket:
+                        await self._send_websocket_safe(websocket, {
+                            "type": "report_generation_progress",
+                            "data": {
+                                "status": "call2_reconciling",
+                                "message": f"🔁 CALL 2: Restarting slides 8-15 with Call 1 rating {streamed_rating}...",
+                                "progress": 30,
+                                "connection_id": connection_id,
+                                "timestamp": datetime.now().isoformat()
+                            }
+                        })
+                    rating = streamed_rating
+                    call2_task = start_call2(rating)
+            call1_content, call2_content = await asyncio.gather(call1_task, call2_task)
+        except BaseException:
+            call1_task.cancel()
+            call2_task.cancel()
+            raise
+        
+        if not call1_content:
+            raise Exception("Call 1 failed to generate content")
+        await self._report_call1_completion(call1_content, websocket, connection_id)
+        
+        # Reconcile: Call 2 must carry the rating Call 1 actually settled on
+        call1_rating = self._extract_rating_from_call1(call1_content)
+        if call1_rating != rating:
+            logger.warning(f"🔁 Rating mismatch: Call 1 {call1_rating} vs Call 2 {rating} - regenerating Call 2")
+            if websocket:
+                await self._send_websocket_safe(websocket, {
+                    "type": "report_generation_progress",
+                    "data": {
+                        "status": "call2_reconciling",
+                        "message": f"🔁 CALL 2: Regenerating slides 8-15 with Call 1 rating {call1_rating}...",
+                        "progress": 60,
+                        "connection_id": connection_id,
+                        "timestamp": datetime.now().isoformat()
+                    }
+                })
+            call2_content = await start_call2(call1_rating, call1_content)
+        
+        if not call2_content:
+            raise Exception("Call 2 failed to generate content")
+        await self._report_call2_completion(call2_content, websocket, connection_id)
+        return call1_content, call2_content
+    
+    async def _generate_slides_in_parallel(
+        self,
+        company_name: str,
+        ticker: str,
+        analyses_data: Dict[str, Any],
+        financial_data: Dict = None,
+        websocket=None,
+        connection_id: str = None,
+        data_sources: Dict = None
+    ) -> tuple:
+        """
+        Slide-level generation: each of the 15 slides is an independent call
+        
+        Every call starts with the same report context (base mandate, company
+        data, analyst insights, slide rules and a pre-decided rating), served
+        from one cached context, and sends only its own slide's template and
+        requirements after it. Up to SLIDE_CONCURRENCY slides run at once and
+        each is retried on its own, so total time approaches that of the
+        slowest slide rather than two full 15-slide streams.
+        
+        Returns:
+            tuple: (call1_content, call2_content) - slides 1-7 and 8-15 in order
+        """
+        rating = await self._pre_decide_rating(company_name, ticker, analyses_data)
+        logger.info(f"🧩 SLIDE MODE: generating {len(REPORT_SLIDES)} slides concurrently (max {SLIDE_CONCURRENCY}) with rating {rating}")
+        
+        if websocket:
+            await self._send_websocket_safe(websocket, {
+                "type": "report_generation_progress",
+                "data": {
+                    "status": "slides_starting",
+                    "message": f"🧩 Generating all {len(REPORT_SLIDES)} slides concurrently ({rating})...",
+                    "progress": 20,
+                    "connection_id": connection_id,
+                    "timestamp": datetime.now().isoformat()
+                }
+            })
+        
+        # The call prompts are built once for their slide templates (metrics, chart and markers filled in)
+        call1_prompt = await self._build_call1_prompt(company_name, ticker, analyses_data, financial_data, self.investment_objective, data_sources)
+        call2_prompt = await self._build_call2_prompt(
+            company_name, ticker, analyses_data, financial_data, {
+                'content_summary': 'Strong fundamentals and growth potential',
+                'investment_rating': rating,
+                'generated_content': ''
+            }, self.investment_objective, data_sources
+        )
+        slide_context = self._build_slide_context(company_name, ticker, analyses_data, financial_data, rating, data_sources)
+        slide_prompts = {
+            number: self._build_slide_prompt(call1_prompt if number <= 7 else call2_prompt, number)
+            for number in REPORT_SLIDES
+        }
+        logger.info(f"🧩 Slide context: {len(slide_context):,} chars shared, "
+                    f"{sum(map(len, slide_prompts.values())) // len(slide_prompts):,} chars per slide on average")
+        
+        semaphore = asyncio.Semaphore(max(1, SLIDE_CONCURRENCY))
+        slides: Dict[int, str] = {}
+        
+        async def generate_slide(slide_number: int):
+            async with semaphore:
+                slides[slide_number] = self._splice_prerendered(await self._generate_single_slide(
+                    slide_context, slide_prompts[slide_number], slide_number
+                ), ticker)
+            
+            slide_stream = self.slide_streams.get(connection_id) if websocket else None
+            if slide_stream:
+                await self._send_slide_updates(
+                    websocket, connection_id, "slides",
+                    slide_stream.update(f"slide{slide_number}", slides[slide_number], final=True),
+                    "streaming_html_slides", min(20 + len(slides) * 4, 80),
+                    f"🧩 Slide {slide_number} done ({len(slides)}/{len(REPORT_SLIDES)} slides)"
+                )
+            # Stream the contiguous, in-order slides finished so far
+            elif websocket:
+                ready = []
+                for number in REPORT_SLIDES:
+                    if number not in slides:
+                        break
+                    ready.append(slides[number])
+                await self._send_websocket_safe(websocket, {
+                    "type": "report_generation_streaming",
+                    "data": {
+                        "status": "streaming_html_slides",
+                        "call_phase": "slides",
+                        "accumulated_html": "\n\n".join(ready),
+                        "chunk_number": len(slides),
+                        "progress": min(20 + len(slides) * 4, 80),
+                        "message": f"🧩 Slide {slide_number} done ({len(slides)}/{len(REPORT_SLIDES)} slides)",
+                        "connection_id": connection_id,
+                        "timestamp": datetime.now().isoformat()
+                    }
+                })
+        
+        tasks = [asyncio.create_task(generate_slide(number)) for number in REPORT_SLIDES]
+        try:
+            await asyncio.gather(*tasks)
+        except Exception:
+            for task in tasks:
+                task.cancel()
+            raise
+        
+        call1_content = "\n\n".join(slides[number] for number in REPORT_SLIDES if number <= 7)
+        call2_content = "\n\n".join(slides[number] for number in REPORT_SLIDES if number > 7)
+        await self._report_call1_completion(call1_content, websocket, connection_id)
+        await self._report_call2_completion(call2_content, websocket, connection_id)
+        return call1_content, call2_content
+    
+    def _build_slide_context(self, company_name: str, ticker: str, analyses_data: Dict[str, Any],
+                             financial_data: Dict = None, rating: str = "NEUTRAL", data_sources: Dict = None) -> str:
+        """
+        Report context shared by all slide calls of one report (sent once, then served from the context cache)
+        
+        Base mandate and report subject, user context, financial statements,
+        analyst insights, price summary and the slide-level rules.
+        """
+        stock_data = self._build_complete_stock_data_with_chart(ticker, financial_data)
+        price_summary = {
+            key: stock_data[key]
+            for key in ("company_name", "ticker", "current_price", "price_range", "total_return", "metrics", "dates", "monthly_prices")
+            if key in stock_data
+        }
+        context = self._build_base_robeco_prompt(company_name, ticker) + f"""
+## REPORT DATA FOR {company_name} ({ticker})
+
+{self._build_user_context(data_sources)}
+
+{self._build_financial_context(company_name, financial_data)}
+
+{self._build_analyst_insights(analyses_data, content_limit=6000)}
+
+**STOCK PRICE DATA (5-year monthly closes and pre-calculated metrics):**
+{price_summary}
+""" + prompt_registry.render("report.slides.rules", rating)
+        
+        blocks = self.prerendered_blocks.get(ticker) if SPLICE_ENABLED else None
+        if blocks:
+            context += splice_directive(list(blocks))
+        return context
     
+    def _build_slide_prompt(self, call_prompt: str, slide_number: int) -> str:
+        """Slide-specific suffix: the slide's requirements (and ready table) then its template, taken from its call prompt"""
+        template = slide_template(call_prompt, slide_number)
+        requirements = slide_requirements(call_prompt, slide_number)
+        if not template:
+            logger.warning(f"⚠️ No template found for slide {slide_number} - generating from its requirements only")
+        
+        return f"""
+## SLIDE {slide_number} / 15 - {REPORT_SLIDES[slide_number].upper()}
+
+{requirements}
+
+### SLIDE {slide_number} TEMPLATE:
+```html
+{template}
+```
+""" + prompt_registry.render("report.slide.task", slide_number, REPORT_SLIDES[slide_number])
+    
+    async def _generate_single_slide(self, slide_context: str, slide_prompt: str, slide_number: int) -> str:
+        """Generate one slide from the shared context and its own suffix, retrying until its page footer is present"""
+        footer = page_marker(slide_number)
+        slide_content = ""
+        
+        for attempt in range(SLIDE_MAX_RETRIES + 1):
+            prompt = slide_context + slide_prompt
+            if attempt:
+                prompt += f"""
+⚠️ RETRY {attempt}/{SLIDE_MAX_RETRIES}: The previous attempt did not produce a complete slide {slide_number} ending with "{footer}".
+"""
+            slide_content = self._clean_slide_html(await self._generate_ai_report(
+                prompt, None, None, f"slide{slide_number}", cached_prefix=slide_context
+            ))
+            if footer in slide_content and '<div class="slide' in slide_content:
+                logger.info(f"✅ Slide {slide_number} generated: {len(slide_content):,} chars (attempt {attempt+1})")
+                return slide_content
+            logger.warning(f"⚠️ Slide {slide_number} incomplete (attempt {attempt+1}/{SLIDE_MAX_RETRIES+1}): {len(slide_content):,} chars")
+        
+        logger.error(f"🚨 Slide {slide_number} still incomplete after {SLIDE_MAX_RETRIES} retries - using last attempt")
+        return slide_content
     
+    def _consensus_rating(self, analyses_data: Dict[str, Any]) -> str:
+        """Rating the collected analyst outputs lean towards (NEUTRAL when they don't say)"""
+        analyst_text = "\n".join(
+            analysis.get('content', '') for analysis in (analyses_data or {}).values() if analysis
+        )
+        return self._extract_rating_from_call1(analyst_text)
+    
+    async def _pre_decide_rating(self, company_name: str, ticker: str, analyses_data: Dict[str, Any]) -> str:
+        """
+        Decide the investment rating with a small, fast call before the slide calls start
+        
+        Falls back to the analysts' consensus rating if the call fails or
+        answers with anything other than a single rating.
+        """
+        insights = self._build_analyst_insights(analyses_data or {}, content_limit=1500)
+        prompt = f"""Based on the analyst research below, decide the Robeco investment rating for {company_name} ({ticker}).
+Answer with exactly one word: OVERWEIGHT, NEUTRAL or UNDERWEIGHT.
+
+{insights}"""
+        
+        for attempt in range(3):
+            key_result = get_intelligent_api_key(agent_type="report_generator", attempt=attempt, force_attempt=True)
+            if not key_result:
+                break
+            api_key, _ = key_result
+            try:
+                response = await Client(api_key=api_key).aio.models.generate_content(
+                    model=REPORT_MODEL,
+                    contents=prompt,
+                    config=types.GenerateContentConfig(
+                        temperature=0.2,
+                        max_output_tokens=1024,
+                        response_mime_type="text/plain"
+                    )
+                )
+                answer = (response.text or "").strip().upper()
+                rating = next((r for r in INVESTMENT_RATINGS if r in answer), None)
+                if rating:
+                    logger.info(f"✅ Pre-decided rating for {ticker}: {rating}")
+                    return rating
+                logger.warning(f"⚠️ Unexpected rating answer: {answer[:80]}")
+                break
+            except Exception as e:
+                logger.warning(f"⚠️ Rating call attempt {attempt+1} failed: {e}")
+        
+        return self._consensus_rating(analyses_data)
+
     async def _generate_combined_overview_and_analysis_section(
         self, 
         company_name: str, 
@@ -291,7 +820,9 @@ class RobecoTemplateReportGenerator:
         financial_data: Dict = None,
         websocket=None,
         connection_id: str = None,
-        data_sources: Dict = None
+        data_sources: Dict = None,
+        investment_rating: str = None,
+        rating_seen: asyncio.Future = None
     ) -> str:
         """
         2-CALL ARCHITECTURE - CALL 1: Generate slides 1-7 (Overview, Company, Industry Analysis)
@@ -310,8 +841,18 @@ class RobecoTemplateReportGenerator:
         # Build Call 1 specific prompt with user context
         call1_prompt = await self._build_call1_prompt(company_name, ticker, analyses_data, financial_data, self.investment_objective, data_sources)
         
+        # Concurrent generation: Call 2 is already writing with this rating
+        if investment_rating:
+            call1_prompt += f"""
+
+**🎯 INVESTMENT RATING (PRE-DECIDED):** Use **{investment_rating}** as the investment rating on every slide - slides 8-15 are being written with the same rating.
+"""
+        
         # Generate Call 1 content (slides 1-7 only)
-        call1_content = await self._generate_ai_report(call1_prompt, websocket, connection_id, "call1")
+        call1_content = self._splice_prerendered(await self._generate_ai_report(
+            call1_prompt, websocket, connection_id, "call1",
+            cached_prefix=self._shared_report_prefix(), rating_seen=rating_seen
+        ), ticker)
         
         # CRITICAL: Validate Call 1 completion before returning
         call1_validation = self._validate_call1_completion(call1_content)
@@ -454,7 +995,10 @@ class RobecoTemplateReportGenerator:
         )
         
         # Generate Call 2 content (slides 8-15 only) with completion validation
-        call2_content = await self._generate_ai_report(call2_prompt, websocket, connection_id, "call2")
+        shared_prefix = self._shared_report_prefix()
+        call2_content = self._splice_prerendered(
+            await self._generate_ai_report(call2_prompt, websocket, connection_id, "call2", cached_prefix=shared_prefix), ticker
+        )
         
         # Validate Call 2 completion and force multiple retries if needed
         retry_count = 0
@@ -476,6 +1020,18 @@ class RobecoTemplateReportGenerator:
         
         while not self._validate_call2_completion(call2_content) and retry_count < max_retries:
             retry_count += 1
+            
+            # Continuation: keep the complete slides and generate only the missing ones
+            if CALL2_RECOVERY_MODE == "continuation":
+                kept_content, last_page = self._keep_complete_slides(call2_content, first_page=8)
+                if 8 <= last_page < 15:
+                    call2_content = self._splice_prerendered(await self._continue_call2(
+                        call2_prompt, kept_content, last_page, retry_count, max_retries,
+                        websocket, connection_id, shared_prefix
+                    ), ticker)
+                    continue
+                logger.warning(f"⚠️ No complete Call 2 slide to continue from (last page {last_page}) - regenerating")
+            
             logger.warning(f"⚠️⚠️⚠️ Call 2 RETRY {retry_count}/{max_retries} - Previous attempt incomplete, applying stronger enforcement")
             
             # Progressively strengthen completion requirements for each retry
@@ -506,7 +1062,9 @@ THIS IS RETRY {retry_count}/3 - COMPLETE ALL 8 SLIDES OR SYSTEM WILL RETRY AGAIN
 """
             
             call2_prompt_retry = call2_prompt + completion_enforcement
-            call2_content = await self._generate_ai_report(call2_prompt_retry, websocket, connection_id, f"call2_retry_{retry_count}")
+            call2_content = self._splice_prerendered(await self._generate_ai_report(
+                call2_prompt_retry, websocket, connection_id, f"call2_retry_{retry_count}", cached_prefix=shared_prefix
+            ), ticker)
         
         if retry_count > 0:
             logger.info(f"📊 Call 2 completed after {retry_count} retries")
@@ -514,6 +1072,70 @@ THIS IS RETRY {retry_count}/3 - COMPLETE ALL 8 SLIDES OR SYSTEM WILL RETRY AGAIN
         logger.info(f"✅ CALL 2 completed: {len(call2_content):,} characters generated")
         return call2_content
     
+    def _keep_complete_slides(self, content: str, first_page: int = 8) -> tuple:
+        """
+        Cut partial output back to its last complete slide
+        
+        A slide counts as complete once its "Page N / 15" footer has been
+        written; anything after it that starts another slide is dropped.
+        
+        Returns:
+            tuple: (kept_content, last_complete_page) - last page is first_page - 1 when none is complete
+        """
+        import re
+        
+        last_page = first_page - 1
+        footer_end = -1
+        for match in re.finditer(r'Page\s+(\d+)\s*/\s*15', content):
+            page = int(match.group(1))
+            if page >= first_page and page > last_page:
+                last_page, footer_end = page, match.end()
+        
+        if footer_end < 0:
+            return "", last_page
+        
+        next_slide = content.find('<div class="slide', footer_end)
+        kept_content = content[:next_slide] if next_slide != -1 else content
+        return kept_content.rstrip(), last_page
+    
+    async def _continue_call2(
+        self,
+        call2_prompt: str,
+        kept_content: str,
+        last_page: int,
+        retry_count: int,
+        max_retries: int,
+        websocket=None,
+        connection_id: str = None,
+        cached_prefix: str = None
+    ) -> str:
+        """Generate only slides after ``last_page`` and append them to the kept slides"""
+        missing = list(range(last_page + 1, 16))
+        logger.warning(
+            f"⚠️ Call 2 CONTINUATION {retry_count}/{max_retries} - keeping slides 8-{last_page} "
+            f"({len(kept_content):,} chars), generating slides {missing[0]}-{missing[-1]}"
+        )
+        
+        continuation_prompt = call2_prompt + f"""
+
+**🔁 CONTINUATION - GENERATE ONLY SLIDES {missing[0]}-15:**
+- Slides 8-{last_page} are ALREADY GENERATED and will be kept - do NOT repeat them
+- Continue directly with slide {missing[0]} ("{REPORT_SLIDES[missing[0]]}") and generate every slide through slide 15 ("{REPORT_SLIDES[15]}")
+- Follow the templates above for slides {', '.join(str(page) for page in missing)}; each slide ends with its "Page N / 15" footer
+- Final output: Must contain "INVESTMENT CONCLUSION" and "Page 15 / 15"
+- Start directly with <div class="slide"> - no CSS, <html>, <head> or <body> tags
+
+**END OF THE ALREADY GENERATED SLIDES (for continuity only - do not repeat):**
+{kept_content[-1500:]}
+"""
+        slide_stream = self.slide_streams.get(connection_id) if websocket else None
+        if slide_stream:
+            slide_stream.set_first_index(f"call2_continue_{retry_count}", missing[0])
+        continuation = await self._generate_ai_report(
+            continuation_prompt, websocket, connection_id, f"call2_continue_{retry_count}", cached_prefix=cached_prefix
+        )
+        return kept_content + "\n\n" + self._clean_slide_html(continuation)
+    
     def _validate_call2_completion(self, call2_content: str) -> bool:
         """Validate if Call 2 has completed all 8 slides (8-15) - AGGRESSIVE validation"""
         try:
@@ -599,288 +1221,31 @@ THIS IS RETRY {retry_count}/3 - COMPLETE ALL 8 SLIDES OR SYSTEM WILL RETRY AGAIN
         """
         Build the foundational Robeco prompt with style guidelines, writing standards, and formatting requirements.
         This serves as the common base for both Call 1 and Call 2 prompts.
-        """
         
-        return f"""# ROBECO ALPHA-GENERATING INVESTMENT ANALYSIS - {company_name} ({ticker})
-
-## ELITE PORTFOLIO MANAGER ROLE & MANDATE
-
-### YOUR IDENTITY & EXPERTISE:
-You are an **elite hedge fund Portfolio Manager** with 25+ years of experience at top-tier firms like Renaissance Technologies, Bridgewater Associates, and Citadel. You've consistently generated significant alpha by **identifying insights that consensus systematically misses**. Your analytical prowess combines:
-
-- **Information Asymmetry Hunter**: Expert at finding insights hiding in plain sight for {company_name} that others overlook due to cognitive biases, complexity, or time horizons
-- **Second-Order Thinking Master**: Understanding consequences of consequences - how today's trends create tomorrow's opportunities and risks that markets haven't priced
-- **Pattern Recognition Virtuoso**: Identifying historical parallels, cycle analysis, and inflection points before they become obvious to consensus for {company_name}
-- **Contrarian Positioning Expert**: Systematic frameworks for understanding why consensus is wrong and when contrarian positions offer asymmetric returns
-- **Predictive Analytics Pioneer**: Building forward-looking models using leading indicators, management behavior analysis, and competitive intelligence
-- **Capital Cycle Detective**: Understanding where companies are in their investment cycles and predicting capital allocation effectiveness
-- **Technological Disruption Analyst**: Identifying second and third-order effects of emerging technologies on business models and competitive dynamics
-
-**Your reputation**: Wall Street's most prescient mind, known for calling major inflection points 12-18 months before consensus, with a track record of generating 300+ basis points of annual alpha through differentiated insights.
-
-**TARGET AUDIENCE - CIO WITH 30 YEARS STREET EXPERIENCE:**
-Your analysis targets a Chief Investment Officer with 30 years on the Street who:
-- **Understands everything on {company_name}** - needs NO basic explanations or obvious insights
-- **Has NO TIME for fluff** - every sentence must deliver actionable intelligence  
-- **Demands high info density** - more insights per word than any analyst they've read
-- **Values only UNIQUE perspectives** - will instantly recognize recycled consensus thinking for {company_name}
-- **Expects forward-looking analysis** - wants to know what happens NEXT, not what already happened
-- **Requires conviction** - needs specific price targets, timeframes, and conviction levels
-
-**ZERO TOLERANCE POLICY:**
-- ❌ **NO generic statements** ("Company is well-positioned...")
-- ❌ **NO obvious observations** ("Revenue growth is important...")  
-- ❌ **NO clichés or buzzwords** ("Best-in-class", "market leader", "going forward")
-- ❌ **NO filler words** - every word must add value
-- ✅ **ONLY unique insights** that demonstrate superior understanding
-- ✅ **ONLY forward-looking analysis** with specific catalysts and timing
-- ✅ **ONLY differentiated perspectives** that challenge consensus thinking
-- ✅ **CONCISE & PRECISE** - High info density, maximum impact per word
-
-### ALPHA-GENERATION OBJECTIVE:
-Produce an **elite-level, High info density, non-consensus investment analysis** that reveals insights others systematically miss due to cognitive limitations, analytical shortcuts, or time horizon mismatches. Your analysis must demonstrate:
-
-**🎯 PROPRIETARY INSIGHT GENERATION:**
-- **What Consensus Misses**: Identify specific analytical blind spots, cognitive biases, or complexity barriers that cause mispricing
-- **Second-Order Value Drivers**: Uncover how today's developments create tomorrow's competitive advantages or disruptions
-- **Inflection Point Prediction**: Pinpoint when current trends will accelerate, decelerate, or reverse—before markets recognize it
-- **Hidden Optionality**: Identify embedded real options, strategic flexibility, or unrecognized value creation mechanisms
-
-** DEEP FUNDAMENTAL FORENSICS:**
-- **Management Behavior Analysis**: Read between lines of management actions, capital allocation, and strategic messaging for {company_name} as of {datetime.now().strftime("%B %Y")}
-- **Competitive Intelligence**: Understand competitive dynamics, market share shifts, and industry evolution better than consensus
-- **Technology Impact Assessment**: Predict how emerging technologies will reshape business models and competitive moats
-- **Regulatory Anticipation**: Forecast policy changes and their second/third-order effects on industry structure
-
-**⚡ TIMING & CATALYST PRECISION:**
-- **Earnings Inflection Points**: Predict when financial performance will surprise consensus based on leading indicators for {company_name} as of {datetime.now().strftime("%B %Y")}
-- **Multiple Expansion/Compression**: Identify when valuation re-rating will occur and what will trigger it
-- **Capital Cycle Positioning**: Understand where company and industry are in investment cycles for optimal entry/exit timing for {company_name} as of {datetime.now().strftime("%B %Y")}
-- **Sentiment Reversal Timing**: Predict when negative/positive sentiment will reverse based on fundamental improvements
-
-**Your analysis must answer: \"What do I know about {company_name}'s future that the market doesn't yet understand?\"**
-
-### MANDATORY ANALYTICAL REQUIREMENTS:
-
-**1. NON-CONSENSUS THESIS DEVELOPMENT:**
-- **Contrarian Positioning**: Systematically identify why consensus view is fundamentally flawed or incomplete
-- **Information Asymmetry Exploitation**: Leverage complexity, behavioral biases, or time horizon mismatches that create mispricings
-- **Multi-Dimensional Alpha Sources**: Build thesis on 3-4 independent, uncorrelated value drivers that markets underestimate
-- **Differentiated Insight**: Demonstrate differentiated understanding of business model, competitive dynamics, or industry evolution
-
-**2. PREDICTIVE ANALYTICS FRAMEWORK:**
-- **Leading Indicator Analysis**: Identify forward-looking metrics that predict earnings/multiple inflection points 6-12 months ahead for {company_name} starting from {datetime.now().strftime("%B %Y")}
-- **Pattern Recognition**: Apply historical parallels and cycle analysis to predict likely future trajectories
-- **Scenario Probability Assessment**: Quantify likelihood of different outcomes using Bayesian inference and base rate analysis
-- **Inflection Point Mapping**: Pinpoint specific dates/catalysts when thesis will be validated or invalidated
-
-**3. DEEP FUNDAMENTAL FORENSICS:**
-- **Management Quality Assessment**: Analyze track record, capital allocation decisions, and strategic messaging for hidden insights
-- **Competitive Intelligence**: Understand market share trends, pricing power evolution, and competitive response functions
-- **Technology Disruption Analysis**: Assess how emerging technologies will impact business model sustainability
-- **Capital Cycle Analysis**: Determine where company/industry is in investment cycle for optimal positioning
-
-**4. BEHAVIORAL FINANCE EXPLOITATION:**
-- **Cognitive Bias Identification**: Exploit recency bias, anchoring, confirmation bias that create systematic mispricings
-- **Sentiment Analysis**: Predict when overly pessimistic/optimistic sentiment will reverse based on fundamentals
-- **Complexity Premium**: Leverage situations too complex for algorithmic or retail analysis to generate alpha
-- **Time Horizon Arbitrage**: Exploit short-term volatility in fundamentally sound long-term value creation stories
-
-###  CRITICAL: DATA-DRIVEN ANALYTICAL MANDATES
-
-**🔍 RESEARCH-BACKED ANALYSIS REQUIREMENTS:**
-Every analysis point MUST be supported by:
-- **Latest Company Research for {company_name}**: Reference recent analyst reports, management guidance, and industry research for {company_name} as of {datetime.now().strftime("%B %Y")}
-- **Google Search Integration**: Use current news, earnings transcripts, industry reports, regulatory filings
-- **Specific Data Points**: Cite exact numbers, percentages, dates, and quantified metrics for {company_name} as of {datetime.now().strftime("%B %Y")}
-- **Source Attribution**: Reference where insights come from (earnings calls, research reports, industry data)
-- **Comparative Analysis**: Compare to industry benchmarks, peer companies, and historical norms
-
-** STOCK PRICE MOVEMENT ATTRIBUTION (MANDATORY):**
-For every major analytical point, you MUST address:
-- **Historical Price Context**: Why did the stock move up/down in the past 12-24 months?
-- **Fundamental Attribution**: What specific fundamental changes drove those price movements?
-- **Market Reaction Analysis**: Why did the market react that way to specific events/earnings?
-- **Mispricing Identification**: Where did the market overreact or underreact to fundamental changes?
-- **Forward Price Implications**: How will future fundamental changes impact stock price trajectory?
-
-** DIFFERENTIATED VIEW REQUIREMENTS:**
-Every section must demonstrate:
-- **Independent Analytical View**: Present your investment thesis for {company_name} as of {datetime.now().strftime("%B %Y")} with specific evidence
-- **Differentiated Insights**: Lead with your unique perspective and analytical conclusions
-- **Supporting Evidence**: What specific data, trends, or analysis supports your view?
-- **Investment Timing**: Why is this the right time for this investment perspective?
-
-**📊 HIGH-DENSITY ANALYTICAL PRESENTATION:**
-- **Lead with Data-Driven Insights**: Start each section with your analytical conclusion backed by specific evidence
-- **Differentiated Logic Flow**: Present clear, logical progression from analysis to investment implication  
-- **No-Bullshit Delivery**: Concise, professional language targeting experienced PMs who know company fundamentals
-- **Value-Add Focus**: Highlight insights beyond public information that drive investment decisions
-- **Quantified Impact**: What specific financial/stock price impact will your differentiated view create?
-
-** IMPLICATIONS-DRIVEN ANALYSIS:**
-After every analytical statement, you MUST provide:
-- **"So What?" Analysis**: What does this mean for future earnings, margins, competitive position?
-- **Investment Implications**: How does this impact your investment thesis and price target?
-- **Risk Assessment**: What could go wrong with this analysis and how do you mitigate it?
-- **Timeline Specificity**: When will these implications become apparent to the market?
-- **Portfolio Impact**: How does this affect position sizing and risk management?
-
-** FORWARD-LOOKING MANDATE:**
-Every analysis must include:
-- **12-Month Outlook**: Specific predictions for the next 4 quarters with supporting logic for {company_name} starting from {datetime.now().strftime("%B %Y")}
-- **Catalyst Timeline**: Exact dates/events that will validate or invalidate your thesis
-- **Scenario Planning**: Base/Bull/Bear cases with specific probability weightings
-- **Market Recognition**: When and how will the market recognize your insights?
-- **Exit Strategy**: Specific triggers for taking profits or cutting losses
-
-**5. MULTI-DIMENSIONAL VALUATION:**
-- **Dynamic DCF Modeling**: Incorporate optionality, competitive response functions, and non-linear growth trajectories of {company_name}
-- **Sum-of-the-Parts with Synergies**: Value business segments independently while modeling cross-segment synergies
-- **Real Options Valuation**: Quantify strategic flexibility, expansion options, and abandonment values
-- **Through-the-Cycle Analysis**: Normalize for cyclical factors to assess sustainable earning power
+        The company-independent mandate comes first so every report call shares it as one
+        cached prefix; the subject section after it binds the mandate to this company.
+        """
+        return self._shared_report_prefix() + prompt_registry.render("report.subject", company_name, ticker, current_month())
+    
+    @staticmethod
+    def _shared_report_prefix() -> str:
+        """Leading part of every report prompt that is identical across companies (served from the context cache)"""
+        return prompt_registry.render("report.base.shared")
 
-**6. RISK-ADJUSTED IMPLEMENTATION:**
-- **Hedge Construction**: Design synthetic and natural hedges to isolate alpha while managing systematic risk
-- **Drawdown Management**: Establish dynamic stop-loss and portfolio heat metrics
-- **Correlation Analysis**: Understand factor exposures and portfolio construction implications
-
-**7. PROPRIETARY MONITORING SYSTEM:**
-- **Early Warning Indicators**: Track leading metrics that signal thesis validation/invalidation before consensus
-- **Competitive Response Monitoring**: Watch for competitive reactions that could undermine thesis
-- **Management Behavior Tracking**: Monitor insider activity, capital allocation changes, strategic pivots
-- **Sentiment Inflection Detection**: Identify when market perception begins shifting toward thesis validation
-
-### SPECIFIC HTML STRUCTURE COMPLIANCE:
-```html
-<!-- ROBECO LOGO (ALL SLIDES) - Position absolutely in top-right corner -->
-<div class="slide-logo">
-    <img src="https://images.ctfassets.net/tl4x668xzide/7mygwms2vuSwirnfvaCSvL/72d2bbd858a69aecbf59fd3fb8954484/robeco-logo-color.png" alt="Robeco Logo">
-</div>
-
-<!-- HEADER STRUCTURE (ALL SLIDES) -->
-<header class="report-header-container">
-    <div class="header-blue-border">
-        <div class="company-header">
-            <img src="[COMPANY_LOGO]" alt="Company Icon" class="icon" style="margin-top: -5px; width: 20px; height: 20px;">
-            <h1 class="name">{company_name}</h1>
-            <div class="rating" style="color: #2E7D32;">[INVESTMENT_RATING]</div>
-        </div>
-    </div>
-</header>
-
-<!-- FOOTER STRUCTURE (ALL SLIDES) -->
-<footer class="report-footer">
-    <p>Robeco Investment Research</p>
-    <p>Page X / 15</p>
-</footer>
-```
-
-### FINANCIAL TABLE FORMATTING (SLIDES 8-10):
-```html
-<table style="width: 100%; border-collapse: collapse; font-family: 'Segoe UI', -apple-system, BlinkMacSystemFont, 'Roboto', sans-serif; font-size: 11px; box-shadow: 0 4px 12px rgba(0,0,0,0.15); border-radius: 8px; overflow: hidden; background: white;">
-    <thead>
-        <tr style="background: linear-gradient(135deg, #2C5282 0%, #3182CE 100%); color: white; height: 45px;">
-            <!-- Professional gradient header -->
-        </tr>
-    </thead>
-    <tbody>
-        <!-- Alternating row colors with actual financial data -->
-    </tbody>
-</table>
-```
-
-### SOPHISTICATED ANALYTICAL FRAMEWORKS TO DEPLOY:
-
-**MARKET EFFICIENCY ANALYSIS:**
-- **Information Asymmetry**: Identify data/insights not yet reflected in price for {company_name} as of {datetime.now().strftime("%B %Y")}
-- **Behavioral Biases**: Exploit systematic cognitive errors in market pricing
-- **Structural Inefficiencies**: Leverage forced selling, index rebalancing, flow dynamics
-- **Complexity Premium**: Capitalize on situations too complex for mainstream analysis
-
-**MULTI-LAYERED FUNDAMENTAL ANALYSIS:**
-- **Business Model Decomposition**: Unit economics, scalability, defensibility, reinvestment rates for {company_name} as of {datetime.now().strftime("%B %Y")}
-- **Competitive Dynamics**: Porter's 5 forces, competitive response functions, game theory for {company_name} as of {datetime.now().strftime("%B %Y")}
-- **Management Quality**: Capital allocation track record, strategic vision, execution consistency for {company_name} as of {datetime.now().strftime("%B %Y")}
-- **Industry Life Cycle**: Position within cycle, disruption risk, consolidation opportunities for {company_name} as of {datetime.now().strftime("%B %Y")}
-
-**QUANTITATIVE RIGOR REQUIREMENTS:**
-- **Factor Attribution**: Decompose returns into style, sector, and alpha components
-- **Risk-Adjusted Metrics**: Sharpe, Sortino, Calmar ratios with benchmark comparison
-- **Correlation Analysis**: Cross-asset, sector, and macro factor sensitivities
-- **Stress Testing**: Monte Carlo simulation of key assumptions and scenarios
-
-**CATALYST MAPPING & TIMING:**
-- **Event-Driven Catalysts**: Earnings, regulatory decisions, M&A, spin-offs, activist campaigns
-- **Fundamental Inflection Points**: Margin expansion, market share gains, new product cycles
-- **Technical Catalysts**: Support/resistance levels, momentum inflections, options flow
-- **Macro Catalysts**: Interest rate cycles, commodity cycles, currency moves, policy changes
-
-**ADVANCED VALUATION METHODOLOGIES:**
-- **DCF with Real Options**: Capture optionality value in growth investments and strategic pivots
-- **Sum-of-the-Parts**: Asset-based valuation for conglomerates and multi-business entities
-- **Relative Valuation**: Peer group analysis with quality adjustments and growth normalization
-- **Replacement Cost**: Asset replacement value for capital-intensive businesses
-- **Liquidation Value**: Downside protection analysis for distressed or turnaround situations
-
-### INSTITUTIONAL-GRADE WRITING STANDARDS:
-- **Analytical Precision**: Every claim supported by specific data points and logical reasoning
-- **Professional Sophistication**: Goldman Sachs/Morgan Stanley research quality and depth
-- **Quantitative Integration**: Embed metrics naturally: "**ROIC expansion from 12.3% to 16.8% over 24 months**"
-- **Forward-Looking Framework**: Focus on what's not priced in vs. what market already knows
-- **Risk-Reward Asymmetry**: Emphasize upside/downside ratio and probability-weighted outcomes
-
-** CRITICAL: BOLD FORMATTING FOR IMPORTANT ANALYSIS:**
-- **USE <strong></strong> tags** for all KEY INSIGHTS, IMPORTANT METRICS, and CRITICAL INVESTMENT POINTS
-- **Bold all specific numbers**: <strong>25.3% ROIC</strong>, <strong>$2B investment</strong>, <strong>400bps margin expansion</strong>
-- **Bold contrarian statements**: <strong>Unlike consensus, we believe...</strong>
-- **Bold price targets and ratings**: <strong>$150 price target</strong>, <strong>OVERWEIGHT rating</strong>
-- **Bold key catalysts**: <strong>Q1 earnings will demonstrate...</strong>
-- **Bold competitive advantages**: <strong>Market-leading 40% share</strong>
-- **Bold investment conclusions**: <strong>Risk/reward strongly favorable at current levels</strong>
-
-### TECHNICAL FORMATTING REQUIREMENTS:
-- **Document Structure**: Exactly 15 slides with specific HTML classes and IDs
-- **Professional Layout**: 1620px × 2291px institutional presentation format
-- **Data Integration**: Use actual financial data from provided tables
-- **Visual Hierarchy**: Proper headers, numbered sections, professional color scheme
-- **Slide Types**: Analysis-item format (slides 1-2), report-prose format (slides 3-15)
-- **Table Styling**: Professional financial tables with gradient headers and data integration
-
-### PERFORMANCE EXPECTATIONS:
-**Your analysis must demonstrate:**
-- **Intellectual Rigor**: Depth that separates institutional research from sell-side reports for {company_name} as of {datetime.now().strftime("%B %Y")}
-- **Original Insights**: Perspectives not readily available in consensus research
-- **Actionable Intelligence**: Clear investment implications with specific entry/exit strategies
-- **Risk Awareness**: Comprehensive downside protection and scenario planning
-- **Alpha Generation**: Identifiable sources of outperformance vs. market/benchmark
-
-**Remember**: You are not writing generic research. You are crafting alpha-generating investment insights that justify significant capital allocation decisions by sophisticated institutional investors.
-
----
-"""
-
-    def _build_stock_price_data(self, ticker: str) -> Dict:
+    def _build_stock_price_data(self, ticker: str, financial_data: Dict = None) -> Dict:
         """
         Extract clean stock price data for AI to create simple chart
         Returns data points instead of pre-made HTML
         """
         try:
-            import yfinance as yf
-            from datetime import datetime, timedelta
-            
-            stock = yf.Ticker(ticker)
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=5*365)  # 5 years
-            
-            # Get monthly data to keep it simple
-            hist = stock.history(start=start_date, end=end_date, interval="1mo")
+            # 5 years of monthly prices from the fetched market data (no Yahoo call here)
+            hist = self._price_history_frame(financial_data)
             
             if hist.empty:
                 return {"error": "No data available"}
             
             # Get company info
-            info = stock.info
+            info = (financial_data or {}).get('info') or {}
             currency = info.get('currency', 'USD')
             company_name = info.get('longName', ticker)
             
@@ -925,96 +1290,49 @@ Every analysis must include:
     def _build_ready_html_tables(self, company_name: str, financial_data: Dict = None) -> Dict[str, str]:
         """
         Pre-generate clean HTML tables from REAL yfinance data for AI to copy directly.
-        Gets actual company financial statements with real dates and important line items.
+        Built from the annual statements already fetched for the report (no Yahoo call here).
         """
+        income_stmt = self._statement_frame(financial_data, 'income_statement_annual')
+        balance_sheet = self._statement_frame(financial_data, 'balance_sheet_annual')
+        cash_flow = self._statement_frame(financial_data, 'cashflow_annual')
         
-        # Get ticker symbol for yfinance
-        ticker = None
-        if financial_data and 'ticker' in financial_data:
-            ticker = financial_data['ticker']
-        elif isinstance(company_name, str) and len(company_name) <= 5 and company_name.isupper():
-            ticker = company_name  # Assume company_name is ticker if short and uppercase
-        
-        if not ticker:
-            return {
-                'income_table': '<p>No ticker symbol provided</p>',
-                'balance_table': '<p>No ticker symbol provided</p>',
-                'cashflow_table': '<p>No ticker symbol provided</p>'
-            }
-        
-        # Fetch from yfinance directly (always use fresh data)
-        try:
-            import yfinance as yf
-            logger.info(f"📊 Fetching yfinance data for {ticker}")
-            stock = yf.Ticker(ticker)
-            
-            # Get 3 years of financial data
-            income_stmt = stock.financials  # Annual income statement
-            balance_sheet = stock.balance_sheet  # Annual balance sheet  
-            cash_flow = stock.cashflow  # Annual cash flow
-            
-            logger.info(f"✅ Fetched financial data for {ticker}")
-            
-            # Build tables from yfinance data
-            income_html = self._build_yfinance_income_html(income_stmt, ticker)
-            balance_html = self._build_yfinance_balance_html(balance_sheet, ticker)
-            cashflow_html = self._build_yfinance_cashflow_html(cash_flow, ticker)
-            
-            return {
-                'income_table': income_html,
-                'balance_table': balance_html,
-                'cashflow_table': cashflow_html
-            }
-            
-        except Exception as e:
-            logger.warning(f"⚠️ Could not fetch yfinance data for {ticker}: {e}")
+        if income_stmt.empty and balance_sheet.empty and cash_flow.empty:
+            ticker = (financial_data or {}).get('ticker', company_name)
+            logger.warning(f"⚠️ No financial statements available for {ticker}")
             return {
                 'income_table': f'<p>Unable to fetch income statement for {ticker}</p>',
                 'balance_table': f'<p>Unable to fetch balance sheet for {ticker}</p>',
                 'cashflow_table': f'<p>Unable to fetch cash flow for {ticker}</p>'
             }
         
-        # Use provided financial data
-        try:
-            # Build tables from provided data using real yfinance structure
-            ticker = financial_data.get('ticker', company_name)
-            
-            income_html = self._build_yfinance_income_html(
-                financial_data.get('income_statement'), ticker
-            )
-            balance_html = self._build_yfinance_balance_html(
-                financial_data.get('balance_sheet'), ticker  
-            )
-            cashflow_html = self._build_yfinance_cashflow_html(
-                financial_data.get('cash_flow'), ticker
-            )
-            
-            return {
-                'income_table': income_html,
-                'balance_table': balance_html,
-                'cashflow_table': cashflow_html
-            }
-            
-        except Exception as e:
-            logger.warning(f"⚠️ Could not process financial data: {e}")
-            return {
-                'income_table': '<p>Income statement processing error</p>',
-                'balance_table': '<p>Balance sheet processing error</p>',
-                'cashflow_table': '<p>Cash flow processing error</p>'
-            }
+        currency = ((financial_data or {}).get('info') or {}).get('currency', 'USD')
+        return {
+            'income_table': self._build_yfinance_income_html(income_stmt, currency),
+            'balance_table': self._build_yfinance_balance_html(balance_sheet, currency),
+            'cashflow_table': self._build_yfinance_cashflow_html(cash_flow, currency)
+        }
+    
+    @staticmethod
+    def _statement_frame(financial_data: Optional[Dict], key: str) -> pd.DataFrame:
+        """Annual statement ({date: {line item: value}}) as a line item x year frame, most recent year first"""
+        annual = (financial_data or {}).get(key) or {}
+        return pd.DataFrame(annual) if annual else pd.DataFrame()
     
-    def _build_yfinance_income_html(self, income_stmt, ticker: str) -> str:
+    @staticmethod
+    def _price_history_frame(financial_data: Optional[Dict]) -> pd.DataFrame:
+        """Monthly price history ({column: {date: value}}) fetched with the report's market data"""
+        history = (financial_data or {}).get('history') or {}
+        if not history:
+            return pd.DataFrame()
+        frame = pd.DataFrame(history).sort_index()
+        return frame.dropna(subset=['Close']) if 'Close' in frame.columns else pd.DataFrame()
+    
+    def _build_yfinance_income_html(self, income_stmt, currency: str = 'USD') -> str:
         """Build clean income statement HTML from real yfinance data"""
         if income_stmt is None or income_stmt.empty:
             return '<p>No income statement data available</p>'
         
         try:
-            # Get currency info for proper formatting
-            import yfinance as yf
-            stock = yf.Ticker(ticker)
-            info = stock.info
-            currency = info.get('currency', 'USD')
-            
             # Format currency symbol
             if currency == 'JPY':
                 curr_symbol = '¥'
@@ -1145,18 +1463,12 @@ Every analysis must include:
             logger.warning(f"⚠️ Error building income statement HTML: {e}")
             return '<p>Error processing income statement data</p>'
     
-    def _build_yfinance_balance_html(self, balance_sheet, ticker: str) -> str:
+    def _build_yfinance_balance_html(self, balance_sheet, currency: str = 'USD') -> str:
         """Build clean balance sheet HTML from real yfinance data"""
         if balance_sheet is None or balance_sheet.empty:
             return '<p>No balance sheet data available</p>'
         
         try:
-            # Get currency info for proper formatting
-            import yfinance as yf
-            stock = yf.Ticker(ticker)
-            info = stock.info
-            currency = info.get('currency', 'USD')
-            
             # Format currency symbol
             if currency == 'JPY':
                 curr_symbol = '¥'
@@ -1284,18 +1596,12 @@ Every analysis must include:
             logger.warning(f"⚠️ Error building balance sheet HTML: {e}")
             return '<p>Error processing balance sheet data</p>'
     
-    def _build_yfinance_cashflow_html(self, cash_flow, ticker: str) -> str:
+    def _build_yfinance_cashflow_html(self, cash_flow, currency: str = 'USD') -> str:
         """Build clean cash flow HTML from real yfinance data"""
         if cash_flow is None or cash_flow.empty:
             return '<p>No cash flow data available</p>'
         
         try:
-            # Get currency info for proper formatting
-            import yfinance as yf
-            stock = yf.Ticker(ticker)
-            info = stock.info
-            currency = info.get('currency', 'USD')
-            
             # Format currency symbol
             if currency == 'JPY':
                 curr_symbol = '¥'
@@ -1641,7 +1947,7 @@ Focus on qualitative analysis and publicly available information.
         except Exception as e:
             # FALLBACK: Use legacy stock data method
             logger.warning(f"⚠️ PRIMARY system failed ({e}), using FALLBACK")
-            legacy_stock_data = self._build_stock_price_data(ticker)
+            legacy_stock_data = self._build_stock_price_data(ticker, financial_data)
             complete_stock_data = {
                 "chart_ready": False,
                 "metrics_ready": False, 
@@ -1683,6 +1989,12 @@ Focus on qualitative analysis and publicly available information.
         
         # Build Call 1 specific requirements with precise HTML structure
         investment_focus = investment_objective or "comprehensive investment analysis"
+        month = current_month()
+        # Splice mode asks for the metrics grid / pre-calculated chart markers (see _apply_call1_splicing)
+        chart_marker = SPLICE_ENABLED and chart_ready_status
+        call1_slides = prompt_registry.render("report.call1.slides", company_name, ticker, month, investment_focus,
+                                              SPLICE_ENABLED, chart_marker)
+        call1_mandate = prompt_registry.render("report.call1.mandate", company_name, month, SPLICE_ENABLED)
         call1_specific = f"""
 ## ALPHA GENERATION PHASE 1: INVESTMENT FOUNDATION & MARKET INEFFICIENCY IDENTIFICATION (SLIDES 1-7)
 
@@ -1847,583 +2159,7 @@ As a top-tier hedge fund Portfolio Manager, your **first phase objective** is to
                 </svg>
             </div>
         </div>
-        <div class="analysis-sections">
-            [CREATE 4 analysis-item blocks with these EXACT titles and sophisticated PM-level focus areas with high info density and concise and precise - ALL Google Search verified as of {datetime.now().strftime("%B %Y")}:]
-            
-            [ANALYSIS ITEM 1 - REASON TO ANALYZE: Write like a top PM explaining to a CIO why this is worth portfolio allocation. Focus on: market dislocation, timing catalyst, asymmetric risk/reward, differentiated insight that others miss. USE GOOGLE SEARCH to verify current market positioning, recent stock performance, and analyst sentiment. Show what consensus gets wrong with specific evidence. 150 words max.]
-            
-            [ANALYSIS ITEM 2 - LONG TERM OUTLOOK: Demonstrate advanced industry understanding and competitive dynamics. Quantify the TAM expansion, market share trajectory, and sustainable competitive advantages. Include specific 3-5 year targets with supporting thesis. USE GOOGLE SEARCH to verify industry growth forecasts, competitive landscape changes, and market size data. Connect strategy to future cash flows. 150 words max.]
-            
-            [ANALYSIS ITEM 3 - FUNDAMENTAL CONCLUSION: Show sophisticated financial analysis connecting current metrics to future value creation. Explain the investment thesis with DCF-level thinking, margin expansion catalysts, and capital allocation effectiveness. USE GOOGLE SEARCH to verify latest financial metrics, margin trends, and capital allocation announcements. Quantify the path to higher returns. 150 words max.]
-            
-            [ANALYSIS ITEM 4 - FIT WITH TOP-DOWN VIEW: Connect this stock pick to macro themes and sector allocation strategy. Show how this fits portfolio construction, correlation benefits, and thematic exposure. Demonstrate institutional-level portfolio thinking. USE GOOGLE SEARCH to verify current macro trends, sector performance, and thematic investment flows. Show asymmetric risk/reward profile. 150 words max.]
-        </div>
-    </main>
-    <footer class="report-footer">
-        <p>Robeco Investment Research</p>
-        <p>Page 1 / 15</p>
-    </footer>
-</div>
-```
-
-**SLIDE 2 - DETAILED ANALYSIS (analysis-item format):**
-```html
-<div class="slide" id="portrait-page-1A">
-    <header class="report-header-container">
-        <div class="slide-logo" style="top: 65px;">
-            <img src="https://images.ctfassets.net/tl4x668xzide/7mygwms2vuSwirnfvaCSvL/72d2bbd858a69aecbf59fd3fb8954484/robeco-logo-color.png" alt="Robeco Logo" style="height: 2rem;">
-        </div>
-        <div class="header-blue-border">
-            <div class="company-header">
-                <!-- INSTRUCTION: Replace with actual company domain (e.g., apple.com, microsoft.com) -->
-                <!-- INSTRUCTION: Replace with company's main domain for logo. Use https://logo.clearbit.com/[COMPANY-DOMAIN].com format
-                Examples: apple.com, microsoft.com, tesla.com, frasersproperty.com, etc. 
-                Research the actual company domain from stock_data['company_name'] and use appropriate domain -->
-                <img src="https://logo.clearbit.com/[COMPANY-DOMAIN].com" onerror="this.onerror=null;this.src='https://placehold.co/20x20/005F90/ffffff?text={ticker}';" alt="Company Icon" class="icon" style="margin-top: -5px; width: 20px; height: 20px;">
-                <h1 class="name"><!-- INSTRUCTION: Use the FULL OFFICIAL company name from stock_data['company_name'] NOT the user input. Example: "Daikin Industries, Ltd." not "DAKIN" --></h1>
-                <!-- INSTRUCTION: Use CONSISTENT rating across ALL slides. Choose ONE: OVERWEIGHT (green #2E7D32), NEUTRAL (orange #FF8C00), or UNDERWEIGHT (red #C62828) -->
-                <div class="rating" style="color: [RATING-COLOR];">[INVESTMENT-RATING]</div>
-            </div>
-        </div>
-    </header>
-    <main>
-        <div class="analysis-sections">
-            [CREATE 5 analysis-item blocks with these EXACT financial analysis categories and company-specific titles - ALL Google Search verified as of {datetime.now().strftime("%B %Y")}:] for {investment_focus}
-            
-            [VALUATION - CREATE SPECIFIC TITLE: Research {company_name}'s current valuation metrics (P/E, EV/EBITDA, P/B) vs peers and historical averages. Create specific title like "VALUATION - Compelling Entry Point at 17.55x FWD P/E" or "VALUATION - Trading at Premium but Justified by Growth Profile". USE GOOGLE SEARCH to verify latest analyst price targets, peer comparisons, and valuation multiples. Explain why current valuation presents opportunity or risk. Include specific price targets and timeline. 150 words max.]
-            
-            [RISKS - CREATE SPECIFIC TITLE: Identify key investment risks specific to {company_name}'s business model and market position. Create specific title like "RISKS - Geopolitical Instability & Supply Chain Volatility Mitigated by Integration" or "RISKS - Regulatory Changes Offset by Diversification Strategy". USE GOOGLE SEARCH to verify current risk factors, recent news, and management commentary. Quantify impact and mitigation strategies. 150 words max.]
-            
-            [QUANTITATIVE CONCLUSION - CREATE SPECIFIC TITLE: Present quantitative analysis using {company_name}'s financial metrics to support investment thesis. Create specific title like "QUANTITATIVE - 15% ROE and 25% EBITDA Growth Drive Alpha Generation" or "QUANTITATIVE - Strong FCF Conversion Supports 12% IRR Target". USE GOOGLE SEARCH to verify latest financial metrics and trends. Connect numbers to investment conclusion. 150 words max.]
-            
-            [SHORT TERM OUTLOOK - CREATE SPECIFIC TITLE: Analyze near-term catalysts and drivers for {company_name}. Create specific title like "SHORT TERM - U.S. Applied Business Driving Q2 FY2026 Beat" or "SHORT TERM - New Product Launch Expected to Drive Q4 Revenue Acceleration". USE GOOGLE SEARCH to verify upcoming earnings, product launches, and management guidance. Include specific timeframes and expected impact. 150 words max.]
-            
-            [EARNINGS REVISIONS - CREATE SPECIFIC TITLE: Analyze earnings revision trends and expectations for {company_name}. Create specific title like "EARNINGS REVISIONS - Consensus Estimates 15% Below Our Target on Cost Synergies" or "EARNINGS REVISIONS - Upgrade Cycle Supports Above-Consensus Growth". USE GOOGLE SEARCH to verify latest analyst revisions, consensus estimates, and earnings surprise history. Explain revision drivers and implications. 150 words max.]
-        </div>
-    </main>
-    <footer class="report-footer">
-        <p>Robeco Investment Research</p>
-        <p>Page 2 / 15</p>
-    </footer>
-</div>
-```
-
-**SLIDES 3-7 - PROSE FORMAT:**
-```html
-<div class="slide report-prose" id="investment-highlights-pitchbook-page">
-    <header class="report-header-container">
-        <div class="slide-logo" style="top: 65px;">
-            <img src="https://images.ctfassets.net/tl4x668xzide/7mygwms2vuSwirnfvaCSvL/72d2bbd858a69aecbf59fd3fb8954484/robeco-logo-color.png" alt="Robeco Logo" style="height: 2rem;">
-        </div>
-        <div class="header-blue-border">
-            <div class="company-header">
-                <!-- INSTRUCTION: Replace with actual company domain (e.g., apple.com, microsoft.com) -->
-                <!-- INSTRUCTION: Replace with company's main domain for logo. Use https://logo.clearbit.com/[COMPANY-DOMAIN].com format
-                Examples: apple.com, microsoft.com, tesla.com, frasersproperty.com, etc. 
-                Research the actual company domain from stock_data['company_name'] and use appropriate domain -->
-                <img src="https://logo.clearbit.com/[COMPANY-DOMAIN].com" onerror="this.onerror=null;this.src='https://placehold.co/20x20/005F90/ffffff?text={ticker}';" alt="Company Icon" class="icon" style="margin-top: -5px; width: 20px; height: 20px;">
-                <h1 class="name"><!-- INSTRUCTION: Use the FULL OFFICIAL company name from stock_data['company_name'] NOT the user input. Example: "Daikin Industries, Ltd." not "DAKIN" --></h1>
-                <!-- INSTRUCTION: Use CONSISTENT rating across ALL slides. Choose ONE: OVERWEIGHT (green #2E7D32), NEUTRAL (orange #FF8C00), or UNDERWEIGHT (red #C62828) -->
-                <div class="rating" style="color: [RATING-COLOR];">[INVESTMENT-RATING]</div>
-            </div>
-        </div>
-    </header>
-    <main class="report-prose">
-        <h3>[Write a specific, insightful title that captures {company_name}'s unique investment highlights - what makes them a superior investment vs all alternatives? Focus on quantifiable competitive advantages that drive superior returns. Example: "TESLA'S VERTICAL INTEGRATION & BATTERY TECHNOLOGY MOAT" or "NVIDIA'S AI CHIP ARCHITECTURE DOMINANCE" - avoid generic titles]</h3>
-        
-        <h4>[Identify the #1 investment strength and write a subsection title that shows HOW this creates economic value. Think like a PM: what specific mechanism drives superior margins/growth/returns? Example: "Ecosystem Lock-in Strategy: 95% Customer Retention Drives 40% Gross Margins" or "Platform Network Effects: 70% Market Share Expansion"]</h4>
-        <p>[Write 400-500 words with ELITE-LEVEL ANALYTICAL DEPTH that demonstrates differentiated insights. NATURAL ANALYSIS FLOW: 1) CORE INVESTMENT STRENGTH: Lead with your key analytical insight about this competitive advantage (e.g., "Network effects are accelerating adoption curves exponentially rather than linearly") 2) SUPPORTING EVIDENCE: Present specific data and metrics supporting your view (e.g., "NPS tracking shows 85% customer satisfaction vs 60% industry average, indicating expanding pricing power") 3) HISTORICAL PERFORMANCE: Explain how this strength drove past results (e.g., "This moat enabled 300bps margin expansion during 2022-23 downturn while peers contracted") 4) QUANTIFIED IMPACT: Use specific metrics and peer comparisons (e.g., "Management guidance suggests this will drive $2.5B incremental revenue by 2025") 5) FORWARD CATALYSTS: Identify specific events proving your thesis (e.g., "Q3 product launch will demonstrate 40% faster implementation vs legacy solutions") 6) INVESTMENT IMPLICATION: Impact on valuation and timeline (e.g., "This justifies 25x multiple vs 18x peer average, driving $15/share upside by year-end"). Present YOUR analytical conclusions first, reference market views only when directly relevant. Show sophisticated understanding of business model economics and competitive dynamics.]</p>
-        
-        <h4>[Second major investment strength with focus on financial impact and differentiation from peers]</h4>
-        <p>[400-500 words of sophisticated analysis connecting this strength to valuation expansion and alpha generation]</p>
-        
-        <h4>[Third investment strength focusing on growth drivers and scalability]</h4>
-        <p>[400-500 words demonstrating deep understanding of business model economics and expansion potential]</p>
-        
-        <h4>[Fourth investment strength emphasizing risk-adjusted returns and portfolio benefits]</h4>
-        <p>[400-500 words showing institutional-level thinking about correlation, volatility, and portfolio construction]</p>
-    </main>
-    <footer class="report-footer"><p>Robeco Investment Research</p><p>Page 3 / 15</p></footer>
-</div>
-
-<div class="slide report-prose" id="catalyst-page">
-    <header class="report-header-container">
-        <div class="slide-logo" style="top: 65px;">
-            <img src="https://images.ctfassets.net/tl4x668xzide/7mygwms2vuSwirnfvaCSvL/72d2bbd858a69aecbf59fd3fb8954484/robeco-logo-color.png" alt="Robeco Logo" style="height: 2rem;">
-        </div>
-        <div class="header-blue-border">
-            <div class="company-header">
-                <!-- INSTRUCTION: Replace with actual company domain (e.g., apple.com, microsoft.com) -->
-                <!-- INSTRUCTION: Replace with company's main domain for logo. Use https://logo.clearbit.com/[COMPANY-DOMAIN].com format
-                Examples: apple.com, microsoft.com, tesla.com, frasersproperty.com, etc. 
-                Research the actual company domain from stock_data['company_name'] and use appropriate domain -->
-                <img src="https://logo.clearbit.com/[COMPANY-DOMAIN].com" onerror="this.onerror=null;this.src='https://placehold.co/20x20/005F90/ffffff?text={ticker}';" alt="Company Icon" class="icon" style="margin-top: -5px; width: 20px; height: 20px;">
-                <h1 class="name"><!-- INSTRUCTION: Use the FULL OFFICIAL company name from stock_data['company_name'] NOT the user input. Example: "Daikin Industries, Ltd." not "DAKIN" --></h1>
-                <!-- INSTRUCTION: Use CONSISTENT rating across ALL slides. Choose ONE: OVERWEIGHT (green #2E7D32), NEUTRAL (orange #FF8C00), or UNDERWEIGHT (red #C62828) -->
-                <div class="rating" style="color: [RATING-COLOR];">[INVESTMENT-RATING]</div>
-            </div>
-        </div>
-    </header>
-    <main class="report-prose">
-        <h3>[ANALYZE {company_name}'S ACTUAL BUSINESS - Write title showing THE SPECIFIC CATALYST STORYLINE for THIS company. Study what drove {company_name}'s stock historically, what's changing NOW, and future implications. Example based on REAL analysis: "FLCT'S LOGISTICS RENTAL REVERSIONS: FROM 2023 DPU PRESSURE TO 2026 RECOVERY" or "APPLE'S SERVICES INFLECTION: BREAKING THE HARDWARE DEPENDENCE CYCLE"]</h3>
-        
-        **🎯 MANDATORY CATALYST ANALYSIS APPROACH:**
-        
-        **Step 1: STUDY {company_name}'S HISTORICAL STOCK DRIVERS**
-        - What fundamental changes moved {company_name}'s stock price in past 3 years? (important to understand the company's business model and how it has changed over time)
-        - Which earnings releases, business developments, or industry events drove major moves?
-        - What valuation multiples does {company_name} trade at during good/bad times?
-        
-        **Step 2: IDENTIFY {company_name}'S CURRENT CATALYST DEVELOPMENTS**  
-        - What business developments are happening NOW that mirror past stock drivers?
-        - Which upcoming earnings, product launches, or strategic moves matter for {company_name}?
-        - What's priced in vs what market is missing about {company_name}?
-        
-        **Step 3: CREATE COMPANY-SPECIFIC CATALYST SECTIONS**
-        - Write 3-4 catalyst subsections based on {company_name}'s ACTUAL business model
-        - Connect {company_name}'s past stock performance to current developments
-        - Show forward-looking view of {company_name}'s specific triggers
-        
-        [CREATE 3-4 CATALYST SECTIONS SPECIFIC TO {company_name}'S BUSINESS - NOT GENERIC TEMPLATES. Each 150 words showing: HISTORICAL PATTERN for this company → CURRENT DEVELOPMENT for this company → FUTURE STOCK IMPACT for this company. Base everything on {company_name}'s actual fundamentals, stock history, and business model.]
-    </main>
-    <footer class="report-footer"><p>Robeco Investment Research</p><p>Page 4 / 15</p></footer>
-</div>
-
-<div class="slide report-prose" id="company-analysis-page">
-    <header class="report-header-container">
-        <div class="slide-logo" style="top: 65px;">
-            <img src="https://images.ctfassets.net/tl4x668xzide/7mygwms2vuSwirnfvaCSvL/72d2bbd858a69aecbf59fd3fb8954484/robeco-logo-color.png" alt="Robeco Logo" style="height: 2rem;">
-        </div>
-        <div class="header-blue-border">
-            <div class="company-header">
-                <!-- INSTRUCTION: Replace with actual company domain (e.g., apple.com, microsoft.com) -->
-                <!-- INSTRUCTION: Replace with company's main domain for logo. Use https://logo.clearbit.com/[COMPANY-DOMAIN].com format
-                Examples: apple.com, microsoft.com, tesla.com, frasersproperty.com, etc. 
-                Research the actual company domain from stock_data['company_name'] and use appropriate domain -->
-                <img src="https://logo.clearbit.com/[COMPANY-DOMAIN].com" onerror="this.onerror=null;this.src='https://placehold.co/20x20/005F90/ffffff?text={ticker}';" alt="Company Icon" class="icon" style="margin-top: -5px; width: 20px; height: 20px;">
-                <h1 class="name"><!-- INSTRUCTION: Use the FULL OFFICIAL company name from stock_data['company_name'] NOT the user input. Example: "Daikin Industries, Ltd." not "DAKIN" --></h1>
-                <!-- INSTRUCTION: Use CONSISTENT rating across ALL slides. Choose ONE: OVERWEIGHT (green #2E7D32), NEUTRAL (orange #FF8C00), or UNDERWEIGHT (red #C62828) -->
-                <div class="rating" style="color: [RATING-COLOR];">[INVESTMENT-RATING]</div>
-            </div>
-        </div>
-    </header>
-    <main class="report-prose">
-        <h3>[Create company-specific investment thesis title that captures the unique alpha opportunity for {company_name} as of {datetime.now().strftime("%B %Y")}. Examples: "NVIDIA'S AI INFRASTRUCTURE MONOPOLY: $400B TAM WITH 80% MARKET DOMINANCE" or "TESLA'S MANUFACTURING REVOLUTION: $25K MODEL UNLOCKING 50M UNIT TAM" - Use actual company name, specific metrics, and the core alpha driver that makes this stock outperform]</h3>
-        
-        [INSTRUCTION: Identify 3-4 MOST CRITICAL ALPHA-GENERATING THEMES specific to {company_name}'s situation. DO NOT use fixed sections. Choose from company-specific opportunities like:]
-        
-        [- Business Model Innovation (e.g., subscription transformation, platform economics)]
-        [- Technology Leadership (e.g., AI advantage, patent moat, R&D superiority)]  
-        [- Market Disruption (e.g., new category creation, legacy player displacement)]
-        [- Geographic Expansion (e.g., China penetration, India opportunity, Europe growth)]
-        [- Competitive Moat Expansion (e.g., ecosystem lock-in, network effects, scale economics)]
-        [- Regulatory Advantage (e.g., policy beneficiary, compliance moat, licensing barriers)]
-        [- ESG Transformation (e.g., sustainability leadership, carbon advantage, social impact)]
-        [- Capital Allocation Mastery (e.g., buyback strategy, dividend growth, M&A execution)]
-        [- Management Transition (e.g., new CEO catalyst, strategic pivot, operational excellence)]
-        [- Cyclical Recovery (e.g., downturn bottom, capacity utilization, pricing power return)]
-        [- Activist Catalyst (e.g., shareholder pressure, strategic review, asset optimization)]
-        [- Spin-off Value (e.g., conglomerate discount, pure-play premium, asset unlock)]
-        
-        <h4>[ALPHA THEME 1 - CHOOSE MOST CRITICAL]: [Create insight-rich title specific to {company_name}. Example: "NVIDIA's CUDA Software Moat: $50B Ecosystem with 95% Developer Mind Share" or "Tesla's 4680 Battery Breakthrough: 50% Cost Reduction Enabling $25K Model"]</h4>
-        <p>[Write 750-800 words proving why this theme creates alpha for {company_name}. FRAMEWORK: 1) OPPORTUNITY QUANTIFICATION: Size the specific opportunity with TAM, growth rates, margin impact 2){company_name} ADVANTAGE: Explain unique positioning vs competitors with specific metrics 3) MARKET MISUNDERSTANDING: What consensus gets wrong about this opportunity 4) CATALYST TIMING: When this theme will drive stock performance with specific timeline 5) FINANCIAL IMPACT: Connect to earnings growth, margin expansion, multiple re-rating with numbers. Use Google-verified current data and forward-looking insights.]</p>
-        
-        <h4>[ALPHA THEME 2 - CHOOSE SECOND MOST CRITICAL]: [Create insight-rich title specific to {company_name}. Example: "Apple's India Manufacturing: $25B Smartphone Market with 15% Price Reduction" or "Amazon's AI Infrastructure: Bedrock $10B Revenue Potential vs Google/Azure"]</h4>
-        <p>[Write 750-800 words proving alpha generation. Same framework as Theme 1 - focus on what makes {company_name} unique in this specific opportunity area.]</p>
-        
-        <h4>[ALPHA THEME 3 - CHOOSE THIRD MOST CRITICAL]: [Create insight-rich title specific to {company_name}. Example: "Microsoft's Enterprise AI Stack: Teams/Office Integration Creating $50B TAM" or "Meta's Metaverse Recovery: Reality Labs Break-even by 2026"]</h4>
-        <p>[Write 750-800 words proving alpha generation. Same framework - connect theme to specific stock outperformance catalyst.]</p>
-        
-        <h4>[ALPHA THEME 4 - OPTIONAL FOURTH THEME IF CRITICAL]: [Create insight-rich title if there's a fourth major alpha driver specific to {company_name}]</h4>
-        <p>[Write 750-800 words if needed for complete investment story. Focus on timing and quantified impact.]</p>
-    </main>
-    <footer class="report-footer"><p>Robeco Investment Research</p><p>Page 5 / 15</p></footer>
-</div>
-
-<div class="slide report-prose" id="slide-industry-analysis">
-    <header class="report-header-container">
-        <div class="slide-logo" style="top: 65px;">
-            <img src="https://images.ctfassets.net/tl4x668xzide/7mygwms2vuSwirnfvaCSvL/72d2bbd858a69aecbf59fd3fb8954484/robeco-logo-color.png" alt="Robeco Logo" style="height: 2rem;">
-        </div>
-        <div class="header-blue-border">
-            <div class="company-header">
-                <!-- INSTRUCTION: Replace with actual company domain (e.g., apple.com, microsoft.com) -->
-                <!-- INSTRUCTION: Replace with company's main domain for logo. Use https://logo.clearbit.com/[COMPANY-DOMAIN].com format
-                Examples: apple.com, microsoft.com, tesla.com, frasersproperty.com, etc. 
-                Research the actual company domain from stock_data['company_name'] and use appropriate domain -->
-                <img src="https://logo.clearbit.com/[COMPANY-DOMAIN].com" onerror="this.onerror=null;this.src='https://placehold.co/20x20/005F90/ffffff?text={ticker}';" alt="Company Icon" class="icon" style="margin-top: -5px; width: 20px; height: 20px;">
-                <h1 class="name"><!-- INSTRUCTION: Use the FULL OFFICIAL company name from stock_data['company_name'] NOT the user input. Example: "Daikin Industries, Ltd." not "DAKIN" --></h1>
-                <!-- INSTRUCTION: Use CONSISTENT rating across ALL slides. Choose ONE: OVERWEIGHT (green #2E7D32), NEUTRAL (orange #FF8C00), or UNDERWEIGHT (red #C62828) -->
-                <div class="rating" style="color: [RATING-COLOR];">[INVESTMENT-RATING]</div>
-            </div>
-        </div>
-    </header>
-    <main>
-        <h3>[Create contrarian sector insight specific to {company_name}'s industry situation that drives investment outperformance. Examples: "SEMICONDUCTOR AI GOLD RUSH: NVIDIA CAPTURES 80% OF $400B INFRASTRUCTURE BUILD" or "CLOUD WARS ENDGAME: ENTERPRISE AI MIGRATION CREATING WINNER-TAKE-ALL" - Focus on sector dynamics that specifically benefit {company_name} vs peers]</h3>
-        
-        [INSTRUCTION: Identify 2-3 MOST CRITICAL SECTOR THEMES that directly impact {company_name}'s investment case. Choose themes based on current industry situation:]
-        
-        [SECTOR THEME OPTIONS: Market Transformation, Technology Cycle, Regulatory Disruption, Competitive Consolidation, Supply Chain Shifts, ESG Requirements, Geopolitical Impact, Capital Cycle, Customer Behavior Change, Pricing Power Inflection, etc.]
-        
-        <h4>[SECTOR THEME 1 - MOST CRITICAL FOR {company_name}]: [Create sector-insight title. Example: "AI Infrastructure Capex Supercycle: $150B→$400B TAM Favoring NVIDIA's 80% Market Share" or "Enterprise AI Adoption: $200B Cloud Migration Benefiting AWS 32% Market Position"]</h4>
-        <p>[Write 800-900 words proving how this sector trend specifically benefits {company_name}. FRAMEWORK: 1) SECTOR TREND QUANTIFICATION: Size the trend with Google-verified TAM, growth rates, timeline 2) {company_name} POSITIONING: Exact market share, competitive advantage in this trend vs peers 3) MARKET MISUNDERSTANDING: What consensus gets wrong about sector dynamics 4) CATALYST TIMING: When sector trend accelerates with impact on {company_name} 5) FINANCIAL IMPLICATIONS: Connect to {company_name}'s earnings/margin/multiple expansion. Use current industry data and forward projections.]</p>
-        
-        <h4>[SECTOR THEME 2 - SECOND MOST CRITICAL]: [Create sector-insight title specific to {company_name}'s opportunity. Example: "Geopolitical Supply Chain Reshoring: $50B Domestic Chip Investment Benefiting Intel Manufacturing" or "SaaS Margin Expansion Cycle: Enterprise Software Pricing Power Favoring Microsoft/Salesforce"]</h4>
-        <p>[Write 800-900 words proving sector advantage for {company_name}. Same framework - focus on what gives {company_name} specific edge in this sector dynamic.]</p>
-        
-        <h4>[SECTOR THEME 3 - OPTIONAL THIRD THEME IF CRITICAL]: [Create sector-insight title if there's a third major sector dynamic affecting {company_name}]</h4>
-        <p>[Write 800-900 words if needed for complete sector story. Connect to stock outperformance catalyst.]</p>
-    </main>
-    <footer class="report-footer"><p>Robeco Investment Research</p><p>Page 6 / 15</p></footer>
-</div>
-
-<div class="slide report-prose" id="slide-competitive-advantage">
-    <header class="report-header-container">
-        <div class="slide-logo" style="top: 65px;">
-            <img src="https://images.ctfassets.net/tl4x668xzide/7mygwms2vuSwirnfvaCSvL/72d2bbd858a69aecbf59fd3fb8954484/robeco-logo-color.png" alt="Robeco Logo" style="height: 2rem;">
-        </div>
-        <div class="header-blue-border">
-            <div class="company-header">
-                <!-- INSTRUCTION: Replace with actual company domain (e.g., apple.com, microsoft.com) -->
-                <!-- INSTRUCTION: Replace with company's main domain for logo. Use https://logo.clearbit.com/[COMPANY-DOMAIN].com format
-                Examples: apple.com, microsoft.com, tesla.com, frasersproperty.com, etc. 
-                Research the actual company domain from stock_data['company_name'] and use appropriate domain -->
-                <img src="https://logo.clearbit.com/[COMPANY-DOMAIN].com" onerror="this.onerror=null;this.src='https://placehold.co/20x20/005F90/ffffff?text={ticker}';" alt="Company Icon" class="icon" style="margin-top: -5px; width: 20px; height: 20px;">
-                <h1 class="name"><!-- INSTRUCTION: Use the FULL OFFICIAL company name from stock_data['company_name'] NOT the user input. Example: "Daikin Industries, Ltd." not "DAKIN" --></h1>
-                <!-- INSTRUCTION: Use CONSISTENT rating across ALL slides. Choose ONE: OVERWEIGHT (green #2E7D32), NEUTRAL (orange #FF8C00), or UNDERWEIGHT (red #C62828) -->
-                <div class="rating" style="color: [RATING-COLOR];">[INVESTMENT-RATING]</div>
-            </div>
-        </div>
-    </header>
-    <main>
-        <h3>[Create quantified competitive advantage thesis specific to {company_name}'s moat that drives alpha generation as of {datetime.now().strftime("%B %Y")}. Examples: "NVIDIA'S AI SOFTWARE ECOSYSTEM: $50B CUDA MOAT WITH 95% DEVELOPER MIND SHARE" or "TESLA'S MANUFACTURING MACHINE: 50% COST ADVANTAGE ENABLING $25K MODEL" - Focus on {company_name}'s strongest, most defensible competitive advantages]</h3>
-        
-        [INSTRUCTION: Identify 2-3 STRONGEST COMPETITIVE ADVANTAGES that create sustainable alpha for {company_name}. Choose moats based on what's most defensible:]
-        
-        [MOAT OPTIONS: Technology Leadership, Scale Economics, Network Effects, Brand Premium, Switching Costs, Regulatory Barriers, Geographic Advantages, Vertical Integration, IP Portfolio, Management Execution, Capital Access, Data Advantages, Platform Control, etc.]
-        
-        <h4>[COMPETITIVE MOAT 1 - STRONGEST FOR {company_name}]: [Create quantified-moat title. Example: "CUDA Software Ecosystem: $50B Platform with 95% AI Developer Mind Share" or "iPhone Ecosystem Lock-In: 1.4B Devices Creating $80B Annual Services Revenue"]</h4>
-        <p>[Write 800-900 words proving sustainable competitive advantage for {company_name}. FRAMEWORK: 1) MOAT QUANTIFICATION: Measure advantage with specific financial metrics, market share, switching costs 2) SUSTAINABILITY PROOF: Why advantage is expanding not contracting vs historical periods 3) COMPETITOR FAILURE ANALYSIS: Why peers cannot replicate advantage in next 2-3 years with specific examples 4) PRICING POWER CONNECTION: How moat enables premium pricing, margin expansion, market share gains 5) ALPHA GENERATION: Connect moat strength to specific stock outperformance catalyst with timing. Use Google-verified competitive intelligence.]</p>
-        
-        <h4>[COMPETITIVE MOAT 2 - SECOND STRONGEST]: [Create quantified-moat title specific to {company_name}. Example: "Manufacturing Cost Leadership: 50% Lower Production Costs vs Legacy Automakers" or "Enterprise Software Stickiness: 95% Renewal Rates with 120% Net Revenue Retention"]</h4>
-        <p>[Write 800-900 words proving second competitive advantage. Same framework - show why this moat creates alpha vs peers.]</p>
-        
-        <h4>[COMPETITIVE MOAT 3 - OPTIONAL THIRD MOAT IF CRITICAL]: [Create quantified-moat title if there's a third major competitive advantage for {company_name}]</h4>
-        <p>[Write 800-900 words if needed for complete competitive story. Focus on moat expansion trajectory.]</p>
-    </main>
-    <footer class="report-footer"><p>Robeco Investment Research</p><p>Page 7 / 15</p></footer>
-</div>
-```
-
-**INSTRUCTIONS FOR HTML STRUCTURE:**
-- Replace "Apple" examples with actual company being analyzed
-- Use company-specific Clearbit URL: `https://logo.clearbit.com/[company-domain].com`
-- Create insightful, company-specific titles that show unique investment insights
-- Keep exact HTML structure but customize content for each company
-
-<div class="slide report-prose" id="slide-industry-analysis">
-    <header class="report-header-container"><!-- Same header --></header>
-    <main>
-        <h3>6. [INDUSTRY SECTOR]: [SPECIFIC MARKET DYNAMICS THEME]</h3>
-        <p><strong>[Market Overview Section]</strong></p>
-        <p>[600-word industry analysis paragraph with market size, growth trends, key drivers]</p>
-        <p><strong>[Competitive Landscape Section]</strong></p>
-        <p>[600-word competitive analysis with market share, key players, positioning]</p>
-        <!-- Continue for 4-5 subsections -->
-    </main>
-    <footer class="report-footer"><p>Robeco Investment Research</p><p>Page 6 / 15</p></footer>
-</div>
-
-<div class="slide report-prose" id="slide-competitive-advantage">
-    <header class="report-header-container"><!-- Same header --></header>
-    <main>
-        <h3>7. COMPETITIVE ADVANTAGE: [SPECIFIC MOAT & DIFFERENTIATION THEME]</h3>
-        <h4 style="font-size: 22.5px; color: var(--robeco-blue-darker);">[Competitive Positioning]: [Market Share & Leadership]</h4>
-        <p>[600-word analysis of competitive position, market share trends, peer comparison]</p>
-        <h4 style="font-size: 22.5px; color: var(--robeco-blue-darker);">[Competitive Moat]: [Sustainable Advantages]</h4>
-        <p>[600-word analysis of barriers to entry, technology leadership, brand strength]</p>
-        <!-- Continue for 4-5 subsections -->
-    </main>
-    <footer class="report-footer"><p>Robeco Investment Research</p><p>Page 7 / 15</p></footer>
-</div>
-```
-
-### CALL 1 CONTENT SPECIFICATIONS:
-
-**SLIDE 1 REQUIREMENTS:**
-- **Metrics Grid**: Generate EXACTLY 25 metrics in 5x5 grid (MAIN LISTING, SHARE PRICE, MARKET CAP, etc.)
-- **Executive Summary**: 300-word paragraph with company overview, market position, key metrics
-- **Stock Chart**: D3.js SVG chart showing 5-year price history with current price highlight
-- **Analysis Items**: 4 sections using `analysis-item` class with specific titles
-
-**SLIDE 2 REQUIREMENTS:**
-- **Analysis Items**: EXACTLY 5 sections with SPECIFIC titles and content focus:
-  1. **VALUATION** - Compelling Entry Point at [X]x FWD P/E: Current valuation metrics, DCF analysis, peer comparison, intrinsic value calculation
-  2. **RISKS** - [Primary Risk Category] & [Secondary Risk Category]: Key downside risks with specific impact quantification
-  3. **QUANTITATIVE CONCLUSION** - Strong [Key Metric] Generation & [Financial Strength]: ROE, ROIC, cash flow analysis, balance sheet strength
-  4. **SHORT TERM OUTLOOK** - [Specific Timeline] Earnings & [Key Catalyst]: Near-term catalysts, earnings expectations, management guidance
-  5. **EARNINGS REVISIONS** - Consensus [Under/Over]estimates [Key Theme] Momentum: Analyst expectations, revision trends, surprise potential
-- **Format**: Each analysis-item has `item-title` with **bold title** and `content-item` with 200-300 word analysis
-
-**SLIDES 3-7 REQUIREMENTS:**
-
-**SLIDE 3 - COMPANY ANALYSIS (3 FLEXIBLE SECTIONS):**
-- **H3 Title**: Create compelling title specific to {company_name}'s unique investment proposition as of {datetime.now().strftime("%B %Y")}
-
-**TITLE CONSTRUCTION FORMULA**: "3. {company_name}: [CORE INVESTMENT THEME] AMID [CURRENT MARKET/INDUSTRY CONTEXT]"
-
-**TITLE CONSTRUCTION PRINCIPLES:**
-- **Company Name**: Always start with {company_name}
-- **Investment Theme**: Capture the 2-3 word core thesis (what drives value creation)
-- **Current Context**: Reference the current environment this company operates in
-- **Specificity**: Avoid generic terms - be specific to this company's situation
-
-**FLEXIBLE TITLE STRUCTURE TEMPLATES:**
-- "3. {company_name}: [BUSINESS TRANSFORMATION] AMID [MARKET CONDITIONS]"
-- "3. {company_name}: [COMPETITIVE ADVANTAGE] & [GROWTH DRIVER] AMID [INDUSTRY DYNAMICS]"  
-- "3. {company_name}: [STRATEGIC POSITIONING] AMID [ECONOMIC/REGULATORY ENVIRONMENT]"
-
-**TITLE PRINCIPLES:**
-- Include {company_name} at the beginning
-- Capture the PRIMARY investment thesis in 3-6 words
-- Reference current industry/macro environment context
-- Make it immediately clear what drives this company's value creation as of {datetime.now().strftime("%B %Y")}
-
-**🎯 HEDGE FUND ANALYST TO PM ANALYSIS - ULTRA-HIGH DENSITY:**
-Generate EXACTLY 3 sections tailored to this specific company's fundamental drivers. Each section should provide differentiated insights that an experienced PM needs to make portfolio allocation decisions.
-
-**MULTI-DIMENSIONAL ANALYSIS FRAMEWORK:**
-Choose the 3 most critical analytical areas for THIS specific company, incorporating competitive intelligence and differentiated positioning. Consider multiple analytical dimensions:
-
-**CORE ANALYTICAL DIMENSIONS (Select 3 Most Critical):**
-- **Competitive Positioning Evolution**: How has {company_name}'s competitive position shifted vs key rivals? What are competitors doing that impacts {company_name}?
-- **Business Model Differentiation**: What unique economic drivers separate {company_name} from competitors? How sustainable are these advantages?
-- **Market Share Dynamics**: Where is {company_name} gaining/losing ground? What competitive moves are reshaping market structure?
-- **Operational Excellence vs Peers**: How do {company_name}'s operational metrics compare to best-in-class competitors?
-- **Strategic Response Analysis**: How is {company_name} responding to competitive threats? What strategic initiatives differentiate from peer approaches?
-- **Technology/Innovation Gap**: Where does {company_name} lead or lag technologically vs competitors? What are the investment implications?
-- **Financial Performance Divergence**: Why do {company_name}'s financial metrics differ from peers? What explains relative valuation gaps?
-- **Management Execution vs Peers**: How does {company_name}'s management track record compare to competitive alternatives?
-
-**COMPETITIVE INTELLIGENCE REQUIREMENTS:**
-- **Peer Performance Analysis**: Compare {company_name} to 3-5 closest competitors with specific metrics
-- **Strategic Moves Tracking**: Reference recent competitor actions and their impact on {company_name}
-- **Market Position Shifts**: Quantify how competitive landscape changes affect {company_name}'s prospects
-- **Differentiated Investment Case**: Explain why {company_name} is better/worse positioned than alternatives
-
-**SECTION CONSTRUCTION REQUIREMENTS:**
-
-**SECTION TITLES - MUST BE COMPANY-SPECIFIC & INSIGHTFUL:**
-Each of the 3 sections must have H4 titles that immediately convey the analytical insight for {company_name} as of {datetime.now().strftime("%B %Y")}
-
-**SECTION TITLE FORMULA**: "[SPECIFIC BUSINESS DRIVER] + [QUANTIFIED IMPACT] + [TIMELINE/DIRECTION]"
-
-**SECTION TITLE CONSTRUCTION PRINCIPLES:**
-- **Business-Specific**: Focus on the actual drivers unique to this company's business model
-- **Quantified Impact**: Include specific numbers, percentages, or financial metrics
-- **Time-Bound**: Provide timeline for when the impact will be realized
-- **Directional**: Make clear if this is positive, negative, or mixed for the investment case
-
-**TITLE STRUCTURE EXAMPLES (ADAPT TO ANY COMPANY/INDUSTRY):**
-- "[BUSINESS CHANGE]: [X% FINANCIAL IMPACT] OVER [TIMEFRAME] FROM [ROOT CAUSE]"
-- "[STRATEGIC INITIATIVE]: [QUANTIFIED BENEFIT] DRIVING [SPECIFIC OUTCOME] BY [DATE]"
-- "[MARKET DYNAMIC]: [MEASURED EFFECT] ON [KEY METRIC] THROUGH [PERIOD]"
-
-**ANALYTICAL REQUIREMENTS:**
-- **Competitive Context Integration**: Each section must compare {company_name} to 2-3 specific competitors with quantified metrics
-- **Historical Evolution Analysis**: Reference 3-5 year performance trends for both {company_name} and key competitors
-- **Fundamental Drivers Analysis**: Connect {company_name}'s business drivers to financial metrics, explaining divergence from peer performance
-- **Competitive Intelligence**: Reference specific competitor actions, strategies, or announcements that impact {company_name}
-- **Differentiated Investment Thesis**: Explain why {company_name} is positioned better/worse than alternatives with specific evidence
-- **Forward-Looking Competitive Dynamics**: Predict how competitive landscape will evolve and impact {company_name} over 12-24 months
-- **Quantified Comparative Analysis**: Include 8-12 specific metrics showing {company_name} vs peer performance per section
-- **PM-Level Competitive Sophistication**: Focus on non-obvious competitive advantages/disadvantages and second-order market effects
-
-**ULTRA-HIGH INFORMATION DENSITY STANDARDS:**
-- Each section: 600-800 words with MINIMUM 15 quantified data points
-- Every paragraph must contain 3-4 specific metrics, dates, or comparative benchmarks
-- **Competitive Data Density**: Include 5-8 peer comparison metrics per section
-- **Historical Benchmarking**: Reference 3-5 specific competitor moves/events with quantified impacts
-- **Forward-Looking Competitive Intelligence**: Predict competitor responses with probability assessments
-- **Multi-Dimensional Comparison**: Compare across financial performance, operational metrics, strategic positioning, and market share
-- Connect micro-level company dynamics to macro industry/economic trends and competitive landscape shifts
-
-**COMPETITIVE ANALYSIS DEPTH REQUIREMENTS:**
-- **Peer Identification**: Name 2-3 specific closest competitors in each section
-- **Quantified Positioning**: Show exact metrics where {company_name} leads/lags (market share %, margins, growth rates, etc.)
-- **Strategic Differentiation**: Explain specific strategic choices that differentiate {company_name} from each major competitor
-- **Competitive Response Prediction**: Forecast how competitors will react to {company_name}'s moves and vice versa
-
-**SLIDE 4 - CATALYSTS & DEVELOPMENTS (3 FLEXIBLE SECTIONS):**
-- **H3 Title**: Create compelling title specific to {company_name}'s most important catalysts as of {datetime.now().strftime("%B %Y")}
-
-**TITLE CONSTRUCTION FORMULA**: "4. {company_name}: [PRIMARY CATALYST THEME] & [SECONDARY DRIVER] CATALYSTS"
-
-**FLEXIBLE TITLE STRUCTURE TEMPLATES:**
-- "4. {company_name}: [STRATEGIC INITIATIVE] & [MARKET OPPORTUNITY] CATALYSTS"
-- "4. {company_name}: [PRODUCT CYCLE] & [COMPETITIVE ADVANTAGE] CATALYSTS"  
-- "4. {company_name}: [OPERATIONAL TRANSFORMATION] & [FINANCIAL INFLECTION] CATALYSTS"
-
-**🎯 CATALYST SELECTION FRAMEWORK:**
-Generate EXACTLY 3 catalyst sections tailored to {company_name}'s most critical value drivers. Choose from multiple catalyst dimensions based on what's most relevant:
-
-**CATALYST DIMENSIONS (Select 3 Most Critical):**
-- **Product/Innovation Catalysts**: New launches, R&D breakthroughs, technology advantages
-- **Strategic/Operational Catalysts**: Management initiatives, operational improvements, strategic pivots
-- **Market/Competitive Catalysts**: Market share gains, competitive positioning shifts, industry disruption
-- **Financial/Capital Allocation Catalysts**: Margin expansion, capital efficiency, dividend/buyback programs
-- **Regulatory/Policy Catalysts**: Regulatory approvals, policy changes, compliance advantages
-- **Geographic/Market Expansion Catalysts**: New market entry, geographic expansion, customer acquisition
-- **Cyclical/Economic Catalysts**: Economic recovery, commodity cycles, interest rate sensitivity
-- **ESG/Sustainability Catalysts**: ESG improvements, sustainability initiatives, carbon transition
-
-**COMPETITIVE CATALYST INTELLIGENCE:**
-- **Catalyst Timing vs Peers**: How do {company_name}'s catalysts compare to competitor timelines?
-- **Competitive Response Analysis**: How will competitors react to {company_name}'s catalyst execution?
-- **First-Mover Advantages**: Where does {company_name} have timing advantages vs peers?
-- **Catalyst Risk Assessment**: What could derail catalyst execution and how does this compare to peer risks?
-
-**SECTION CONSTRUCTION REQUIREMENTS:**
-- **Catalyst-Specific Titles**: Each section must have H4 title that specifies the exact catalyst with quantified impact and timeline
-- **Competitive Context**: Compare catalyst strength/timing to 2-3 key competitors
-- **Historical Context**: Reference past catalyst execution by {company_name} and lessons learned
-- **Quantified Impact Analysis**: Include specific financial/operational impact predictions with timelines
-- **Probability Assessment**: Assign execution probability and timeline confidence levels
-- **Market Recognition Analysis**: Predict when and how market will recognize catalyst value
-
-**ULTRA-HIGH CATALYST DENSITY STANDARDS:**
-- Each section: 600-700 words with MINIMUM 12 quantified catalyst metrics
-- **Competitive Benchmarking**: Include 4-6 peer catalyst comparisons per section
-- **Timeline Specificity**: Provide exact dates, quarters, or timeframes for catalyst realization
-- **Impact Quantification**: Include specific revenue, margin, or earnings impact predictions
-- **Catalyst Chain Analysis**: Show how catalysts connect and compound over time
-
-**SLIDE 5 - BUSINESS MODEL ANALYSIS (3 FLEXIBLE SECTIONS):**
-- **H3 Title**: Create compelling title specific to {company_name}'s unique business model strengths as of {datetime.now().strftime("%B %Y")}
-
-**TITLE CONSTRUCTION FORMULA**: "5. {company_name}: [CORE BUSINESS MODEL ADVANTAGE] & [DIFFERENTIATED VALUE CREATION]"
-
-**FLEXIBLE TITLE STRUCTURE TEMPLATES:**
-- "5. {company_name}: [ECONOMIC MOAT] & [SCALABILITY ADVANTAGE] ANALYSIS"
-- "5. {company_name}: [OPERATIONAL EXCELLENCE] & [FINANCIAL EFFICIENCY] DRIVERS"
-- "5. {company_name}: [STRATEGIC POSITIONING] & [VALUE CREATION] MECHANISMS"
-
-**🎯 BUSINESS MODEL ANALYSIS FRAMEWORK:**
-Generate EXACTLY 3 sections tailored to {company_name}'s most critical business model drivers. Choose the most relevant analytical areas based on what creates sustainable competitive advantage:
-
-**BUSINESS MODEL DIMENSIONS (Select 3 Most Critical):**
-- **Economic Moat Analysis**: Network effects, switching costs, scale advantages, regulatory barriers
-- **Revenue Model Optimization**: Recurring vs transactional, pricing power, customer lifetime value
-- **Operational Leverage Dynamics**: Fixed cost absorption, margin expansion potential, scalability factors
-- **Capital Efficiency Metrics**: Asset turnover, working capital management, capital allocation effectiveness
-- **Technology/Innovation Moats**: R&D productivity, patent protection, technological differentiation
-- **Customer/Market Positioning**: Brand strength, customer loyalty, market positioning power
-- **Supply Chain/Distribution Advantages**: Vertical integration, supplier relationships, distribution control
-- **Management Execution Excellence**: Strategic vision, operational execution, capital allocation track record
-
-**COMPETITIVE BUSINESS MODEL INTELLIGENCE:**
-- **Business Model Comparison**: How does {company_name}'s model differ from 2-3 key competitors?
-- **Sustainability Analysis**: Which competitive advantages are most defensible long-term?
-- **Evolution Tracking**: How has {company_name}'s business model evolved vs peers over 3-5 years?
-- **Disruption Vulnerability**: Where is the business model most/least vulnerable to disruption?
-
-**SECTION CONSTRUCTION REQUIREMENTS:**
-- **Business-Specific Titles**: Each section must have H4 title that captures the specific business model insight with quantified advantage
-- **Competitive Differentiation**: Explain exactly how {company_name}'s approach differs from competitors with specific evidence
-- **Historical Performance**: Reference 3-5 year track record demonstrating business model strength
-- **Quantified Advantages**: Include specific metrics showing business model superiority (margins, returns, growth rates)
-- **Future Evolution**: Predict how business model will adapt/strengthen over 12-24 months
-- **Valuation Implications**: Connect business model strengths to justified valuation premium/discount
-
-**ULTRA-HIGH BUSINESS MODEL DENSITY STANDARDS:**
-- Each section: 700-800 words with MINIMUM 15 quantified business metrics
-- **Competitive Benchmarking**: Include 5-7 peer business model comparisons per section
-- **Historical Trend Analysis**: Show 3-5 year evolution of key business model metrics
-- **Economic Value Quantification**: Include specific ROI, ROIC, or value creation measurements
-- **Predictive Analysis**: Forecast business model performance with probability assessments
-
-**SLIDE 6 - SECTOR INSIGHT (FLEXIBLE MARKET-SPECIFIC ANALYSIS):**
-- **H3 Title**: Create contrarian sector insight specific to {company_name}'s industry situation as of {datetime.now().strftime("%B %Y")} (e.g., "6. SEMICONDUCTOR AI GOLD RUSH: NVIDIA CAPTURES 80% OF $400B INFRASTRUCTURE BUILD", "6. CLOUD WARS ENDGAME: ENTERPRISE AI MIGRATION CREATING WINNER-TAKE-ALL")
-- **FLEXIBLE SECTOR APPROACH - TAILOR TO INDUSTRY'S CURRENT DYNAMICS:**
-  - **IDENTIFY 2-3 MOST CRITICAL SECTOR THEMES** that directly impact {company_name}'s investment case
-  - **NO FIXED SECTIONS** - Choose based on sector situation: Market Transformation, Regulatory Disruption, Technology Cycle, Competitive Consolidation, Supply Chain Shifts, ESG Requirements, Geopolitical Impact, Capital Cycle, etc.
-  - **EXAMPLES OF SECTOR-SPECIFIC THEMES:**
-    - **SEMICONDUCTORS**: "AI Infrastructure Capex Supercycle", "Geopolitical Supply Chain Reshoring", "Advanced Node Oligopoly Formation"
-    - **CLOUD SOFTWARE**: "Enterprise AI Adoption Acceleration", "Hyperscaler Infrastructure Spending", "SaaS Margin Expansion Cycle"
-    - **AUTOMOTIVE**: "EV Transition Inflection Point", "Autonomous Driving Technology Race", "Battery Supply Chain Consolidation"
-    - **ENERGY**: "Renewable Energy Scaling Economics", "Grid Modernization Investment", "Carbon Pricing Policy Impact"
-- **CRITICAL SECTOR ALPHA PRINCIPLES**:
-  - Focus on sector trends that SPECIFICALLY benefit {company_name} vs peers
-  - Identify what market MISUNDERSTANDS about industry dynamics
-  - Use GOOGLE-VERIFIED current industry data and forward projections
-  - Connect sector trends to {company_name}'s SPECIFIC earnings/margin/multiple catalysts
-  - Show why sector dynamics create 12-24 month outperformance opportunity for {company_name}
-- **Format**: Each section starts with sector-insight H4 title and 800-900 words proving how sector dynamics specifically benefit {company_name}
-
-**SLIDE 7 - COMPETITIVE ADVANTAGE (FLEXIBLE MOAT-SPECIFIC ANALYSIS):**
-- **H3 Title**: Create quantified competitive advantage thesis specific to {company_name}'s moat (e.g., "7. NVIDIA'S AI SOFTWARE ECOSYSTEM: $50B CUDA MOAT WITH 95% DEVELOPER MIND SHARE", "7. TESLA'S MANUFACTURING MACHINE: 50% COST ADVANTAGE ENABLING $25K MODEL")
-- **FLEXIBLE COMPETITIVE APPROACH - TAILOR TO COMPANY'S SPECIFIC MOATS:**
-  - **IDENTIFY 2-3 STRONGEST COMPETITIVE ADVANTAGES** that create sustainable alpha generation
-  - **NO MANDATORY SECTIONS** - Choose from: Technology Leadership, Scale Economics, Network Effects, Brand Premium, Switching Costs, Regulatory Barriers, Geographic Advantages, Vertical Integration, IP Portfolio, Management Execution, Capital Access, etc.
-  - **EXAMPLES OF COMPANY-SPECIFIC MOATS:**
-    - **APPLE**: "Ecosystem Lock-In Economics", "Premium Brand Pricing Power", "Vertical Silicon Integration"
-    - **AMAZON**: "Logistics Network Scale", "AWS Infrastructure Moat", "Prime Membership Flywheel"
-    - **MICROSOFT**: "Enterprise Software Stickiness", "Cloud Platform Network Effects", "Developer Ecosystem Lock-In"
-    - **GOOGLE**: "Search Data Advantage", "Android Platform Control", "AI/ML Technical Leadership"
-- **CRITICAL COMPETITIVE ALPHA PRINCIPLES**:
-  - QUANTIFY each competitive advantage with specific financial metrics
-  - Prove advantage is EXPANDING not contracting vs historical periods
-  - Show why competitors CANNOT replicate advantage in next 2-3 years for {company_name}
-  - Connect moat strength to SPECIFIC pricing power, market share, margin expansion opportunities
-  - Use GOOGLE-VERIFIED competitive intelligence and benchmark data
-- **Format**: Each section starts with quantified-moat H4 title and 800-900 words proving sustainable competitive advantage with expansion trajectory
-
-**CRITICAL TITLE GENERATION PRINCIPLES:**
-- **NO GENERIC PLACEHOLDERS**: Never use "[COMPANY] INVESTMENT HIGHLIGHTS" - always create specific, insightful titles
-- **CAPTURE THE INSIGHT**: Titles must immediately convey the unique investment thesis as of {datetime.now().strftime("%B %Y")} (e.g., "TESLA'S VERTICAL INTEGRATION: BATTERY-TO-SOFTWARE DOMINANCE")
-- **USE QUANTIFICATION**: Include specific metrics when impactful (e.g., "APPLE'S $200B+ SERVICES TRANSFORMATION")
-- **COMPELLING & SPECIFIC**: Make readers want to read more - show WHY this matters specifically for {company_name}
-- **INDUSTRY-SPECIFIC**: Tailor to {company_name}'s sector and unique competitive position
-- **ACTION-ORIENTED**: Convey what {company_name} is DOING that creates value (expansion, transformation, dominance, etc.)
-
-**CRITICAL FORMATTING:**
-- Use `report-prose` class with numbered headers (3., 4., 5., 6., 7.)
-- Each slide must be complete with all subsections
-- 500-600 word paragraphs with institutional sophistication
-- Specific metrics and quantitative support throughout
-
-### ELITE PM ANALYTICAL APPROACH FOR CALL 1:
-
-**PROPRIETARY INSIGHT GENERATION (What Others Miss):**
-- **Hidden Inflection Points**: Identify business model changes, competitive shifts, or technology adoptions occurring beneath surface that will drive 12-18 month performance starting from {datetime.now().strftime("%B %Y")}
-- **Management Behavior Decoding**: Analyze subtle changes in capital allocation, strategic messaging, or operational focus that signal future direction before consensus recognizes
-- **Competitive Intelligence Advantage**: Understand market share dynamics, pricing power evolution, and competitive response functions that aren't captured in public data
-- **Second-Order Technology Effects**: Predict how emerging technologies will create/destroy value in ways that aren't immediately obvious
-
-**NON-CONSENSUS POSITIONING FRAMEWORKS:**
-- **Consensus Deconstruction as of {datetime.now().strftime("%B %Y")}**: Systematically identify why current analyst estimates, valuation metrics, or market sentiment are systematically wrong
-- **Complexity Arbitrage**: Exploit situations where business model complexity, accounting complexity, or industry evolution create analytical barriers for consensus
-- **Time Horizon Arbitrage**: Identify long-term value creation stories temporarily obscured by short-term noise or cyclical headwinds
-- **Behavioral Finance Exploitation**: Leverage recency bias, anchoring effects, or sector rotation patterns that create temporary mispricings
-
-**⚡ PREDICTIVE ANALYTICS MASTERY:**
-- **Leading Indicator Development**: Identify forward-looking metrics (KPIs, competitive data, technology adoption) that predict earnings inflection points 2-3 quarters ahead
-- **Pattern Recognition Application**: Apply historical parallels from similar companies, industries, or market cycles to predict likely future trajectories
-- **Catalyst Probability Weighting**: Assess likelihood and timing of specific catalysts using base rates, management track records, and industry precedents
-- **Inflection Point Timing**: Predict when current trends will accelerate, plateau, or reverse based on fundamental analysis
-
-** FUTURE STATE VISUALIZATION:**
-- **Business Model Evolution**: Predict how {company_name}'s business model will evolve over 3-5 years starting from {datetime.now().strftime("%B %Y")} based on current strategic initiatives and industry trends
-- **Competitive Positioning Forecast**: Anticipate how competitive dynamics will shift and where {company_name} will be positioned
-- **Technology Disruption Assessment**: Evaluate whether emerging technologies represent threats or opportunities for long-term competitive positioning
-- **Capital Allocation Optimization**: Predict how management will allocate capital and the returns on that allocation based on historical patterns and current priorities
-
-** SOPHISTICATED THESIS ARCHITECTURE:**
-- **Multi-Layer Value Creation**: Identify 3-4 {company_name} independent value drivers operating on different time horizons that compound to create asymmetric returns
-- **Option Value Recognition**: Quantify hidden optionality in business model flexibility, strategic assets, or expansion opportunities
-- **Moat Evolution Analysis**: Predict how competitive advantages will strengthen/weaken over time and what management is doing to reinforce them
-- **Quality of Growth Assessment**: Distinguish between revenue growth and profitable, sustainable, capital-efficient growth that creates long-term value
-
+{call1_slides}
 {user_context}
 
 {financial_context}
@@ -2432,119 +2168,7 @@ Generate EXACTLY 3 sections tailored to {company_name}'s most critical business
 
 **STOCK PRICE DATA FOR CHART CREATION and the analysis of the stock price and its fundementals:**
 {str(complete_stock_data)}
-
-**ULTRA-SOPHISTICATED EXECUTION MANDATE as of {datetime.now().strftime("%B %Y")}**: 
-Create ALL 7 slides that demonstrate **differentiated insights, non-consensus positioning, and second-order thinking** that generates sustainable alpha. Each slide must answer: **\"What do I know about {company_name}'s future that the market doesn't yet understand?\"**
-
-**CRITICAL ANALYTICAL REQUIREMENTS:**
-- **EXPLICIT DATE CONTEXT**: All analysis must explicitly reference current date {datetime.now().strftime("%B %Y")} to ensure updated information
-- **MANDATORY GOOGLE SEARCH GROUNDING**: ALL information must be grounded with Google Search tool - no generic statements allowed
-- **DIFFERENTIATED VIEW MANDATE**: Show what previous fundamentals reveal about stock price implications and future implications based on recent company strategy and themes
-- **FORWARD-LOOKING FOCUS**: Provide concrete, precise analysis that demonstrates deep company understanding and insight into how strategy affects stock price and future performance
-- **PM CONVICTION STANDARD**: Write concise, precise analysis that convinces PM you are different, have your own view, know company very well, and understand how company strategy will affect stock price and future - NO bullshit, be concrete and precise
-
-**ADVANCED WRITING TECHNIQUES FOR MAXIMUM PM IMPACT:**
-- **QUANTIFIED SPECIFICITY**: Use exact numbers, not ranges. "23.4% margin expansion" not "strong margins"
-- **HISTORICAL PATTERN RECOGNITION**: Reference specific past events. "Similar to 2019 automation rollout that drove 400bps margin gains"
-- **MANAGEMENT BEHAVIOR DECODING**: Read between lines. "CFO's emphasis on 'capital discipline' signals dividend increase vs buybacks"
-- **SECOND-ORDER IMPLICATIONS**: Show cascade effects. "Pricing power in segment A enables cross-subsidization of segment B expansion"
-- **COMPETITIVE INTELLIGENCE**: Demonstrate market knowledge. "While peers struggle with supply chain, {company_name}'s vertical integration provides 18-month cost advantage"
-- **UNIT ECONOMICS MASTERY**: Show business model understanding. "Each new customer generates $2.3K annual recurring revenue at 67% gross margin"
-- **CATALYST SEQUENCING**: Predict event timing. "Q1 earnings will show margin inflection, followed by guidance raise in Q2, driving re-rating by Q3"
-- **CONTRARIAN EVIDENCE ACKNOWLEDGMENT**: Address bear case. "Despite cyclical headwinds, structural demand shift to premium segment sustains pricing"
-- **INSIDER-LEVEL INSIGHTS**: Write like you know the company intimately. "Management's R&D reallocation toward AI indicates 2026 product cycle acceleration"
-- **PROBABILISTIC THINKING**: Assign outcome probabilities. "75% chance of beating guidance by 5%+ given leading indicator trends"
-
-**MAXIMUM INFORMATION DENSITY REQUIREMENTS:**
-- **SYNTHESIS MASTERY**: Connect 3+ data points per insight. "Capex +40%, R&D +25%, and patent filings +60% signal product cycle acceleration beginning Q3 2025"
-- **LAYERED ANALYSIS**: Multiple analytical lenses per paragraph. "Margin expansion (financial), market share gains (competitive), and customer satisfaction scores (operational) all confirm pricing power sustainability"
-- **FORWARD-LOOKING SYNTHESIS**: Predict specific outcomes. "Current inventory build (+23% QoQ) + supplier contract renegotiations + automation phase 2 completion = 35% gross margin by Q2 2025"
-- **BENCHMARKING SOPHISTICATION**: Multi-dimensional comparisons. "Trading at 0.8x vs historical 1.2x multiple, 0.7x vs peer average, but 1.1x vs growth-adjusted fair value"
-- **RESOURCE ALLOCATION INTELLIGENCE**: Capital efficiency insights. "$500M capex generates $2.1B revenue capacity at 28% incremental margins = 84% IRR vs 15% cost of capital"
-- **COMPRESSED INSIGHT DELIVERY**: Maximum insights per sentence. "Q3 beat (+8% vs consensus) driven by pricing (+5%), volume (+2%), and mix (+1%) validates our 3-factor expansion thesis"
-
-**NON-CONSENSUS INSIGHT REQUIREMENTS:**
-- **Slide 1**: Identify the primary market mispricing and why consensus is systematically wrong as of {datetime.now().strftime("%B %Y")}
-- **Slide 2**: Highlight 5 specific insights that demonstrate superior analytical depth vs. sell-side research
-- **Slide 3**: Reveal competitive advantages or market opportunities that others miss or underestimate
-- **Slide 4**: Predict specific catalysts and their timing that consensus hasn't properly analyzed
-- **Slide 5**: Demonstrate understanding of business model evolution that exceeds public company guidance
-- **Slide 6**: Identify industry dynamics and second-order effects that create hidden value
-- **Slide 7**: Quantify sustainable competitive advantages that others treat as commoditized as of {datetime.now().strftime("%B %Y")}
-
-**🎯 MANDATORY KEY TAKEAWAYS SECTION (SLIDES 3-7 ONLY):**
-Starting from Slide 3, each slide MUST end with a "Key Takeaways" section containing 2-5 bullet points (flexible based on content richness) that capture the most important insights from that specific slide's analysis.
-
-**Key Takeaways Format:**
-```html
-<div class="key-takeaways-section">
-    <h4 class="takeaways-header">Key Investment Takeaways</h4>
-    <ul class="takeaways-list">
-        <li class="takeaway-item">[Extract most critical insight from your analysis - company-specific with quantified data]</li>
-        <li class="takeaway-item">[Second most important conclusion from your detailed analysis above]</li>
-        <!-- Add more bullets ONLY if your analysis contains additional significant insights -->
-    </ul>
-</div>
-```
-
-**FLEXIBLE CONTENT-DRIVEN TAKEAWAY RULES:**
-- **Content-Determined Quantity**: Generate 2-5 bullets based on how many significant insights your slide analysis actually contains
-- **Quality over Quantity**: Better to have 2 powerful insights than 5 weak ones
-- **Slide-Specific Focus**: Takeaways should only reflect what you analyzed in THIS specific slide
-- **No Padding**: Don't add generic bullets just to reach a number
-- **Analysis-Extraction**: Each bullet must summarize a specific conclusion from your detailed content above
-
-**Bullet Point Requirements:**
-- Each bullet point: 15-25 words maximum
-- Must be analytical and quantified (include specific numbers/percentages where possible)
-- NO GENERIC STATEMENTS: Avoid phrases like "strong fundamentals" or "competitive advantages"
-- COMPANY-SPECIFIC ONLY: Must reference actual company name, specific business metrics, real financial data
-- CONTENT-DERIVED: Extract insights directly from the detailed analysis you just wrote
-- DIFFERENTIATED VIEW: Show how your analysis differs from consensus with specific evidence
-
-**CRITICAL: ORGANIC CONTENT-BASED TAKEAWAYS**
-- **Slide 3 might have**: 2 bullets (if focused on one major competitive advantage) or 4 bullets (if analyzing multiple strategic strengths)
-- **Slide 8 might have**: 3 bullets (if income statement reveals key insights) or 2 bullets (if analysis is straightforward)
-- **Quality First**: A slide with 2 powerful, specific insights is better than 5 generic statements
-- **Content Determines Count**: Let your actual analysis drive the number of takeaways, not a fixed template
-- **Industry-Specific**: Apple takeaways will be completely different from REIT or Tesla takeaways based on business fundamentals
-
-**DIFFERENTIATION STANDARDS:**
-- Every insight must be **differentiated** - something that institutional investors paying $50K+ annually would find valuable
-- Demonstrate **pattern recognition** from historical analysis that others haven't applied
-- Show **predictive analytics** that forecast inflection points 12-18 months ahead
-- Reveal **complexity arbitrage** opportunities where business model sophistication creates analytical barriers
-
-**MANDATORY SLIDE COMPLETION REQUIREMENTS:**
-- MUST generate EXACTLY 7 slides: slides 1, 2, 3, 4, 5, 6, AND 7
-- SLIDE 6 MUST be complete with full industry analysis content
-- SLIDE 7 MUST be complete with full competitive advantage analysis  
-- Each slide MUST have complete content - NO truncation allowed
-- Final slide MUST end with "Page 7 / 15" footer
-
-**CRITICAL OUTPUT FORMAT REQUIREMENTS:**
-- Output PURE HTML ONLY - NO markdown code blocks, NO **bold** markdown
-- NO ```html tags, NO explanatory text, NO comments
-- ALL emphasis must use <strong>text</strong> HTML tags, NEVER **text** markdown
-- Start directly with <div class="slide" id="portrait-page-1">
-- End with slide 7's closing </div> tag (Page 7 / 15)
-- Use exact CSS classes and structure shown in examples above
-- GENERATE ALL 7 SLIDES COMPLETELY - DO NOT STOP EARLY
-
-**⚠️ CRITICAL: FOLLOW EXACT HTML STRUCTURE - NO DEVIATIONS ALLOWED:**
-- MUST use `<header class="report-header-container">` with `<div class="slide-logo">` inside
-- MUST use `<section class="metrics-grid">` with simple `<div class="metrics-item">` structure 
-- MUST use exact same header structure for ALL slides 1-7
-- ⚠️ **MANDATORY**: COPY the metrics grid HTML EXACTLY as shown - DO NOT generate your own metrics
-- ⚠️ **DO NOT REPLACE** placeholders like __MARKET_CAP__ - these will be automatically replaced with real data
-- DO NOT create custom layouts or change the structure - follow template EXACTLY
-
-**CONCISE & PRECISE WRITING REQUIREMENTS:**
-- Each analysis section: MAX 150-200 words (not 300+ words)
-- Each subsection paragraph: MAX 400-500 words (not 600+ words)
-- Use <strong>key metrics</strong> and <strong>critical insights</strong> for emphasis
-- Be punchy, direct, and impactful - eliminate unnecessary words
-- Every sentence must add specific value or data points
+{call1_mandate}
 """
         
         # Use metrics from comprehensive system (or extract as fallback)
@@ -2653,14 +2277,14 @@ Starting from Slide 3, each slide MUST end with a "Key Takeaways" section contai
             
             logger.info(f"✅ Call 1 prompt built: {len(formatted_final):,} characters with real metrics and context")
             logger.info(f"🔍 DEBUG: User context in final prompt: {'user_context' not in formatted_final}")
-            return formatted_final
+            return self._apply_call1_splicing(formatted_final, ticker, chart_ready_status)
             
         except KeyError as e:
             logger.error(f"❌ Formatting error in Call 1 prompt: {e}")
             logger.error(f"🔍 Looking for malformed placeholder: {e}")
             # Return version with metrics replaced (even if company name formatting failed)
             logger.info(f"✅ Call 1 prompt built (metrics replaced): {len(complete_call1_prompt_with_metrics):,} characters")
-            return complete_call1_prompt_with_metrics
+            return self._apply_call1_splicing(complete_call1_prompt_with_metrics, ticker, chart_ready_status)
 
     # REMOVED: _build_real_metrics_grid() - replaced by comprehensive system
     
@@ -2669,16 +2293,10 @@ Starting from Slide 3, each slide MUST end with a "Key Takeaways" section contai
         Extract metrics data from yfinance and format as template variables
         """
         try:
-            # Use the financial_data already fetched by the server to ensure data consistency
-            if financial_data and 'info' in financial_data:
-                info = financial_data['info']
-                logger.info(f"📊 Using pre-fetched yfinance data for {ticker}")
-            else:
-                # Fallback: Import yfinance to get fresh info data  
-                import yfinance as yf
-                stock = yf.Ticker(ticker)
-                info = stock.info
-                logger.warning(f"⚠️ No pre-fetched data available, making fresh yfinance call for {ticker}")
+            # Use the financial_data fetched for this report to ensure data consistency
+            info = (financial_data or {}).get('info') or {}
+            if not info:
+                logger.warning(f"⚠️ No pre-fetched company info available for {ticker}")
             
             # Get current price and basic info
             current_price = info.get('currentPrice') or info.get('regularMarketPrice', 0)
@@ -2806,872 +2424,191 @@ Starting from Slide 3, each slide MUST end with a "Key Takeaways" section contai
                 'volume': 'N/A'
             }
     
-    async def _build_call2_prompt(
-        self,
-        company_name: str,
-        ticker: str,
-        analyses_data: Dict[str, Any],
-        financial_data: Dict = None,
-        call1_context: Dict = None,
-        investment_objective: str = None,
-        data_sources: Dict = None
-    ) -> str:
-        """Build optimized prompt for Call 2 (slides 8-15) using modular base prompt + Call 2 specifics + Call 1 context"""
-        
-        logger.info(f"🔧 Building Call 2 prompt for {ticker} (slides 8-15)")
-        
-        # Get base Robeco prompt (style, methodology, standards)
-        base_prompt = self._build_base_robeco_prompt(company_name, ticker)
-        
-        # Load CSS template for Call 2 styling requirements
-        try:
-            with open(self.css_path, 'r', encoding='utf-8') as f:
-                css_template = f.read()
-            css_guidance = f"""
-### CSS STYLING FOR CALL 2:
-
-**MANDATORY SIMPLIFICATION**: To avoid HTML generation overload, use SIMPLE CSS classes instead of complex inline styling.
-
-**FINANCIAL TABLE STRUCTURE** (greatly simplified):
-```html
-<table class="financial-table">
-    <thead>
-        <tr>
-            <th>INCOME STATEMENT</th>
-            <th class="text-right">2024-03-31</th>
-            <th class="text-right">2023-03-31</th>
-            <th class="text-right">YoY %</th>
-        </tr>
-    </thead>
-    <tbody>
-        <tr>
-            <td>Revenue</td>
-            <td class="text-right positive">$2.5B</td>
-            <td class="text-right">$2.1B</td>
-            <td class="text-right positive">+19.0%</td>
-        </tr>
-    </tbody>
-</table>
-```
-
-**CSS CLASSES AVAILABLE:**
-- `financial-table` - Main table styling with professional gradient headers
-- `text-right` - Right-align content  
-- `positive` - Green color for positive values
-- `negative` - Red color for negative values
-- `neutral` - Gray color for neutral values
-
-**CRITICAL SIMPLIFICATION**: 
-- NO complex inline styles allowed
-- NO nested style attributes
-- Use ONLY the CSS classes listed above
-- This reduces AI cognitive load by 80%
-"""
-        except Exception as e:
-            logger.warning(f"⚠️ Could not load CSS template for Call 2: {e}")
-            css_guidance = ""
-        
-        # Get pre-built HTML tables for AI to copy directly (eliminates generation complexity)
-        ready_tables = self._build_ready_html_tables(company_name, financial_data)
-        
-        # Get financial context using helper method
-        financial_context = self._build_financial_context(company_name, financial_data)
-        
-        # Get analyst insights using helper method (6000 char limit for Call 2 - more detail)
-        analyst_insights = self._build_analyst_insights(analyses_data, content_limit=6000)
-        
-        # Get user context using helper method
-        user_context = self._build_user_context(data_sources)
-        
-        # Get Call 1 context summary using helper method
-        call1_summary = self._build_call1_context_summary(call1_context)
-        
-        # Build Call 2 specific requirements with precise HTML structure
-        investment_focus = investment_objective or "comprehensive investment analysis"
-        call2_specific = f"""
-## ALPHA GENERATION PHASE 2: QUANTITATIVE VALIDATION & SOPHISTICATED VALUATION (SLIDES 8-15)
-
-### YOUR ELITE PM MANDATE FOR CALL 2:
-As an elite Portfolio Manager writing in {datetime.now().strftime("%B %Y")}, your **second phase objective** is to provide rigorous quantitative validation of the Phase 1 investment thesis through sophisticated financial analysis and multi-methodology valuation. You're applying the same analytical rigor that generates consistent alpha at the world's top hedge funds.
-
-**INVESTMENT OBJECTIVE FOCUS**: {investment_focus} - Ensure all financial analysis and valuation work supports this specific investment objective and connects quantitative insights to this goal.
-
-**Deploy your 25+ years of experience** in factor modeling, risk decomposition, and advanced valuation techniques. Every financial insight must demonstrate the quantitative sophistication that separates institutional research from generic analysis. **Critical**: Use the most current financial data available as of {datetime.now().strftime("%B %Y")}, including latest quarterly reports, recent market developments, and current economic conditions. **Google Search Grounding**: Use Google Search extensively to verify all financial statements data, recent earnings results, analyst estimates, competitor performance, and industry benchmarks mentioned in your analysis.
-
-{call1_summary}
-
-
-### EXACT HTML STRUCTURE REQUIREMENTS - GENERATE PRECISELY:
-
-## 🎯 READY-MADE HTML TABLES - JUST COPY THESE DIRECTLY:
-
-### SLIDE 8 - INCOME STATEMENT TABLE (COPY EXACTLY):
-{ready_tables['income_table']}
-
-### SLIDE 9 - BALANCE SHEET TABLE (COPY EXACTLY): 
-{ready_tables['balance_table']}
-
-### SLIDE 10 - CASH FLOW TABLE (COPY EXACTLY):
-{ready_tables['cashflow_table']}
-
-## 📋 SLIDES 8-10 STRUCTURE - COPY THE TABLES ABOVE:
-```html
-<!-- 🚨 ADVANCED ANALYTICAL REQUIREMENTS for Slides 8-15 as of {datetime.now().strftime("%B %Y")}:
-
-1. FINANCIAL DEEP DIVE: Show mastery of financial statement analysis with forward-looking insights
-2. VALUATION SOPHISTICATION: Demonstrate multiple valuation methodologies with probability weightings  
-3. SCENARIO ANALYSIS: Present bull/base/bear cases with specific assumptions and outcomes
-4. RISK ASSESSMENT: Identify second-order risks that consensus misses
-5. RATING CONSISTENCY: Use IDENTICAL rating from Call 1 across ALL slides
-6. GOOGLE SEARCH MANDATE: Every financial metric, competitive comparison, and market assumption must be Google Search verified
-
-WRITING STANDARDS:
-- Avoid generic statements like "strong fundamentals" - be specific: "25.3% ROIC vs 18% sector average"
-- Connect strategy to numbers: "AI investment of $2B drives 400bps margin expansion by 2026"
-- Show differentiated insights: "Unlike consensus focus on top-line, we see margin inflection as key catalyst"
-- Quantify everything: "40% probability of $100 target vs 30% probability of $85 downside scenario"
-
-CRITICAL: BOLD FORMATTING FOR IMPORTANT ANALYSIS:
-- **USE <strong></strong> tags** for all KEY FINANCIAL INSIGHTS, IMPORTANT METRICS, and CRITICAL VALUATION POINTS
-- **Bold all specific numbers**: <strong>25.3% ROIC</strong>, <strong>$2B revenue</strong>, <strong>400bps margin expansion</strong>
-- **Bold financial conclusions**: <strong>Free cash flow generation supports...</strong>
-- **Bold valuation metrics**: <strong>Trading at 15.2x NTM EV/EBITDA</strong>, <strong>20% FCF yield</strong>
-- **Bold competitive positioning**: <strong>Market-leading margins of 35%</strong>
-- **Bold investment thesis**: <strong>Undervalued at current multiples</strong>
-- **Bold risk factors**: <strong>Key downside risk is...</strong>
-
-HEADER INSTRUCTIONS:
-- Always use the exact Robeco logo URL: https://images.ctfassets.net/tl4x668xzide/7mygwms2vuSwirnfvaCSvL/72d2bbd858a69aecbf59fd3fb8954484/robeco-logo-color.png
-- For company icons, use Clearbit format: https://logo.clearbit.com/[company-domain].com
-- Examples: https://logo.clearbit.com/apple.com, https://logo.clearbit.com/microsoft.com, https://logo.clearbit.com/tesla.com
-- Fallback for any company: https://placehold.co/20x20/005F90/ffffff?text=[TICKER]
-- Use actual company name (not placeholder) and determine rating based on your analysis
--->
-<div class="slide report-prose" id="slide-financial-income-statement">
-    <div class="slide-logo" style="top: 65px;">
-        <img src="https://images.ctfassets.net/tl4x668xzide/7mygwms2vuSwirnfvaCSvL/72d2bbd858a69aecbf59fd3fb8954484/robeco-logo-color.png" alt="Robeco Logo" style="height: 2rem;">
-    </div>
-    <header class="report-header-container">
-        <div class="header-blue-border">
-            <div class="company-header">
-                <!-- INSTRUCTION: Replace with actual company domain (e.g., apple.com, microsoft.com) -->
-                <!-- INSTRUCTION: Replace with company's main domain for logo. Use https://logo.clearbit.com/[COMPANY-DOMAIN].com format
-                Examples: apple.com, microsoft.com, tesla.com, frasersproperty.com, etc. 
-                Research the actual company domain from stock_data['company_name'] and use appropriate domain -->
-                <img src="https://logo.clearbit.com/[COMPANY-DOMAIN].com" onerror="this.onerror=null;this.src='https://placehold.co/20x20/005F90/ffffff?text={ticker}';" alt="Company Icon" class="icon" style="margin-top: -5px; width: 20px; height: 20px;">
-                <h1 class="name"><!-- INSTRUCTION: Use the FULL OFFICIAL company name from stock_data['company_name'] NOT the user input. Example: "Daikin Industries, Ltd." not "DAKIN" --></h1>
-                <!-- INSTRUCTION: Use CONSISTENT rating across ALL slides. Choose ONE: OVERWEIGHT (green #2E7D32), NEUTRAL (orange #FF8C00), or UNDERWEIGHT (red #C62828) -->
-                <div class="rating" style="color: [RATING-COLOR];">[INVESTMENT-RATING]</div>
-            </div>
-        </div>
-    </header>
-    <main>
-        <h3>[Create a specific title that captures the key income statement insight that drives your investment thesis. Think like a PM presenting to the investment committee - what financial story does the P&L tell? Examples: "REVENUE ACCELERATION & MARGIN EXPANSION DRIVE EARNINGS MOMENTUM" or "SUBSCRIPTION MODEL TRANSFORMATION: 70% RECURRING REVENUE GROWTH" or "COST DISCIPLINE AMID GROWTH: OPERATING LEVERAGE DRIVES PROFITABILITY"]</h3>
-        
-        [COPY THE COMPLETE INCOME STATEMENT TABLE FROM ABOVE - DON'T GENERATE NEW TABLES]
-        
-        <p><strong>[Write a section header that identifies the key revenue growth drivers and profitability trends visible in the data]</strong></p>
-        <p>[Write 400-500 words with DEEP FINANCIAL FORENSICS that reveals insights consensus misses. MANDATORY ANALYTICAL FRAMEWORK: 1) CONSENSUS ERROR IDENTIFICATION: Identify what street gets wrong about revenue/margin trends with specific evidence (e.g., "Consensus models 5% revenue growth but ignores $500M contract backlog disclosed in last earnings call") 2) HISTORICAL PRICE ATTRIBUTION: Connect income statement changes to past stock moves (e.g., "Q2 margin miss drove 15% stock decline, but one-time costs masked 200bps underlying improvement") 3) DIFFERENTIATED EARNINGS VIEW: Present your contrarian position on earnings quality/trajectory with research support (e.g., "While bears focus on headline revenue deceleration, we see 25% acceleration in high-margin subscription revenue") 4) COMPETITIVE INTELLIGENCE: Reference specific peer comparisons and industry data (e.g., "Unlike competitor margin compression, this company's 300bps expansion reflects superior operational execution") 5) FORWARD EARNINGS CATALYST: Identify specific upcoming events that will drive earnings inflection (e.g., "New product launch in Q1 should deliver $150M incremental high-margin revenue based on pilot program results") 6) INVESTMENT IMPLICATION: Quantify exact impact on valuation and timing (e.g., "Earnings revision cycle supports 20% multiple expansion to 25x vs current 21x"). Reference specific numbers from financial table, cite recent management commentary, and include forward EPS estimates with supporting assumptions. Every statement must connect to stock price implications.]</p>
-        
-        <p><strong>[Write a section header focusing on operational efficiency and margin expansion opportunities]</strong></p>
-        <p>[Write 400-500 words demonstrating advanced understanding of operational leverage, cost structure optimization, and margin expansion catalysts. Connect the financial data to business model advantages and competitive positioning.]</p>
-    </main>
-    <footer class="report-footer"><p>Robeco Investment Research</p><p>Page 8 / 15</p></footer>
-</div>
-
-<div class="slide report-prose" id="slide-financial-balance-sheet">
-    <div class="slide-logo" style="top: 65px;">
-        <img src="https://images.ctfassets.net/tl4x668xzide/7mygwms2vuSwirnfvaCSvL/72d2bbd858a69aecbf59fd3fb8954484/robeco-logo-color.png" alt="Robeco Logo" style="height: 2rem;">
-    </div>
-    <header class="report-header-container">
-        <div class="header-blue-border">
-            <div class="company-header">
-                <!-- INSTRUCTION: Replace with actual company domain (e.g., apple.com, microsoft.com) -->
-                <!-- INSTRUCTION: Replace with company's main domain for logo. Use https://logo.clearbit.com/[COMPANY-DOMAIN].com format
-                Examples: apple.com, microsoft.com, tesla.com, frasersproperty.com, etc. 
-                Research the actual company domain from stock_data['company_name'] and use appropriate domain -->
-                <img src="https://logo.clearbit.com/[COMPANY-DOMAIN].com" onerror="this.onerror=null;this.src='https://placehold.co/20x20/005F90/ffffff?text={ticker}';" alt="Company Icon" class="icon" style="margin-top: -5px; width: 20px; height: 20px;">
-                <h1 class="name"><!-- INSTRUCTION: Use the FULL OFFICIAL company name from stock_data['company_name'] NOT the user input. Example: "Daikin Industries, Ltd." not "DAKIN" --></h1>
-                <!-- INSTRUCTION: Use CONSISTENT rating across ALL slides. Choose ONE: OVERWEIGHT (green #2E7D32), NEUTRAL (orange #FF8C00), or UNDERWEIGHT (red #C62828) -->
-                <div class="rating" style="color: [RATING-COLOR];">[INVESTMENT-RATING]</div>
-            </div>
-        </div>
-    </header>
-    <main>
-        <h3>[Create a title that demonstrates sophisticated balance sheet analysis and shows what this means for investment returns. Think like a PM assessing financial strength and capital allocation. Examples: "FORTRESS BALANCE SHEET: $200B CASH ENABLES STRATEGIC FLEXIBILITY" or "DEBT OPTIMIZATION: REFINANCING LOWERS COST OF CAPITAL 150bps" or "ASSET-LIGHT MODEL: HIGH ROIC FROM WORKING CAPITAL EFFICIENCY"]</h3>
-        
-        [COPY THE COMPLETE BALANCE SHEET TABLE FROM ABOVE - DON'T GENERATE NEW TABLES]
-        
-        <p><strong>[Write a section header that identifies the key balance sheet strengths and what they enable strategically]</strong></p>
-        <p>[Write 400-500 words like a PM assessing balance sheet quality for investment risk/return profile. Focus on: 1) Capital structure optimization - debt levels, cost of capital, refinancing opportunities, credit quality 2) Asset quality and efficiency - working capital management, asset turnover, return on assets, hidden assets/liabilities 3) Financial flexibility assessment - cash position, borrowing capacity, covenant headroom, acquisition capability 4) Risk assessment - leverage ratios, liquidity position, maturity profile, off-balance sheet items 5) Investment implications - how balance sheet strength supports growth investments, shareholder returns, defensive characteristics. Reference specific metrics from the table and compare to industry standards. Show understanding of how balance sheet positioning creates or destroys shareholder value.]</p>
-        
-        <p><strong>[Write a section header on capital allocation effectiveness and return on invested capital]</strong></p>
-        <p>[Write 400-500 words demonstrating sophisticated understanding of how management uses the balance sheet to create shareholder value through strategic investments, acquisitions, and capital returns.]</p>
-    </main>
-    <footer class="report-footer"><p>Robeco Investment Research</p><p>Page 9 / 15</p></footer>
-</div>
-
-<div class="slide report-prose" id="slide-financial-cash-flow-statement">
-    <div class="slide-logo" style="top: 65px;">
-        <img src="https://images.ctfassets.net/tl4x668xzide/7mygwms2vuSwirnfvaCSvL/72d2bbd858a69aecbf59fd3fb8954484/robeco-logo-color.png" alt="Robeco Logo" style="height: 2rem;">
-    </div>
-    <header class="report-header-container">
-        <div class="header-blue-border">
-            <div class="company-header">
-                <!-- INSTRUCTION: Replace with actual for {company_name} domain (e.g., apple.com, microsoft.com) -->
-                <!-- INSTRUCTION: Replace with company's main domain for logo. Use https://logo.clearbit.com/[COMPANY-DOMAIN].com format
-                Examples: apple.com, microsoft.com, tesla.com, frasersproperty.com, etc. 
-                Research the actual company domain from stock_data['company_name'] and use appropriate domain -->
-                <img src="https://logo.clearbit.com/[COMPANY-DOMAIN].com" onerror="this.onerror=null;this.src='https://placehold.co/20x20/005F90/ffffff?text={ticker}';" alt="Company Icon" class="icon" style="margin-top: -5px; width: 20px; height: 20px;">
-                <h1 class="name"><!-- INSTRUCTION: Use the FULL OFFICIAL company name from stock_data['company_name'] NOT the user input. Example: "Daikin Industries, Ltd." not "DAKIN" --></h1>
-                <!-- INSTRUCTION: Use CONSISTENT rating across ALL slides. Choose ONE: OVERWEIGHT (green #2E7D32), NEUTRAL (orange #FF8C00), or UNDERWEIGHT (red #C62828) -->
-                <div class="rating" style="color: [RATING-COLOR];">[INVESTMENT-RATING]</div>
-            </div>
-        </div>
-    </header>
-    <main>
-        <h3>[Create a title highlighting the key cash flow insight that validates your investment thesis for {company_name} as of {datetime.now().strftime("%B %Y")}. Think like a PM focused on cash generation quality and sustainability. Examples: "EXCEPTIONAL FCF CONVERSION: 95% OF NET INCOME TO FREE CASH FLOW" or "CAPEX EFFICIENCY: GROWTH WITH MINIMAL CAPITAL INTENSITY" or "CASH GENERATION ACCELERATION: WORKING CAPITAL IMPROVEMENTS"]</h3>
-        
-        [COPY THE COMPLETE CASH FLOW TABLE FROM ABOVE - DON'T GENERATE NEW TABLES]
-        
-        <p><strong>[Write a section header that identifies the quality and sustainability of operating cash flow generation]</strong></p>
-        <p>[Write 600-800 words like a top-tier PM evaluating cash flow quality for investment decision-making that incrope the for {company_name}' specifc business model and fundemntal and link to the financial statements result. Focus on: 1) Operating cash flow quality - cash vs non-cash earnings, working capital impacts, seasonality patterns, collection efficiency 2) Free cash flow analysis - capex requirements, maintenance vs growth capex, asset intensity, cash conversion cycles 3) Cash flow sustainability - predictability, cyclicality, margin of safety, through-cycle analysis 4) Capital allocation analysis - reinvestment needs, dividend coverage, buyback capacity, acquisition funding 5) Investment implications - how cash generation supports valuation models, dividend growth, balance sheet strength. Reference specific numbers from the table and analyze cash flow trends vs peers. Show understanding of what separates high-quality cash generators from earnings manipulators.]</p>
-        
-        <p><strong>[Write a section header on capital efficiency and free cash flow yield analysi for {company_name}]</strong></p>
-        <p>[Write 400-500 words demonstrating advanced understanding of cash flow-based valuation, capital intensity analysis, and how cash generation patterns support your investment thesis, must link to the financial statements result and the company fundmental and specifc events/news that happened that related to the cash flow and the investment thesis]</p>
-    </main>
-    <footer class="report-footer"><p>Robeco Investment Research</p><p>Page 10 / 15</p></footer>
-</div>
-
-<div class="slide report-prose" id="slide-financial-ratios">
-    <div class="slide-logo" style="top: 65px;">
-        <img src="https://images.ctfassets.net/tl4x668xzide/7mygwms2vuSwirnfvaCSvL/72d2bbd858a69aecbf59fd3fb8954484/robeco-logo-color.png" alt="Robeco Logo" style="height: 2rem;">
-    </div>
-    <header class="report-header-container">
-        <div class="header-blue-border">
-            <div class="company-header">
-                <!-- INSTRUCTION: Replace with actual for {company_name} domain (e.g., apple.com, microsoft.com) -->
-                <!-- INSTRUCTION: Replace with company's main domain for logo. Use https://logo.clearbit.com/[COMPANY-DOMAIN].com format
-                Examples: apple.com, microsoft.com, tesla.com, frasersproperty.com, etc. 
-                Research the actual company domain from stock_data['company_name'] and use appropriate domain -->
-                <img src="https://logo.clearbit.com/[COMPANY-DOMAIN].com" onerror="this.onerror=null;this.src='https://placehold.co/20x20/005F90/ffffff?text={ticker}';" alt="Company Icon" class="icon" style="margin-top: -5px; width: 20px; height: 20px;">
-                <h1 class="name"><!-- INSTRUCTION: Use the FULL OFFICIAL company name from stock_data['company_name'] NOT the user input. Example: "Daikin Industries, Ltd." not "DAKIN" --></h1>
-                <!-- INSTRUCTION: Use CONSISTENT rating across ALL slides. Choose ONE: OVERWEIGHT (green #2E7D32), NEUTRAL (orange #FF8C00), or UNDERWEIGHT (red #C62828) -->
-                <div class="rating" style="color: [RATING-COLOR];">[INVESTMENT-RATING]</div>
-            </div>
-        </div>
-    </header>
-    <main>
-        <h3>[Create a title that shows sophisticated ratio analysis and competitive benchmarking for {company_name} as of {datetime.now().strftime("%B %Y")}. Think like a PM demonstrating superior analytical insight. Examples: "SUPERIOR CAPITAL EFFICIENCY: 25% ROE VS INDUSTRY 12% AVERAGE" or "MARGIN EXPANSION OPPORTUNITY: PATH TO INDUSTRY-LEADING PROFITABILITY" or "ASSET TURNOVER LEADERSHIP: OPERATIONAL EFFICIENCY DRIVES RETURNS"]</h3>
-        
-        <p><strong>[Write a section header focusing on profitability ratios and peer comparison analysis for {company_name}]</strong></p>
-        <p>[Write 400-500 words like a PM conducting sophisticated ratio analysis for portfolio construction. Focus on: 1) Profitability analysis - ROE decomposition (margin x turnover x leverage), ROI trends, ROIC vs WACC analysis, peer benchmarking 2) Quality metrics - gross margin stability, EBITDA margin expansion, operating leverage measurement 3) Efficiency ratios - asset turnover, working capital management, inventory turnover, receivables quality 4) Trend analysis - 3-5 year ratio evolution, cyclical adjustments, normalized earnings power 5) Investment implications - how ratio analysis supports valuation premium/discount, identifies operational improvements, predicts mean reversion. Use industry-specific ratios and benchmarks. Show understanding of what ratios matter most for this business model and industry.]</p>
-        
-        <p><strong>[Write a section header on capital allocation efficiency and shareholder return metrics]</strong></p>
-        <p>[Write 400-500 words demonstrating advanced understanding of capital efficiency metrics, management effectiveness in deploying capital, and how this translates to superior shareholder returns vs alternatives.]</p>
-    </main>
-    <footer class="report-footer"><p>Robeco Investment Research</p><p>Page 11 / 15</p></footer>
-</div>
-
-<div class="slide report-prose" id="slide-valuation">
-    <div class="slide-logo" style="top: 65px;">
-        <img src="https://images.ctfassets.net/tl4x668xzide/7mygwms2vuSwirnfvaCSvL/72d2bbd858a69aecbf59fd3fb8954484/robeco-logo-color.png" alt="Robeco Logo" style="height: 2rem;">
-    </div>
-    <header class="report-header-container">
-        <div class="header-blue-border">
-            <div class="company-header">
-                <!-- INSTRUCTION: Replace with actual for {company_name} domain (e.g., apple.com, microsoft.com) -->
-                <!-- INSTRUCTION: Replace with company's main domain for logo. Use https://logo.clearbit.com/[COMPANY-DOMAIN].com format
-                Examples: apple.com, microsoft.com, tesla.com, frasersproperty.com, etc. 
-                Research the actual company domain from stock_data['company_name'] and use appropriate domain -->
-                <img src="https://logo.clearbit.com/[COMPANY-DOMAIN].com" onerror="this.onerror=null;this.src='https://placehold.co/20x20/005F90/ffffff?text={ticker}';" alt="Company Icon" class="icon" style="margin-top: -5px; width: 20px; height: 20px;">
-                <h1 class="name"><!-- INSTRUCTION: Use the FULL OFFICIAL company name from stock_data['company_name'] NOT the user input. Example: "Daikin Industries, Ltd." not "DAKIN" --></h1>
-                <!-- INSTRUCTION: Use CONSISTENT rating across ALL slides. Choose ONE: OVERWEIGHT (green #2E7D32), NEUTRAL (orange #FF8C00), or UNDERWEIGHT (red #C62828) -->
-                <div class="rating" style="color: [RATING-COLOR];">[INVESTMENT-RATING]</div>
-            </div>
-        </div>
-    </header>
-    <main>
-        <h3>[Create a title that demonstrates sophisticated valuation analysis and shows specific upside potential for {company_name} as of {datetime.now().strftime("%B %Y")}. Think like a PM presenting a compelling valuation case. Examples: "SIGNIFICANT UNDERVALUATION: DCF SHOWS 40% UPSIDE TO FAIR VALUE" or "GROWTH AT REASONABLE PRICE: 1.2 PEG RATIO SUPPORTS PREMIUM" or "SUM-OF-PARTS ANALYSIS: HIDDEN VALUE IN UNDERVALUED SEGMENTS"]</h3>
-        
-        <p><strong>[Write a section header on DCF analysis and intrinsic value calculation]</strong></p>
-        <p>[Write 700-800 words with DEEP DCF LINE-ITEM ANALYSIS that demonstrates sophisticated bottom-up modeling. ⚠️ GOOGLE SEARCH REQUIREMENT: Use Google Search extensively to verify all financial data, recent earnings results, segment performance, industry forecasts, and competitive dynamics mentioned. 
-
-MANDATORY DCF STRUCTURE - ANALYZE EACH COMPONENT:
-
-**REVENUE BREAKDOWN & FORECASTING (200-250 words):**
-1) SEGMENT-LEVEL ANALYSIS: Break down revenue by business segments/geographies with specific growth drivers. Search for latest segment reporting, management guidance, and end-market dynamics
-2) UNIT ECONOMICS: Analyze revenue per customer, pricing trends, volume growth, market share progression. Search for unit metrics, customer growth rates, and pricing announcements
-3) CYCLICAL vs STRUCTURAL GROWTH: Distinguish temporary vs sustainable revenue drivers. Search for industry growth rates, competitive positioning, and secular trends
-4) TOP-LINE CATALYSTS: Quantify impact of new products, market expansion, price increases. Search for product launch timelines, addressable market size, and penetration rates
-
-**OPERATING MARGIN PROGRESSION (200-250 words):**
-1) MARGIN BRIDGE ANALYSIS: Decompose operating leverage, cost inflation, mix effects, efficiency gains. Search for recent cost pressures, automation initiatives, and margin guidance
-2) SCALABILITY ASSESSMENT: Fixed vs variable cost structure, incremental margin potential. Search for operating leverage history and management commentary on scalability
-3) COMPETITIVE DYNAMICS: Margin sustainability vs pricing pressure, moat strength. Search for competitor margin trends and pricing actions
-4) INVESTMENT PHASE IMPACT: R&D, capex, SG&A investments and their margin implications. Search for investment cycles and expected returns
-
-**FREE CASH FLOW MODELING (200-250 words):**
-1) CAPEX REQUIREMENTS: Maintenance vs growth capex, asset intensity, automation investments. Search for recent capex guidance and industry reinvestment needs
-2) WORKING CAPITAL DYNAMICS: Cash conversion cycles, seasonality, growth impact on working capital. Search for working capital trends and management efficiency initiatives
-3) CASH CONVERSION QUALITY: Percentage of earnings converted to free cash flow, sustainability. Search for cash flow quality metrics and historical conversion rates
-4) TAX OPTIMIZATION: Effective tax rate progression, geographic optimization, tax reform impact. Search for recent tax strategies and jurisdictional changes
-
-Each analysis must connect to current fundamentals using specific public information sources and predict future performance based on verifiable trends and management actions.
-
-**🔥 SLIDE 12 ULTRA-HIGH DENSITY REQUIREMENTS:**
-PACK MAXIMUM ANALYTICAL VALUE - This section must be dense with quantified insights:
-- Include 15+ specific financial metrics (growth rates, margins, ratios, multiples)
-- Reference 6+ peer companies with exact valuation multiples  
-- Present 3+ valuation methodologies with specific price targets
-- Provide 8+ DCF assumptions with justification and sensitivity analysis
-- Include 4+ scenario outcomes with probability weightings
-- Reference 10+ recent data points (earnings, guidance, industry reports)
-- Every sentence must contain 2-3 quantified data points - NO filler content]</p>
-        
-        <p><strong>[Write a section header on multiple-based valuation and peer comparison]</strong></p>
-        <p>[Write 600-700 words demonstrating SOPHISTICATED RELATIVE VALUATION with quality-adjusted peer analysis. ⚠️ GOOGLE SEARCH REQUIREMENT: Search extensively for current peer multiples, financial metrics, growth rates, and recent trading patterns.
-
-MANDATORY MULTIPLES ANALYSIS STRUCTURE:
-
-**PEER SELECTION & ADJUSTMENT (150-200 words):**
-1) PURE-PLAY IDENTIFICATION: Select 4-6 closest operational comparables with justification. Search for companies with similar business models, end markets, and scale
-2) FINANCIAL QUALITY ADJUSTMENTS: Normalize for differences in profitability, growth, balance sheet strength. Search for peer ROE, ROIC, debt levels, and cash generation metrics
-3) BUSINESS MODEL PREMIUMS/DISCOUNTS: Quantify valuation impact of subscription vs transactional, asset-light vs asset-heavy, recurring vs cyclical. Search for business model valuations and investor preferences
-4) MARKET POSITIONING: Adjust for competitive positioning, market share, and moat strength. Search for market share data and competitive analysis
-
-**FORWARD-LOOKING MULTIPLE ANALYSIS (200-250 words):**
-1) EV/SALES PROGRESSION: Analyze revenue quality, growth sustainability, conversion to profits. Search for revenue visibility, contract duration, and organic vs inorganic growth
-2) EV/EBITDA vs EBIT SPREAD: Assess D&A intensity, capex requirements, asset productivity. Search for peer capital intensity and depreciation policies
-3) P/E vs PEG ANALYSIS: Growth-adjusted valuation, earnings quality, cyclical adjustments. Search for earnings growth forecasts and quality metrics
-4) PRICE/BOOK PREMIUM: Asset intensity, intangible value, return on equity justification. Search for peer asset turns and intangible asset ratios
-
-**CATALYST-DRIVEN MULTIPLE EXPANSION (200-250 words):**
-1) HISTORICAL RE-RATING ANALYSIS: When and why multiples expanded/contracted historically. Search for past multiple ranges and fundamental drivers
-2) PEER MULTIPLE MIGRATION: Track how comparable companies achieved premium valuations. Search for successful transformation stories and multiple progression
-3) SECTOR ROTATION IMPACT: Position within investment themes and sector allocation flows. Search for sector performance trends and institutional flows
-4) TIMING CATALYSTS: Specific events that drive multiple re-rating (earnings, approvals, announcements). Search for upcoming catalysts and historical precedents
-
-Connect each multiple to fundamental performance and show specific path to valuation convergence/divergence with peers based on differentiated business performance.]</p>
-    </main>
-    <footer class="report-footer"><p>Robeco Investment Research</p><p>Page 12 / 15</p></footer>
-</div>
-```
-
-**SLIDES 13-15 - COMPREHENSIVE ANALYSIS & CONCLUSION:**
-```html
-<div class="slide report-prose" id="slide-bull-bear-analysis">
-    <div class="slide-logo" style="top: 65px;">
-        <img src="https://images.ctfassets.net/tl4x668xzide/7mygwms2vuSwirnfvaCSvL/72d2bbd858a69aecbf59fd3fb8954484/robeco-logo-color.png" alt="Robeco Logo" style="height: 2rem;">
-    </div>
-    <header class="report-header-container">
-        <div class="header-blue-border">
-            <div class="company-header">
-                <!-- INSTRUCTION: Replace with actual company domain (e.g., apple.com, microsoft.com) -->
-                <!-- INSTRUCTION: Replace with company's main domain for logo. Use https://logo.clearbit.com/[COMPANY-DOMAIN].com format
-                Examples: apple.com, microsoft.com, tesla.com, frasersproperty.com, etc. 
-                Research the actual company domain from stock_data['company_name'] and use appropriate domain -->
-                <img src="https://logo.clearbit.com/[COMPANY-DOMAIN].com" onerror="this.onerror=null;this.src='https://placehold.co/20x20/005F90/ffffff?text={ticker}';" alt="Company Icon" class="icon" style="margin-top: -5px; width: 20px; height: 20px;">
-                <h1 class="name"><!-- INSTRUCTION: Use the FULL OFFICIAL company name from stock_data['company_name'] NOT the user input. Example: "Daikin Industries, Ltd." not "DAKIN" --></h1>
-                <!-- INSTRUCTION: Use CONSISTENT rating across ALL slides. Choose ONE: OVERWEIGHT (green #2E7D32), NEUTRAL (orange #FF8C00), or UNDERWEIGHT (red #C62828) -->
-                <div class="rating" style="color: [RATING-COLOR];">[INVESTMENT-RATING]</div>
-            </div>
-        </div>
-    </header>
-    <main>
-        <h3>[Create a title that demonstrates sophisticated risk assessment and asymmetric return analysis for {company_name} as of {datetime.now().strftime("%B %Y")}. Think like a PM presenting risk/reward to investment committee. Examples: "AI LEADERSHIP VS COMPETITION THREAT: ASYMMETRIC RISK/REWARD" or "MARKET EXPANSION VS REGULATORY RISK: PROBABILITY-WEIGHTED OUTCOMES" or "MARGIN EXPANSION VS CYCLICAL HEADWINDS: DEFENSIVE GROWTH PROFILE"]</h3>
+    def _apply_call1_splicing(self, prompt: str, ticker: str, chart_ready: bool) -> str:
+        """
+        Splice mode: move the metrics grid and (when pre-calculated) the price
+        chart out of the Call 1 prompt and ask for markers instead
+        """
+        if not SPLICE_ENABLED:
+            return prompt
+        
+        blocks = {}
+        grid_span = find_block(prompt, '<section class="metrics-grid">', '</section>')
+        if grid_span:
+            blocks['METRICS_GRID'] = strip_html_comments(prompt[grid_span[0]:grid_span[1]])
+            prompt = prompt[:grid_span[0]] + marker('METRICS_GRID') + prompt[grid_span[1]:]
+            prompt = prompt.replace(
+                '<!-- ⚠️ MANDATORY: COPY this metrics grid EXACTLY - DO NOT replace placeholders, DO NOT generate your own metrics -->',
+                '<!-- ⚠️ MANDATORY: output the marker below EXACTLY - the metrics grid is inserted by the system -->'
+            )
+        if chart_ready:
+            chart_span = find_block(prompt, '<div style="height: 420px;', '</div>', after_token='</svg>')
+            if chart_span:
+                blocks['PRICE_CHART'] = strip_html_comments(prompt[chart_span[0]:chart_span[1]])
+                prompt = prompt[:chart_span[0]] + marker('PRICE_CHART') + prompt[chart_span[1]:]
+        
+        if not blocks:
+            return prompt
+        self.prerendered_blocks.setdefault(ticker, {}).update(blocks)
+        logger.info(f"🧩 Call 1 splice mode: {', '.join(blocks)} pre-rendered ({sum(len(b) for b in blocks.values()):,} chars)")
+        return prompt + splice_directive(list(blocks))
+    
+    def _apply_call2_splicing(self, prompt: str, ticker: str, ready_tables: Dict[str, str]) -> str:
+        """
+        Splice mode: keep the ready tables in the Call 2 prompt as reference
+        data but ask for markers where the slides 8-10 tables go
+        """
+        if not SPLICE_ENABLED:
+            return prompt
         
-        <h4>[Write a bull case section title that identifies the primary upside driver with quantified potential. Example: "Bull Case: AI Platform Dominance Drives 40% Revenue CAGR"]</h4>
-        <p>[Write 500-600 words like a PM building the bull case for investment committee approval. Focus on: 1) Primary upside catalyst with specific timeline and probability assessment 2) Quantified financial impact - revenue growth, margin expansion, market share gains with supporting analysis 3) Market opportunity size and company's ability to capture value with competitive advantages 4) Multiple expansion potential and valuation re-rating catalysts 5) Risk mitigation factors that protect downside even if bull case doesn't fully materialize. Use specific data, industry research, and competitive intelligence. Show sophisticated understanding of what could drive exceptional returns and why this outcome is achievable.]</p>
+        statements = (
+            ('INCOME_TABLE', 'income_table', 'INCOME STATEMENT', 'SLIDE 8 - INCOME STATEMENT TABLE'),
+            ('BALANCE_TABLE', 'balance_table', 'BALANCE SHEET', 'SLIDE 9 - BALANCE SHEET TABLE'),
+            ('CASHFLOW_TABLE', 'cashflow_table', 'CASH FLOW', 'SLIDE 10 - CASH FLOW TABLE'),
+        )
+        blocks = {}
+        for name, key, statement, heading in statements:
+            table = ready_tables.get(key)
+            placeholder = f"[COPY THE COMPLETE {statement} TABLE FROM ABOVE - DON'T GENERATE NEW TABLES]"
+            if not table or placeholder not in prompt:
+                continue
+            blocks[name] = table
+            prompt = prompt.replace(placeholder, marker(name))
+            prompt = prompt.replace(
+                f"### {heading} (COPY EXACTLY):",
+                f"### {heading} (REFERENCE DATA - OUTPUT {marker(name)} INSTEAD OF COPYING):"
+            )
         
-        <h4>[Write a bear case section title that identifies the primary downside risk with specific threat. Example: "Bear Case: Regulatory Headwinds + Competition Pressure Margin Compression"]</h4> 
-        <p>[Write 500-600 words like a PM conducting rigorous risk analysis for downside protection. Focus on: 1) Primary downside risk with timeline and probability assessment 2) Quantified negative impact - revenue headwinds, margin compression, market share loss with supporting analysis 3) Competitive threats, regulatory risks, or macro headwinds that could derail thesis 4) Valuation compression scenarios and multiple contraction risks 5) Risk mitigation strategies, hedging opportunities, and downside protection measures. Show understanding of base rates, historical precedents, and what has gone wrong in similar situations. Demonstrate sophisticated risk management thinking.]</p>
+        if not blocks:
+            return prompt
+        self.prerendered_blocks.setdefault(ticker, {}).update(blocks)
+        logger.info(f"🧩 Call 2 splice mode: {', '.join(blocks)} pre-rendered ({sum(len(b) for b in blocks.values()):,} chars)")
+        return prompt + splice_directive(list(blocks))
+    
+    def _splice_prerendered(self, content: str, ticker: str) -> str:
+        """Substitute pre-rendered blocks for the markers in generated content"""
+        blocks = self.prerendered_blocks.get(ticker)
+        if not blocks:
+            return content
+        return splice_blocks(content, blocks)[0]
+    
+    async def _build_call2_prompt(
+        self,
+        company_name: str,
+        ticker: str,
+        analyses_data: Dict[str, Any],
+        financial_data: Dict = None,
+        call1_context: Dict = None,
+        investment_objective: str = None,
+        data_sources: Dict = None
+    ) -> str:
+        """Build optimized prompt for Call 2 (slides 8-15) using modular base prompt + Call 2 specifics + Call 1 context"""
         
-        <h4>Risk-Adjusted Return Assessment & Expected Value Calculation for {company_name} as of {datetime.now().strftime("%B %Y")}</h4>
-        <p>[Write 400-500 words like a PM conducting rigorous expected value analysis for portfolio construction. Include probability-weighted scenario analysis, Sharpe ratio calculations, maximum drawdown assessment, and correlation analysis vs portfolio holdings. Show sophisticated risk-adjusted return thinking that goes beyond simple upside/downside scenarios.]</p>
-    </main>
-    <footer class="report-footer"><p>Robeco Investment Research</p><p>Page 13 / 15</p></footer>
-</div>
-
-<div class="slide report-prose" id="slide-scenario-analysis">
-    <div class="slide-logo" style="top: 65px;">
-        <img src="https://images.ctfassets.net/tl4x668xzide/7mygwms2vuSwirnfvaCSvL/72d2bbd858a69aecbf59fd3fb8954484/robeco-logo-color.png" alt="Robeco Logo" style="height: 2rem;">
-    </div>
-    <header class="report-header-container">
-        <div class="header-blue-border">
-            <div class="company-header">
-                <!-- INSTRUCTION: Replace with actual company domain (e.g., apple.com, microsoft.com) -->
-                <!-- INSTRUCTION: Replace with company's main domain for logo. Use https://logo.clearbit.com/[COMPANY-DOMAIN].com format
-                Examples: apple.com, microsoft.com, tesla.com, frasersproperty.com, etc. 
-                Research the actual company domain from stock_data['company_name'] and use appropriate domain -->
-                <img src="https://logo.clearbit.com/[COMPANY-DOMAIN].com" onerror="this.onerror=null;this.src='https://placehold.co/20x20/005F90/ffffff?text={ticker}';" alt="Company Icon" class="icon" style="margin-top: -5px; width: 20px; height: 20px;">
-                <h1 class="name"><!-- INSTRUCTION: Use the FULL OFFICIAL company name from stock_data['company_name'] NOT the user input. Example: "Daikin Industries, Ltd." not "DAKIN" --></h1>
-                <!-- INSTRUCTION: Use CONSISTENT rating across ALL slides. Choose ONE: OVERWEIGHT (green #2E7D32), NEUTRAL (orange #FF8C00), or UNDERWEIGHT (red #C62828) -->
-                <div class="rating" style="color: [RATING-COLOR];">[INVESTMENT-RATING]</div>
-            </div>
-        </div>
-    </header>
-    <main>
-        <h3>[Create a title that demonstrates sophisticated scenario analysis and quantified probability assessment. Think like a PM using Monte Carlo analysis. Examples: "THREE SCENARIOS: BASE CASE 25% RETURNS DRIVE OVERWEIGHT RATING" or "MONTE CARLO ANALYSIS: 70% PROBABILITY OF OUTPERFORMANCE" or "RISK-ADJUSTED RETURNS: 2.1 SHARPE RATIO IN ALL SCENARIOS"]</h3>
+        logger.info(f"🔧 Building Call 2 prompt for {ticker} (slides 8-15)")
         
-        <p><strong>[Write section header for base case with specific probability and return expectation]</strong></p>
-        <p>[Write 400-500 words like a PM modeling the most likely scenario for investment committee. Focus on: 1) Base case assumptions with supporting rationale and historical precedents 2) Key financial drivers and their expected evolution with specific timeline 3) Catalyst realization timeline with realistic execution assessment 4) Expected return calculation with proper risk adjustment 5) Key signposts and metrics to monitor base case progression. Use industry benchmarks, management guidance analysis, and competitive positioning assessment. Show this is the most probable outcome with supporting evidence.]</p>
+        # Get base Robeco prompt (style, methodology, standards)
+        base_prompt = self._build_base_robeco_prompt(company_name, ticker)
         
-        <p><strong>[Write section header for bull case with specific probability and upside potential]</strong></p>
-        <p>[Write 400-500 words demonstrating sophisticated understanding of what drives exceptional investment outcomes. Include analysis of catalyst acceleration, market expansion scenarios, and multiple re-rating potential with quantified upside targets and timeline.]</p>
+        # CSS guidance for Call 2 styling requirements (only when the CSS template is available)
+        try:
+            report_assets.css()
+            css_guidance = f"""
+### CSS STYLING FOR CALL 2:
+
+**MANDATORY SIMPLIFICATION**: To avoid HTML generation overload, use SIMPLE CSS classes instead of complex inline styling.
+
+**FINANCIAL TABLE STRUCTURE** (greatly simplified):
+```html
+<table class="financial-table">
+    <thead>
+        <tr>
+            <th>INCOME STATEMENT</th>
+            <th class="text-right">2024-03-31</th>
+            <th class="text-right">2023-03-31</th>
+            <th class="text-right">YoY %</th>
+        </tr>
+    </thead>
+    <tbody>
+        <tr>
+            <td>Revenue</td>
+            <td class="text-right positive">$2.5B</td>
+            <td class="text-right">$2.1B</td>
+            <td class="text-right positive">+19.0%</td>
+        </tr>
+    </tbody>
+</table>
+```
+
+**CSS CLASSES AVAILABLE:**
+- `financial-table` - Main table styling with professional gradient headers
+- `text-right` - Right-align content  
+- `positive` - Green color for positive values
+- `negative` - Red color for negative values
+- `neutral` - Gray color for neutral values
+
+**CRITICAL SIMPLIFICATION**: 
+- NO complex inline styles allowed
+- NO nested style attributes
+- Use ONLY the CSS classes listed above
+- This reduces AI cognitive load by 80%
+"""
+        except Exception as e:
+            logger.warning(f"⚠️ Could not load CSS template for Call 2: {e}")
+            css_guidance = ""
         
-        <p><strong>[Write section header for bear case with specific probability and downside protection]</strong></p>
-        <p>[Write 400-500 words showing advanced risk analysis of what could go wrong, with specific downside scenarios, risk mitigation strategies, and portfolio protection measures.]</p>
+        # Get pre-built HTML tables for AI to copy directly (eliminates generation complexity)
+        ready_tables = self._build_ready_html_tables(company_name, financial_data)
         
-        <p><strong>Expected Value Analysis & Target Price Derivation</strong></p>
-        <p>[Write 300-400 words like a PM calculating probability-weighted target prices for position sizing decisions. Include expected value calculations, risk-adjusted returns, and specific entry/exit price targets with supporting methodology.]</p>
-    </main>
-    <footer class="report-footer"><p>Robeco Investment Research</p><p>Page 14 / 15</p></footer>
-</div>
-
-<div class="slide report-prose" id="slide-investment-conclusion">
-    <div class="slide-logo" style="top: 65px;">
-        <img src="https://images.ctfassets.net/tl4x668xzide/7mygwms2vuSwirnfvaCSvL/72d2bbd858a69aecbf59fd3fb8954484/robeco-logo-color.png" alt="Robeco Logo" style="height: 2rem;">
-    </div>
-    <header class="report-header-container">
-        <div class="header-blue-border">
-            <div class="company-header">
-                <!-- INSTRUCTION: Replace with actual company {company_name} domain (e.g., apple.com, microsoft.com) -->
-                <!-- INSTRUCTION: Replace with company's main domain for logo. Use https://logo.clearbit.com/[COMPANY-DOMAIN].com format
-                Examples: apple.com, microsoft.com, tesla.com, frasersproperty.com, etc. 
-                Research the actual company domain from stock_data['company_name'] and use appropriate domain -->
-                <img src="https://logo.clearbit.com/[COMPANY-DOMAIN].com" onerror="this.onerror=null;this.src='https://placehold.co/20x20/005F90/ffffff?text={ticker}';" alt="Company Icon" class="icon" style="margin-top: -5px; width: 20px; height: 20px;">
-                <h1 class="name"><!-- INSTRUCTION: Use the FULL OFFICIAL company name from stock_data['company_name'] NOT the user input. Example: "Daikin Industries, Ltd." not "DAKIN" --></h1>
-                <!-- INSTRUCTION: Use CONSISTENT rating across ALL slides. Choose ONE: OVERWEIGHT (green #2E7D32), NEUTRAL (orange #FF8C00), or UNDERWEIGHT (red #C62828) -->
-                <div class="rating" style="color: [RATING-COLOR];">[INVESTMENT-RATING]</div>
-            </div>
-        </div>
-    </header>
-    <main>
-        <h3>[Create a title that delivers your SPECIFIC rating with quantified thesis and timeline as of {datetime.now().strftime("%B %Y")}. Google Search: recent guidance, analyst estimates, valuation metrics. Examples: "OVERWEIGHT: 35% UPSIDE FROM AI AUTOMATION BY Q4 2025" or "NEUTRAL: FAIR VALUE AT 18X P/E AMID MARGIN HEADWINDS" or "UNDERWEIGHT: 25% DOWNSIDE RISK FROM CYCLICAL PEAK"]</h3>
+        # Get financial context using helper method
+        financial_context = self._build_financial_context(company_name, financial_data)
         
-        <p><strong>[Write section header focusing on the core alpha generation thesis and specific return expectations]</strong></p>
-        <p>[Write 400-500 words like a PM delivering the final investment recommendation to the investment committee. Focus on: 1) Core investment thesis with specific return target and timeline 2) Key alpha drivers that differentiate this opportunity from alternatives 3) Catalyst timeline with specific milestones and expected market reaction 4) Risk-adjusted return profile and why this merits portfolio allocation 5) Conviction level and position sizing recommendation based on opportunity size and risk assessment. Synthesize all prior analysis into compelling investment case that demonstrates superior risk-adjusted returns vs alternatives.]</p>
+        # Get analyst insights using helper method (6000 char limit for Call 2 - more detail)
+        analyst_insights = self._build_analyst_insights(analyses_data, content_limit=6000)
         
-        <p><strong>[Write section header on portfolio construction and institutional considerations]</strong></p>
-        <p>[Write 300-400 words demonstrating institutional-level portfolio thinking including position sizing, correlation benefits, sector allocation impact, liquidity considerations, and how this investment fits overall portfolio construction strategy.]</p>
+        # Get user context using helper method
+        user_context = self._build_user_context(data_sources)
         
-        <p><strong>[Write section header on monitoring framework and performance tracking]</strong></p>
-        <p>[Write 300-400 words like a PM setting up systematic monitoring of investment thesis progression. Include specific KPIs, financial metrics, industry benchmarks, and signposts to track thesis validation or deterioration with actionable triggers for position adjustments.]</p>
+        # Get Call 1 context summary using helper method
+        call1_summary = self._build_call1_context_summary(call1_context)
         
-        <p><strong>[Write section header on catalyst timeline and exit strategy]</strong></p>
-        <p>[Write 300-400 words showing sophisticated understanding of catalyst timing, price target realization, exit strategy planning, and specific dates/milestones that will drive investment performance. Include risk management protocols and position adjustment triggers.]</p>
-    </main>
-    <footer class="report-footer"><p>Robeco Investment Research</p><p>Page 15 / 15</p></footer>
-</div>
-```
-
-### CRITICAL: NO TABLE GENERATION REQUIRED!
-
-**SLIDES 8-10 - FINANCIAL STATEMENTS ANALYSIS WITH HIGH-DENSITY FRAMEWORK:**
-
-**SLIDE 8 - INCOME STATEMENT ANALYSIS:**
-- **H3 Title**: Create compelling title specific to {company_name}'s earnings quality as of {datetime.now().strftime("%B %Y")}
-
-**TITLE CONSTRUCTION FORMULA**: "8. {company_name}: [EARNINGS INSIGHT] & [MARGIN ANALYSIS] AMID [CURRENT ENVIRONMENT]"
-
-**🎯 ADAPTIVE INCOME STATEMENT ANALYSIS FOR {company_name}:**
-Generate 2-4 sections (flexible based on {company_name}'s specific financial characteristics) analyzing the most critical income statement insights for THIS company.
-
-**COMPANY-ADAPTIVE ANALYTICAL APPROACH:**
-Choose the most relevant analytical angles based on {company_name}'s business model, industry dynamics, and current financial position. Consider these potential dimensions but select only those most critical for {company_name}:
-
-**POTENTIAL INCOME STATEMENT FOCUS AREAS (Select Most Relevant):**
-- **Revenue Model Analysis**: For subscription/SaaS companies - recurring vs one-time revenue analysis
-- **Seasonality & Cyclicality**: For retail/consumer companies - seasonal pattern analysis and normalization
-- **Geographic Revenue Mix**: For multinational companies - regional performance and currency impact analysis
-- **Product/Segment Profitability**: For diversified companies - segment margin analysis and resource allocation
-- **Operating Leverage Dynamics**: For high fixed-cost companies - incremental margin analysis and scale benefits
-- **Pricing Power Assessment**: For branded/premium companies - price realization and volume trade-offs
-- **Cost Structure Evolution**: For transforming companies - fixed vs variable cost analysis and efficiency gains
-- **Regulatory Impact Analysis**: For regulated industries - regulatory cost impact and compliance analysis
-
-**SLIDE 9 - BALANCE SHEET ANALYSIS:**
-- **H3 Title**: Create compelling title specific to {company_name}'s financial strength as of {datetime.now().strftime("%B %Y")}
-
-**TITLE CONSTRUCTION FORMULA**: "9. {company_name}: [BALANCE SHEET STRENGTH] & [CAPITAL STRUCTURE] POSITIONING"
-
-**🎯 ADAPTIVE BALANCE SHEET ANALYSIS FOR {company_name}:**
-Generate 2-4 sections (flexible based on {company_name}'s capital structure and business model) analyzing the most critical balance sheet insights for THIS company.
-
-**COMPANY-ADAPTIVE ANALYTICAL APPROACH:**
-Choose the most relevant balance sheet angles based on {company_name}'s industry, capital intensity, and financial strategy. Select only the most critical areas for {company_name}:
-
-**POTENTIAL BALANCE SHEET FOCUS AREAS (Select Most Relevant):**
-- **Capital Intensity Analysis**: For manufacturing/infrastructure companies - asset turnover and capital efficiency
-- **Working Capital Dynamics**: For retail/manufacturing companies - inventory, receivables, and cash conversion cycle
-- **Debt Structure Optimization**: For leveraged companies - maturity profile, covenant analysis, and refinancing risks
-- **Asset Quality Assessment**: For financial institutions - loan quality, provisions, and risk-weighted assets
-- **Intangible Asset Valuation**: For tech/pharma companies - R&D capitalization, IP value, and goodwill analysis
-- **Real Estate Portfolio Value**: For REITs/retail companies - property valuation and location analysis
-- **Cash Management Strategy**: For cash-rich companies - cash deployment strategy and capital allocation priorities
-- **Off-Balance Sheet Analysis**: For complex companies - operating leases, JVs, and contingent liabilities
-
-**SLIDE 10 - CASH FLOW ANALYSIS:**
-- **H3 Title**: Create compelling title specific to {company_name}'s cash generation as of {datetime.now().strftime("%B %Y")}
-
-**TITLE CONSTRUCTION FORMULA**: "10. {company_name}: [CASH FLOW INSIGHT] & [CAPITAL ALLOCATION] EFFECTIVENESS"
-
-**🎯 ADAPTIVE CASH FLOW ANALYSIS FOR {company_name}:**
-Generate 2-4 sections (flexible based on {company_name}'s cash flow characteristics and business model) analyzing the most critical cash flow insights for THIS company.
-
-**COMPANY-ADAPTIVE ANALYTICAL APPROACH:**
-Choose the most relevant cash flow angles based on {company_name}'s business model, capital requirements, and cash flow patterns. Select only the most critical areas for {company_name}:
-
-**POTENTIAL CASH FLOW FOCUS AREAS (Select Most Relevant):**
-- **Free Cash Flow Conversion**: For high-growth companies - conversion from earnings to free cash flow and sustainability
-- **Capital Allocation Efficiency**: For mature companies - dividend policy, buybacks, and M&A cash deployment
-- **Working Capital Seasonality**: For seasonal businesses - cash flow timing and financing requirements
-- **Capex Investment Cycles**: For capital-intensive companies - maintenance vs growth capex and ROI analysis
-- **Cash Flow Predictability**: For subscription companies - recurring cash flow visibility and customer churn impact
-- **Financing Cash Flow Analysis**: For high-growth companies - funding requirements and capital raising patterns
-- **Operating Cash Flow Quality**: For complex companies - cash vs non-cash components and sustainability
-- **International Cash Flow**: For multinational companies - repatriation policies and geographic cash distribution
-
-**IMPLEMENTATION REQUIREMENTS:**
-- **Tables**: Copy the ready-made HTML tables provided above - NEVER create from scratch
-- **Analysis**: Write detailed analysis paragraphs referencing specific numbers from the tables
-- **Competitive Context**: Compare {company_name} to 2-3 specific competitors in each section
-
-### SIMPLIFIED CALL 2 CONTENT SPECIFICATIONS:
-
-**SLIDES 11-12 (RATIOS & VALUATION) - ULTRA-HIGH DENSITY ANALYSIS:**
-
-**SLIDE 11 - FINANCIAL RATIOS ANALYSIS:**
-- **H3 Title**: Create compelling title specific to {{company_name}}'s financial performance as of {datetime.now().strftime("%B %Y")}
-
-**TITLE CONSTRUCTION FORMULA**: "8. {{company_name}}: [KEY FINANCIAL INSIGHT] & [COMPETITIVE POSITIONING] AS OF {datetime.now().strftime("%B %Y")}"
-
-**TITLE CONSTRUCTION PRINCIPLES:**
-- **Company Name**: Always start with {{company_name}}
-- **Financial Insight**: Capture the 2-3 word core financial strength/weakness
-- **Competitive Context**: Reference how {{company_name}} compares to industry/peers
-- **Specificity**: Include specific metrics or performance indicators
-
-**🎯 ADAPTIVE FINANCIAL RATIOS ANALYSIS FOR {company_name}:**
-Generate 2-4 sections (flexible based on {company_name}'s most critical ratio performance areas) analyzing the key financial metrics that drive investment decisions for THIS company.
-
-**COMPANY-ADAPTIVE ANALYTICAL APPROACH:**
-Choose the most relevant ratio categories based on {company_name}'s business model, industry dynamics, and key performance drivers. Select only the most critical ratio areas for {company_name}:
-
-**POTENTIAL FINANCIAL RATIO FOCUS AREAS (Select Most Relevant):**
-- **Profitability & Returns Analysis**: For capital-intensive companies - ROE, ROIC, ROA trends and peer comparison
-- **Efficiency & Productivity Metrics**: For asset-heavy companies - asset turnover, inventory turns, receivables efficiency
-- **Leverage & Coverage Ratios**: For debt-heavy companies - debt/equity, interest coverage, debt service capability
-- **Liquidity & Financial Flexibility**: For cyclical companies - current ratio, quick ratio, cash conversion cycle
-- **Growth & Investment Ratios**: For high-growth companies - reinvestment rates, growth sustainability metrics
-- **Valuation Ratios Analysis**: For value/growth companies - P/E, EV/EBITDA, PEG ratio peer comparison
-- **Quality & Sustainability Metrics**: For dividend companies - payout ratios, dividend coverage, earnings quality
-- **Sector-Specific Ratios**: For specialized industries - same-store sales (retail), loan-to-deposit (banks), occupancy (REITs)
-
-**SLIDE 12 - VALUATION METHODOLOGY ANALYSIS:**
-- **H3 Title**: Create compelling title specific to {{company_name}}'s valuation opportunity as of {datetime.now().strftime("%B %Y")}
-
-**TITLE CONSTRUCTION FORMULA**: "9. {{company_name}}: [VALUATION THESIS] AMID [MARKET MISPRICING/OPPORTUNITY] AS OF {datetime.now().strftime("%B %Y")}"
-
-**🎯 ADAPTIVE VALUATION ANALYSIS FOR {company_name}:**
-Generate 2-4 sections (flexible based on {company_name}'s most appropriate valuation methodologies) covering the most relevant valuation approaches for THIS company's business model and industry.
-
-**COMPANY-ADAPTIVE VALUATION APPROACH:**
-Choose the most suitable valuation methodologies based on {company_name}'s business characteristics, cash flow patterns, and industry standards. Select only the most relevant approaches for {company_name}:
-
-**POTENTIAL VALUATION METHODOLOGY FOCUS AREAS (Select Most Relevant):**
-- **DCF Valuation Analysis**: For stable cash flow companies - detailed DCF with sensitivity analysis and terminal value assessment
-- **Comparable Company Analysis**: For industry-standard companies - trading multiples vs peers with premium/discount analysis
-- **Sum-of-the-Parts Valuation**: For diversified companies - segment-by-segment valuation and conglomerate discount analysis
-- **Asset-Based Valuation**: For asset-heavy companies - book value, replacement cost, and liquidation value analysis
-- **Revenue Multiple Analysis**: For high-growth companies - P/S, EV/Sales analysis with growth-adjusted metrics
-- **Option Valuation Models**: For development-stage companies - real options valuation for growth opportunities
-- **Dividend Discount Model**: For dividend-focused companies - DDM with growth rate and payout ratio analysis
-- **Industry-Specific Metrics**: For specialized sectors - price per subscriber (telecom), price per barrel (oil), NAV (REITs)
-
-### CRITICAL SIMPLIFICATION MANDATE:
-- **80% complexity reduction** - Remove all nested inline styles
-- **Focus on content quality** over visual complexity
-- **Use ONLY basic HTML** - `<p>`, `<ul>`, `<li>`, `<strong>`, `<table class="financial-table">`
-- **This prevents AI cognitive overload** that caused slide 9-10 failures
-
-### CRITICAL TITLE GENERATION PRINCIPLES FOR CALL 2:
-- **FINANCIAL INSIGHT FOCUS**: Every title must capture the key financial insight (e.g., "EXCEPTIONAL FCF CONVERSION: 95% OF NET INCOME TO FREE CASH FLOW")
-- **QUANTIFY THE STORY**: Include specific metrics that show financial strength/weakness (e.g., "25% ROE VS INDUSTRY 12% AVERAGE")
-- **COMPARATIVE ADVANTAGE**: Show how {company_name}'s financials compare to peers/industry (e.g., "SUPERIOR CAPITAL EFFICIENCY")
-- **VALUE DRIVER IDENTIFICATION**: Highlight what drives financial performance (e.g., "SUBSCRIPTION MODEL TRANSFORMATION")
-- **INVESTMENT IMPLICATION**: Make clear why this financial insight matters for investment returns
-- **NO GENERIC FINANCIAL TITLES**: Avoid "Income Statement Analysis" - use "REVENUE ACCELERATION & MARGIN EXPANSION"
-rd valuation with DCF and multiples (no complex tables)
-- **Format**: Simple paragraph structure with clear section headers
-- **Focus**: Quality over complexity - concise but comprehensive analysis
-
-**SLIDES 13-15 (RISK & CONCLUSION) - INSTITUTIONAL-GRADE ANALYSIS:**
-
-**SLIDE 13 - COMPREHENSIVE RISK ASSESSMENT:**
-- **H3 Title**: Create compelling title specific to {company_name}'s risk profile as of {datetime.now().strftime("%B %Y")}
-
-**TITLE CONSTRUCTION FORMULA**: "10. {company_name}: [PRIMARY RISK THEME] & [MITIGATION STRATEGY] IN {datetime.now().strftime("%B %Y")} ENVIRONMENT"
-
-**🎯 ADAPTIVE RISK ANALYSIS FOR {company_name}:**
-Generate 2-4 sections (flexible based on {company_name}'s most material risk factors) covering the key risks that could significantly impact investment returns for THIS company.
-
-**COMPANY-ADAPTIVE RISK APPROACH:**
-Choose the most material risk categories based on {company_name}'s business model, industry position, and current environment. Select only the most critical risk areas for {company_name}:
-
-**POTENTIAL RISK FOCUS AREAS (Select Most Relevant):**
-- **Cyclical & Economic Risks**: For economically sensitive companies - recession impact, interest rate sensitivity, commodity exposure
-- **Competitive & Market Share Risks**: For market leaders - disruption threats, new entrants, competitive response risks
-- **Regulatory & Political Risks**: For regulated industries - policy changes, compliance costs, political stability
-- **Technology & Disruption Risks**: For traditional companies - digital transformation, automation, obsolescence threats
-- **Financial & Leverage Risks**: For debt-heavy companies - refinancing, covenant breaches, credit rating risks
-- **Operational & Execution Risks**: For complex operations - supply chain, manufacturing, project execution risks
-- **ESG & Sustainability Risks**: For resource companies - environmental liabilities, social license, governance issues
-- **Geographic & Currency Risks**: For international companies - country risks, currency volatility, trade tensions
-
-**SLIDE 14 - SCENARIO ANALYSIS & BULL/BEAR CASES:**
-- **H3 Title**: Create compelling title specific to {company_name}'s scenario outcomes as of {datetime.now().strftime("%B %Y")}
-
-**TITLE CONSTRUCTION FORMULA**: "11. {company_name}: [SCENARIO THEME] WITH [PROBABILITY RANGE] OUTCOMES BY {datetime.now().strftime("%B %Y")}"
-
-**🎯 ADAPTIVE SCENARIO ANALYSIS FOR {company_name}:**
-Generate 2-4 sections (flexible based on {company_name}'s key scenario drivers) covering the most probable outcome scenarios that drive investment decision-making for THIS company.
-
-**COMPANY-ADAPTIVE SCENARIO APPROACH:**
-Choose the most relevant scenario frameworks based on {company_name}'s key value drivers, risk factors, and catalyst timeline. Select the scenario structure most appropriate for {company_name}:
-
-**POTENTIAL SCENARIO FRAMEWORK OPTIONS (Select Most Relevant):**
-- **Traditional Bull/Base/Bear**: For stable companies - probability-weighted outcomes with price targets
-- **Catalyst-Driven Scenarios**: For event-driven companies - regulatory approval, merger, product launch outcomes
-- **Cycle-Based Scenarios**: For cyclical companies - upcycle, downcycle, recovery scenarios with timing analysis
-- **Execution Scenarios**: For turnaround companies - successful transformation vs execution failure scenarios
-- **Market Environment Scenarios**: For macro-sensitive companies - rate environment, economic growth scenarios
-- **Competitive Response Scenarios**: For market leaders - competitive dynamics and market share scenarios
-- **Technology Adoption Scenarios**: For disruptive companies - adoption rate scenarios and market penetration
-- **Geographic Expansion Scenarios**: For growth companies - expansion success vs market entry challenges
-
-**SLIDE 15 - INVESTMENT CONCLUSION & RECOMMENDATION:**
-- **H3 Title**: Create compelling title specific to {company_name}'s investment conclusion as of {datetime.now().strftime("%B %Y")}
-
-**TITLE CONSTRUCTION FORMULA**: "12. {company_name}: [INVESTMENT RATING] - [KEY CATALYST] DRIVES [EXPECTED RETURN] BY {datetime.now().strftime("%B %Y")}"
-
-**🎯 ADAPTIVE INVESTMENT CONCLUSION FOR {company_name}:**
-Generate 3-5 sections (flexible based on {company_name}'s investment complexity and decision factors) synthesizing the complete analysis into actionable portfolio recommendations for THIS company.
-
-**COMPANY-ADAPTIVE CONCLUSION APPROACH:**
-Choose the most relevant conclusion framework based on {company_name}'s investment characteristics, risk profile, and portfolio fit. Select the conclusion structure most appropriate for {company_name}:
+        # Build Call 2 specific requirements with precise HTML structure
+        investment_focus = investment_objective or "comprehensive investment analysis"
+        month = current_month()
+        call2_slides = prompt_registry.render("report.call2.slides", company_name, ticker, month)
+        call2_mandate = prompt_registry.render("report.call2.mandate", company_name, month)
+        call2_specific = f"""
+## ALPHA GENERATION PHASE 2: QUANTITATIVE VALIDATION & SOPHISTICATED VALUATION (SLIDES 8-15)
 
-**POTENTIAL CONCLUSION FOCUS AREAS (Select Most Relevant):**
-- **Core Investment Thesis Summary**: For all companies - fundamental value proposition and differentiated positioning
-- **Valuation & Price Target Analysis**: For value opportunities - target price methodology and expected returns timeline
-- **Risk-Adjusted Return Profile**: For complex positions - risk/reward analysis and portfolio impact assessment
-- **Position Sizing & Timing Guidance**: For tactical positions - recommended allocation and entry/exit strategy
-- **Catalyst Timeline & Milestones**: For catalyst-driven positions - key events and milestone tracking framework
-- **Portfolio Construction Impact**: For core holdings - correlation analysis and diversification benefits
-- **ESG & Sustainability Factors**: For ESG-focused strategies - sustainability profile and long-term viability
-- **Competitive Moat Assessment**: For quality companies - sustainable advantage analysis and durability assessment
+### YOUR ELITE PM MANDATE FOR CALL 2:
+As an elite Portfolio Manager writing in {datetime.now().strftime("%B %Y")}, your **second phase objective** is to provide rigorous quantitative validation of the Phase 1 investment thesis through sophisticated financial analysis and multi-methodology valuation. You're applying the same analytical rigor that generates consistent alpha at the world's top hedge funds.
 
-**🎯 ADAPTIVE FRAMEWORK IMPLEMENTATION:**
-- **Company-Specific Selection**: For each slide, select only the 2-4 most relevant analytical areas for {company_name}
-- **Business Model Driven**: Let {company_name}'s specific characteristics (industry, size, growth stage, capital structure) determine the analytical focus
-- **Quality Over Quantity**: Better to have 2 deep, company-specific sections than 4 generic ones
-- **Industry Adaptation**: Tech companies get different analysis than REITs, banks get different analysis than retail companies
+**INVESTMENT OBJECTIVE FOCUS**: {investment_focus} - Ensure all financial analysis and valuation work supports this specific investment objective and connects quantitative insights to this goal.
 
-**ULTRA-HIGH INFORMATION DENSITY STANDARDS FOR ALL CALL 2 SLIDES:**
-- Each section: 600-800 words with MINIMUM 15 quantified data points
-- Every paragraph must contain 3-4 specific metrics, dates, or comparative benchmarks
-- **Financial Data Density**: Include 8-12 financial metrics per section with peer comparisons
-- **Historical Benchmarking**: Reference 3-5 year financial trends with specific competitor comparisons
-- **Forward-Looking Financial Intelligence**: Predict financial performance with probability assessments
-- **Multi-Dimensional Financial Comparison**: Compare across profitability, efficiency, leverage, and growth metrics
-- Connect financial analysis to macro economic trends and competitive landscape shifts
+**Deploy your 25+ years of experience** in factor modeling, risk decomposition, and advanced valuation techniques. Every financial insight must demonstrate the quantitative sophistication that separates institutional research from generic analysis. **Critical**: Use the most current financial data available as of {datetime.now().strftime("%B %Y")}, including latest quarterly reports, recent market developments, and current economic conditions. **Google Search Grounding**: Use Google Search extensively to verify all financial statements data, recent earnings results, analyst estimates, competitor performance, and industry benchmarks mentioned in your analysis.
 
-**COMPETITIVE FINANCIAL ANALYSIS DEPTH REQUIREMENTS:**
-- **Peer Financial Benchmarking**: Compare {company_name} to 2-3 closest competitors with exact financial ratios
-- **Quantified Financial Positioning**: Show specific metrics where {company_name} leads/lags (ROE, margins, debt ratios, etc.)
-- **Financial Strategy Differentiation**: Explain capital allocation choices that differentiate {company_name} from competitors
-- **Financial Performance Prediction**: Forecast how {company_name}'s financial metrics will evolve vs peer group
-### CRITICAL SIMPLIFICATION MANDATE FOR CALL 2:
-- **80% complexity reduction** - Remove all nested inline styles that cause AI cognitive overload
-- **Focus on analytical content quality** over visual complexity  
-- **Use ONLY basic HTML** - `<p>`, `<ul>`, `<li>`, `<strong>`, `<h3>`, `<h4>`, `<table class="financial-table">`
-- **This prevents AI cognitive overload** that historically caused slide 9-10 generation failures
+{call1_summary}
 
-### 🎯 CRITICAL TITLE GENERATION FOR CALL 2:
-- **FINANCIAL INSIGHT FOCUS**: Every title must capture the key financial insight (e.g., "EXCEPTIONAL FCF CONVERSION: 95% OF NET INCOME TO FREE CASH FLOW")
-- **QUANTIFY THE STORY**: Include specific metrics showing strength/weakness (e.g., "25% ROE VS INDUSTRY 12% AVERAGE")  
-- **COMPARATIVE ADVANTAGE**: Show {company_name}'s financials vs peers (e.g., "SUPERIOR CAPITAL EFFICIENCY: 25% ROIC VS PEER 15%")
-- **VALUE DRIVER IDENTIFICATION**: Highlight what drives performance (e.g., "SUBSCRIPTION MODEL: 70% GROSS MARGINS")
-- **INVESTMENT IMPLICATION**: Connect financial insight to stock price impact and investment returns
-- **NO GENERIC TITLES**: Avoid "Income Statement Analysis" - use "REVENUE ACCELERATION & MARGIN EXPANSION CYCLE"
 
-### ELITE PM FINANCIAL ANALYSIS FRAMEWORK for {company_name} as of {datetime.now().strftime("%B %Y")}:
+### EXACT HTML STRUCTURE REQUIREMENTS - GENERATE PRECISELY:
 
-** FINANCIAL FORENSICS & QUALITY ANALYSIS:**
-- **Earnings Quality Dissection**: Separate recurring vs. non-recurring, cash vs. non-cash components; assess sustainability of reported margins; identify accounting choices that enhance/mask true performance specific to {company_name} as of {datetime.now().strftime("%B %Y")}
-- **Capital Allocation Mastery**: Assess ROIC trends by segment, incremental returns on new investments, M&A track record, and value creation vs. destruction patterns
-- **Hidden Value Discovery**: Identify understated assets, off-balance sheet value, real estate/IP portfolios, and embedded optionality not reflected in current valuation
+## 🎯 READY-MADE HTML TABLES - JUST COPY THESE DIRECTLY:
 
-**⚡ FORWARD-LOOKING FINANCIAL INSIGHTS:**
-- **Leading Indicator Analysis**: Identify metrics that predict earnings 2-3 quarters ahead (deferred revenue growth, customer acquisition trends, inventory patterns)
-- **Margin Inflection Prediction**: Analyze when margin expansion/compression accelerates; assess pricing power sustainability and cost structure evolution
-- **Cash Flow Predictability**: Evaluate free cash flow conversion consistency, working capital seasonality, and cash generation through cycles
-- **Capital Efficiency Evolution**: Predict future ROIC/ROE trajectory based on investment patterns, competitive positioning, and industry dynamics
+### SLIDE 8 - INCOME STATEMENT TABLE (COPY EXACTLY):
+{ready_tables['income_table']}
 
-**🎯 NON-CONSENSUS INSIGHTS & ALPHA GENERATION:**
-- **Segment Profitability Deep Dive**: Uncover hidden value in segments consensus treats as commoditized; identify cross-subsidization and standalone opportunities
-- **Competitive Financial Edge**: Predict how {company_name}'s unit economics and cost advantages evolve vs peers; assess pricing power sustainability
-- **Capital Cycle Positioning**: Determine where company sits in investment/harvest cycle; predict future cash generation vs. capital needs
-- **Quality of Growth Assessment**: Distinguish growth that creates vs. destroys value using incremental returns and customer economics analysis
+### SLIDE 9 - BALANCE SHEET TABLE (COPY EXACTLY): 
+{ready_tables['balance_table']}
 
-**PRACTICAL VALUATION & RISK ASSESSMENT:**
-- **Multiple Valuation Methods**: DCF with realistic assumptions, sum-of-parts analysis, peer comparisons with quality adjustments
-- **Scenario Analysis**: Bull/base/bear cases with specific assumptions and probability assessments based on fundamentals
-- **Through-Cycle Normalization**: Adjust for cyclical factors to assess sustainable earning power and appropriate multiples
-- **Risk Factor Identification**: Company-specific, sector, and macro risks with impact quantification and mitigation assessment
+### SLIDE 10 - CASH FLOW TABLE (COPY EXACTLY):
+{ready_tables['cashflow_table']}
 
+{call2_slides}
 {user_context}
 
 {financial_context}
 
 {analyst_insights}
-
-**ULTRA-SOPHISTICATED EXECUTION MANDATE as of {datetime.now().strftime("%B %Y")}**: 
-Generate ALL 8 slides that demonstrate **differentiated financial insights, predictive analytics, and quantitative edge** that validates your investment thesis through analysis that others systematically miss. Each slide must answer: **"What do the financials reveal about {company_name}'s future that consensus analysis overlooks?"**
-
-**CRITICAL ANALYTICAL REQUIREMENTS:**
-- **EXPLICIT DATE CONTEXT**: All analysis must explicitly reference current date {datetime.now().strftime("%B %Y")} to ensure updated information
-- **MANDATORY GOOGLE SEARCH GROUNDING**: ALL information must be grounded with Google Search tool - no generic statements allowed
-- **DIFFERENTIATED VIEW MANDATE**: Show what previous fundamentals reveal about stock price implications and future implications based on recent company strategy and themes
-- **FORWARD-LOOKING FOCUS**: Provide concrete, precise analysis that demonstrates deep company understanding and insight into how strategy affects stock price and future performance
-- **PM CONVICTION STANDARD**: Write concise, precise analysis that convinces PM you are different, have your own view, know company very well, and understand how company strategy will affect stock price and future - NO bullshit, be concrete and precise
-
-**ADVANCED WRITING TECHNIQUES FOR MAXIMUM PM IMPACT:**
-- **QUANTIFIED SPECIFICITY**: Use exact numbers, not ranges. "23.4% margin expansion" not "strong margins"
-- **HISTORICAL PATTERN RECOGNITION**: Reference specific past events. "Similar to 2019 automation rollout that drove 400bps margin gains"
-- **MANAGEMENT BEHAVIOR DECODING**: Read between lines. "CFO's emphasis on 'capital discipline' signals dividend increase vs buybacks"
-- **SECOND-ORDER IMPLICATIONS**: Show cascade effects. "Pricing power in segment A enables cross-subsidization of segment B expansion"
-- **COMPETITIVE INTELLIGENCE**: Demonstrate market knowledge. "While peers struggle with supply chain, {company_name}'s vertical integration provides 18-month cost advantage"
-- **UNIT ECONOMICS MASTERY**: Show business model understanding. "Each new customer generates $2.3K annual recurring revenue at 67% gross margin"
-- **CATALYST SEQUENCING**: Predict event timing. "Q1 earnings will show margin inflection, followed by guidance raise in Q2, driving re-rating by Q3"
-- **CONTRARIAN EVIDENCE ACKNOWLEDGMENT**: Address bear case. "Despite cyclical headwinds, structural demand shift to premium segment sustains pricing"
-- **INSIDER-LEVEL INSIGHTS**: Write like you know the company intimately. "Management's R&D reallocation toward AI indicates 2026 product cycle acceleration"
-- **PROBABILISTIC THINKING**: Assign outcome probabilities. "75% chance of beating guidance by 5%+ given leading indicator trends"
-
-**MAXIMUM INFORMATION DENSITY REQUIREMENTS:**
-- **SYNTHESIS MASTERY**: Connect 3+ data points per insight. "Capex +40%, R&D +25%, and patent filings +60% signal product cycle acceleration beginning Q3 2025"
-- **LAYERED ANALYSIS**: Multiple analytical lenses per paragraph. "Margin expansion (financial), market share gains (competitive), and customer satisfaction scores (operational) all confirm pricing power sustainability"
-- **FORWARD-LOOKING SYNTHESIS**: Predict specific outcomes. "Current inventory build (+23% QoQ) + supplier contract renegotiations + automation phase 2 completion = 35% gross margin by Q2 2025"
-- **BENCHMARKING SOPHISTICATION**: Multi-dimensional comparisons. "Trading at 0.8x vs historical 1.2x multiple, 0.7x vs peer average, but 1.1x vs growth-adjusted fair value"
-- **RESOURCE ALLOCATION INTELLIGENCE**: Capital efficiency insights. "$500M capex generates $2.1B revenue capacity at 28% incremental margins = 84% IRR vs 15% cost of capital"
-- **COMPRESSED INSIGHT DELIVERY**: Maximum insights per sentence. "Q3 beat (+8% vs consensus) driven by pricing (+5%), volume (+2%), and mix (+1%) validates our 3-factor expansion thesis"
-
-**FINANCIAL INSIGHT REQUIREMENTS for {company_name} as of {datetime.now().strftime("%B %Y")}:
-- **Slide 8**: Identify hidden earnings quality issues or sustainable competitive advantages buried in income statement
-- **Slide 9**: Reveal balance sheet strengths/weaknesses that create option value or hidden risks consensus misses
-- **Slide 10**: Uncover cash flow generation patterns that predict future capital allocation effectiveness
-- **Slide 11**: Demonstrate superior ratio analysis that identifies competitive positioning trends before consensus
-- **Slide 12**: Generate valuation insights using sophisticated methodologies that exploit market mispricing
-- **Slide 13**: Assess risks using probability-weighted analysis that accounts for second-order effects
-- **Slide 14**: Model scenarios that incorporate competitive responses and industry dynamics consensus ignores
-- **Slide 15**: Synthesize financial analysis into actionable investment conclusion with specific alpha generation pathway
-
-**🎯 MANDATORY KEY TAKEAWAYS SECTION (ALL SLIDES 8-15):**
-Each slide from 8-15 MUST end with a "Key Takeaways" section containing 2-4 bullet points (flexible based on analysis depth) that distill the most important financial insights from that specific slide's content.
-
-**Financial Key Takeaways Format:**
-```html
-<div class="key-takeaways-section">
-    <h4 class="takeaways-header">Key Investment Takeaways</h4>
-    <ul class="takeaways-list">
-        <li class="takeaway-item">[Most important financial discovery from your analysis - include specific metrics and ratios]</li>
-        <li class="takeaway-item">[Key competitive financial positioning insight - quantified vs peers with actual numbers]</li>
-        <!-- Add more bullets ONLY if your analysis contains additional critical financial insights -->
-    </ul>
-</div>
-```
-
-**FLEXIBLE FINANCIAL TAKEAWAY GENERATION RULES:**
-- **Analysis-Driven Quantity**: Generate 2-4 bullets based on the actual financial insights discovered in THIS slide
-- **Slide-Specific Content**: Takeaways should only reflect the financial analysis performed on this particular slide
-- **Metric-Rich**: Each bullet must include specific financial data, ratios, or percentages from your analysis
-- **No Generic Fillers**: Don't add standard financial bullets just to reach a count
-- **Investment-Focused**: Each takeaway should have clear implications for investment decisions
-
-**Financial Bullet Point Requirements:**
-- Each bullet point: 15-25 words maximum  
-- MUST include specific financial metrics, ratios, or percentages from your analysis
-- NO GENERIC FINANCIAL STATEMENTS: Avoid "strong balance sheet" or "healthy cash flow"
-- COMPANY-SPECIFIC METRICS: Reference actual ROE, debt-to-equity, free cash flow margins, etc.
-- ANALYSIS-DERIVED: Extract insights directly from the financial tables and analysis you wrote
-- PEER-COMPARATIVE: Show how financial metrics compare to specific competitors with numbers
-
-**EXAMPLES OF GOOD vs BAD TAKEAWAYS:**
-❌ BAD: "Strong cash flow generation supports dividend growth"
-✅ GOOD: "Frasers Logistics generates 95% cash-to-earnings conversion vs peer average of 78%, supporting 4% DPU growth"
-
-❌ BAD: "Attractive valuation metrics indicate upside potential"  
-✅ GOOD: "DCF fair value of $1.15 vs current $0.95 suggests 21% upside, driven by NOI recovery"
-
-❌ BAD: "Solid balance sheet provides financial flexibility"
-✅ GOOD: "Debt-to-assets ratio of 35% vs sector average 42% provides $800M additional borrowing capacity"
-
-**QUANTITATIVE DIFFERENTIATION STANDARDS:**
-- **Financial Forensics**: Uncover insights in financial statements that require deep analytical sophistication
-- **Predictive Modeling**: Use financial trends to predict inflection points 2-3 quarters ahead of consensus
-- **Quality Assessment**: Distinguish between accounting performance and true economic value creation
-- **Complexity Premium**: Exploit valuation gaps created by financial statement complexity or business model sophistication
-
-**MANDATORY SLIDE COMPLETION REQUIREMENTS:**
-- MUST generate EXACTLY 8 slides: slides 8, 9, 10, 11, 12, 13, 14, AND 15
-- Each slide MUST have complete financial analysis content
-- SLIDE 15 MUST be complete with investment conclusion
-- Each slide MUST have complete content - NO truncation allowed  
-- Final slide MUST end with "Page 15 / 15" footer
-
-**CRITICAL OUTPUT FORMAT REQUIREMENTS:**
-- Output PURE HTML ONLY - NO markdown code blocks, NO **bold** markdown
-- NO ```html tags, NO explanatory text, NO comments
-- ALL emphasis must use <strong>text</strong> HTML tags, NEVER **text** markdown
-- Start directly with <div class="slide report-prose" id="slide-financial-income-statement">
-- End with slide 15's closing </div> tag (Page 15 / 15)
-- Use exact CSS classes and structure shown in examples above
-- GENERATE ALL 8 SLIDES COMPLETELY - DO NOT STOP EARLY
-
-**🚨 CRITICAL: USE EXACT RATING "{{call1_rating}}" ON ALL SLIDES 8-15**
-- Call 1 established the investment rating: **{{call1_rating}}**
-- YOU MUST use "{{call1_rating}}" on EVERY single slide (8, 9, 10, 11, 12, 13, 14, 15)
-- All financial analysis must SUPPORT the "{{call1_rating}}" investment conclusion
-- ABSOLUTELY NO contradictory ratings - use "{{call1_rating}}" only
-
-**🔥 ULTRA-HIGH INFORMATION DENSITY REQUIREMENTS:**
-
-**SLIDES 12-14 CRITICAL ANALYTICAL CORE - MAXIMUM DENSITY:**
-- **Slide 12 (DCF & Multiples)**: HIGHEST density - pack 3-4 valuation insights per paragraph, include 8-12 specific metrics, reference 4-6 peer comparisons with exact multiples
-- **Slide 13 (Risk Analysis)**: Ultra-compressed risk assessment - 4-6 quantified risks with probability estimates, 3-4 scenario outcomes with specific price impacts  
-- **Slide 14 (Bull/Bear Cases)**: Maximum scenario density - 6-8 bull factors, 6-8 bear factors, each with quantified earnings/price impact and probability weighting
-
-**INFORMATION DENSITY STANDARDS:**
-- **Slide 12**: Minimum 15 financial metrics per section, 6+ peer comparisons, 3+ valuation methodologies with specific price targets
-- **Slide 13**: Minimum 8 quantified risk factors, 4+ scenario probabilities, 6+ specific impact measurements (earnings, cash flow, valuation)
-- **Slide 14**: Minimum 12 bull/bear factors total, each with specific % impact on earnings/price, timeline for catalyst realization
-
-**WRITING REQUIREMENTS - MAXIMUM EFFICIENCY:**
-- Each analysis section: MAX 150-200 words but MINIMUM 8-10 specific data points per section
-- Each subsection paragraph: MAX 400-500 words but MINIMUM 12-15 quantified insights per paragraph  
-- Use <strong>key metrics</strong> and <strong>critical insights</strong> for emphasis
-- Be punchy, direct, and impactful - eliminate unnecessary words
-- Every sentence must add 2-3 specific value/data points minimum
-- NO filler words, NO generic statements - pure analytical content only
-
-**CRITICAL COMPLETION ENFORCEMENT:**
-YOU MUST COMPLETE ALL 8 SLIDES (8, 9, 10, 11, 12, 13, 14, 15). 
-- Do NOT stop at slide 10 or any intermediate slide
-- Each slide must have complete content and proper footer with page numbers
-- Slide 15 MUST end with "Page 15 / 15" footer
-- If you reach token limits, prioritize completing the slide structure over verbose content
-- ABSOLUTELY REQUIRED: Generate slides 8, 9, 10, 11, 12, 13, 14, AND 15
+{call2_mandate}
 """
         
         # Combine base prompt with CSS guidance, ready tables, and Call 2 specifics
@@ -3708,13 +2645,13 @@ YOU MUST COMPLETE ALL 8 SLIDES (8, 9, 10, 11, 12, 13, 14, 15).
             
             logger.info(f"✅ Call 2 prompt built: {len(formatted_call2_prompt):,} characters with pre-built HTML tables and context")
             logger.info(f"🔍 DEBUG: User context in Call 2 final prompt: {'user_context' not in formatted_call2_prompt}")
-            return formatted_call2_prompt
+            return self._apply_call2_splicing(formatted_call2_prompt, ticker, ready_tables)
         except KeyError as e:
             logger.error(f"❌ Formatting error in Call 2 prompt: {e}")
             logger.error(f"🔍 Looking for malformed placeholder: {e}")
             # Return unformatted prompt for debugging
             logger.info(f"✅ Call 2 prompt built (unformatted): {len(complete_call2_prompt):,} characters")
-            return complete_call2_prompt
+            return self._apply_call2_splicing(complete_call2_prompt, ticker, ready_tables)
     
     def _extract_financial_statements_for_analysis(self, financial_data: Dict) -> Dict[str, Any]:
         """
@@ -3780,34 +2717,22 @@ YOU MUST COMPLETE ALL 8 SLIDES (8, 9, 10, 11, 12, 13, 14, 15).
                 'html_tables_for_ai': ''
             }
     
-    async def _generate_ai_report(self, prompt: str, websocket=None, connection_id: str = None, call_phase: str = "generation") -> str:
-        """Generate slides content using AI with automatic retry logic and optional websocket streaming"""
+    async def _generate_ai_report(self, prompt: str, websocket=None, connection_id: str = None, call_phase: str = "generation",
+                                  cached_prefix: str = None, rating_seen: asyncio.Future = None) -> str:
+        """
+        Generate slides content using AI with automatic retry logic and optional websocket streaming
+
+        ``cached_prefix`` marks the leading part of ``prompt`` shared across calls
+        (the company-independent base prompt); it is served from a Gemini cached context.
+        ``rating_seen`` is resolved with the investment rating as soon as the
+        rating badge appears in the stream.
+        """
         
         # Get current date for dynamic prompts
         current_date = datetime.now().strftime("%B %d, %Y")
         current_month_year = datetime.now().strftime("%B %Y")
         
-        max_retries = 100  # Try many keys until we find a working one
-        for attempt in range(max_retries):
-            # Get API key with force_attempt to start with primary key
-            key_result = get_intelligent_api_key(agent_type="report_generator", attempt=attempt, force_attempt=True)
-            if not key_result:
-                raise Exception("No API key available for report generation")
-            
-            api_key, key_info = key_result
-            logger.info(f"📝 Report generation attempt {attempt+1} using API key: {api_key[:8]}...{api_key[-4:]}")
-            
-            try:
-                client = Client(api_key=api_key)
-                
-                # Configure for maximum comprehensive content generation with Google Search grounding
-                generate_config = types.GenerateContentConfig(
-                    temperature=1.2,  # Slightly higher for more detailed analysis
-                    top_p=0.9,  # Good for comprehensive content generation
-                    max_output_tokens=800000,  # ULTRA-MAXIMIZED for complete 15-slide template structure
-                    response_mime_type="text/plain",
-                    tools=[Tool(google_search=GoogleSearch())],  # Enable Google Search grounding
-                    system_instruction=f"""You are a Managing Director at Robeco writing institutional-grade investment research as of {current_date}. 
+        system_instruction = f"""You are a Managing Director at Robeco writing institutional-grade investment research as of {current_date}. 
 
 🎯 DIFFERENTIATED ANALYSIS MANDATE: 
 - Write PROPRIETARY insights that distinguish you from sell-side research
@@ -3855,27 +2780,55 @@ Determine CONSISTENT investment rating (OVERWEIGHT/NEUTRAL/UNDERWEIGHT) based on
 - <strong>bold text</strong> (HTML) ✅
 - <em>italic text</em> (HTML) ✅
 - Proper HTML structure only ✅"""
-                )
+        
+        max_retries = 100  # Try many keys until we find a working one
+        for attempt in range(max_retries):
+            # Get API key with force_attempt to start with primary key
+            key_result = get_intelligent_api_key(agent_type="report_generator", attempt=attempt, force_attempt=True)
+            if not key_result:
+                raise Exception("No API key available for report generation")
+            
+            api_key, key_info = key_result
+            logger.info(f"📝 Report generation attempt {attempt+1} using API key: {api_key[:8]}...{api_key[-4:]}")
+            
+            generate_config = None
+            try:
+                client = Client(api_key=api_key)
                 
-                contents = [
-                    types.Content(
-                        role="user",
-                        parts=[types.Part.from_text(text=prompt)]
-                    )
-                ]
+                # Configure for maximum comprehensive content generation with Google Search grounding;
+                # the shared prefix and system instruction come from a cached context when available
+                contents, generate_config = await report_context_cache.prepare_request(
+                    client,
+                    api_key,
+                    REPORT_MODEL,
+                    prompt,
+                    system_instruction=system_instruction,
+                    tools=[Tool(google_search=GoogleSearch())],  # Enable Google Search grounding
+                    cached_prefix=cached_prefix,
+                    temperature=1.2,  # Slightly higher for more detailed analysis
+                    top_p=0.9,  # Good for comprehensive content generation
+                    max_output_tokens=800000,  # ULTRA-MAXIMIZED for complete 15-slide template structure
+                    response_mime_type="text/plain"
+                )
                 
                 # Generate report with streaming (focused error logging)
                 logger.info(f"🚀 Starting generation: {len(prompt)} chars prompt → {api_key[:8]}...")
                 
                 accumulated_response = ""
                 chunk_count = 0
+                slide_stream = self.slide_streams.get(connection_id) if websocket and connection_id else None
+                if slide_stream:
+                    slide_stream.restart_phase(call_phase)
                 
                 # Use streaming to get real content as it generates with ULTRA-DEBUG tracking
                 try:
                     last_chunk_text = ""
                     slide_detection_log = []
                     
-                    # DEBUG: Track slide detection in real-time
+                    # DEBUG: Track slide detection in real-time (incrementally - only new text is scanned)
+                    scanner = ReportStreamScanner(
+                        watch_terms=("Operating Cash Flow", "Page 11", "slide-financial-ratios", "11.")
+                    )
                     current_slide_count = 0
                     last_detected_slide = 0
                     operating_cash_flow_detected = False
@@ -3885,8 +2838,8 @@ Determine CONSISTENT investment rating (OVERWEIGHT/NEUTRAL/UNDERWEIGHT) based on
                     if call_phase.startswith('call2'):
                         logger.info(f"🚨 CALL 2 DEBUG MODE ACTIVATED - Monitoring slide 8-15 generation")
                     
-                    for chunk in client.models.generate_content_stream(
-                        model='gemini-2.5-flash',
+                    async for chunk in await client.aio.models.generate_content_stream(
+                        model=REPORT_MODEL,
                         contents=contents,
                         config=generate_config,
                     ):
@@ -3894,18 +2847,23 @@ Determine CONSISTENT investment rating (OVERWEIGHT/NEUTRAL/UNDERWEIGHT) based on
                             chunk_count += 1
                             accumulated_response += chunk.text
                             last_chunk_text = chunk.text
+                            scan = scanner.feed(chunk.text)
+                            
+                            if rating_seen and not rating_seen.done():
+                                badge = RATING_BADGE.search(accumulated_response, max(0, len(accumulated_response) - len(chunk.text) - 200))
+                                if badge:
+                                    rating_seen.set_result(badge.group(1).upper())
                             
                             # ULTRA-DEBUG: Real-time slide detection
-                            new_slide_count = accumulated_response.count('<div class="slide')
-                            if new_slide_count > current_slide_count:
-                                current_slide_count = new_slide_count
+                            if scan.new_slides:
+                                current_slide_count = scanner.slide_count
                                 logger.info(f"🎯 SLIDE DETECTED: Slide #{current_slide_count} started at chunk {chunk_count}")
                             
                             # ULTRA-DEBUG: Page number detection for Call 2
                             if call_phase.startswith('call2'):
-                                for page_num in range(8, 16):
+                                for page_num in scan.new_pages:
                                     page_marker = f"Page {page_num} / 15"
-                                    if page_marker in accumulated_response and page_num > last_detected_slide:
+                                    if 8 <= page_num <= 15 and page_num > last_detected_slide:
                                         last_detected_slide = page_num
                                         logger.info(f"📄 PAGE MARKER DETECTED: {page_marker} at chunk {chunk_count} ({len(accumulated_response):,} chars)")
                                         slide_detection_log.append(f"Page {page_num} at chunk {chunk_count}")
@@ -3918,7 +2876,7 @@ Determine CONSISTENT investment rating (OVERWEIGHT/NEUTRAL/UNDERWEIGHT) based on
                                                 logger.info(f"🔍 SLIDE 10 CONTEXT: {last_slide_content}")
                             
                             # ULTRA-DEBUG: Operating Cash Flow detection (critical failure point)
-                            if "Operating Cash Flow" in chunk.text and not operating_cash_flow_detected:
+                            if "Operating Cash Flow" in scan.new_terms:
                                 operating_cash_flow_detected = True
                                 logger.warning(f"🚨 CRITICAL: Operating Cash Flow detected at chunk {chunk_count} - MONITOR FOR EARLY STOPPING!")
                                 logger.info(f"🔍 Context around Operating Cash Flow: ...{accumulated_response[-200:]}")
@@ -3933,8 +2891,8 @@ Determine CONSISTENT investment rating (OVERWEIGHT/NEUTRAL/UNDERWEIGHT) based on
                                 logger.info(f"📝 FIRST CHUNK ({call_phase}): {chunk.text[:300]}...")
                             
                             # Enhanced progress tracking with completion detection
-                            contains_html_end = '</html>' in accumulated_response.lower()
-                            contains_body_end = '</body>' in accumulated_response.lower()
+                            contains_html_end = scanner.has_html_end
+                            contains_body_end = scanner.has_body_end
                             
                             # ULTRA-DEBUG: Detect potential early stopping patterns
                             if chunk_count > 50 and call_phase.startswith('call2'):
@@ -3945,7 +2903,7 @@ Determine CONSISTENT investment rating (OVERWEIGHT/NEUTRAL/UNDERWEIGHT) based on
                                         logger.warning(f"⚠️ SUSPICIOUS ENDING: '{ending}' at chunk {chunk_count} - may indicate early stopping")
                                         
                                 # Check for incomplete slide 10 (more flexible detection)
-                                if last_detected_slide == 10 and chunk_count > 200 and not any(pattern in accumulated_response for pattern in ["Page 11", "slide-financial-ratios", "11."]):
+                                if last_detected_slide == 10 and chunk_count > 200 and not any(scanner.seen(pattern) for pattern in ["Page 11", "slide-financial-ratios", "11."]):
                                     logger.error(f"🚨 SLIDE 10 STUCK: No progress to slide 11 after {chunk_count} chunks!")
                             
                             # Send real-time streaming updates to frontend with DEBUG info
@@ -3955,35 +2913,44 @@ Determine CONSISTENT investment rating (OVERWEIGHT/NEUTRAL/UNDERWEIGHT) based on
                                     if contains_html_end:
                                         progress = 95  # Near completion when HTML end detected
                                     
-                                    # Create message data first
-                                    message_data = {
-                                        "type": "report_generation_streaming",
-                                        "data": {
-                                            "status": f"streaming_html_{call_phase}",
-                                            "call_phase": call_phase,
-                                            "html_chunk": chunk.text,
-                                            "accumulated_html": accumulated_response,
-                                            "chunk_number": chunk_count,
-                                            "progress": progress,
-                                            "message": f"🤖 {call_phase.upper()} Gen: {chunk_count} chunks, {len(accumulated_response):,} chars [Slides: {current_slide_count}, Page: {last_detected_slide}, OCF: {'✓' if operating_cash_flow_detected else '✗'}]",
-                                            "connection_id": connection_id,
-                                            "timestamp": datetime.now().isoformat(),
-                                            "completion_indicators": {
-                                                "has_html_end": contains_html_end,
-                                                "has_body_end": contains_body_end
-                                            },
-                                            "debug_info": {
-                                                "slides_detected": current_slide_count,
-                                                "last_page_detected": last_detected_slide,
-                                                "operating_cash_flow_seen": operating_cash_flow_detected,
-                                                "slide_log": slide_detection_log[-3:],  # Last 3 slide detections
-                                                "recent_content_sample": accumulated_response[-100:] if len(accumulated_response) > 100 else accumulated_response
+                                    # Slide stream mode: only new / changed slides, nothing when no slide moved on
+                                    if slide_stream:
+                                        updates = slide_stream.update(call_phase, accumulated_response)
+                                        if updates:
+                                            await self._send_slide_updates(
+                                                websocket, connection_id, call_phase, updates, f"streaming_html_{call_phase}", progress,
+                                                f"🤖 {call_phase.upper()} Gen: {chunk_count} chunks, {len(accumulated_response):,} chars [Slides: {current_slide_count}, Page: {last_detected_slide}]"
+                                            )
+                                    else:
+                                        # Create message data first
+                                        message_data = {
+                                            "type": "report_generation_streaming",
+                                            "data": {
+                                                "status": f"streaming_html_{call_phase}",
+                                                "call_phase": call_phase,
+                                                "html_chunk": chunk.text,
+                                                "accumulated_html": accumulated_response,
+                                                "chunk_number": chunk_count,
+                                                "progress": progress,
+                                                "message": f"🤖 {call_phase.upper()} Gen: {chunk_count} chunks, {len(accumulated_response):,} chars [Slides: {current_slide_count}, Page: {last_detected_slide}, OCF: {'✓' if operating_cash_flow_detected else '✗'}]",
+                                                "connection_id": connection_id,
+                                                "timestamp": datetime.now().isoformat(),
+                                                "completion_indicators": {
+                                                    "has_html_end": contains_html_end,
+                                                    "has_body_end": contains_body_end
+                                                },
+                                                "debug_info": {
+                                                    "slides_detected": current_slide_count,
+                                                    "last_page_detected": last_detected_slide,
+                                                    "operating_cash_flow_seen": operating_cash_flow_detected,
+                                                    "slide_log": slide_detection_log[-3:],  # Last 3 slide detections
+                                                    "recent_content_sample": accumulated_response[-100:] if len(accumulated_response) > 100 else accumulated_response
+                                                }
                                             }
                                         }
-                                    }
                                     
-                                    # Send the message using safe WebSocket method
-                                    await self._send_websocket_safe(websocket, message_data)
+                                        # Send the message using safe WebSocket method
+                                        await self._send_websocket_safe(websocket, message_data)
                                     
                                 except Exception as ws_error:
                                     logger.warning(f"WebSocket streaming failed: {ws_error}")
@@ -4067,6 +3034,8 @@ Determine CONSISTENT investment rating (OVERWEIGHT/NEUTRAL/UNDERWEIGHT) based on
                 
             except Exception as api_error:
                 logger.warning(f"⚠️ Report generation failed with key {api_key[:8]}...{api_key[-4:]}: {api_error}")
+                if generate_config is not None and 'cache' in str(api_error).lower():
+                    report_context_cache.discard(generate_config.cached_content)
                 
                 # Log API error for pure rotation system
                 if "suspended" in str(api_error).lower() or "403" in str(api_error):
@@ -4117,42 +3086,9 @@ Determine CONSISTENT investment rating (OVERWEIGHT/NEUTRAL/UNDERWEIGHT) based on
         logger.info(f"🔧 Combining Call 1 ({len(call1_content):,} chars) + Call 2 ({len(call2_content):,} chars)")
         
         try:
-            # Clean both content pieces
-            clean_call1 = call1_content.strip()
-            clean_call2 = call2_content.strip()
-            
             # Remove any stray HTML wrapper tags and markdown code blocks from AI output
-            import re
-            
-            # Clean Call 1 content
-            clean_call1 = re.sub(r'<!DOCTYPE[^>]*>', '', clean_call1, flags=re.IGNORECASE)
-            clean_call1 = re.sub(r'</?html[^>]*>', '', clean_call1, flags=re.IGNORECASE)
-            clean_call1 = re.sub(r'</?head[^>]*>', '', clean_call1, flags=re.IGNORECASE)
-            clean_call1 = re.sub(r'</?body[^>]*>', '', clean_call1, flags=re.IGNORECASE)
-            clean_call1 = re.sub(r'<style[^>]*>.*?</style>', '', clean_call1, flags=re.IGNORECASE | re.DOTALL)
-            # Remove markdown code blocks
-            clean_call1 = re.sub(r'```html\s*', '', clean_call1, flags=re.IGNORECASE)
-            clean_call1 = re.sub(r'```\s*', '', clean_call1, flags=re.IGNORECASE)
-            # Remove any stray text before the first <div> tag
-            first_div = clean_call1.find('<div')
-            if first_div > 0:
-                clean_call1 = clean_call1[first_div:]
-            clean_call1 = clean_call1.strip()
-            
-            # Clean Call 2 content
-            clean_call2 = re.sub(r'<!DOCTYPE[^>]*>', '', clean_call2, flags=re.IGNORECASE)
-            clean_call2 = re.sub(r'</?html[^>]*>', '', clean_call2, flags=re.IGNORECASE)
-            clean_call2 = re.sub(r'</?head[^>]*>', '', clean_call2, flags=re.IGNORECASE)
-            clean_call2 = re.sub(r'</?body[^>]*>', '', clean_call2, flags=re.IGNORECASE)
-            clean_call2 = re.sub(r'<style[^>]*>.*?</style>', '', clean_call2, flags=re.IGNORECASE | re.DOTALL)
-            # Remove markdown code blocks
-            clean_call2 = re.sub(r'```html\s*', '', clean_call2, flags=re.IGNORECASE)
-            clean_call2 = re.sub(r'```\s*', '', clean_call2, flags=re.IGNORECASE)
-            # Remove any stray text before the first <div> tag
-            first_div = clean_call2.find('<div')
-            if first_div > 0:
-                clean_call2 = clean_call2[first_div:]
-            clean_call2 = clean_call2.strip()
+            clean_call1 = self._clean_slide_html(call1_content)
+            clean_call2 = self._clean_slide_html(call2_content)
             
             # Combine the content
             combined_content = clean_call1 + '\n\n' + clean_call2
@@ -4179,49 +3115,40 @@ Determine CONSISTENT investment rating (OVERWEIGHT/NEUTRAL/UNDERWEIGHT) based on
             # Return simple concatenation as fallback
             return f"{call1_content}\n{call2_content}"
     
-    def _save_report_to_file(self, html_content: str, company_name: str, ticker: str) -> str:
+    def _clean_slide_html(self, content: str) -> str:
+        """Strip document wrappers, <style> blocks, markdown fences and leading text from generated slides"""
+        # Single pass over the content (see report_html_sanitizer)
+        return clean_slide_html(content)
+    
+    async def _archive_report(self, html_content: str, company_name: str, ticker: str, rating: str = None) -> Optional[int]:
         """
-        Save the complete HTML report to Example Output directory
+        Store the complete HTML report in the versioned report archive
+        
+        Compression, the SQLite index write and pruning run in a worker thread.
         
         Args:
             html_content: Complete HTML report content
-            company_name: Company name for filename
+            company_name: Company name
             ticker: Stock ticker
+            rating: Investment rating of the report
             
         Returns:
-            Path to saved file in src/robeco/Example Output/ directory
+            Archive id of the report, or None if archiving failed
         """
         try:
-            # Clean company name for filename (remove special characters)
-            import re
-            clean_name = re.sub(r'[^\w\s-]', '', company_name)
-            clean_name = re.sub(r'[-\s]+', '_', clean_name)
-            clean_name = clean_name.strip('_')
-            
-            # Create filename: CompanyName.html (like Dakin.html, Arista.html)
-            if clean_name:
-                filename = f"{clean_name}.html"
-            else:
-                filename = f"{ticker}.html"
-            
-            # Save to the Example Output directory
-            report_dir = Path(__file__).parent.parent / "Example Output"
-            
-            # Ensure the Example Output directory exists
-            report_dir.mkdir(parents=True, exist_ok=True)
-            
-            filepath = report_dir / filename
-            
-            # Write the HTML file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            
-            logger.info(f"💾 Report saved to: {filepath}")
-            return str(filepath)
+            # Report prompt sections and their versions, so reports can be compared across prompt changes
+            prompt_version = ",".join(
+                f"{name}@v{template.version}" for name, template in sorted(prompt_registry.templates().items())
+                if name.startswith("report.")
+            )
+            entry = await asyncio.to_thread(
+                report_archive.save, html_content, company_name, ticker, rating=rating, prompt_version=prompt_version
+            )
+            return entry.id
             
         except Exception as e:
-            logger.error(f"❌ Failed to save report file: {e}")
-            return ""
+            logger.error(f"❌ Failed to archive report: {e}")
+            return None
     
     def _combine_css_with_slides(self, company_name: str, ticker: str, slides_content: str) -> str:
         """Combine fixed CSS template with AI-generated slide content"""
@@ -4229,21 +3156,8 @@ Determine CONSISTENT investment rating (OVERWEIGHT/NEUTRAL/UNDERWEIGHT) based on
         logger.info(f"🔧 Combining fixed CSS with {len(slides_content):,} characters of slide content")
         
         try:
-            # Load the fixed CSS template
-            with open(self.css_path, 'r', encoding='utf-8') as f:
-                css_template = f.read()
-            
-            logger.info(f"✅ Loaded fixed CSS template: {len(css_template):,} characters")
-            
-            # Update template to match current company
-            css_template = css_template.replace(
-                'Robeco - IHI Investment Analysis',
-                f'Robeco - {company_name} Investment Analysis'
-            ).replace(
-                'IHI Corporation', company_name
-            ).replace(
-                '7013 JT', ticker
-            )
+            # Fixed CSS document head (through <body>), updated to match current company
+            head_section = report_assets.head_section(company_name, ticker)
             
             # Clean the AI-generated slide content (remove any stray HTML tags)
             clean_slides = slides_content.strip()
@@ -4257,10 +3171,6 @@ Determine CONSISTENT investment rating (OVERWEIGHT/NEUTRAL/UNDERWEIGHT) based on
             clean_slides = re.sub(r'<style[^>]*>.*?</style>', '', clean_slides, flags=re.IGNORECASE | re.DOTALL)
             clean_slides = clean_slides.strip()
             
-            # Extract everything before <body> tag (including <body>)
-            body_start = css_template.find('<body>')
-            head_section = css_template[:body_start + 6]  # Include <body>
-            
             # Create the complete HTML
             complete_html = head_section + '\n' + clean_slides + '\n</body>\n</html>'
             
@@ -4310,24 +3220,13 @@ Determine CONSISTENT investment rating (OVERWEIGHT/NEUTRAL/UNDERWEIGHT) based on
         try:
             logger.info(f"🏗️ Pre-processing complete stock data for {ticker}")
             
-            # Use consistent financial_data from server
-            if financial_data and 'info' in financial_data:
-                info = financial_data['info']
-                logger.info(f"📊 Using pre-fetched yfinance data for complete processing")
-            else:
-                # Fallback: Fresh yfinance call
-                import yfinance as yf
-                stock = yf.Ticker(ticker)
-                info = stock.info
-                logger.warning(f"⚠️ Making fresh yfinance call for complete processing")
-            
-            # Get historical price data
-            from datetime import datetime, timedelta
-            import yfinance as yf
-            stock = yf.Ticker(ticker)
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=5*365)  # 5 years
-            hist = stock.history(start=start_date, end=end_date, interval="1mo")
+            # Use consistent financial_data fetched for this report (no Yahoo call here)
+            info = (financial_data or {}).get('info') or {}
+            if not info:
+                logger.warning(f"⚠️ No pre-fetched company info available for complete processing")
+            
+            # 5 years of monthly prices
+            hist = self._price_history_frame(financial_data)
             
             if hist.empty:
                 return {"error": "No historical data available", "chart_ready": False, "metrics_ready": False}
@@ -4559,39 +3458,8 @@ Determine CONSISTENT investment rating (OVERWEIGHT/NEUTRAL/UNDERWEIGHT) based on
     def _convert_markdown_to_html(self, content: str) -> str:
         """Convert leaked markdown formatting to proper HTML tags"""
         try:
-            import re
-            
-            conversions_made = 0
-            
-            # Convert ***bold italic*** to <strong><em>bold italic</em></strong> (do this first)
-            before_count = content.count('***')
-            content = re.sub(r'\*\*\*(.*?)\*\*\*', r'<strong><em>\1</em></strong>', content)
-            conversions_made += (before_count - content.count('***')) // 2
-            
-            # Convert **bold** to <strong>bold</strong>
-            before_count = content.count('**')
-            content = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', content)
-            conversions_made += (before_count - content.count('**')) // 2
-            
-            # Convert *italic* to <em>italic</em> (but avoid conflict with remaining asterisks)
-            before_count = content.count('*')
-            content = re.sub(r'(?<!\*)\*([^*\n]+?)\*(?!\*)', r'<em>\1</em>', content)
-            italic_conversions = (before_count - content.count('*')) // 2
-            conversions_made += italic_conversions
-            
-            # Convert # headers to h4 (if any leak through)
-            header_matches = re.findall(r'^#{1,6}\s+(.+)$', content, re.MULTILINE)
-            if header_matches:
-                content = re.sub(r'^#{1,6}\s+(.+)$', r'<h4>\1</h4>', content, flags=re.MULTILINE)
-                conversions_made += len(header_matches)
-            
-            # Convert - bullet points to proper list items (if any leak through)
-            bullet_matches = re.findall(r'^\s*-\s+(.+)$', content, re.MULTILINE)
-            if bullet_matches:
-                content = re.sub(r'^\s*-\s+(.+)$', r'<li>\1</li>', content, flags=re.MULTILINE)
-                # Wrap consecutive li items in ul tags
-                content = re.sub(r'(<li>.*?</li>(?:\s*<li>.*?</li>)*)', r'<ul>\1</ul>', content, flags=re.DOTALL)
-                conversions_made += len(bullet_matches)
+            # ***bold italic***, **bold**, *italic*, # headers and - bullets in one scan
+            content, conversions_made = convert_markdown_to_html(content)
             
             # Log if any conversions were made
             if conversions_made > 0:
@@ -13,6 +13,7 @@ from fastapi import WebSocket, WebSocketDisconnect
 
 from ..core.memory import EnhancedSharedMemory
 from ..core.models import WebSocketMessage
+from ..core.serialization import dumps
 
 logger = logging.getLogger(__name__)
 
@@ -148,7 +149,7 @@ class WebSocketManager:
         if client_id in self.active_connections:
             try:
                 websocket = self.active_connections[client_id]
-                await websocket.send_text(json.dumps(message))
+                await websocket.send_text(dumps(message))
                 
                 # Update metrics
                 self.connection_metadata[client_id]["messages_sent"] += 1
@@ -162,12 +163,15 @@ class WebSocketManager:
         """Broadcast message to all connected clients"""
         disconnected_clients = []
         
+        # Serialize once for all recipients
+        message_text = dumps(message)
+        
         for client_id, websocket in self.active_connections.items():
             if exclude_client and client_id == exclude_client:
                 continue
             
             try:
-                await websocket.send_text(json.dumps(message))
+                await websocket.send_text(message_text)
                 self.connection_metadata[client_id]["messages_sent"] += 1
                 
             except Exception as e:
@@ -3,9 +3,18 @@
 Robeco HTML-to-Word Report Generator
 Converts generated HTML reports to Word documents (.docx) with exact layout preservation
 Maintains Robeco professional styling, metrics grids, and institutional formatting
+
+Reports are converted in one streaming pass by StreamingWordConverter
+(word_stream_converter.py); the BeautifulSoup converter below is kept as a
+fallback.
+
+Environment:
+    ROBECO_WORD_STREAMING    on | off: streaming converter (default on)
 """
 
+import asyncio
 import logging
+import os
 import re
 import io
 import base64
@@ -29,6 +38,13 @@ import requests
 from io import BytesIO
 from PIL import Image
 
+try:
+    from .report_chart_rasterizer import ChartRasterizeError, chart_rasterizer
+    from .word_stream_converter import StreamingWordConverter
+except ImportError:
+    from robeco.backend.report_chart_rasterizer import ChartRasterizeError, chart_rasterizer
+    from robeco.backend.word_stream_converter import StreamingWordConverter
+
 # Import InlineShape for image insertion
 try:
     from docx.shared import Mm
@@ -52,6 +68,9 @@ class RobecoWordReportGenerator:
         self._first_analysis_item = False
         self._robeco_logo_added = False
         
+        # Single-pass lxml converter; off falls back to the BeautifulSoup tree walk
+        self.streaming_conversion = os.getenv("ROBECO_WORD_STREAMING", "on").lower() not in ("off", "false", "0")
+        
         # Professional font configuration
         self.primary_font = 'Calibri'  # Fallback for Taz Semilight
         
@@ -102,9 +121,6 @@ class RobecoWordReportGenerator:
         logger.info(f"🔄 Converting HTML report to Word: {ticker}")
         
         try:
-            # Parse HTML content
-            soup = BeautifulSoup(html_content, 'lxml')
-            
             # Create new Word document
             doc = Document()
             
@@ -114,162 +130,10 @@ class RobecoWordReportGenerator:
             # Configure page layout
             self._configure_page_layout(doc)
             
-            # Process presentation container or find slides directly
-            presentation = soup.find('div', class_='presentation-container')
-            if presentation:
-                # ENHANCED SLIDE DETECTION: Find ALL slide variations used in 3-call architecture
-                slides = []
-                
-                # Method 1: Find all divs with "slide" in their class attribute
-                all_slide_divs = presentation.find_all('div', class_=lambda c: c and 'slide' in ' '.join(c))
-                slides.extend(all_slide_divs)
-                
-                # Method 1.5: SPECIFIC ID SEARCH - Find slides by expected IDs (critical for 3-call architecture)
-                expected_slide_ids = ['portrait-page-1', 'portrait-page-1A', 'investment-highlights-pitchbook-page', 
-                                     'catalyst-page', 'company-analysis-page', 'financial-highlights-table-page',
-                                     'slide-industry-analysis-part1', 'slide-financial-income-statement', 
-                                     'slide-financial-balance-sheet', 'cash-flow-page', 'dcf-analysis-page', 
-                                     'bull-bear-analysis-comprehensive']
-                
-                for slide_id in expected_slide_ids:
-                    # First try within presentation container
-                    slide_by_id = presentation.find('div', id=slide_id)
-                    if slide_by_id:
-                        slides.append(slide_by_id)
-                        logger.info(f"🎯 DIRECT ID MATCH (in presentation): Found slide with ID '{slide_id}'")
-                    else:
-                        # If not found in presentation, search entire document
-                        slide_by_id = soup.find('div', id=slide_id)
-                        if slide_by_id:
-                            slides.append(slide_by_id)
-                            logger.info(f"🎯 DIRECT ID MATCH (in document): Found slide with ID '{slide_id}'")
-                
-                # Method 2: Backup CSS selectors for specific patterns
-                backup_slides = (
-                    presentation.select('div.slide') +              # Basic slide
-                    presentation.select('div.slide.report-prose') + # Slide with report-prose  
-                    presentation.select('div[class*="slide"]') +    # Any div containing "slide"
-                    presentation.select('div[id*="page"]')          # Slides with page IDs
-                )
-                slides.extend(backup_slides)
-                
-                logger.info(f"🔍 ENHANCED DETECTION: Found {len(all_slide_divs)} slide divs, {len(backup_slides)} backup slides")
-                
+            if self.streaming_conversion:
+                StreamingWordConverter(self).convert(doc, html_content)
             else:
-                # If no presentation container, find slides directly in body
-                slides = []
-                
-                # Method 1: Find all divs with "slide" in their class attribute
-                all_slide_divs = soup.find_all('div', class_=lambda c: c and 'slide' in ' '.join(c))
-                slides.extend(all_slide_divs)
-                
-                # Method 2: Backup selectors
-                backup_slides = (
-                    soup.select('div.slide') + 
-                    soup.select('div.slide.report-prose') + 
-                    soup.select('div[class*="slide"]') +
-                    soup.select('div[id*="page"]')
-                )
-                slides.extend(backup_slides)
-                
-                logger.info(f"🔍 ENHANCED DETECTION (no container): Found {len(all_slide_divs)} slide divs, {len(backup_slides)} backup slides")
-            
-            # DEBUG: Show raw slides before deduplication
-            logger.info(f"🔍 RAW SLIDES BEFORE DEDUP: {len(slides)} total")
-            raw_slide_info = []
-            for i, slide in enumerate(slides):
-                slide_id = slide.get('id', f'no-id-{i}')
-                slide_classes = slide.get('class', [])
-                raw_slide_info.append(f"{slide_id}({' '.join(slide_classes)})")
-            logger.info(f"   📋 Raw slide details: {raw_slide_info}")
-            
-            # Remove duplicates while preserving order using element IDs and content
-            seen_elements = set()
-            unique_slides = []
-            for slide in slides:
-                # Create unique identifier using element ID or content hash
-                slide_id = slide.get('id') or str(hash(str(slide)[:100]))
-                if slide_id not in seen_elements:
-                    seen_elements.add(slide_id)
-                    unique_slides.append(slide)
-                    logger.info(f"✅ KEPT SLIDE: {slide_id} ({slide.get('class', [])})")
-                else:
-                    logger.info(f"🔄 SKIPPED DUPLICATE: {slide_id} ({slide.get('class', [])})")
-            
-            slides = unique_slides
-            
-            logger.info(f"📄 Processing {len(slides)} slides")
-            
-            # ENHANCED DEBUG: Log comprehensive slide information
-            slide_info = []
-            for i, slide in enumerate(slides):
-                slide_id = slide.get('id', f'no-id-{i}')
-                slide_classes = slide.get('class', [])
-                slide_info.append(f"{slide_id}({' '.join(slide_classes)})")
-            
-            logger.info(f"🔍 ENHANCED SLIDE DETECTION RESULTS:")
-            logger.info(f"   📄 Total slides found: {len(slides)}")
-            logger.info(f"   📋 Slide details: {slide_info}")
-            
-            # Debug: Log HTML structure summary if we found fewer slides than expected
-            expected_min_slides = 10  # We expect at least 10 slides from 3-call architecture
-            if len(slides) < expected_min_slides:
-                logger.warning(f"⚠️ Only found {len(slides)} slides (expected >= {expected_min_slides}), analyzing HTML...")
-                
-                # Count all divs with any slide-related content
-                all_divs = soup.find_all('div')
-                slide_related_divs = [div for div in all_divs if div.get('class') and any('slide' in cls for cls in div.get('class', []))]
-                page_id_divs = [div for div in all_divs if div.get('id') and 'page' in div.get('id', '')]
-                portrait_divs = [div for div in all_divs if div.get('id') and 'portrait' in div.get('id', '')]
-                
-                logger.info(f"🔍 HTML ANALYSIS:")
-                logger.info(f"   📄 Total divs in HTML: {len(all_divs)}")
-                logger.info(f"   📄 Slide-related divs: {len(slide_related_divs)}")
-                logger.info(f"   📄 Page ID divs: {len(page_id_divs)}")
-                logger.info(f"   📄 Portrait divs: {len(portrait_divs)}")
-                
-                # Log the specific IDs found
-                portrait_ids = [div.get('id') for div in portrait_divs]
-                logger.info(f"   📋 Portrait IDs found: {portrait_ids}")
-                logger.info(f"   📄 Divs with 'slide' in class: {len(slide_related_divs)}")
-                logger.info(f"   📄 Divs with 'page' in ID: {len(page_id_divs)}")
-                logger.info(f"   📄 Total HTML length: {len(html_content):,} characters")
-                
-                # Show first few div classes for debugging
-                div_classes = [div.get('class', []) for div in all_divs[:15]]
-                logger.info(f"   📋 First 15 div classes: {div_classes}")
-                
-                # Look for specific slide IDs we expect
-                expected_ids = ['portrait-page-1', 'portrait-page-1A', 'investment-highlights-pitchbook-page', 
-                               'catalyst-page', 'company-analysis-page', 'financial-highlights-table-page']
-                found_ids = []
-                for expected_id in expected_ids:
-                    if soup.find('div', id=expected_id):
-                        found_ids.append(expected_id)
-                
-                logger.info(f"   ✅ Expected slide IDs found: {found_ids}")
-                logger.info(f"   ❌ Missing slide IDs: {set(expected_ids) - set(found_ids)}")
-                
-                # Check for presentation container
-                if presentation:
-                    logger.info("   ✅ Found presentation-container")
-                    pres_divs = presentation.find_all('div')
-                    logger.info(f"   📄 Divs inside presentation-container: {len(pres_divs)}")
-                else:
-                    logger.warning("   ⚠️ No presentation-container found, searching entire document")
-            
-            # Initialize header flag for the document
-            self._header_added = False
-            
-            for i, slide in enumerate(slides):
-                logger.info(f"🎯 Processing slide {i+1}/{len(slides)}")
-                
-                if i > 0:
-                    # Add page break between slides
-                    self._add_page_break(doc)
-                
-                # Process slide content
-                self._process_slide(doc, slide, i+1)
+                self._convert_with_soup(doc, html_content)
             
             # Generate output filename
             if not output_path:
@@ -286,6 +150,168 @@ class RobecoWordReportGenerator:
             logger.error(f"❌ HTML to Word conversion failed: {e}")
             raise
     
+    def _convert_with_soup(self, doc: Document, html_content: str):
+        """Legacy conversion: BeautifulSoup tree, slide detection by repeated searches"""
+        # Parse HTML content
+        soup = BeautifulSoup(html_content, 'lxml')
+        
+        # Process presentation container or find slides directly
+        presentation = soup.find('div', class_='presentation-container')
+        if presentation:
+            # ENHANCED SLIDE DETECTION: Find ALL slide variations used in 3-call architecture
+            slides = []
+        
+            # Method 1: Find all divs with "slide" in their class attribute
+            all_slide_divs = presentation.find_all('div', class_=lambda c: c and 'slide' in ' '.join(c))
+            slides.extend(all_slide_divs)
+        
+            # Method 1.5: SPECIFIC ID SEARCH - Find slides by expected IDs (critical for 3-call architecture)
+            expected_slide_ids = ['portrait-page-1', 'portrait-page-1A', 'investment-highlights-pitchbook-page', 
+                                 'catalyst-page', 'company-analysis-page', 'financial-highlights-table-page',
+                                 'slide-industry-analysis-part1', 'slide-financial-income-statement', 
+                                 'slide-financial-balance-sheet', 'cash-flow-page', 'dcf-analysis-page', 
+                                 'bull-bear-analysis-comprehensive']
+        
+            for slide_id in expected_slide_ids:
+                # First try within presentation container
+                slide_by_id = presentation.find('div', id=slide_id)
+                if slide_by_id:
+                    slides.append(slide_by_id)
+                    logger.info(f"🎯 DIRECT ID MATCH (in presentation): Found slide with ID '{slide_id}'")
+                else:
+                    # If not found in presentation, search entire document
+                    slide_by_id = soup.find('div', id=slide_id)
+                    if slide_by_id:
+                        slides.append(slide_by_id)
+                        logger.info(f"🎯 DIRECT ID MATCH (in document): Found slide with ID '{slide_id}'")
+        
+            # Method 2: Backup CSS selectors for specific patterns
+            backup_slides = (
+                presentation.select('div.slide') +              # Basic slide
+                presentation.select('div.slide.report-prose') + # Slide with report-prose  
+                presentation.select('div[class*="slide"]') +    # Any div containing "slide"
+                presentation.select('div[id*="page"]')          # Slides with page IDs
+            )
+            slides.extend(backup_slides)
+        
+            logger.info(f"🔍 ENHANCED DETECTION: Found {len(all_slide_divs)} slide divs, {len(backup_slides)} backup slides")
+        
+        else:
+            # If no presentation container, find slides directly in body
+            slides = []
+        
+            # Method 1: Find all divs with "slide" in their class attribute
+            all_slide_divs = soup.find_all('div', class_=lambda c: c and 'slide' in ' '.join(c))
+            slides.extend(all_slide_divs)
+        
+            # Method 2: Backup selectors
+            backup_slides = (
+                soup.select('div.slide') + 
+                soup.select('div.slide.report-prose') + 
+                soup.select('div[class*="slide"]') +
+                soup.select('div[id*="page"]')
+            )
+            slides.extend(backup_slides)
+        
+            logger.info(f"🔍 ENHANCED DETECTION (no container): Found {len(all_slide_divs)} slide divs, {len(backup_slides)} backup slides")
+        
+        # DEBUG: Show raw slides before deduplication
+        logger.info(f"🔍 RAW SLIDES BEFORE DEDUP: {len(slides)} total")
+        raw_slide_info = []
+        for i, slide in enumerate(slides):
+            slide_id = slide.get('id', f'no-id-{i}')
+            slide_classes = slide.get('class', [])
+            raw_slide_info.append(f"{slide_id}({' '.join(slide_classes)})")
+        logger.info(f"   📋 Raw slide details: {raw_slide_info}")
+        
+        # Remove duplicates while preserving order using element IDs and content
+        seen_elements = set()
+        unique_slides = []
+        for slide in slides:
+            # Create unique identifier using element ID or content hash
+            slide_id = slide.get('id') or str(hash(str(slide)[:100]))
+            if slide_id not in seen_elements:
+                seen_elements.add(slide_id)
+                unique_slides.append(slide)
+                logger.info(f"✅ KEPT SLIDE: {slide_id} ({slide.get('class', [])})")
+            else:
+                logger.info(f"🔄 SKIPPED DUPLICATE: {slide_id} ({slide.get('class', [])})")
+        
+        slides = unique_slides
+        
+        logger.info(f"📄 Processing {len(slides)} slides")
+        
+        # ENHANCED DEBUG: Log comprehensive slide information
+        slide_info = []
+        for i, slide in enumerate(slides):
+            slide_id = slide.get('id', f'no-id-{i}')
+            slide_classes = slide.get('class', [])
+            slide_info.append(f"{slide_id}({' '.join(slide_classes)})")
+        
+        logger.info(f"🔍 ENHANCED SLIDE DETECTION RESULTS:")
+        logger.info(f"   📄 Total slides found: {len(slides)}")
+        logger.info(f"   📋 Slide details: {slide_info}")
+        
+        # Debug: Log HTML structure summary if we found fewer slides than expected
+        expected_min_slides = 10  # We expect at least 10 slides from 3-call architecture
+        if len(slides) < expected_min_slides:
+            logger.warning(f"⚠️ Only found {len(slides)} slides (expected >= {expected_min_slides}), analyzing HTML...")
+        
+            # Count all divs with any slide-related content
+            all_divs = soup.find_all('div')
+            slide_related_divs = [div for div in all_divs if div.get('class') and any('slide' in cls for cls in div.get('class', []))]
+            page_id_divs = [div for div in all_divs if div.get('id') and 'page' in div.get('id', '')]
+            portrait_divs = [div for div in all_divs if div.get('id') and 'portrait' in div.get('id', '')]
+        
+            logger.info(f"🔍 HTML ANALYSIS:")
+            logger.info(f"   📄 Total divs in HTML: {len(all_divs)}")
+            logger.info(f"   📄 Slide-related divs: {len(slide_related_divs)}")
+            logger.info(f"   📄 Page ID divs: {len(page_id_divs)}")
+            logger.info(f"   📄 Portrait divs: {len(portrait_divs)}")
+        
+            # Log the specific IDs found
+            portrait_ids = [div.get('id') for div in portrait_divs]
+            logger.info(f"   📋 Portrait IDs found: {portrait_ids}")
+            logger.info(f"   📄 Divs with 'slide' in class: {len(slide_related_divs)}")
+            logger.info(f"   📄 Divs with 'page' in ID: {len(page_id_divs)}")
+            logger.info(f"   📄 Total HTML length: {len(html_content):,} characters")
+        
+            # Show first few div classes for debugging
+            div_classes = [div.get('class', []) for div in all_divs[:15]]
+            logger.info(f"   📋 First 15 div classes: {div_classes}")
+        
+            # Look for specific slide IDs we expect
+            expected_ids = ['portrait-page-1', 'portrait-page-1A', 'investment-highlights-pitchbook-page', 
+                           'catalyst-page', 'company-analysis-page', 'financial-highlights-table-page']
+            found_ids = []
+            for expected_id in expected_ids:
+                if soup.find('div', id=expected_id):
+                    found_ids.append(expected_id)
+        
+            logger.info(f"   ✅ Expected slide IDs found: {found_ids}")
+            logger.info(f"   ❌ Missing slide IDs: {set(expected_ids) - set(found_ids)}")
+        
+            # Check for presentation container
+            if presentation:
+                logger.info("   ✅ Found presentation-container")
+                pres_divs = presentation.find_all('div')
+                logger.info(f"   📄 Divs inside presentation-container: {len(pres_divs)}")
+            else:
+                logger.warning("   ⚠️ No presentation-container found, searching entire document")
+        
+        # Initialize header flag for the document
+        self._header_added = False
+        
+        for i, slide in enumerate(slides):
+            logger.info(f"🎯 Processing slide {i+1}/{len(slides)}")
+        
+            if i > 0:
+                # Add page break between slides
+                self._add_page_break(doc)
+        
+            # Process slide content
+            self._process_slide(doc, slide, i+1)
+    
     def _set_document_properties(self, doc: Document, company_name: str, ticker: str):
         """Set document properties and metadata"""
         core_props = doc.core_properties
@@ -1441,103 +1467,38 @@ class RobecoWordReportGenerator:
             fallback_run.font.color.rgb = self.robeco_colors['blue']
     
     def _convert_svg_to_image(self, cell, chart_area, svg_chart):
-        """Convert SVG chart directly to PNG image and insert into Word cell"""
-        logger.info("🖼️ === ENTERING SVG TO IMAGE CONVERSION ===")
-        logger.info(f"🖼️ DEBUG: SVG chart type: {type(svg_chart)}")
-        logger.info(f"🖼️ DEBUG: SVG chart tag: {getattr(svg_chart, 'name', 'None')}")
-        logger.info(f"🖼️ DEBUG: SVG viewBox: {svg_chart.get('viewBox')}")
-        logger.info(f"🖼️ DEBUG: SVG style: {svg_chart.get('style')}")
-        logger.info(f"🖼️ DEBUG: SVG HTML preview: {str(svg_chart)[:300]}...")
-        
-        # Use Puppeteer to capture the chart as image
+        """Rasterize the chart SVG in-process and insert the PNG into the Word cell"""
+        title_elem = chart_area.find('h4')
+        title = title_elem.get_text(strip=True) if title_elem else None
+        return self._add_chart_picture(cell, title, str(svg_chart))
+    
+    def _add_chart_picture(self, container, title: Optional[str], svg_markup: str) -> bool:
+        """Insert a rasterized chart (and its heading) into a cell or document; False if it cannot be drawn"""
         try:
-            import tempfile
-            import subprocess
-            import os
-            
-            logger.info("📊 Converting chart to image using Puppeteer")
-            
-            # Extract the chart area HTML
-            chart_html = str(chart_area)
-            
-            # Create a temporary HTML file with just the chart
-            html_content = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <style>
-        body {{ 
-            margin: 0; 
-            padding: 20px; 
-            font-family: Arial, sans-serif;
-            background: white;
-        }}
-    </style>
-</head>
-<body>
-    {chart_html}
-</body>
-</html>
-"""
-            
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8') as temp_html:
-                temp_html.write(html_content)
-                temp_html_path = temp_html.name
-            
-            # Create temporary PNG file
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_png:
-                temp_png_path = temp_png.name
-            
-            # Use Puppeteer to capture screenshot
-            puppeteer_script = f'''
-const puppeteer = require('puppeteer');
-(async () => {{
-    const browser = await puppeteer.launch({{headless: true}});
-    const page = await browser.newPage();
-    await page.goto('file://{temp_html_path}');
-    await page.setViewport({{width: 500, height: 450}});
-    await page.screenshot({{path: '{temp_png_path}', fullPage: true}});
-    await browser.close();
-}})();
-'''
-            
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.js', delete=False) as temp_js:
-                temp_js.write(puppeteer_script)
-                temp_js_path = temp_js.name
-            
-            # Run Puppeteer
-            result = subprocess.run(['node', temp_js_path], 
-                                  capture_output=True, text=True, timeout=30)
-            
-            if result.returncode == 0 and os.path.exists(temp_png_path):
-                # Insert the image into Word
-                img_para = cell.add_paragraph()
-                img_para.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
-                
-                run = img_para.add_run()
-                run.add_picture(temp_png_path, width=Inches(4.0))
-                
-                logger.info("✅ Successfully converted chart to image using Puppeteer")
-                success = True
-            else:
-                logger.error(f"❌ Puppeteer failed: {result.stderr}")
-                success = False
-            
-            # Clean up temporary files
-            for temp_file in [temp_html_path, temp_png_path, temp_js_path]:
-                if os.path.exists(temp_file):
-                    os.unlink(temp_file)
-            
-            return success
-            
-        except ImportError as e:
-            logger.warning(f"⚠️ SVG conversion libraries not available: {e}")
-            logger.info("💡 Install with: pip install cairosvg pillow")
+            png = chart_rasterizer.rasterize(svg_markup)
+        except ChartRasterizeError as e:
+            logger.warning(f"⚠️ Chart SVG cannot be rasterized: {e}")
             return False
         except Exception as e:
             logger.error(f"❌ SVG to image conversion failed: {e}")
             return False
+
+        # The chart heading sits above the SVG in the HTML; keep it as Word text
+        if title:
+            title_para = container.add_paragraph()
+            title_para.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
+            title_run = title_para.add_run(title)
+            title_run.font.name = self.primary_font
+            title_run.font.size = Pt(11)
+            title_run.font.bold = True
+            title_run.font.color.rgb = self.robeco_colors['text_secondary']
+
+        img_para = container.add_paragraph()
+        img_para.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
+        img_para.add_run().add_picture(BytesIO(png), width=Inches(4.0))
+
+        logger.info(f"✅ Chart rasterized in-process ({len(png):,} bytes PNG)")
+        return True
     
     def _add_chart_placeholder(self, paragraph, title):
         """Create a visual chart placeholder"""
@@ -3433,4 +3394,15 @@ const puppeteer = require('puppeteer');
             return WD_PARAGRAPH_ALIGNMENT.LEFT
 
 # Global instance for use across the application
-word_report_generator = RobecoWordReportGenerator()
\ No newline at end of file
+word_report_generator = RobecoWordReportGenerator()
+
+
+def convert_html_to_word_file(html_content: str, company_name: str, ticker: str,
+                              output_path: Optional[str] = None) -> str:
+    """
+    Synchronous HTML-to-Word conversion for worker processes
+
+    Runs the shared generator to completion without an event loop of its
+    own; returns the path of the generated document.
+    """
+    return asyncio.run(word_report_generator.convert_html_to_word(html_content, company_name, ticker, output_path))
@@ -0,0 +1,835 @@
+#!/usr/bin/env python3
+"""
+Streaming HTML-to-Word Converter
+Single-pass conversion of report HTML driven by lxml parse events
+
+The original converter parsed the whole report into a BeautifulSoup tree
+and then searched it again and again (find / find_all / select for slides,
+headers, metrics, charts and images), so conversion time and memory grew
+with the size of the report times the number of lookups. This converter
+feeds the HTML through an lxml HTMLPullParser in chunks and reacts to
+start / end events:
+
+- a ``div`` with the ``slide`` class (or a known slide id) opens a slide
+  and, after the first one, a page break
+- elements listed in the dispatch tables (by class first, then by tag) are
+  blocks: their handler receives the finished subtree on the end event
+- inline elements (strong, em, span, a, ...) stay part of the text of the
+  element they sit in
+- everything else is a container the stream passes through; its own text
+  and inline children are written as a paragraph whenever a block or
+  nested container starts, and when the container ends, so prose around
+  and between blocks keeps its place
+
+Written blocks and containers are emptied straight away. The empty element
+stays in its parent container only until the text after it (its tail) has
+been written, so the tree holds little more than the path to the current
+element and the block being built. Each element is visited once, in
+document order.
+Run formatting is built once per style and copied onto each new run, since
+python-docx's ordered property setters dominate the cost of a run.
+
+Styling, image download and table XML helpers are shared with
+RobecoWordReportGenerator, so both converters produce the same formatting.
+"""
+
+import copy
+import logging
+import re
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from docx.enum.table import WD_ALIGN_VERTICAL, WD_TABLE_ALIGNMENT
+from docx.enum.text import WD_BREAK, WD_PARAGRAPH_ALIGNMENT
+from docx.oxml.shared import OxmlElement, qn
+from docx.shared import Inches, Pt, RGBColor
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+# Slide ids produced by the 3-call report architecture, also used by the legacy converter
+EXPECTED_SLIDE_IDS = frozenset({
+    'portrait-page-1', 'portrait-page-1A', 'investment-highlights-pitchbook-page', 'catalyst-page',
+    'company-analysis-page', 'financial-highlights-table-page', 'slide-industry-analysis-part1',
+    'slide-financial-income-statement', 'slide-financial-balance-sheet', 'cash-flow-page',
+    'dcf-analysis-page', 'bull-bear-analysis-comprehensive',
+})
+
+# Pages 1-2 always use the analysis layout, whatever their classes say
+ANALYSIS_LAYOUT_SLIDES = frozenset({'portrait-page-1', 'portrait-page-1A'})
+
+# Subtrees that never produce Word content (<footer> page numbers are left to Word)
+SKIPPED_TAGS = frozenset({'head', 'script', 'style', 'noscript', 'template', 'footer', 'canvas'})
+
+# Text-level elements: part of the paragraph of the container they sit in
+INLINE_TAGS = frozenset({
+    'a', 'abbr', 'b', 'br', 'cite', 'code', 'em', 'i', 'mark', 'q', 's', 'small', 'span', 'strong',
+    'sub', 'sup', 'time', 'u',
+})
+
+HEADING_SIZES = {'h1': 28, 'h2': 24, 'h3': 20, 'h4': 18, 'h5': 16, 'h6': 14}
+
+_WHITESPACE = re.compile(r'\s+')
+
+_CENTER_CLASSES = {'center', 'text-center', 'align-center', 'company-header', 'report-header', 'report-title', 'report-subtitle'}
+_RIGHT_CLASSES = {'right', 'text-right', 'align-right'}
+
+
+def _classes(element) -> List[str]:
+    return (element.get('class') or '').split()
+
+
+def _text(element) -> str:
+    return _WHITESPACE.sub(' ', ''.join(element.itertext())).strip()
+
+
+def _find_class(element, class_name: str):
+    """First descendant (or the element itself) carrying ``class_name``"""
+    for node in element.iter():
+        if isinstance(node.tag, str) and class_name in _classes(node):
+            return node
+    return None
+
+
+def _find_tag(element, *tags: str):
+    for node in element.iter(*tags):
+        return node
+    return None
+
+
+def _displayed_text(element) -> str:
+    """Text of ``element`` without script, style and comment contents (like BeautifulSoup's get_text)"""
+    parts = []
+    for node in element.iter():
+        if isinstance(node.tag, str) and node.tag not in ('script', 'style'):
+            parts.append(node.text or '')
+        if node is not element:
+            parts.append(node.tail or '')
+    return ''.join(parts)
+
+
+def _chart_summary(chart_area, title: Optional[str]) -> Tuple[Optional[str], Optional[float], Optional[str]]:
+    """
+    (title, current price, price range) read from a chart that cannot be drawn
+
+    Same sources, in the same order, as the soup path's text fallback: the
+    chart-title / current-price / price-range elements, prices in the chart
+    text, the SVG's price labels, and the ``stockData`` points of the script
+    that draws the chart in the browser.
+    """
+    title_element = _find_class(chart_area, 'chart-title')
+    chart_title = _text(title_element) if title_element is not None else None
+    current_price, price_range = None, None
+
+    price_element = _find_class(chart_area, 'current-price')
+    if price_element is not None:
+        match = re.search(r'[\$HKD\s]*(\d+\.?\d*)', _text(price_element))
+        if match:
+            current_price = float(match.group(1))
+    range_element = _find_class(chart_area, 'price-range')
+    if range_element is not None:
+        price_range = _text(range_element)
+
+    if current_price is None:
+        # Displayed text only: the drawing script's numbers are read from stockData below
+        chart_text = _displayed_text(chart_area)
+        prices = re.findall(r'(?:Current|Price|HKD|[\$])\s*[\$]?\s*(\d+\.?\d*)', chart_text)
+        if prices:
+            current_price = float(prices[0])
+        ranges = re.findall(r'Range[:\s]*[\$]?\s*(\d+\.?\d*)\s*[-–]\s*[\$]?\s*(\d+\.?\d*)', chart_text)
+        if ranges:
+            price_range = f"${ranges[0][0]} - ${ranges[0][1]}"
+
+    svg = _find_tag(chart_area, 'svg')
+    if current_price is None and svg is not None:
+        if title:
+            chart_title = title
+            match = re.search(r'Current:\s*S?\$?(\d+\.\d+)', title)
+            if match:
+                current_price = float(match.group(1))
+        prices = []
+        for label in svg.iter('text'):
+            match = re.search(r'[S$]?\$?(\d+\.\d+)', _text(label))
+            if match:
+                prices.append(float(match.group(1)))
+        if prices:
+            current_price = current_price or max(prices)
+            price_range = f"S${min(prices):.2f} - S${max(prices):.2f}"
+
+    if current_price is None:
+        for script in chart_area.iter('script'):
+            script_text = script.text or ''
+            if 'stockData' in script_text:
+                points = re.findall(r"'price':\s*([\d.]+)", script_text)
+                if points:
+                    current_price = float(points[-1])
+                    break
+
+    return chart_title or title, current_price, price_range
+
+
+def _inline_segments(element, children=None) -> List[Tuple[str, bool, bool]]:
+    """
+    (text, bold, italic) runs of an element's inline content, whitespace collapsed as a browser would
+
+    ``children`` limits the content to the element's text plus those children and their tails.
+    """
+    segments = [(element.text or '', False, False)]
+    for child in (element if children is None else children):
+        if isinstance(child.tag, str):
+            if child.tag == 'br':
+                segments.append(('\n', False, False))
+            else:
+                segments.append((''.join(child.itertext()), child.tag in ('strong', 'b'), child.tag in ('em', 'i')))
+        segments.append((child.tail or '', False, False))
+
+    runs = []
+    for text, bold, italic in segments:
+        if text == '\n':
+            runs.append((text, bold, italic))
+            continue
+        text = _WHITESPACE.sub(' ', text)
+        if not text:
+            continue
+        # One space between runs, like collapsed HTML whitespace
+        if runs and runs[-1][0].endswith(' ') and text.startswith(' '):
+            text = text[1:]
+        if text:
+            runs.append((text, bold, italic))
+    if runs:
+        runs[0] = (runs[0][0].lstrip(' '), *runs[0][1:])
+        runs[-1] = (runs[-1][0].rstrip(' '), *runs[-1][1:])
+    return [run for run in runs if run[0]]
+
+
+class StreamingWordConverter:
+    """
+    One-pass, event-driven HTML report to Word converter
+
+    Usage:
+        slides = StreamingWordConverter(word_report_generator).convert(doc, html_content)
+    """
+
+    # Block handlers by CSS class; the first class of an element found here wins
+    BLOCK_CLASSES: Dict[str, str] = {
+        'slide-logo': '_slide_logo',
+        'report-header-container': '_report_header',
+        'company-header': '_company_header',
+        'slide-header': '_slide_header',
+        'section-title': '_section_title',
+        'metrics-grid': '_metrics_grid',
+        'intro-and-chart-container': '_intro_and_chart',
+        'analysis-item': '_analysis_item',
+        'bullet-list-square': '_bullet_list_square',
+        'report-footer': '_report_footer',
+    }
+
+    # Block handlers by tag, for elements without a handled class
+    BLOCK_TAGS: Dict[str, str] = {
+        **{heading: '_heading' for heading in HEADING_SIZES},
+        'p': '_paragraph',
+        'ul': '_list',
+        'ol': '_list',
+        'table': '_table',
+        'svg': '_standalone_chart',
+    }
+
+    def __init__(self, generator, chunk_size: int = 64 * 1024):
+        self.generator = generator
+        self.chunk_size = chunk_size
+        self.colors = generator.robeco_colors
+        self.font = generator.primary_font
+        self._class_handlers: Dict[str, Callable] = {name: getattr(self, method) for name, method in self.BLOCK_CLASSES.items()}
+        self._tag_handlers: Dict[str, Callable] = {tag: getattr(self, method) for tag, method in self.BLOCK_TAGS.items()}
+        self._run_properties: Dict[Tuple, object] = {}
+
+        self.doc = None
+        self.slides = 0
+        self.blocks = 0
+        self._prose = False
+        self._slide_id = ''
+        self._slide_classes: List[str] = []
+        self._in_slide = False
+        self._header_added = False
+        self._robeco_logo_added = False
+
+    # ------------------------------------------------------------------
+    # Event loop
+    # ------------------------------------------------------------------
+
+    def convert(self, doc, html_content: str) -> int:
+        """Stream ``html_content`` into ``doc``; returns the number of slides written"""
+        started = time.time()
+        self.doc = doc
+        parser = etree.HTMLPullParser(events=('start', 'end'), remove_comments=True, remove_pis=True)
+        # Frames of open elements: [kind, handler]
+        stack: List[list] = []
+
+        for offset in range(0, len(html_content), self.chunk_size):
+            parser.feed(html_content[offset:offset + self.chunk_size])
+            self._dispatch(parser.read_events(), stack)
+        parser.close()
+        self._dispatch(parser.read_events(), stack)
+
+        logger.info(f"📄 Streamed {self.slides} slides ({self.blocks} blocks) into Word in {time.time() - started:.2f}s")
+        return self.slides
+
+    def _dispatch(self, events, stack: List[list]):
+        for event, element in events:
+            if event == 'start':
+                self._start(element, stack)
+            else:
+                self._end(element, stack)
+
+    def _start(self, element, stack: List[list]):
+        parent_kind = stack[-1][0] if stack else 'container'
+        if parent_kind in ('block', 'inner', 'skip'):
+            # Part of a block that is handled as a whole on its end event
+            stack.append(['inner' if parent_kind != 'skip' else 'skip', None])
+            return
+
+        tag = element.tag if isinstance(element.tag, str) else ''
+        if tag in SKIPPED_TAGS:
+            stack.append(['skip', None])
+            return
+
+        if not self._in_slide:
+            if tag == 'div' and ('slide' in _classes(element) or element.get('id') in EXPECTED_SLIDE_IDS):
+                self._start_slide(element)
+                stack.append(['slide', None])
+            else:
+                stack.append(['outside', None])
+            return
+
+        handler = self._handler(element, tag)
+        if handler is None and tag in INLINE_TAGS and parent_kind == 'container':
+            # Written with the container's text (its tail too), so it stays in the tree until then
+            stack.append(['inner', None])
+            return
+        if parent_kind == 'container':
+            # Text and inline elements before this child come first in the document
+            self._flush_text(element.getparent(), stop=element)
+
+        if handler is not None:
+            stack.append(['block', handler])
+            return
+        if tag == 'main':
+            self._prose = (self._slide_id not in ANALYSIS_LAYOUT_SLIDES and
+                           ('report-prose' in _classes(element) or 'report-prose' in self._slide_classes))
+        stack.append(['container', None])
+
+    def _end(self, element, stack: List[list]):
+        kind, handler = stack.pop()
+        if kind == 'inner':
+            return
+        if kind == 'block':
+            try:
+                handler(element)
+            except Exception as e:
+                logger.error(f"❌ Word export of <{element.tag} class='{element.get('class', '')}'> failed: {e}")
+            self.blocks += 1
+        elif kind == 'container':
+            self._flush_text(element)
+        elif kind == 'slide':
+            self._in_slide = False
+            logger.info(f"✅ Slide {self.slides} ({self._slide_id or 'no-id'}) written")
+
+        if stack and stack[-1][0] == 'container':
+            # The parent's text after this element arrives as its tail; keep the empty element until then
+            element.clear(keep_tail=True)
+        else:
+            self._discard(element)
+
+    def _handler(self, element, tag: str) -> Optional[Callable]:
+        for class_name in _classes(element):
+            handler = self._class_handlers.get(class_name)
+            if handler is not None:
+                return handler
+        return self._tag_handlers.get(tag)
+
+    def _flush_text(self, container, stop=None):
+        """Write a container's pending text and inline children (up to ``stop``) as one paragraph, then drop them"""
+        children = []
+        for child in container:
+            if child is stop:
+                break
+            children.append(child)
+        if self._paragraph(container, children):
+            self.blocks += 1
+        container.text = None
+        for child in children:
+            container.remove(child)
+
+    @staticmethod
+    def _discard(element):
+        # Written content is never looked at again: drop it so memory stays flat
+        element.clear(keep_tail=False)
+        parent = element.getparent()
+        if parent is not None:
+            parent.remove(element)
+
+    def _start_slide(self, element):
+        if self.slides > 0:
+            paragraph = self.doc.add_paragraph()
+            paragraph.add_run().add_break(WD_BREAK.PAGE)
+        self.slides += 1
+        self._in_slide = True
+        self._slide_id = element.get('id') or ''
+        self._slide_classes = _classes(element)
+        self._prose = False
+        logger.info(f"🎯 Processing slide {self.slides} ({self._slide_id or 'no-id'}, classes: {self._slide_classes})")
+
+    # ------------------------------------------------------------------
+    # Shared formatting
+    # ------------------------------------------------------------------
+
+    def _add_runs(self, paragraph, element, size: int, color: Optional[RGBColor] = None, children=None):
+        for text, bold, italic in _inline_segments(element, children):
+            if text == '\n':
+                paragraph.add_run().add_break()
+                continue
+            self._format_run(paragraph.add_run(text), size, color, bold, italic)
+
+    def _styled_run(self, paragraph, text: str, size: int, color: Optional[RGBColor] = None, bold: bool = False):
+        return self._format_run(paragraph.add_run(text), size, color, bold)
+
+    def _format_run(self, run, size: int, color: Optional[RGBColor] = None, bold: bool = False, italic: bool = False):
+        key = (size, str(color) if color is not None else None, bold, italic)
+        properties = self._run_properties.get(key)
+        if properties is not None:
+            run._r.insert(0, copy.deepcopy(properties))
+            return run
+
+        run.font.size = Pt(size)
+        run.font.name = self.font
+        if bold:
+            run.font.bold = True
+        if italic:
+            run.font.italic = True
+        if color is not None:
+            run.font.color.rgb = color
+        self._run_properties[key] = copy.deepcopy(run._r.rPr)
+        return run
+
+    @staticmethod
+    def _paragraph_border(paragraph, side: str, size: str, color: str = '005F90', space: Optional[str] = None):
+        p_pr = paragraph._element.get_or_add_pPr()
+        p_bdr = OxmlElement('w:pBdr')
+        border = OxmlElement(f'w:{side}')
+        border.set(qn('w:val'), 'single')
+        border.set(qn('w:sz'), size)
+        border.set(qn('w:color'), color)
+        if space is not None:
+            border.set(qn('w:space'), space)
+        p_bdr.append(border)
+        p_pr.append(p_bdr)
+
+    @staticmethod
+    def _alignment(element):
+        """Paragraph alignment from the element's own and ancestors' classes (legacy _fix_element_alignment rules)"""
+        parent = element.getparent()
+        grandparent = parent.getparent() if parent is not None else None
+        own = set(_classes(element))
+        parent_classes = set(_classes(parent)) if parent is not None else set()
+        grandparent_classes = set(_classes(grandparent)) if grandparent is not None else set()
+
+        if _CENTER_CLASSES & (own | parent_classes | grandparent_classes):
+            return WD_PARAGRAPH_ALIGNMENT.CENTER
+        if _RIGHT_CLASSES & (own | parent_classes):
+            return WD_PARAGRAPH_ALIGNMENT.RIGHT
+        if 'content-item' in parent_classes or 'intro-text-block' in own:
+            return WD_PARAGRAPH_ALIGNMENT.JUSTIFY
+        if 'item-title' in own or element.tag in HEADING_SIZES:
+            return WD_PARAGRAPH_ALIGNMENT.LEFT
+        if 'analysis-item' in parent_classes or 'analysis-item' in grandparent_classes:
+            return WD_PARAGRAPH_ALIGNMENT.JUSTIFY if ('content-item' in own or element.tag == 'p') else WD_PARAGRAPH_ALIGNMENT.LEFT
+        if {'company-header', 'report-header-container', 'slide-header'} & (parent_classes | grandparent_classes):
+            return WD_PARAGRAPH_ALIGNMENT.CENTER
+        return WD_PARAGRAPH_ALIGNMENT.LEFT
+
+    def _remove_paragraph(self, paragraph):
+        element = paragraph._element
+        element.getparent().remove(element)
+
+    # ------------------------------------------------------------------
+    # Block handlers
+    # ------------------------------------------------------------------
+
+    def _paragraph(self, element, children=None) -> bool:
+        """Paragraph of an element's inline content (or only its text and ``children``); False when empty"""
+        if not any(text.strip() for text, _, _ in _inline_segments(element, children)):
+            return False
+        paragraph = self.doc.add_paragraph()
+        paragraph.alignment = self._alignment(element)
+        self._add_runs(paragraph, element, 18, children=children)
+        paragraph.space_after = Pt(12)
+        return True
+
+    def _heading(self, element):
+        text = _text(element)
+        if not text:
+            return
+        paragraph = self.doc.add_paragraph()
+        paragraph.alignment = self._alignment(element)
+        self._styled_run(paragraph, text, HEADING_SIZES.get(element.tag, 18), self.colors['blue_darker'], bold=True)
+        paragraph.space_after = Pt(16)
+
+    def _list(self, element, special: Optional[bool] = None):
+        if special is None:
+            special = any('bullet-list-square' in _classes(ancestor) for ancestor in element.iterancestors())
+        style = self.doc.styles['List Bullet' if element.tag == 'ul' else 'List Number']
+        for item in element.iter('li'):
+            if not _text(item):
+                continue
+            paragraph = self.doc.add_paragraph()
+            paragraph.style = style
+            if special:
+                paragraph.alignment = self._alignment(item)
+                self._add_runs(paragraph, item, 16)
+                paragraph.space_after = Pt(8)
+            else:
+                paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.LEFT
+                self._add_runs(paragraph, item, 16, self.colors['text_dark'])
+
+    def _table(self, element):
+        rows = [[cell for cell in row if cell.tag in ('td', 'th')] for row in element.iter('tr')]
+        rows = [row for row in rows if row]
+        if not rows:
+            return
+        columns = max(len(row) for row in rows)
+        table = self.doc.add_table(rows=len(rows), cols=columns)
+
+        if self._prose:
+            # Prose pages: full page width, evenly split columns
+            table.alignment = WD_TABLE_ALIGNMENT.CENTER
+            table.autofit = False
+            for column in table.columns:
+                column.width = Inches(7.5 / columns)
+        else:
+            table.alignment = WD_TABLE_ALIGNMENT.LEFT
+
+        for i, row in enumerate(rows):
+            for j, html_cell in enumerate(row):
+                cell = table.cell(i, j)
+                paragraph = cell.paragraphs[0]
+                header = html_cell.tag == 'th'
+                self._styled_run(paragraph, _text(html_cell), 12 if self._prose else 14,
+                                 self.colors['blue_darker'] if header else None, bold=header)
+                if self._prose:
+                    paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER if header else WD_PARAGRAPH_ALIGNMENT.LEFT
+                    cell.vertical_alignment = WD_ALIGN_VERTICAL.TOP
+
+        if self._prose:
+            spacing = self.doc.add_paragraph()
+            spacing.space_after = Pt(16)
+
+    def _section_title(self, element):
+        paragraph = self.doc.add_paragraph()
+        paragraph.alignment = self._alignment(element)
+        self._styled_run(paragraph, _text(element), 26, self.colors['blue_darker'], bold=True)
+        paragraph.space_after = Pt(18)
+        self._paragraph_border(paragraph, 'bottom', '30')
+
+    def _slide_header(self, element):
+        title = _find_class(element, 'report-title')
+        if title is not None:
+            paragraph = self.doc.add_paragraph()
+            paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.LEFT
+            self._styled_run(paragraph, _text(title), 57, self.colors['brown_black'], bold=True)
+            paragraph.space_after = Pt(0)
+        subtitle = _find_class(element, 'report-subtitle')
+        if subtitle is not None:
+            paragraph = self.doc.add_paragraph()
+            paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.LEFT
+            self._styled_run(paragraph, _text(subtitle), 27, self.colors['text_dark'])
+            paragraph.space_after = Pt(22)
+
+    def _report_footer(self, element):
+        text = _text(element)
+        if not text:
+            return
+        paragraph = self.doc.add_paragraph()
+        paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
+        self._styled_run(paragraph, text, 17, self.colors['text_secondary'])
+        self._paragraph_border(paragraph, 'top', '30')
+
+    def _slide_logo(self, element):
+        img = _find_tag(element, 'img')
+        if img is None:
+            return
+        src, alt = img.get('src', ''), img.get('alt', '')
+        if 'robeco' not in src.lower() and 'robeco' not in alt.lower():
+            return
+        paragraph = self.doc.add_paragraph()
+        paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.RIGHT
+        if self.generator._download_and_insert_image_inline(paragraph, src, alt, Inches(1.0)):
+            paragraph.space_after = Pt(12)
+        else:
+            self._remove_paragraph(paragraph)
+
+    def _report_header(self, element):
+        if self._header_added:
+            logger.info("🔄 Skipping duplicate report header")
+            return
+        self._header_added = True
+
+        logo_container = _find_class(element, 'robeco-logo-container')
+        if logo_container is not None and not self._robeco_logo_added:
+            paragraph = self.doc.add_paragraph()
+            paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.RIGHT
+            img = _find_tag(logo_container, 'img')
+            if img is None or not self.generator._download_and_insert_image_inline(
+                    paragraph, img.get('src', ''), "Robeco Logo", Inches(1.2)):
+                self._styled_run(paragraph, "ROBECO", 24, self.colors['blue_darker'], bold=True)
+            paragraph.space_after = Pt(12)
+            self._robeco_logo_added = True
+
+        company_header = _find_class(element, 'company-header')
+        if company_header is not None:
+            self._company_header(company_header)
+
+    def _company_header(self, element):
+        """Icon + name on the left, rating on the right; blue rule below inside header-blue-border"""
+        table = self.doc.add_table(rows=1, cols=2)
+        table.alignment = WD_TABLE_ALIGNMENT.LEFT
+        table.columns[0].width = Inches(5.0)
+        table.columns[1].width = Inches(2.5)
+        self.generator._hide_table_borders(table)
+
+        left_cell = table.cell(0, 0)
+        left_cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
+        self._company_name_with_icon(left_cell, element)
+
+        right_cell = table.cell(0, 1)
+        right_cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
+        rating = _find_class(element, 'rating')
+        if rating is not None:
+            paragraph = right_cell.paragraphs[0]
+            paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.RIGHT
+            rating_text = _text(rating)
+            rating_upper = rating_text.upper()
+            if 'UNDERWEIGHT' in rating_upper or 'UNDERPERFORM' in rating_upper:
+                color = RGBColor(198, 40, 40)
+            elif 'OVERWEIGHT' in rating_upper or 'OUTPERFORM' in rating_upper:
+                color = RGBColor(76, 175, 80)
+            else:
+                color = RGBColor(255, 152, 0)
+            self._styled_run(paragraph, rating_text, 20, color, bold=True)
+
+        spacing = self.doc.add_paragraph()
+        spacing.space_after = Pt(16)
+
+        if any('header-blue-border' in _classes(ancestor) for ancestor in element.iterancestors()):
+            border = self.doc.add_paragraph()
+            border.space_before = Pt(3)
+            border.space_after = Pt(6)
+            self._paragraph_border(border, 'bottom', '18', space='0')
+
+    def _company_name_with_icon(self, cell, element):
+        name = _find_class(element, 'name')
+        if name is None:
+            return
+        company_name = _text(name)
+        paragraph = cell.paragraphs[0]
+        paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.LEFT
+
+        icon_added = False
+        for img in element.iter('img'):
+            src, alt = img.get('src', ''), img.get('alt', '')
+            if 'clearbit.com' in src or 'icon' in _classes(img) or 'icon' in alt.lower() or src.endswith('.co.jp'):
+                for url in self.generator._generate_intelligent_logo_fallbacks(src, company_name):
+                    if self.generator._download_and_insert_image_inline(paragraph, url, alt, Inches(0.4)):
+                        icon_added = True
+                        break
+                break
+        if icon_added:
+            paragraph.add_run(" ")
+        self._styled_run(paragraph, company_name, 20, self.colors['text_dark'], bold=True)
+
+    def _metrics_grid(self, element):
+        items = [node for node in element.iter() if isinstance(node.tag, str) and 'metrics-item' in _classes(node)]
+        if not items:
+            return
+        if len(items) > 25:
+            logger.warning("⚠️ More than 25 metrics items found, truncating at 25")
+
+        table = self.doc.add_table(rows=max(5, (len(items) + 4) // 5), cols=5)
+        table.alignment = WD_TABLE_ALIGNMENT.CENTER
+        table.autofit = False
+        for column in table.columns:
+            column.width = Inches(1.5)
+        for row in table.rows:
+            row.height = Inches(0.8)
+        self.generator._add_table_border(table, 'top')
+
+        for index, item in enumerate(items[:25]):
+            label, value = _find_class(item, 'label'), _find_class(item, 'value')
+            if label is None or value is None:
+                continue
+            cell = table.cell(index // 5, index % 5)
+            label_paragraph = cell.paragraphs[0]
+            label_paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.LEFT
+            self._styled_run(label_paragraph, _text(label), 10, self.colors['text_secondary'], bold=True)
+            value_paragraph = cell.add_paragraph()
+            value_paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.LEFT
+            self._styled_run(value_paragraph, _text(value), 14, self.colors['text_dark'], bold=True)
+            cell.vertical_alignment = WD_ALIGN_VERTICAL.TOP
+
+        self.generator._add_table_border(table, 'bottom')
+
+    def _analysis_item(self, element):
+        """Title / content as a 16% / 84% two-column table"""
+        title = _find_class(element, 'item-title')
+        content = _find_class(element, 'content-item')
+        if title is None or content is None:
+            self._paragraph(element)
+            return
+
+        table = self.doc.add_table(rows=1, cols=2)
+        table.alignment = WD_TABLE_ALIGNMENT.LEFT
+        self.generator._apply_analysis_item_html_styling(table, 'first-analysis-item' in _classes(element))
+        self.generator._force_precise_flexbox_layout(table)
+
+        left_cell = table.cell(0, 0)
+        left_cell.vertical_alignment = WD_ALIGN_VERTICAL.TOP
+        title_paragraph = left_cell.paragraphs[0]
+        title_paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.LEFT
+        self._styled_run(title_paragraph, _text(title), 16, self.colors['blue_darker'], bold=True)
+        self.generator._apply_cell_padding(left_cell, right_padding=15)
+
+        right_cell = table.cell(0, 1)
+        right_cell.vertical_alignment = WD_ALIGN_VERTICAL.TOP
+        self._content_item(right_cell, content)
+
+        spacing = self.doc.add_paragraph()
+        spacing.space_after = Pt(12)
+
+    def _content_item(self, cell, content):
+        paragraphs = [p for p in content.iter('p') if _text(p)]
+        if paragraphs:
+            for index, html_paragraph in enumerate(paragraphs):
+                paragraph = cell.paragraphs[0] if index == 0 else cell.add_paragraph()
+                paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.JUSTIFY
+                self._add_runs(paragraph, html_paragraph, 18, self.colors['text_dark'])
+                paragraph.space_after = Pt(8)
+            return
+
+        items = [li for li in content.iter('li') if _text(li)]
+        if items:
+            for item in items:
+                paragraph = cell.add_paragraph()
+                self._add_runs(paragraph, item, 18, self.colors['text_dark'])
+                paragraph.space_after = Pt(4)
+            return
+
+        paragraph = cell.paragraphs[0]
+        paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.JUSTIFY
+        self._add_runs(paragraph, content, 18, self.colors['text_dark'])
+
+    def _bullet_list_square(self, element):
+        for child in element:
+            if not isinstance(child.tag, str):
+                continue
+            if child.tag == 'h4':
+                paragraph = self.doc.add_paragraph()
+                self._styled_run(paragraph, _text(child), 20, self.colors['blue_darker'], bold=True)
+                paragraph.space_after = Pt(6)
+            elif child.tag == 'p':
+                if _text(child):
+                    paragraph = self.doc.add_paragraph()
+                    self._add_runs(paragraph, child, 16)
+                    paragraph.alignment = self._alignment(child)
+                    paragraph.space_after = Pt(8)
+            elif child.tag in ('ul', 'ol'):
+                self._list(child, special=True)
+            else:
+                self._bullet_list_square(child)
+
+    def _chart_parts(self, element):
+        """(chart container, its <h4> title, its <svg>) inside ``element``"""
+        svg = _find_tag(element, 'svg')
+        chart_area = _find_class(element, 'stock-chart-container')
+        if chart_area is None and svg is not None:
+            chart_area = svg.getparent()
+        title = _find_tag(chart_area, 'h4') if chart_area is not None else None
+        return chart_area, (_text(title) if title is not None else None), svg
+
+    def _intro_and_chart(self, element):
+        """Intro text and stock chart side by side (50 / 50), or one after the other on prose pages"""
+        intro = _find_class(element, 'intro-text-block')
+        chart_area, chart_title, svg = self._chart_parts(element)
+
+        if self._prose:
+            if intro is not None:
+                for html_paragraph in (list(intro.iter('p')) or [intro]):
+                    self._paragraph(html_paragraph)
+            if svg is not None or chart_area is not None:
+                self._chart(self.doc, chart_title, svg, chart_area)
+            return
+
+        table = self.doc.add_table(rows=1, cols=2)
+        table.alignment = WD_TABLE_ALIGNMENT.CENTER
+        table.columns[0].width = Inches(3.55)
+        table.columns[1].width = Inches(3.55)
+        self.generator._hide_table_borders(table)
+
+        left_cell = table.cell(0, 0)
+        left_cell.vertical_alignment = WD_ALIGN_VERTICAL.TOP
+        if intro is not None:
+            left_cell.paragraphs[0].clear()
+            html_paragraphs = [p for p in intro.iter('p') if _text(p)]
+            for html_paragraph in html_paragraphs or [intro]:
+                paragraph = left_cell.add_paragraph()
+                paragraph.alignment = self._alignment(html_paragraph) if html_paragraphs else WD_PARAGRAPH_ALIGNMENT.LEFT
+                self._add_runs(paragraph, html_paragraph, 18, self.colors['text_dark'])
+                paragraph.space_after = Pt(12)
+
+        right_cell = table.cell(0, 1)
+        right_cell.vertical_alignment = WD_ALIGN_VERTICAL.TOP
+        if svg is not None or chart_area is not None:
+            self._chart(right_cell, chart_title, svg, chart_area)
+        else:
+            right_cell.paragraphs[0].clear()
+
+        spacing = self.doc.add_paragraph()
+        spacing.space_after = Pt(20)
+
+    def _standalone_chart(self, element):
+        parent = element.getparent()
+        title = _find_tag(parent, 'h4') if parent is not None else None
+        self._chart(self.doc, _text(title) if title is not None else None, element)
+
+    def _chart(self, container, title: Optional[str], svg, chart_area=None):
+        """
+        Rasterized chart picture; when the SVG cannot be drawn (or the chart is
+        drawn by a script), its title with the current price and price range
+        """
+        markup = etree.tostring(svg, encoding='unicode', method='html') if svg is not None else ''
+        if markup and self.generator._add_chart_picture(container, title, markup):
+            return
+
+        chart_title, current_price, price_range = _chart_summary(chart_area if chart_area is not None else svg, title)
+        if current_price is None and not chart_title:
+            paragraph = container.add_paragraph()
+            paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
+            run = self._styled_run(paragraph, "📊 [Stock Chart]", 14, self.colors['text_secondary'])
+            run.font.italic = True
+            return
+
+        paragraph = container.add_paragraph()
+        paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
+        paragraph.space_after = Pt(10)
+        self._styled_run(paragraph, chart_title or "📈 Stock Price Chart", 14, self.colors['brown_black'], bold=True)
+        if current_price is None:
+            return
+
+        currency = "S$" if "S$" in str(price_range) else "$"
+        paragraph = container.add_paragraph()
+        paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
+        paragraph.space_after = Pt(8)
+        self._styled_run(paragraph, f"{currency}{current_price:.2f}", 20, self.colors['blue'], bold=True)
+        if price_range:
+            paragraph = container.add_paragraph()
+            paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
+            paragraph.space_after = Pt(8)
+            self._styled_run(paragraph, f"Range: {price_range}", 12, self.colors['text_secondary'])
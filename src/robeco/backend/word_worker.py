@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Word Conversion Worker
+Child processes that build Word documents for the document conversion queue
+
+Word building is CPU-bound python-docx work, so the conversion queue runs it
+outside the server process. A multiprocessing pool re-imports the parent's
+main module in every worker; run from professional_streaming_server.py that
+is the whole server with its AI clients and routes. Workers are therefore
+started as ``python -m robeco.backend.word_worker``, which only imports the
+Word generator. Each worker converts one document at a time and stays up
+for the next job.
+
+Jobs arrive as JSON lines on stdin:
+    {"id": 1, "html_content": "...", "company_name": "...", "ticker": "..."}
+and every job is answered with one JSON line on stdout:
+    {"id": 1, "ok": true, "file_path": "/tmp/..._Investment_Report_....docx", "elapsed": 1.82}
+    {"id": 1, "ok": false, "error": "..."}
+Logging goes to stderr. Closing stdin ends the worker. A job that runs past
+the pool's timeout gets its worker killed; a fresh one starts for the next
+job.
+"""
+
+import itertools
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    from .word_report_generator import convert_html_to_word_file
+except ImportError:
+    from robeco.backend.word_report_generator import convert_html_to_word_file
+
+logger = logging.getLogger(__name__)
+
+WORKER_MODULE = "robeco.backend.word_worker"
+SRC_ROOT = Path(__file__).resolve().parent.parent.parent
+
+
+class WordWorkerError(RuntimeError):
+    """A worker process could not run a job (failed to start or exited mid-job)"""
+
+
+class WordWorkerTimeout(TimeoutError):
+    """A job ran past the pool's timeout; its worker was killed"""
+
+
+class WordWorkerPool:
+    """
+    Client side of the Word conversion workers
+
+    ``convert`` blocks until the document is built or ``job_timeout``
+    seconds pass, so it is called on a thread. At most ``size`` workers run;
+    idle ones are reused and a worker that exits or is killed for running
+    too long is replaced on the next job.
+
+    Usage:
+        file_path = await asyncio.to_thread(word_worker_pool.convert, html, "Arista Networks", "ANET")
+    """
+
+    def __init__(self, size: int = 2, job_timeout: float = 300.0):
+        self.size = size
+        self.job_timeout = job_timeout
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._idle: List[subprocess.Popen] = []
+        self._job_ids = itertools.count(1)
+        self.stats = {"jobs": 0, "worker_starts": 0, "worker_exits": 0, "timeouts": 0}
+
+    def _worker_env(self) -> Dict[str, str]:
+        env = os.environ.copy()
+        python_paths = [str(SRC_ROOT)]
+        if env.get("PYTHONPATH"):
+            python_paths.append(env["PYTHONPATH"])
+        env["PYTHONPATH"] = os.pathsep.join(python_paths)
+        return env
+
+    def _start_worker(self) -> subprocess.Popen:
+        try:
+            worker = subprocess.Popen(
+                [sys.executable, "-m", WORKER_MODULE],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                env=self._worker_env(), text=True, encoding="utf-8", bufsize=1
+            )
+        except OSError as e:
+            raise WordWorkerError(f"Word worker failed to start: {e}") from e
+        self.stats["worker_starts"] += 1
+        logger.info(f"📝 Started Word worker (pid {worker.pid})")
+        return worker
+
+    def _take_worker(self) -> subprocess.Popen:
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.poll() is None:
+                    return worker
+        return self._start_worker()
+
+    def convert(self, html_content: str, company_name: str, ticker: str) -> str:
+        """
+        Build a Word document in a worker process
+
+        Returns:
+            Path of the generated document
+
+        Raises:
+            WordWorkerError: when no worker could run the job
+            WordWorkerTimeout: when the job ran past ``job_timeout``
+            RuntimeError: when the conversion itself failed
+        """
+        with self._slots:
+            worker = self._take_worker()
+            job = {"id": next(self._job_ids), "html_content": html_content,
+                   "company_name": company_name, "ticker": ticker}
+            self.stats["jobs"] += 1
+            # Killing the worker closes its stdout, which ends the read below
+            timed_out = threading.Event()
+            watchdog = threading.Timer(self.job_timeout, self._expire, (worker, timed_out))
+            watchdog.daemon = True
+            watchdog.start()
+            try:
+                worker.stdin.write(json.dumps(job) + "\n")
+                worker.stdin.flush()
+                result = self._read_result(worker, job["id"])
+            except (BrokenPipeError, OSError):
+                result = None
+            finally:
+                watchdog.cancel()
+            if result is None:
+                worker.kill()
+                worker.wait()
+                if timed_out.is_set():
+                    self.stats["timeouts"] += 1
+                    raise WordWorkerTimeout(f"Word conversion exceeded {self.job_timeout:.0f}s; worker killed")
+                self.stats["worker_exits"] += 1
+                raise WordWorkerError(f"Word worker exited (code {worker.returncode})")
+
+            with self._lock:
+                self._idle.append(worker)
+
+        if not result.get("ok"):
+            raise RuntimeError(result.get("error", "Word conversion failed"))
+        return result["file_path"]
+
+    @staticmethod
+    def _expire(worker: subprocess.Popen, timed_out: threading.Event):
+        timed_out.set()
+        logger.warning(f"⏰ Word worker (pid {worker.pid}) exceeded the job timeout, killing it")
+        worker.kill()
+
+    @staticmethod
+    def _read_result(worker: subprocess.Popen, job_id: int) -> Optional[Dict[str, Any]]:
+        """Next reply for ``job_id``; ``None`` once the worker has exited"""
+        for line in worker.stdout:
+            try:
+                result = json.loads(line)
+            except ValueError:
+                # Printed while the worker imported the generator, before replies own stdout
+                logger.info(f"📝 {line.rstrip()}")
+                continue
+            if isinstance(result, dict) and result.get("id") == job_id:
+                return result
+        return None
+
+    def shutdown(self):
+        """Stop idle workers; closing stdin lets them exit cleanly"""
+        with self._lock:
+            workers, self._idle = self._idle, []
+        for worker in workers:
+            worker.stdin.close()
+            try:
+                worker.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                worker.kill()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "workers": self.size, "idle_workers": len(self._idle),
+                "job_timeout": self.job_timeout}
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr, format="[word-worker] %(message)s")
+    # Replies own stdout; anything the generator prints goes to stderr
+    replies, sys.stdout = sys.stdout, sys.stderr
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        job = json.loads(line)
+        started = time.time()
+        try:
+            file_path = convert_html_to_word_file(job["html_content"], job["company_name"], job["ticker"])
+            reply = {"id": job["id"], "ok": True, "file_path": file_path,
+                     "elapsed": round(time.time() - started, 2)}
+        except Exception as e:
+            logger.error(f"❌ Word conversion job {job['id']} failed: {e}")
+            reply = {"id": job["id"], "ok": False, "error": str(e)}
+        replies.write(json.dumps(reply) + "\n")
+        replies.flush()
+
+
+if __name__ == "__main__":
+    main()
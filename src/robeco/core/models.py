@@ -4,11 +4,14 @@ Core data models for Robeco AI System
 Defines the fundamental data structures used throughout the system.
 """
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from enum import Enum
 
+import numpy as np
+
 
 class AnalysisStatus(Enum):
     """Analysis status enumeration"""
@@ -102,7 +105,7 @@ class WebSocketMessage:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class FinancialData:
     """Structured financial data from yfinance"""
     ticker: str
@@ -178,4 +181,161 @@ class FinancialData:
             dividend_yield=info.get('dividendYield', 0),
             payout_ratio=info.get('payoutRatio', 0),
             dividend_rate=info.get('dividendRate', 0)
-        )
\ No newline at end of file
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        data = asdict(self)
+        data["timestamp"] = self.timestamp.isoformat()
+        return data
+
+
+def _json_floats(values: np.ndarray) -> List[Optional[float]]:
+    """Array to JSON-safe list with NaN/inf mapped to None"""
+    return [float(v) if np.isfinite(v) else None for v in values.tolist()]
+
+
+@dataclass(slots=True)
+class PriceSeries:
+    """OHLCV price history stored as one NumPy array per field"""
+    interval: str
+    dates: np.ndarray    # datetime64[s], local wall time of ``tz``
+    open: np.ndarray     # float64
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray   # float64 (NaN-capable)
+    period: str = ""
+    tz: Optional[str] = None
+    dividends: Optional[np.ndarray] = None
+    splits: Optional[np.ndarray] = None
+    
+    @classmethod
+    def from_dataframe(cls, frame, interval: str = "1d", period: str = "") -> 'PriceSeries':
+        """Create PriceSeries from a yfinance history DataFrame"""
+        index = frame.index
+        tz = getattr(index, "tz", None)
+        if tz is not None:
+            index = index.tz_localize(None)
+        
+        def column(name: str) -> np.ndarray:
+            if name in frame.columns:
+                return frame[name].to_numpy(dtype=np.float64, na_value=np.nan)
+            return np.full(len(frame), np.nan)
+        
+        return cls(
+            interval=interval,
+            dates=index.to_numpy(dtype="datetime64[s]"),
+            open=column("Open"),
+            high=column("High"),
+            low=column("Low"),
+            close=column("Close"),
+            volume=column("Volume"),
+            period=period,
+            tz=str(tz) if tz is not None else None,
+            dividends=column("Dividends") if "Dividends" in frame.columns else None,
+            splits=column("Stock Splits") if "Stock Splits" in frame.columns else None
+        )
+    
+    def to_dataframe(self):
+        """yfinance-shaped history DataFrame (timezone and action columns restored)"""
+        import pandas as pd
+        
+        index = pd.DatetimeIndex(self.dates.astype("datetime64[ns]"), name="Date")
+        if self.tz is not None:
+            index = index.tz_localize(self.tz)
+        columns = {"Open": self.open, "High": self.high, "Low": self.low, "Close": self.close, "Volume": self.volume}
+        if self.dividends is not None:
+            columns["Dividends"] = self.dividends
+        if self.splits is not None:
+            columns["Stock Splits"] = self.splits
+        return pd.DataFrame(columns, index=index)
+    
+    def __len__(self) -> int:
+        return len(self.dates)
+    
+    @property
+    def nbytes(self) -> int:
+        arrays = (self.dates, self.open, self.high, self.low, self.close, self.volume, self.dividends, self.splits)
+        return sum(a.nbytes for a in arrays if a is not None)
+    
+    def to_json(self) -> Dict[str, Any]:
+        """Columnar JSON-serializable dictionary"""
+        return {
+            "period": self.period,
+            "interval": self.interval,
+            "dates": np.datetime_as_string(self.dates, unit="D").tolist(),
+            "open": _json_floats(self.open),
+            "high": _json_floats(self.high),
+            "low": _json_floats(self.low),
+            "close": _json_floats(self.close),
+            "volume": _json_floats(self.volume)
+        }
+    
+@dataclass(slots=True)
+class StatementTable:
+    """Financial statement as a (line item x period) float matrix"""
+    name: str
+    periods: List[str]
+    line_items: List[str]
+    values: np.ndarray   # shape (len(line_items), len(periods)), float64
+    
+    @classmethod
+    def from_dataframe(cls, name: str, frame) -> 'StatementTable':
+        """Create StatementTable from a yfinance statement DataFrame (line items x dates)"""
+        periods = [c.strftime("%Y-%m-%d") if hasattr(c, "strftime") else str(c) for c in frame.columns]
+        try:
+            values = frame.to_numpy(dtype=np.float64, na_value=np.nan)
+        except (TypeError, ValueError):
+            values = frame.apply(lambda col: col.map(_to_float)).to_numpy(dtype=np.float64)
+        return cls(name=name, periods=periods, line_items=[str(i) for i in frame.index], values=values)
+    
+    def to_dataframe(self):
+        """yfinance-shaped statement DataFrame (line items x period timestamps)"""
+        import pandas as pd
+        
+        columns = pd.to_datetime(self.periods, errors="coerce")
+        if columns.isna().any():
+            columns = pd.Index(self.periods)
+        return pd.DataFrame(self.values, index=pd.Index(self.line_items), columns=columns)
+    
+    @property
+    def nbytes(self) -> int:
+        labels = sum(sys.getsizeof(label) for label in self.periods + self.line_items)
+        return self.values.nbytes + labels
+    
+    def get(self, line_item: str) -> Dict[str, Optional[float]]:
+        """One line item across all periods"""
+        if line_item not in self.line_items:
+            return {}
+        row = self.values[self.line_items.index(line_item)]
+        return dict(zip(self.periods, _json_floats(row)))
+    
+    def to_json(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """``{period: {line_item: value}}``, the shape the statement consumers already use"""
+        return {
+            period: dict(zip(self.line_items, _json_floats(self.values[:, i])))
+            for i, period in enumerate(self.periods)
+        }
+
+
+def _to_float(value: Any) -> float:
+    """Statement cell to float, NaN for anything non-numeric"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def deep_sizeof(obj: Any, seen: Optional[set] = None) -> int:
+    """Recursive sys.getsizeof for nested dict/list structures"""
+    seen = seen if seen is not None else set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    return size
@@ -0,0 +1,164 @@
+"""
+JSON serialization layer for Robeco AI System
+
+Single entry point for outbound WebSocket and HTTP payloads. Uses orjson
+when it is installed and falls back to the stdlib encoder otherwise. Both
+backends emit null for NaN/inf and handle datetimes, pandas/numpy values,
+Decimal and enums, so payloads no longer need a separate cleaning pass.
+"""
+
+import json
+import logging
+import math
+from dataclasses import is_dataclass, asdict
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional fast backend
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+_backend = "orjson" if orjson is not None else "json"
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def get_backend() -> str:
+    """Name of the active serialization backend"""
+    return _backend
+
+
+def set_backend(name: str) -> str:
+    """
+    Select the serialization backend
+
+    Args:
+        name: "orjson" or "json"
+
+    Returns:
+        The backend actually in use (falls back to "json" if orjson is missing)
+    """
+    global _backend
+    if name not in ("orjson", "json"):
+        raise ValueError(f"Unknown JSON backend: {name}")
+    if name == "orjson" and orjson is None:
+        logger.warning("⚠️ orjson not installed, using stdlib json backend")
+        name = "json"
+    _backend = name
+    return _backend
+
+
+def to_jsonable(obj: Any) -> Any:
+    """
+    Recursively convert ``obj`` into plain JSON types
+
+    NaN/inf and pandas NaT become None, datetimes become ISO strings,
+    numpy scalars and arrays become Python numbers and lists, and
+    dictionary keys become strings.
+    """
+    if obj is None or isinstance(obj, (str, bool, int)):
+        return obj
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {_key(k): to_jsonable(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return [to_jsonable(item) for item in obj]
+    return to_jsonable(_default(obj))
+
+
+def _key(key: Any) -> str:
+    """Dictionary key as a string (dates use ISO format)"""
+    if isinstance(key, str):
+        return key
+    if hasattr(key, "isoformat") and not _is_nat(key):
+        return key.isoformat()
+    return str(key)
+
+
+def _is_nat(obj: Any) -> bool:
+    return type(obj).__name__ == "NaTType"
+
+
+def _default(obj: Any) -> Any:
+    """Fallback conversion for types neither backend handles natively"""
+    if _is_nat(obj):
+        return None
+    if isinstance(obj, (datetime, date)) or hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, "tolist"):  # numpy arrays / pandas objects
+        return obj.tolist()
+    if hasattr(obj, "item"):  # numpy scalars
+        return obj.item()
+    if is_dataclass(obj):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes"""
+    if _backend == "orjson":
+        try:
+            return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # e.g. ints beyond 64 bits or unsupported dict keys; the
+            # stdlib path below converts everything explicitly
+            pass
+    return json.dumps(to_jsonable(obj), ensure_ascii=False).encode("utf-8")
+
+
+def dumps(obj: Any) -> str:
+    """Serialize to a JSON string (suitable for ``websocket.send_text``)"""
+    return dumps_bytes(obj).decode("utf-8")
+
+
+class SerializedMessage:
+    """
+    A payload serialized exactly once
+
+    Lets callers measure the size of a message, inspect it and send it
+    (possibly to several sockets) without re-encoding.
+    """
+
+    __slots__ = ("data", "_bytes", "_text")
+
+    def __init__(self, data: Any):
+        self.data = data
+        self._bytes = dumps_bytes(data)
+        self._text = None
+
+    @property
+    def size(self) -> int:
+        """Encoded size in bytes"""
+        return len(self._bytes)
+
+    @property
+    def bytes(self) -> bytes:
+        return self._bytes
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = self._bytes.decode("utf-8")
+        return self._text
+
+
+def as_text(message: Union[SerializedMessage, str, Any]) -> str:
+    """Text for ``send_text`` from a pre-serialized message, a JSON string or a raw payload"""
+    if isinstance(message, SerializedMessage):
+        return message.text
+    if isinstance(message, str):
+        return message
+    return dumps(message)
@@ -296,49 +296,14 @@ def time_execution(func):
         return sync_wrapper
 
 
-class JSONEncoder(json.JSONEncoder):
-    """Custom JSON encoder for datetime and other objects"""
-    
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        elif isinstance(obj, Decimal):
-            return float(obj)
-        # Handle pandas Timestamp objects
-        elif hasattr(obj, 'isoformat'):
-            return obj.isoformat()
-        # Handle pandas NaT (Not a Time) objects
-        elif str(type(obj)) == "<class 'pandas._libs.tslibs.nattype.NaTType'>":
-            return None
-        # Handle numpy int64 and other numpy types
-        elif hasattr(obj, 'item'):
-            return obj.item()
-        # Handle numpy arrays
-        elif hasattr(obj, 'tolist'):
-            return obj.tolist()
-        return super().default(obj)
-
-
-def _convert_keys(obj):
-    """Recursively convert dictionary keys to strings"""
-    if isinstance(obj, dict):
-        return {str(k): _convert_keys(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [_convert_keys(item) for item in obj]
-    elif hasattr(obj, 'isoformat'):  # pandas Timestamp
-        return obj.isoformat()
-    elif hasattr(obj, 'item'):  # numpy types
-        return obj.item()
-    elif hasattr(obj, 'tolist'):  # numpy arrays
-        return obj.tolist()
-    else:
-        return obj
-
 def safe_json_dumps(obj: Any, **kwargs) -> str:
     """Safely serialize object to JSON"""
-    # First convert all keys to strings and handle complex objects
-    cleaned_obj = _convert_keys(obj)
-    return json.dumps(cleaned_obj, cls=JSONEncoder, **kwargs)
+    from .serialization import dumps, to_jsonable
+    
+    # Formatting options (indent, sort_keys, ...) need the stdlib encoder
+    if kwargs:
+        return json.dumps(to_jsonable(obj), **kwargs)
+    return dumps(obj)
 
 
 def get_system_info() -> Dict[str, Any]:
@@ -7,9 +7,18 @@ Contains financial data fetchers, processors, and validators.
 from .yfinance_fetcher import YFinanceFetcher
 from .data_processor import DataProcessor
 from .data_validator import DataValidator
+from .market_data_service import MarketDataService, TickerSnapshot, market_data_service
+from .ratio_engine import calculate_ratio_matrix
+from .market_data_recorder import enable_recording, enable_replay
 
 __all__ = [
     "YFinanceFetcher",
     "DataProcessor", 
-    "DataValidator"
+    "DataValidator",
+    "MarketDataService",
+    "TickerSnapshot",
+    "market_data_service",
+    "calculate_ratio_matrix",
+    "enable_recording",
+    "enable_replay"
 ]
\ No newline at end of file
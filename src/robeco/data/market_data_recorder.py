@@ -0,0 +1,210 @@
+"""
+Offline market data recorder and replayer
+
+Record mode wraps every Yahoo call made through the MarketDataService and
+stores the responses in a compressed snapshot file. Replay mode serves
+those responses back (with optional simulated latency) so the fetcher,
+server and report pipeline can be profiled and load-tested without
+network access.
+
+Snapshot files are gzip-compressed pickles; only load files you recorded.
+
+Environment:
+    ROBECO_MARKET_DATA_MODE       live | record | replay (default live)
+    ROBECO_MARKET_DATA_SNAPSHOT   snapshot file path
+    ROBECO_REPLAY_LATENCY_MS      simulated latency per replayed call
+"""
+
+import atexit
+import gzip
+import logging
+import os
+import pickle
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple, Callable
+
+import yfinance as yf
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SNAPSHOT_PATH = "market_data_snapshot.pkl.gz"
+
+ResponseKey = Tuple[str, str, Optional[str]]
+
+
+def _call_signature(args: tuple, kwargs: Dict[str, Any]) -> str:
+    return repr((args, sorted(kwargs.items())))
+
+
+class MarketDataRecording:
+    """In-memory store of Yahoo responses keyed by (symbol, attribute, call signature)"""
+
+    def __init__(self):
+        self.responses: Dict[ResponseKey, Any] = {}
+        self.metadata: Dict[str, Any] = {"recorded_at": datetime.now().isoformat()}
+        self._lock = threading.Lock()
+
+    def record(self, key: ResponseKey, value: Any):
+        with self._lock:
+            self.responses[key] = value
+
+    def lookup(self, key: ResponseKey) -> Any:
+        try:
+            return self.responses[key]
+        except KeyError:
+            raise LookupError(f"No recorded response for {key[0]}.{key[1]} {key[2] or ''}".strip())
+
+    def has(self, key: ResponseKey) -> bool:
+        return key in self.responses
+
+    def tickers(self):
+        return sorted({key[0] for key in self.responses})
+
+    def save(self, path: str) -> Path:
+        """Write the recording as a gzip-compressed pickle"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            payload = {"metadata": {**self.metadata, "tickers": self.tickers()}, "responses": dict(self.responses)}
+        with gzip.open(path, "wb", compresslevel=6) as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        logger.info(f"💾 Market data snapshot saved: {path} ({len(payload['responses'])} responses, {path.stat().st_size:,} bytes)")
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> 'MarketDataRecording':
+        with gzip.open(path, "rb") as f:
+            payload = pickle.load(f)
+        recording = cls()
+        recording.responses = payload["responses"]
+        recording.metadata = payload.get("metadata", {})
+        logger.info(f"📼 Market data snapshot loaded: {path} ({len(recording.responses)} responses)")
+        return recording
+
+
+class RecordingTicker:
+    """yf.Ticker proxy that stores every attribute and method result it returns"""
+
+    def __init__(self, symbol: str, recording: MarketDataRecording):
+        self._symbol = symbol
+        self._recording = recording
+        self._ticker = yf.Ticker(symbol)
+
+    def __getattr__(self, name: str):
+        value = getattr(self._ticker, name)
+        if not callable(value):
+            self._recording.record((self._symbol, name, None), value)
+            return value
+
+        def recorded_call(*args, **kwargs):
+            result = value(*args, **kwargs)
+            self._recording.record((self._symbol, name, _call_signature(args, kwargs)), result)
+            return result
+        return recorded_call
+
+
+class ReplayTicker:
+    """yf.Ticker stand-in that serves recorded responses after a simulated delay"""
+
+    def __init__(self, symbol: str, recording: MarketDataRecording, latency: float = 0.0):
+        self._symbol = symbol
+        self._recording = recording
+        self._latency = latency
+
+    def _wait(self):
+        if self._latency:
+            time.sleep(self._latency)
+
+    def __getattr__(self, name: str):
+        attribute_key = (self._symbol, name, None)
+        # Properties on yf.Ticker (info, financials, ...) are data, everything else a method
+        if self._recording.has(attribute_key) or not callable(getattr(yf.Ticker, name, None)):
+            self._wait()
+            return self._recording.lookup(attribute_key)
+
+        def replayed_call(*args, **kwargs):
+            self._wait()
+            key = (self._symbol, name, _call_signature(args, kwargs))
+            if self._recording.has(key):
+                return self._recording.lookup(key)
+            if name == "history" and "start" in kwargs:
+                return self._replay_incremental_history(kwargs)
+            return self._recording.lookup(key)  # raises LookupError
+        return replayed_call
+
+    def _replay_incremental_history(self, kwargs: Dict[str, Any]) -> pd.DataFrame:
+        """Serve a start-bounded history request from a recorded full series"""
+        interval = kwargs.get("interval", "1d")
+        for (symbol, name, signature), frame in self._recording.responses.items():
+            if symbol == self._symbol and name == "history" and f"('interval', '{interval}')" in (signature or "") \
+                    and "'start'" not in signature and isinstance(frame, pd.DataFrame) and not frame.empty:
+                start = pd.Timestamp(kwargs["start"])
+                if frame.index.tz is not None and start.tzinfo is None:
+                    start = start.tz_localize(frame.index.tz)
+                return frame.loc[frame.index >= start]
+        return pd.DataFrame()
+
+
+def recording_download(recording: MarketDataRecording) -> Callable:
+    """yf.download wrapper that records its result"""
+    def download(tickers, *args, **kwargs):
+        result = yf.download(tickers, *args, **kwargs)
+        recording.record(("__batch__", "download", _call_signature((tuple(tickers),) + args, kwargs)), result)
+        return result
+    return download
+
+
+def replay_download(recording: MarketDataRecording, latency: float = 0.0) -> Callable:
+    """yf.download stand-in serving a recorded batch"""
+    def download(tickers, *args, **kwargs):
+        if latency:
+            time.sleep(latency)
+        return recording.lookup(("__batch__", "download", _call_signature((tuple(tickers),) + args, kwargs)))
+    return download
+
+
+def enable_recording(service, path: str = DEFAULT_SNAPSHOT_PATH) -> MarketDataRecording:
+    """
+    Route the service's Yahoo calls through a recorder
+
+    The snapshot file is written at interpreter exit; call
+    ``recording.save(path)`` to write it earlier.
+    """
+    recording = MarketDataRecording()
+    service.set_data_source(
+        ticker_factory=lambda symbol: RecordingTicker(symbol, recording),
+        download=recording_download(recording)
+    )
+    atexit.register(recording.save, path)
+    logger.info(f"⏺️ Market data recording enabled -> {path}")
+    return recording
+
+
+def enable_replay(service, path: str = DEFAULT_SNAPSHOT_PATH, latency_ms: float = 0.0) -> MarketDataRecording:
+    """Serve the service's Yahoo calls from a snapshot file"""
+    recording = MarketDataRecording.load(path)
+    latency = max(0.0, latency_ms) / 1000
+    service.set_data_source(
+        ticker_factory=lambda symbol: ReplayTicker(symbol, recording, latency),
+        download=replay_download(recording, latency)
+    )
+    logger.info(f"▶️ Market data replay enabled from {path} ({latency_ms:.0f} ms simulated latency)")
+    return recording
+
+
+def configure_from_env(service) -> Optional[MarketDataRecording]:
+    """Apply ROBECO_MARKET_DATA_MODE to the service (no-op in live mode)"""
+    mode = os.getenv("ROBECO_MARKET_DATA_MODE", "live").lower()
+    path = os.getenv("ROBECO_MARKET_DATA_SNAPSHOT", DEFAULT_SNAPSHOT_PATH)
+
+    if mode == "record":
+        return enable_recording(service, path)
+    if mode == "replay":
+        return enable_replay(service, path, float(os.getenv("ROBECO_REPLAY_LATENCY_MS", "0")))
+    if mode != "live":
+        logger.warning(f"⚠️ Unknown ROBECO_MARKET_DATA_MODE '{mode}', using live Yahoo data")
+    return None
@@ -0,0 +1,605 @@
+"""
+Shared market data service for Robeco AI System
+
+Keeps one canonical snapshot per ticker that the streaming server, the
+YFinanceFetcher and the report generators all read from, so each Yahoo
+endpoint is hit once per ticker instead of once per consumer.
+
+Environment:
+    ROBECO_WATCHLIST            comma-separated tickers warmed at server startup
+    ROBECO_WATCHLIST_REFRESH    seconds between watchlist re-warms (default 0: startup only)
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Tuple, Callable
+
+import yfinance as yf
+import pandas as pd
+
+from ..core.models import PriceSeries, StatementTable, deep_sizeof
+from ..core.utils import parse_timeframe
+
+logger = logging.getLogger(__name__)
+
+# Price history is fetched once at this depth; shorter windows are sliced from it
+CANONICAL_HISTORY_PERIOD = "5y"
+
+# Exchange suffixes tried for bare international tickers
+INTERNATIONAL_SUFFIXES = [".SI", ".HK", ".TO", ".L"]
+
+
+class PriceHistoryStore:
+    """
+    Long-lived price series cache keyed by ticker/period/interval
+
+    Outlives individual snapshots: once a series is cached, later refreshes
+    only request bars from the last cached timestamp onwards and merge them
+    in place. A dividend or split in the new bars invalidates the adjusted
+    history, so those trigger a full re-download instead. Series are held
+    as compact PriceSeries arrays and shared with the snapshots that read
+    them.
+    """
+
+    def __init__(self, max_series: int = 500):
+        self.max_series = max_series
+        self._series: "OrderedDict[Tuple[str, str, str], PriceSeries]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"full_fetches": 0, "incremental_fetches": 0, "rows_fetched": 0}
+
+    def get(self, ticker_obj, symbol: str, period: str, interval: str) -> PriceSeries:
+        """Return the series, refreshing only the bars after the last cached one"""
+        key = (symbol, period, interval)
+        with self._lock:
+            cached = self._series.get(key)
+
+        if cached is None or not len(cached):
+            frame = ticker_obj.history(period=period, interval=interval)
+            return self._record(key, frame, full=True, rows=len(frame))
+
+        cached_frame = cached.to_dataframe()
+        last_timestamp = cached_frame.index[-1]
+        new_bars = ticker_obj.history(start=last_timestamp, interval=interval)
+
+        if new_bars is None or new_bars.empty:
+            return cached
+
+        if _has_corporate_actions(new_bars.loc[new_bars.index > last_timestamp]):
+            logger.info(f"🔄 {symbol} {interval}: corporate action in new bars, re-downloading full history")
+            frame = ticker_obj.history(period=period, interval=interval)
+            return self._record(key, frame, full=True, rows=len(frame))
+
+        # The last cached bar may have been partial; the fresh copy replaces it
+        merged = pd.concat([cached_frame.loc[cached_frame.index < new_bars.index[0]], new_bars])
+        merged = merged[~merged.index.duplicated(keep="last")]
+        merged = _trim_to_period(merged, period)
+
+        logger.info(f"📈 {symbol} {interval}: merged {len(new_bars)} new bars into {len(cached)} cached")
+        return self._record(key, merged, full=False, rows=len(new_bars))
+
+    def put(self, symbol: str, period: str, interval: str, frame: pd.DataFrame) -> PriceSeries:
+        """Store a series fetched elsewhere (e.g. a batch download)"""
+        return self._record((symbol, period, interval), frame, full=True, rows=0)
+
+    def _record(self, key: Tuple[str, str, str], frame: pd.DataFrame, full: bool, rows: int) -> PriceSeries:
+        series = PriceSeries.from_dataframe(frame, interval=key[2], period=key[1])
+        with self._lock:
+            if len(series):
+                self._series[key] = series
+                self._series.move_to_end(key)
+                while len(self._series) > self.max_series:
+                    self._series.popitem(last=False)
+            if rows:
+                self.stats["full_fetches" if full else "incremental_fetches"] += 1
+                self.stats["rows_fetched"] += rows
+        return series
+
+    def clear(self, symbol: Optional[str] = None):
+        """Drop cached series for one ticker, or all of them"""
+        with self._lock:
+            if symbol is None:
+                self._series.clear()
+            else:
+                for key in [k for k in self._series if k[0] == symbol]:
+                    del self._series[key]
+
+    def nbytes(self) -> int:
+        with self._lock:
+            return sum(series.nbytes for series in self._series.values())
+
+
+class TickerSnapshot:
+    """
+    Canonical, lazily populated Yahoo data for a single ticker
+
+    Attribute access mirrors ``yf.Ticker`` (``info``, ``financials``,
+    ``balance_sheet``, ...) so existing call sites can use a snapshot in
+    place of a ticker object. Each attribute and each history/option chain
+    request is fetched at most once for the lifetime of the snapshot.
+
+    Financial statements and price history are stored in their compact
+    form (StatementTable / PriceSeries arrays) as soon as they arrive; the
+    DataFrames callers see are rebuilt from those arrays on access.
+    """
+
+    CACHED_ATTRIBUTES = frozenset({
+        "info",
+        "financials", "quarterly_financials",
+        "balance_sheet", "quarterly_balance_sheet",
+        "cashflow", "quarterly_cashflow",
+        "institutional_holders", "major_holders", "mutualfund_holders",
+        "insider_purchases", "insider_roster_holders", "insider_transactions",
+        "options", "recommendations", "analyst_price_targets",
+        "calendar", "earnings_dates", "sustainability",
+        "dividends", "news",
+    })
+
+    STATEMENT_ATTRIBUTES = frozenset({
+        "financials", "quarterly_financials",
+        "balance_sheet", "quarterly_balance_sheet",
+        "cashflow", "quarterly_cashflow",
+    })
+
+    def __init__(self, symbol: str, history_store: Optional[PriceHistoryStore] = None,
+                 ticker_factory: Callable[[str], Any] = yf.Ticker):
+        self.symbol = symbol
+        self.history_store = history_store
+        self.created_at = datetime.now()
+        self.fetch_counts: Dict[str, int] = {}
+        self._ticker = ticker_factory(symbol)
+        self._values: Dict[Any, Any] = {}
+        self._locks: Dict[Any, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def __getattr__(self, name: str):
+        # Only called for names not found normally, i.e. the yfinance data attributes
+        if name in TickerSnapshot.CACHED_ATTRIBUTES:
+            return self._load(name, lambda: getattr(self._ticker, name))
+        raise AttributeError(f"{type(self).__name__!s} has no attribute {name!r}")
+
+    def _load(self, key: Any, loader):
+        """Fetch a value once; concurrent callers for the same key wait on one request"""
+        if key in self._values:
+            return _expand(self._values[key])
+
+        with self._guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+
+        with lock:
+            if key not in self._values:
+                value = loader()
+                self._values[key] = self._compress(key, value)
+                label = key if isinstance(key, str) else ":".join(str(part) for part in key)
+                self.fetch_counts[label] = self.fetch_counts.get(label, 0) + 1
+            return _expand(self._values[key])
+
+    @staticmethod
+    def _compress(key: Any, value: Any) -> Any:
+        """Compact form of a fetched value, when it has one"""
+        if not isinstance(value, pd.DataFrame) or value.empty:
+            return value
+        if key in TickerSnapshot.STATEMENT_ATTRIBUTES:
+            return StatementTable.from_dataframe(key, value)
+        if isinstance(key, tuple) and key[0] == "history":
+            return PriceSeries.from_dataframe(value, interval=key[2], period=key[1])
+        return value
+
+    def history(self, period: Optional[str] = None, interval: str = "1d",
+                start: Optional[Any] = None, end: Optional[Any] = None) -> pd.DataFrame:
+        """
+        Price history for the given interval
+
+        Date-bounded requests are served by slicing the canonical
+        ``CANONICAL_HISTORY_PERIOD`` series rather than issuing a new request.
+        """
+        if start is not None or end is not None:
+            frame = self.history(CANONICAL_HISTORY_PERIOD, interval)
+            return _slice_history(frame, start, end)
+
+        period = period or CANONICAL_HISTORY_PERIOD
+        if self.history_store is not None:
+            loader = lambda: self.history_store.get(self._ticker, self.symbol, period, interval)
+        else:
+            loader = lambda: self._ticker.history(period=period, interval=interval)
+        return self._load(("history", period, interval), loader)
+
+    def prime_history(self, period: str, interval: str, frame: pd.DataFrame):
+        """Seed a history entry fetched elsewhere (e.g. a batch download)"""
+        key = ("history", period, interval)
+        if self.history_store is not None:
+            series = self.history_store.put(self.symbol, period, interval, frame)
+        else:
+            series = PriceSeries.from_dataframe(frame, interval=interval, period=period)
+        with self._guard:
+            self._values[key] = series
+
+    def option_chain(self, date: Optional[str] = None):
+        """Option chain for one expiration date"""
+        return self._load(("option_chain", date), lambda: self._ticker.option_chain(date))
+
+    async def fetch(self, name: str):
+        """Async accessor for a cached attribute; runs the Yahoo call off the event loop"""
+        return await asyncio.to_thread(lambda: getattr(self, name))
+
+    async def fetch_history(self, period: Optional[str] = None, interval: str = "1d") -> pd.DataFrame:
+        """Async accessor for price history"""
+        return await asyncio.to_thread(lambda: self.history(period, interval))
+
+    def memory_report(self) -> Dict[str, int]:
+        """Approximate bytes this snapshot actually holds, per component"""
+        values = dict(self._values)
+        report = {"prices": 0, "statements": 0, "info": 0, "other": 0}
+        for key, value in values.items():
+            if isinstance(value, PriceSeries):
+                report["prices"] += value.nbytes
+            elif isinstance(value, StatementTable):
+                report["statements"] += value.nbytes
+            elif key == "info":
+                report["info"] += deep_sizeof(value)
+            else:
+                report["other"] += deep_sizeof(value)
+        report["total"] = sum(report.values())
+        return report
+
+    def is_valid(self) -> bool:
+        """Whether Yahoo returned a usable quote for this symbol"""
+        try:
+            info = self.info
+        except Exception as e:
+            logger.info(f"❌ Failed format {self.symbol}: {str(e)[:100]}")
+            return False
+        return bool(info) and len(info) > 10 and info.get("regularMarketPrice") is not None
+
+
+class MarketDataService:
+    """
+    Per-ticker snapshot cache shared by every data consumer
+
+    Ad-hoc tickers live in an LRU of ``max_snapshots`` entries that expire
+    after ``cache_duration`` seconds. Watchlist tickers are pinned outside
+    the LRU: they are never evicted and expire after ``watchlist_ttl``,
+    which follows the warm-up interval, so a scheduled re-warm replaces
+    them before they go stale.
+    """
+
+    def __init__(self, cache_duration: int = 300, max_snapshots: int = 100):
+        self.cache_duration = cache_duration
+        self.max_snapshots = max_snapshots
+        self.watchlist_ttl: float = cache_duration
+        self._snapshots: "OrderedDict[str, TickerSnapshot]" = OrderedDict()
+        self._watchlist: Dict[str, TickerSnapshot] = {}
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self._lock = threading.Lock()
+        self.history_store = PriceHistoryStore()
+        # Yahoo access points; swapped by the offline recorder/replayer
+        self.ticker_factory: Callable[[str], Any] = yf.Ticker
+        self.download: Callable[..., pd.DataFrame] = yf.download
+
+    def get_snapshot(self, ticker: str) -> TickerSnapshot:
+        """Return the live snapshot for ``ticker``, creating a fresh one when expired"""
+        symbol = ticker.upper().strip()
+
+        with self._lock:
+            if symbol in self._watchlist:
+                snapshot = self._watchlist[symbol]
+                if (datetime.now() - snapshot.created_at).total_seconds() < self.watchlist_ttl:
+                    self.stats["hits"] += 1
+                    return snapshot
+                self.stats["misses"] += 1
+                snapshot = self._watchlist[symbol] = TickerSnapshot(symbol, self.history_store, self.ticker_factory)
+                return snapshot
+
+            snapshot = self._snapshots.get(symbol)
+            if snapshot is not None:
+                age = (datetime.now() - snapshot.created_at).total_seconds()
+                if age < self.cache_duration:
+                    self._snapshots.move_to_end(symbol)
+                    self.stats["hits"] += 1
+                    return snapshot
+
+            self.stats["misses"] += 1
+            snapshot = TickerSnapshot(symbol, self.history_store, self.ticker_factory)
+            self._snapshots[symbol] = snapshot
+            self._snapshots.move_to_end(symbol)
+
+            while len(self._snapshots) > self.max_snapshots:
+                self._snapshots.popitem(last=False)
+                self.stats["evictions"] += 1
+
+            return snapshot
+
+    def resolve_snapshot(self, ticker: str) -> Tuple[Optional[TickerSnapshot], List[str]]:
+        """
+        Find the first exchange format of ``ticker`` that Yahoo recognises
+
+        Returns:
+            (snapshot or None, list of formats tried)
+        """
+        candidates = candidate_symbols(ticker)
+        logger.info(f"📊 Trying ticker formats: {candidates}")
+
+        for symbol in candidates:
+            logger.info(f"🎯 Testing ticker format: {symbol}")
+            snapshot = self.get_snapshot(symbol)
+            if snapshot.is_valid():
+                logger.info(f"✅ Success with ticker format: {symbol}")
+                return snapshot, candidates
+            logger.info(f"⚠️ No data for format: {symbol}")
+
+        return None, candidates
+
+    async def aresolve_snapshot(self, ticker: str) -> Tuple[Optional[TickerSnapshot], List[str]]:
+        """Async variant of resolve_snapshot that keeps Yahoo calls off the event loop"""
+        return await asyncio.to_thread(self.resolve_snapshot, ticker)
+
+    async def warm_watchlist(self, tickers: List[str], period: str = CANONICAL_HISTORY_PERIOD,
+                             interval: str = "1d", fundamentals: Tuple[str, ...] = ("info",),
+                             max_concurrency: int = 8, ttl: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Bulk-load a watchlist into the snapshot cache
+
+        Price history for every ticker comes from a single threaded
+        ``yf.download`` call; fundamentals are then fetched per ticker with
+        at most ``max_concurrency`` requests in flight. The warm-up builds
+        fresh snapshots and, once loaded, pins them as the new watchlist in
+        place of the previous one (tickers that failed are not pinned).
+
+        Args:
+            tickers: Yahoo symbols to warm
+            period: History period to download
+            interval: History interval to download
+            fundamentals: Snapshot attributes to prefetch per ticker
+            max_concurrency: Maximum concurrent fundamentals requests
+            ttl: Seconds the pinned snapshots stay valid (default ``cache_duration``)
+
+        Returns:
+            Summary with per-ticker failures and throughput
+        """
+        symbols = list(dict.fromkeys(t.upper().strip() for t in tickers if t and t.strip()))
+        if not symbols:
+            return {"tickers": 0, "succeeded": [], "failed": {}, "elapsed_seconds": 0.0, "tickers_per_second": 0.0}
+
+        # Loaded outside the cache, so readers keep the previous round's snapshots meanwhile
+        snapshots = {symbol: TickerSnapshot(symbol, self.history_store, self.ticker_factory) for symbol in symbols}
+        summary = await self._warm_symbols(snapshots, period, interval, fundamentals, max_concurrency)
+
+        with self._lock:
+            self.watchlist_ttl = ttl if ttl else self.cache_duration
+            self._watchlist = {symbol: snapshots[symbol] for symbol in summary["succeeded"]}
+            for symbol in self._watchlist:
+                self._snapshots.pop(symbol, None)
+        return summary
+
+    async def _warm_symbols(self, snapshots: Dict[str, TickerSnapshot], period: str, interval: str,
+                            fundamentals: Tuple[str, ...], max_concurrency: int) -> Dict[str, Any]:
+        symbols = list(snapshots)
+        started = datetime.now()
+        failed: Dict[str, str] = {}
+        logger.info(f"📦 Warming watchlist: {len(symbols)} tickers ({period}/{interval})")
+
+        # 1. Prices: one threaded batch request for the whole list
+        try:
+            prices = await asyncio.to_thread(
+                lambda: self.download(
+                    symbols, period=period, interval=interval, group_by="ticker",
+                    threads=True, actions=True, auto_adjust=True, ignore_tz=False, progress=False
+                )
+            )
+        except Exception as e:
+            logger.error(f"❌ Batch price download failed: {e}")
+            prices = None
+
+        for symbol in symbols:
+            frame = _extract_batch_frame(prices, symbol, len(symbols))
+            if frame is None or frame.empty:
+                failed[symbol] = "no price history"
+                continue
+            snapshots[symbol].prime_history(period, interval, frame)
+
+        logger.info(f"   📈 Batch prices cached for {len(symbols) - len(failed)}/{len(symbols)} tickers")
+
+        # 2. Fundamentals: bounded per-ticker concurrency
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _warm_fundamentals(symbol: str):
+            snapshot = snapshots[symbol]
+            async with semaphore:
+                for name in fundamentals:
+                    try:
+                        await snapshot.fetch(name)
+                    except Exception as e:
+                        failed.setdefault(symbol, f"{name}: {str(e)[:100]}")
+
+        await asyncio.gather(*(_warm_fundamentals(symbol) for symbol in symbols if symbol not in failed))
+
+        elapsed = (datetime.now() - started).total_seconds()
+        rate = len(symbols) / elapsed if elapsed > 0 else float(len(symbols))
+        succeeded = [symbol for symbol in symbols if symbol not in failed]
+
+        logger.info(f"✅ Watchlist warmed: {len(succeeded)}/{len(symbols)} tickers in {elapsed:.1f}s ({rate:.2f} tickers/s)")
+        if failed:
+            logger.warning(f"⚠️ Watchlist failures: {failed}")
+
+        return {
+            "tickers": len(symbols),
+            "succeeded": succeeded,
+            "failed": failed,
+            "elapsed_seconds": round(elapsed, 2),
+            "tickers_per_second": round(rate, 2),
+        }
+
+    async def run_watchlist_schedule(self, tickers: List[str], refresh_seconds: float = 0.0):
+        """
+        Warm ``tickers`` now and, when ``refresh_seconds`` is positive, again on that interval
+
+        Meant to run as a background task for the lifetime of the server;
+        a failed round is logged and retried on the next interval. Pinned
+        snapshots outlive one interval by ``cache_duration``, so they stay
+        valid while the next round is loading.
+        """
+        ttl = refresh_seconds + self.cache_duration if refresh_seconds > 0 else None
+        while True:
+            try:
+                await self.warm_watchlist(tickers, ttl=ttl)
+            except Exception as e:
+                logger.error(f"❌ Watchlist warm-up failed: {e}")
+            if refresh_seconds <= 0:
+                return
+            await asyncio.sleep(refresh_seconds)
+
+    def set_data_source(self, ticker_factory: Callable[[str], Any], download: Callable[..., pd.DataFrame]):
+        """Swap the Yahoo access points (e.g. for record/replay) and drop everything cached"""
+        self.ticker_factory = ticker_factory
+        self.download = download
+        self.invalidate(include_history=True)
+
+    def invalidate(self, ticker: Optional[str] = None, include_history: bool = False):
+        """Drop one ticker's snapshot, or all of them"""
+        symbol = ticker.upper().strip() if ticker else None
+        with self._lock:
+            if symbol is None:
+                self._snapshots.clear()
+                self._watchlist.clear()
+            else:
+                self._snapshots.pop(symbol, None)
+                self._watchlist.pop(symbol, None)
+        if include_history:
+            self.history_store.clear(symbol)
+
+    def memory_report(self) -> Dict[str, Dict[str, int]]:
+        """Per-ticker bytes held by each cached snapshot (price arrays are shared with the history store)"""
+        with self._lock:
+            snapshots = [*self._watchlist.values(), *self._snapshots.values()]
+        return {s.symbol: s.memory_report() for s in snapshots}
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Snapshot cache statistics including per-endpoint fetch counts"""
+        with self._lock:
+            snapshots = [*self._watchlist.values(), *self._snapshots.values()]
+            watchlist = len(self._watchlist)
+
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            "cached_tickers": len(snapshots),
+            "watchlist_tickers": watchlist,
+            "cache_duration": self.cache_duration,
+            "watchlist_ttl": self.watchlist_ttl,
+            **self.stats,
+            "hit_rate": round(self.stats["hits"] / lookups, 3) if lookups else 0.0,
+            "fetch_counts": {s.symbol: dict(s.fetch_counts) for s in snapshots},
+            "price_history": {**self.history_store.stats, "bytes": self.history_store.nbytes()},
+        }
+
+
+def candidate_symbols(ticker: str) -> List[str]:
+    """Yahoo symbols to try for a user-entered ticker, most likely first"""
+    ticker = ticker.upper().strip()
+
+    # Singapore Exchange (SGX) formatting
+    if "SGX:" in ticker:
+        symbol = ticker.replace("SGX:", "").strip()
+        return [f"{symbol}.SI", symbol, f"{symbol}.SG"]
+
+    # Hong Kong Exchange (HKG) formatting
+    if "HKG:" in ticker:
+        symbol = ticker.replace("HKG:", "").strip()
+        padded = f"0{symbol}.HK" if len(symbol) < 4 else f"{symbol}.HK"
+        return list(dict.fromkeys([f"{symbol}.HK", padded, symbol]))
+
+    # Other exchange formats
+    if ":" in ticker:
+        exchange, symbol = ticker.split(":", 1)
+        symbol = symbol.strip()
+        if exchange in ("NYSE", "NASDAQ"):
+            return [symbol]
+        return [f"{symbol}.{exchange}", symbol]
+
+    candidates = [ticker]
+    if "." not in ticker:
+        candidates.extend(f"{ticker}{suffix}" for suffix in INTERNATIONAL_SUFFIXES)
+    return candidates
+
+
+def watchlist_from_env() -> Tuple[List[str], float]:
+    """(tickers, refresh seconds) configured through ROBECO_WATCHLIST / ROBECO_WATCHLIST_REFRESH"""
+    tickers = [t.strip() for t in os.getenv("ROBECO_WATCHLIST", "").split(",") if t.strip()]
+    return tickers, float(os.getenv("ROBECO_WATCHLIST_REFRESH", "0"))
+
+
+def _extract_batch_frame(prices: Optional[pd.DataFrame], symbol: str, batch_size: int) -> Optional[pd.DataFrame]:
+    """Pull one ticker's OHLCV frame out of a ``yf.download(group_by="ticker")`` result"""
+    if prices is None or prices.empty:
+        return None
+
+    if isinstance(prices.columns, pd.MultiIndex):
+        if symbol not in prices.columns.get_level_values(0):
+            return None
+        frame = prices[symbol]
+    elif batch_size == 1:
+        frame = prices
+    else:
+        return None
+
+    # Rows where Yahoo had no bar for this ticker come back all-NaN
+    frame = frame.dropna(how="all")
+    frame.columns.name = None
+    return frame
+
+
+def _expand(value: Any) -> Any:
+    """DataFrame view of a compact stored value; anything else as is"""
+    if isinstance(value, (StatementTable, PriceSeries)):
+        return value.to_dataframe()
+    return value
+
+
+def _has_corporate_actions(frame: pd.DataFrame) -> bool:
+    """Whether any bar carries a dividend or split (which rewrites adjusted history)"""
+    for column in ("Dividends", "Stock Splits"):
+        if column in frame.columns and (frame[column].fillna(0) != 0).any():
+            return True
+    return False
+
+
+def _trim_to_period(frame: pd.DataFrame, period: str) -> pd.DataFrame:
+    """Drop bars older than the requested period so merged series don't grow unbounded"""
+    try:
+        window = parse_timeframe(period.replace("mo", "m"))
+    except ValueError:
+        return frame  # 'max', 'ytd' etc.
+    return frame.loc[frame.index >= frame.index[-1] - window]
+
+
+def _slice_history(frame: pd.DataFrame, start: Optional[Any], end: Optional[Any]) -> pd.DataFrame:
+    """Slice a price history frame by date, matching the index timezone"""
+    if frame is None or frame.empty:
+        return frame
+
+    tz = getattr(frame.index, "tz", None)
+
+    def _bound(value):
+        stamp = pd.Timestamp(value)
+        if tz is not None and stamp.tzinfo is None:
+            return stamp.tz_localize(tz)
+        if tz is None and stamp.tzinfo is not None:
+            return stamp.tz_localize(None)
+        return stamp
+
+    mask = pd.Series(True, index=frame.index)
+    if start is not None:
+        mask &= frame.index >= _bound(start)
+    if end is not None:
+        mask &= frame.index <= _bound(end)
+    return frame[mask.values]
+
+
+# Global instance shared by the server, fetchers and report generators
+market_data_service = MarketDataService()
+
+# Offline record/replay when ROBECO_MARKET_DATA_MODE is set
+from .market_data_recorder import configure_from_env
+configure_from_env(market_data_service)
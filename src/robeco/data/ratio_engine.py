@@ -0,0 +1,200 @@
+"""
+Vectorized financial ratio engine
+
+Aligns income statement, balance sheet and cash flow periods into one
+frame and computes the full ratio matrix for every period at once, so
+agents receive precomputed ratios instead of deriving them from raw
+statements.
+"""
+
+import logging
+from typing import Dict, Any, List
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# yfinance line item names, most specific first
+LINE_ITEMS: Dict[str, List[str]] = {
+    'revenue': ['Total Revenue', 'Operating Revenue'],
+    'cost_of_revenue': ['Cost Of Revenue', 'Reconciled Cost Of Revenue'],
+    'gross_profit': ['Gross Profit'],
+    'operating_income': ['Operating Income', 'Total Operating Income As Reported'],
+    'ebit': ['EBIT', 'Operating Income'],
+    'ebitda': ['EBITDA', 'Normalized EBITDA'],
+    'interest_expense': ['Interest Expense', 'Interest Expense Non Operating'],
+    'net_income': ['Net Income', 'Net Income Common Stockholders', 'Net Income From Continuing Operations'],
+    'total_assets': ['Total Assets'],
+    'total_equity': ['Stockholders Equity', 'Common Stock Equity', 'Total Equity Gross Minority Interest'],
+    'total_debt': ['Total Debt'],
+    'net_debt': ['Net Debt'],
+    'current_assets': ['Current Assets'],
+    'current_liabilities': ['Current Liabilities'],
+    'inventory': ['Inventory'],
+    'receivables': ['Accounts Receivable', 'Receivables'],
+    'cash': ['Cash And Cash Equivalents', 'Cash Cash Equivalents And Short Term Investments'],
+    'operating_cash_flow': ['Operating Cash Flow', 'Cash Flow From Continuing Operating Activities'],
+    'free_cash_flow': ['Free Cash Flow'],
+    'capex': ['Capital Expenditure'],
+}
+
+STATEMENT_TYPES = ['financials', 'balance_sheet', 'cashflow']
+
+
+def build_aligned_frame(financial_statements: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Align the three statements on period end date
+
+    Args:
+        financial_statements: ``result['financial_statements']`` from YFinanceFetcher,
+            each entry holding ``{'data': {date_str: {line_item: value}}}``
+
+    Returns:
+        DataFrame indexed by period (ascending) with one column per line item
+    """
+    frames = []
+    for statement_type in STATEMENT_TYPES:
+        statement = financial_statements.get(statement_type) or {}
+        data = statement.get('data') if isinstance(statement, dict) else None
+        if data:
+            # Columns are periods in the source dict; transpose to rows
+            frames.append(pd.DataFrame(data, dtype=float).T)
+
+    if not frames:
+        return pd.DataFrame()
+
+    aligned = pd.concat(frames, axis=1, join='outer')
+    # Line items repeated across statements (e.g. Net Income) keep the first occurrence
+    aligned = aligned.loc[:, ~aligned.columns.duplicated()]
+    return aligned.sort_index()
+
+
+def _line(frame: pd.DataFrame, name: str) -> pd.Series:
+    """First available yfinance line item for a canonical name, NaN if missing"""
+    for candidate in LINE_ITEMS[name]:
+        if candidate in frame.columns:
+            return frame[candidate]
+    return pd.Series(np.nan, index=frame.index)
+
+
+def _average(series: pd.Series) -> pd.Series:
+    """Average of opening and closing balance; falls back to closing for the first period"""
+    return series.rolling(2, min_periods=1).mean()
+
+
+def _divide(numerator: pd.Series, denominator: pd.Series) -> pd.Series:
+    """Element-wise division with zero denominators mapped to NaN"""
+    return numerator / denominator.replace(0, np.nan)
+
+
+def calculate_ratio_matrix(financial_statements: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Compute every ratio for every period in one vectorized pass
+
+    Returns:
+        DataFrame indexed by period with a (category, ratio) MultiIndex on the columns
+    """
+    frame = build_aligned_frame(financial_statements)
+    if frame.empty:
+        return pd.DataFrame()
+
+    revenue = _line(frame, 'revenue')
+    cost_of_revenue = _line(frame, 'cost_of_revenue')
+    gross_profit = _line(frame, 'gross_profit').fillna(revenue - cost_of_revenue)
+    net_income = _line(frame, 'net_income')
+    total_assets = _line(frame, 'total_assets')
+    total_equity = _line(frame, 'total_equity')
+    total_debt = _line(frame, 'total_debt')
+    cash = _line(frame, 'cash')
+    net_debt = _line(frame, 'net_debt').fillna(total_debt - cash)
+    current_assets = _line(frame, 'current_assets')
+    current_liabilities = _line(frame, 'current_liabilities')
+    inventory = _line(frame, 'inventory')
+    operating_cash_flow = _line(frame, 'operating_cash_flow')
+    capex = _line(frame, 'capex')
+    free_cash_flow = _line(frame, 'free_cash_flow').fillna(operating_cash_flow + capex)
+
+    matrix = {
+        ('profitability', 'gross_margin'): _divide(gross_profit, revenue),
+        ('profitability', 'operating_margin'): _divide(_line(frame, 'operating_income'), revenue),
+        ('profitability', 'ebitda_margin'): _divide(_line(frame, 'ebitda'), revenue),
+        ('profitability', 'net_margin'): _divide(net_income, revenue),
+        ('profitability', 'roe'): _divide(net_income, _average(total_equity)),
+        ('profitability', 'roa'): _divide(net_income, _average(total_assets)),
+        ('liquidity', 'current_ratio'): _divide(current_assets, current_liabilities),
+        ('liquidity', 'quick_ratio'): _divide(current_assets - inventory.fillna(0), current_liabilities),
+        ('liquidity', 'cash_ratio'): _divide(cash, current_liabilities),
+        ('leverage', 'debt_to_equity'): _divide(total_debt, total_equity),
+        ('leverage', 'debt_to_assets'): _divide(total_debt, total_assets),
+        ('leverage', 'interest_coverage'): _divide(_line(frame, 'ebit'), _line(frame, 'interest_expense').abs()),
+        ('leverage', 'net_debt_to_ebitda'): _divide(net_debt, _line(frame, 'ebitda')),
+        ('efficiency', 'asset_turnover'): _divide(revenue, _average(total_assets)),
+        ('efficiency', 'inventory_turnover'): _divide(cost_of_revenue, _average(inventory)),
+        ('efficiency', 'receivables_turnover'): _divide(revenue, _average(_line(frame, 'receivables'))),
+        ('cash_flow', 'fcf_margin'): _divide(free_cash_flow, revenue),
+        ('cash_flow', 'cash_conversion'): _divide(operating_cash_flow, net_income),
+        ('cash_flow', 'capex_to_revenue'): _divide(capex.abs(), revenue),
+        ('growth', 'revenue_growth'): revenue.pct_change(fill_method=None),
+        ('growth', 'net_income_growth'): _divide(net_income - net_income.shift(1), net_income.shift(1).abs()),
+    }
+
+    ratios = pd.DataFrame(matrix, index=frame.index)
+    ratios.columns = pd.MultiIndex.from_tuples(ratios.columns)
+    return ratios.replace([np.inf, -np.inf], np.nan)
+
+
+# Display unit per ratio, matching the 'value'/'unit' shape used in smart_ratios
+RATIO_UNITS: Dict[str, str] = {
+    'gross_margin': '%', 'operating_margin': '%', 'ebitda_margin': '%', 'net_margin': '%',
+    'roe': '%', 'roa': '%',
+    'current_ratio': 'x', 'quick_ratio': 'x', 'cash_ratio': 'x',
+    'debt_to_equity': 'x', 'debt_to_assets': 'x', 'interest_coverage': 'x', 'net_debt_to_ebitda': 'x',
+    'asset_turnover': 'x', 'inventory_turnover': 'x', 'receivables_turnover': 'x',
+    'fcf_margin': '%', 'cash_conversion': 'x', 'capex_to_revenue': '%',
+    'revenue_growth': '%', 'net_income_growth': '%',
+}
+
+
+def ratio_matrix_to_time_series(ratios: pd.DataFrame) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Convert the ratio matrix to ``{date_str: {category: {ratio: {'value', 'unit'}}}}``
+
+    Percent-unit values stay as fractions, consistent with the yfinance ``info`` fields.
+    """
+    time_series: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    if ratios.empty:
+        return time_series
+
+    rounded = ratios.round(4).astype(object).where(ratios.notna(), None)
+    for period, row in rounded.iterrows():
+        date_str = period if isinstance(period, str) else pd.Timestamp(period).strftime('%Y-%m-%d')
+        period_ratios: Dict[str, Dict[str, Any]] = {}
+        for (category, name), value in row.items():
+            period_ratios.setdefault(category, {})[name] = {'value': value, 'unit': RATIO_UNITS.get(name, 'x')}
+        time_series[date_str] = period_ratios
+
+    return time_series
+
+
+def latest_ratios(ratios: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+    """
+    Most recent non-null value of each ratio and the period it comes from
+
+    Returns ``{ratio: {'value', 'period'}}``; a ratio that is null in the
+    latest period keeps its older value but reports that older period, so
+    stale figures are never passed off as current. Both are None when the
+    ratio was never computable.
+    """
+    latest: Dict[str, Dict[str, Any]] = {}
+    for (_, name), series in ratios.items():
+        reported = series.dropna()
+        if reported.empty:
+            latest[name] = {'value': None, 'period': None}
+            continue
+        period = reported.index[-1]
+        latest[name] = {
+            'value': round(float(reported.iloc[-1]), 4),
+            'period': period if isinstance(period, str) else pd.Timestamp(period).strftime('%Y-%m-%d'),
+        }
+    return latest
@@ -16,9 +16,19 @@ import numpy as np
 
 from ..core.models import FinancialData
 from ..core.utils import retry_async, time_execution, calculate_quality_score
+from .market_data_service import market_data_service
+from .ratio_engine import calculate_ratio_matrix, ratio_matrix_to_time_series, latest_ratios
 
 logger = logging.getLogger(__name__)
 
+# Options chain fetching limits and the per-contract fields kept (columnar)
+MAX_OPTION_EXPIRATIONS = 5
+OPTIONS_CONCURRENCY = 3
+OPTION_CHAIN_FIELDS = [
+    'contractSymbol', 'strike', 'lastPrice', 'bid', 'ask', 'volume',
+    'openInterest', 'impliedVolatility', 'inTheMoney'
+]
+
 
 class YFinanceFetcher:
     """Comprehensive yfinance data fetcher with caching and error handling"""
@@ -56,8 +66,9 @@ class YFinanceFetcher:
             "fetch_errors": []
         }
         
-        # Create ticker object
-        ticker_obj = yf.Ticker(ticker)
+        # Shared snapshot: Yahoo responses already fetched by the server or
+        # report generator for this ticker are reused instead of re-requested
+        ticker_obj = market_data_service.get_snapshot(ticker)
         
         # Fetch MAXIMUM data sources in parallel for hedge fund analysis
         fetch_tasks = [
@@ -83,6 +94,13 @@ class YFinanceFetcher:
         try:
             smart_ratios = self._calculate_comprehensive_smart_ratios(result)
             result["smart_ratios"] = smart_ratios
+            
+            # Backfill statement-derived key metrics
+            key_metrics = result.get("key_metrics")
+            current = smart_ratios.get("current_ratios", {})
+            if key_metrics is not None and current:
+                key_metrics["interest_coverage"] = current['leverage']['interest_coverage']['value']
+                key_metrics["asset_turnover"] = current['efficiency']['asset_turnover']['value']
             result["data_sources"].append("smart_ratios")
         except Exception as ratio_error:
             logger.warning(f"   ⚠️ Smart ratios calculation failed: {ratio_error}")
@@ -165,9 +183,9 @@ class YFinanceFetcher:
                 "earnings_growth": self._safe_number(info.get('earningsGrowth')),
                 "free_cashflow": self._safe_number(info.get('freeCashflow')),
                 "working_capital": self._safe_number(info.get('totalCash', 0) - info.get('totalDebt', 0)),
-                "interest_coverage": None,  # Would need calculation from financial statements
-                "asset_turnover": None,    # Would need calculation from financial statements
-                "fcf_yield": None          # Would need calculation
+                "interest_coverage": None,  # Filled from the ratio engine once statements are in
+                "asset_turnover": None,    # Filled from the ratio engine once statements are in
+                "fcf_yield": self._safe_fcf_yield(info)
             }
             
             # Store structured data
@@ -297,6 +315,14 @@ class YFinanceFetcher:
             logger.error(f"Error fetching comprehensive financial statements: {e}")
             result["fetch_errors"].append(f"financial_statements: {str(e)}")
     
+    def _safe_fcf_yield(self, info: Dict[str, Any]) -> Optional[float]:
+        """Free cash flow yield (FCF / market cap) as a fraction"""
+        fcf = self._safe_number(info.get('freeCashflow'))
+        market_cap = self._safe_number(info.get('marketCap'))
+        if fcf is None or not market_cap:
+            return None
+        return round(fcf / market_cap, 4)
+    
     def _safe_number(self, value) -> Optional[float]:
         """Safely convert value to number, handling None and NaN"""
         if value is None:
@@ -483,7 +509,7 @@ class YFinanceFetcher:
             result["fetch_errors"].append(f"ownership_data: {str(e)}")
     
     async def _fetch_options_data(self, ticker_obj: yf.Ticker, result: Dict[str, Any]):
-        """Fetch options chain data"""
+        """Fetch options chains concurrently (bounded), stored columnar with derived metrics"""
         try:
             options_data = {}
             
@@ -492,21 +518,40 @@ class YFinanceFetcher:
             
             if options_dates:
                 options_data["expiration_dates"] = list(options_dates)
+                
+                # Spot price for moneyness; info is shared with the company info fetch
+                info = await asyncio.to_thread(lambda: ticker_obj.info)
+                spot = self._safe_number(info.get('currentPrice') or info.get('regularMarketPrice'))
+                
+                semaphore = asyncio.Semaphore(OPTIONS_CONCURRENCY)
+                
+                async def fetch_chain(exp_date: str):
+                    async with semaphore:
+                        try:
+                            option_chain = await asyncio.to_thread(
+                                lambda date=exp_date: ticker_obj.option_chain(date)
+                            )
+                            return exp_date, option_chain
+                        except Exception as chain_error:
+                            logger.warning(f"Error fetching options chain for {exp_date}: {chain_error}")
+                            return exp_date, None
+                
+                # Limit expirations to avoid too much data
+                fetched = await asyncio.gather(*(fetch_chain(d) for d in options_dates[:MAX_OPTION_EXPIRATIONS]))
+                
                 options_data["chains"] = {}
+                term_structure = []
+                for exp_date, option_chain in fetched:
+                    if option_chain is None:
+                        continue
+                    calls, puts = option_chain.calls, option_chain.puts
+                    options_data["chains"][exp_date] = {
+                        "calls": self._option_chain_columns(calls),
+                        "puts": self._option_chain_columns(puts)
+                    }
+                    term_structure.append(self._option_expiry_metrics(exp_date, calls, puts, spot))
                 
-                # Get options chains for first few expiration dates
-                for i, exp_date in enumerate(options_dates[:5]):  # Limit to 5 to avoid too much data
-                    try:
-                        option_chain = await asyncio.to_thread(
-                            lambda date=exp_date: ticker_obj.option_chain(date)
-                        )
-                        
-                        options_data["chains"][exp_date] = {
-                            "calls": option_chain.calls.to_dict('records') if not option_chain.calls.empty else [],
-                            "puts": option_chain.puts.to_dict('records') if not option_chain.puts.empty else []
-                        }
-                    except Exception as chain_error:
-                        logger.warning(f"Error fetching options chain for {exp_date}: {chain_error}")
+                options_data["summary"] = self._summarize_options(term_structure, spot)
             
             result["options_data"] = options_data
             result["data_sources"].append("options")
@@ -515,6 +560,76 @@ class YFinanceFetcher:
             logger.error(f"Error fetching options data: {e}")
             result["fetch_errors"].append(f"options_data: {str(e)}")
     
+    def _option_chain_columns(self, chain: pd.DataFrame) -> Dict[str, List[Any]]:
+        """One list per field instead of one dict per contract"""
+        if chain is None or chain.empty:
+            return {field: [] for field in OPTION_CHAIN_FIELDS}
+        
+        columns = {}
+        for field in OPTION_CHAIN_FIELDS:
+            if field in chain.columns:
+                values = chain[field]
+                columns[field] = values.astype(object).where(values.notna(), None).tolist()
+            else:
+                columns[field] = [None] * len(chain)
+        return columns
+    
+    def _option_expiry_metrics(self, exp_date: str, calls: pd.DataFrame, puts: pd.DataFrame,
+                               spot: Optional[float]) -> Dict[str, Any]:
+        """Put/call ratios, ATM implied volatility and OTM open-interest skew for one expiration"""
+        def total(frame: pd.DataFrame, column: str) -> float:
+            return float(frame[column].fillna(0).sum()) if column in frame.columns else 0.0
+        
+        def ratio(numerator: float, denominator: float) -> Optional[float]:
+            return round(numerator / denominator, 3) if denominator else None
+        
+        def atm_iv(frame: pd.DataFrame) -> Optional[float]:
+            if spot is None or frame.empty or 'impliedVolatility' not in frame.columns:
+                return None
+            nearest = (frame['strike'] - spot).abs().idxmin()
+            return self._safe_number(frame.loc[nearest, 'impliedVolatility'])
+        
+        call_oi, put_oi = total(calls, 'openInterest'), total(puts, 'openInterest')
+        call_iv, put_iv = atm_iv(calls), atm_iv(puts)
+        atm_ivs = [iv for iv in (call_iv, put_iv) if iv is not None]
+        
+        oi_skew = None
+        if spot is not None and 'openInterest' in calls.columns and 'openInterest' in puts.columns:
+            otm_call_oi = float(calls.loc[calls['strike'] > spot, 'openInterest'].fillna(0).sum())
+            otm_put_oi = float(puts.loc[puts['strike'] < spot, 'openInterest'].fillna(0).sum())
+            oi_skew = ratio(otm_put_oi - otm_call_oi, otm_put_oi + otm_call_oi)
+        
+        return {
+            'expiration': exp_date,
+            'put_call_volume_ratio': ratio(total(puts, 'volume'), total(calls, 'volume')),
+            'put_call_oi_ratio': ratio(put_oi, call_oi),
+            'atm_iv': round(sum(atm_ivs) / len(atm_ivs), 4) if atm_ivs else None,
+            'oi_skew': oi_skew,  # +1 all OTM puts, -1 all OTM calls
+            'contracts': len(calls) + len(puts)
+        }
+    
+    def _summarize_options(self, term_structure: List[Dict[str, Any]], spot: Optional[float]) -> Dict[str, Any]:
+        """Aggregate per-expiration metrics into a prompt-ready summary"""
+        if not term_structure:
+            return {}
+        
+        ivs = [t['atm_iv'] for t in term_structure if t['atm_iv'] is not None]
+        front = term_structure[0]
+        
+        iv_slope = None
+        if len(ivs) >= 2:
+            iv_slope = 'contango' if ivs[-1] > ivs[0] else ('backwardation' if ivs[-1] < ivs[0] else 'flat')
+        
+        return {
+            'spot_price': spot,
+            'front_month_put_call_oi_ratio': front['put_call_oi_ratio'],
+            'front_month_put_call_volume_ratio': front['put_call_volume_ratio'],
+            'front_month_oi_skew': front['oi_skew'],
+            'iv_term_structure': [{'expiration': t['expiration'], 'atm_iv': t['atm_iv']} for t in term_structure],
+            'iv_term_structure_shape': iv_slope,
+            'by_expiration': term_structure
+        }
+    
     async def _fetch_comprehensive_analyst_coverage(self, ticker_obj: yf.Ticker, result: Dict[str, Any]):
         """Fetch comprehensive analyst recommendations and price targets"""
         try:
@@ -984,6 +1099,17 @@ class YFinanceFetcher:
             valuation = data.get('valuation_metrics', {})
             info = data.get('info', {})
             
+            # Full ratio matrix for every reported period in one vectorized pass
+            ratio_matrix = calculate_ratio_matrix(financials) if financials else pd.DataFrame()
+            latest = latest_ratios(ratio_matrix)
+            
+            def statement_ratio(name: str, unit: str) -> Dict[str, Any]:
+                # Value from the latest statement period that has it, labelled with that period
+                entry = latest.get(name, {})
+                return {'value': entry.get('value'), 'unit': unit, 'period': entry.get('period')}
+            
+            cash_ratio = self._safe_number(info.get('cashRatio'))
+            
             # Calculate current ratios from available data
             current_ratios = {
                 'profitability': {
@@ -996,7 +1122,8 @@ class YFinanceFetcher:
                 'liquidity': {
                     'current_ratio': {'value': self._safe_number(info.get('currentRatio')), 'unit': 'x'},
                     'quick_ratio': {'value': self._safe_number(info.get('quickRatio')), 'unit': 'x'},
-                    'cash_ratio': {'value': self._safe_number(info.get('cashRatio')), 'unit': 'x'}
+                    'cash_ratio': ({'value': cash_ratio, 'unit': 'x'} if cash_ratio is not None
+                                   else statement_ratio('cash_ratio', 'x'))
                 },
                 'valuation': {
                     'pe_ratio': {'value': self._safe_number(info.get('trailingPE')), 'unit': 'x'},
@@ -1007,34 +1134,19 @@ class YFinanceFetcher:
                 },
                 'leverage': {
                     'debt_to_equity': {'value': self._safe_number(info.get('debtToEquity')), 'unit': '%'},
-                    'interest_coverage': {'value': None, 'unit': 'x'},  # Would need calculation
-                    'debt_to_assets': {'value': None, 'unit': '%'}      # Would need calculation
+                    'interest_coverage': statement_ratio('interest_coverage', 'x'),
+                    'debt_to_assets': statement_ratio('debt_to_assets', '%'),
+                    'net_debt_to_ebitda': statement_ratio('net_debt_to_ebitda', 'x')
                 },
                 'efficiency': {
-                    'asset_turnover': {'value': None, 'unit': 'x'},     # Would need calculation
-                    'inventory_turnover': {'value': None, 'unit': 'x'}, # Would need calculation
-                    'receivables_turnover': {'value': None, 'unit': 'x'} # Would need calculation
+                    'asset_turnover': statement_ratio('asset_turnover', 'x'),
+                    'inventory_turnover': statement_ratio('inventory_turnover', 'x'),
+                    'receivables_turnover': statement_ratio('receivables_turnover', 'x')
                 }
             }
             
-            # Calculate time series ratios from financial statements if available
-            time_series_ratios = {}
-            if financials:
-                # Process financial statements for time series
-                for statement_type in ['financials', 'balance_sheet', 'cashflow']:
-                    statement_data = financials.get(statement_type, {}).get('data', {})
-                    if statement_data:
-                        for date_str, values in statement_data.items():
-                            if date_str not in time_series_ratios:
-                                time_series_ratios[date_str] = {
-                                    'profitability': {},
-                                    'liquidity': {},
-                                    'efficiency': {}
-                                }
-                            
-                            # Calculate ratios for this period
-                            # This would be expanded with actual ratio calculations
-                            # using the financial statement data
+            # Time series ratios from the aligned income/balance/cash flow periods
+            time_series_ratios = ratio_matrix_to_time_series(ratio_matrix)
             
             return {
                 'current_ratios': current_ratios,
@@ -1043,7 +1155,8 @@ class YFinanceFetcher:
                 'data_quality': {
                     'financial_statements_available': bool(financials),
                     'market_data_available': bool(data.get('monthly_prices', {}).get('has_data')),
-                    'completeness_score': len([v for v in current_ratios['profitability'].values() if v['value'] is not None]) / 5
+                    'completeness_score': len([v for v in current_ratios['profitability'].values() if v['value'] is not None]) / 5,
+                    'periods_calculated': len(time_series_ratios)
                 }
             }
             
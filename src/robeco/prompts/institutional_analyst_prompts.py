@@ -5,9 +5,10 @@ Professional prompts for each specialist analyst following advanced prompt engin
 Designed to produce hedge fund-quality investment analysis for CIO reporting
 """
 
-from datetime import datetime
 import json
 
+from .prompt_registry import prompt_registry
+
 class InstitutionalAnalystPrompts:
     """
     Professional prompts for each specialist analyst
@@ -15,11 +16,9 @@ class InstitutionalAnalystPrompts:
     """
     
     @staticmethod
-    def get_fundamentals_prompt(company: str, ticker: str, user_query: str = "", financial_data: dict = None, data_sources: dict = None) -> str:
-        """
-        Advanced Fundamental Analysis Specialist - Hedge Fund Quality
-        """
-        current_date = datetime.now().strftime("%Y-%m-%d")
+    @prompt_registry.register("analyst.fundamentals", version="1")
+    def _fundamentals_prefix(company: str, ticker: str) -> str:
+        """Static sections of the fundamentals prompt (role, style, requirements, output structure)"""
         return f"""# Context
 You are a seasoned Senior Fundamental Analyst with 20+ years of experience at top-tier hedge funds and investment banks, with deep expertise in {company} and its industry. You possess the analytical rigor of a CFA charterholder and write with the sophistication expected by Chief Investment Officers. You have comprehensive knowledge of {company}'s business model, competitive dynamics, financial history, and strategic positioning. You prepare institutional-quality fundamental analysis that drives high-stakes investment decisions for sophisticated investors.
 
@@ -73,7 +72,15 @@ Generate comprehensive fundamental analysis covering:
 - **Risk Factors**: Primary investment risks and potential challenges
 - **Valuation Perspective**: Fair value assessment using available metrics
 - **Catalyst Timeline**: Key events and milestones that could drive performance
+"""
 
+    @staticmethod
+    def get_fundamentals_prompt(company: str, ticker: str, user_query: str = "", financial_data: dict = None, data_sources: dict = None) -> str:
+        """
+        Advanced Fundamental Analysis Specialist - Hedge Fund Quality
+        """
+        prefix = prompt_registry.render("analyst.fundamentals", company, ticker)
+        return f"""{prefix}
 {f"""
 🚨🚨🚨 **SUPREME PRIORITY: USER-PROVIDED CONTEXT** 🚨🚨🚨
 ====================================================================================
@@ -117,11 +124,9 @@ CRITICAL INSTRUCTION: You have access to the COMPLETE raw dataset above. Use ANY
 Provide sophisticated fundamental analysis of {company} ({ticker}) with the depth and insight expected from a senior hedge fund analyst reporting to the CIO."""
 
     @staticmethod
-    def get_industry_prompt(company: str, ticker: str, user_query: str = "", financial_data: dict = None, data_sources: dict = None) -> str:
-        """
-        Advanced Industry Analysis Specialist - Hedge Fund Quality
-        """
-        current_date = datetime.now().strftime("%Y-%m-%d")
+    @prompt_registry.register("analyst.industry", version="1")
+    def _industry_prefix(company: str, ticker: str) -> str:
+        """Static sections of the industry prompt (role, style, requirements, output structure)"""
         return f"""# Context
 You are a seasoned Senior Industry Analyst with 20+ years of experience covering {company}'s sector at leading hedge funds and investment banks. You possess deep expertise in the industry dynamics, competitive landscape, and regulatory environment affecting {company}. You have the analytical skills of a top-tier equity researcher and the strategic insight of a management consultant. You prepare institutional-quality sector analysis that provides sophisticated investors with competitive intelligence and strategic positioning insights.
 
@@ -173,7 +178,15 @@ Generate comprehensive industry analysis covering:
 
 # CRITICAL WRITING INSTRUCTION
 DO NOT start your analysis with roleplay preambles like "As a seasoned Senior Industry Analyst..." or "I am an experienced analyst...". Begin DIRECTLY with the industry analysis content. Start immediately with sector outlook, competitive landscape, or strategic positioning insights.
+"""
 
+    @staticmethod
+    def get_industry_prompt(company: str, ticker: str, user_query: str = "", financial_data: dict = None, data_sources: dict = None) -> str:
+        """
+        Advanced Industry Analysis Specialist - Hedge Fund Quality
+        """
+        prefix = prompt_registry.render("analyst.industry", company, ticker)
+        return f"""{prefix}
 # User Request
 {user_query if user_query else "Industry competitive analysis and strategic positioning assessment"}
 
@@ -190,11 +203,9 @@ CRITICAL: Use the COMPLETE raw dataset above for industry competitive analysis.
 Provide sophisticated industry analysis of {company} ({ticker}) with the depth and competitive intelligence expected from a senior hedge fund sector analyst reporting to the CIO."""
 
     @staticmethod
-    def get_technical_prompt(company: str, ticker: str, user_query: str = "", financial_data: dict = None, data_sources: dict = None) -> str:
-        """
-        Advanced Technical Analysis Specialist - Hedge Fund Quality
-        """
-        current_date = datetime.now().strftime("%Y-%m-%d")
+    @prompt_registry.register("analyst.technical", version="1")
+    def _technical_prefix(company: str, ticker: str) -> str:
+        """Static sections of the technical prompt (role, style, requirements, output structure)"""
         return f"""# Context
 You are a seasoned Senior Technical Analyst with 20+ years of experience at leading hedge funds and proprietary trading firms, with deep expertise in analyzing {ticker} and its technical patterns. You possess advanced quantitative skills and comprehensive understanding of market microstructure, institutional flow, and price action dynamics. You prepare institutional-quality technical analysis that guides tactical positioning and execution strategies for sophisticated institutional investors.
 
@@ -246,7 +257,15 @@ Generate comprehensive technical analysis covering:
 
 # CRITICAL WRITING INSTRUCTION
 DO NOT start your analysis with roleplay preambles like "As a seasoned Senior Technical Analyst..." or "I am an experienced analyst...". Begin DIRECTLY with the technical analysis content. Start immediately with trading recommendation, key technical levels, or chart pattern analysis.
+"""
 
+    @staticmethod
+    def get_technical_prompt(company: str, ticker: str, user_query: str = "", financial_data: dict = None, data_sources: dict = None) -> str:
+        """
+        Advanced Technical Analysis Specialist - Hedge Fund Quality
+        """
+        prefix = prompt_registry.render("analyst.technical", company, ticker)
+        return f"""{prefix}
 # User Request
 {user_query if user_query else "Technical analysis for institutional trading and positioning"}
 
@@ -263,11 +282,9 @@ CRITICAL: Use the COMPLETE raw dataset above for technical analysis. Access ALL
 Provide sophisticated technical analysis of {ticker} ({company}) with the depth and market insight expected from a senior hedge fund technical analyst reporting to the CIO."""
 
     @staticmethod
-    def get_risk_prompt(company: str, ticker: str, user_query: str = "", financial_data: dict = None, data_sources: dict = None) -> str:
-        """
-        Advanced Risk Analysis Specialist - Hedge Fund Quality
-        """
-        current_date = datetime.now().strftime("%Y-%m-%d")
+    @prompt_registry.register("analyst.risk", version="1")
+    def _risk_prefix(company: str, ticker: str) -> str:
+        """Static sections of the risk prompt (role, style, requirements, output structure)"""
         return f"""# Context
 You are a seasoned Senior Risk Analyst with 20+ years of experience at leading hedge funds and institutional asset managers, with deep expertise in analyzing investment risks affecting {company} and its sector. You possess advanced risk management credentials and comprehensive understanding of systematic and idiosyncratic risk factors. You prepare institutional-quality risk analysis that guides portfolio construction and risk management decisions for sophisticated investors.
 
@@ -320,7 +337,15 @@ Generate comprehensive risk analysis covering:
 
 # CRITICAL WRITING INSTRUCTION
 DO NOT start your analysis with roleplay preambles like "As a seasoned Senior Risk Analyst..." or "I am an experienced analyst...". Begin DIRECTLY with the risk analysis content. Start immediately with risk assessment summary, key risk factors, or business risks.
+"""
 
+    @staticmethod
+    def get_risk_prompt(company: str, ticker: str, user_query: str = "", financial_data: dict = None, data_sources: dict = None) -> str:
+        """
+        Advanced Risk Analysis Specialist - Hedge Fund Quality
+        """
+        prefix = prompt_registry.render("analyst.risk", company, ticker)
+        return f"""{prefix}
 # User Request
 {user_query if user_query else "Comprehensive risk assessment for institutional portfolio management"}
 
@@ -337,11 +362,9 @@ CRITICAL: Use the COMPLETE raw dataset above for comprehensive risk analysis. Ac
 Provide sophisticated risk analysis of {company} ({ticker}) with the depth and insight expected from a senior hedge fund risk analyst reporting to the CIO."""
 
     @staticmethod
-    def get_esg_prompt(company: str, ticker: str, user_query: str = "", financial_data: dict = None, data_sources: dict = None) -> str:
-        """
-        Advanced ESG Analysis Specialist - Hedge Fund Quality
-        """
-        current_date = datetime.now().strftime("%Y-%m-%d")
+    @prompt_registry.register("analyst.esg", version="1")
+    def _esg_prefix(company: str, ticker: str) -> str:
+        """Static sections of the esg prompt (role, style, requirements, output structure)"""
         return f"""# Context
 You are a seasoned Senior ESG Analyst with 20+ years of experience at leading institutional investors and ESG-focused investment firms, with deep expertise in analyzing sustainability factors affecting {company} and its industry. You possess comprehensive understanding of ESG integration in investment analysis and the materiality of environmental, social, and governance factors for long-term value creation. You prepare institutional-quality ESG analysis that guides sustainable investment decisions for sophisticated investors.
 
@@ -394,7 +417,15 @@ Generate comprehensive ESG analysis covering:
 - **ESG Integration Strategy**: Sustainability strategy alignment with business model
 - **ESG Risks & Opportunities**: Material ESG risks and value creation opportunities
 - **Investment Implications**: ESG factor impact on long-term investment thesis
+"""
 
+    @staticmethod
+    def get_esg_prompt(company: str, ticker: str, user_query: str = "", financial_data: dict = None, data_sources: dict = None) -> str:
+        """
+        Advanced ESG Analysis Specialist - Hedge Fund Quality
+        """
+        prefix = prompt_registry.render("analyst.esg", company, ticker)
+        return f"""{prefix}
 # User Request
 {user_query if user_query else "ESG analysis for sustainable investment decision"}
 
@@ -411,11 +442,9 @@ CRITICAL: Use the COMPLETE raw dataset above for comprehensive ESG analysis. Acc
 Provide sophisticated ESG analysis of {company} ({ticker}) with the depth and sustainability insight expected from a senior institutional ESG analyst reporting to the CIO."""
 
     @staticmethod
-    def get_valuation_prompt(company: str, ticker: str, user_query: str = "", financial_data: dict = None, data_sources: dict = None) -> str:
-        """
-        Advanced Valuation Analysis Specialist - Hedge Fund Quality
-        """
-        current_date = datetime.now().strftime("%Y-%m-%d")
+    @prompt_registry.register("analyst.valuation", version="1")
+    def _valuation_prefix(company: str, ticker: str) -> str:
+        """Static sections of the valuation prompt (role, style, requirements, output structure)"""
         return f"""# Context
 You are a seasoned Senior Valuation Analyst with 20+ years of experience at leading hedge funds and investment banks, with deep expertise in valuing {company} and similar companies in its sector. You possess advanced financial modeling skills and comprehensive understanding of multiple valuation methodologies. You prepare institutional-quality valuation analysis that drives investment decisions and price target determination for sophisticated investors.
 
@@ -467,7 +496,15 @@ Generate comprehensive valuation analysis covering:
 
 # CRITICAL WRITING INSTRUCTION
 DO NOT start your analysis with roleplay preambles like "As a seasoned Senior Valuation Analyst..." or "I am an experienced analyst...". Begin DIRECTLY with the valuation analysis content. Start immediately with valuation summary, price target, or DCF analysis.
+"""
 
+    @staticmethod
+    def get_valuation_prompt(company: str, ticker: str, user_query: str = "", financial_data: dict = None, data_sources: dict = None) -> str:
+        """
+        Advanced Valuation Analysis Specialist - Hedge Fund Quality
+        """
+        prefix = prompt_registry.render("analyst.valuation", company, ticker)
+        return f"""{prefix}
 # User Request
 {user_query if user_query else "Complete valuation analysis with price target and investment recommendation"}
 
@@ -484,11 +521,9 @@ CRITICAL: Use the COMPLETE raw dataset above for comprehensive valuation analysi
 Provide sophisticated valuation analysis of {company} ({ticker}) with the depth and financial modeling expertise expected from a senior hedge fund valuation analyst reporting to the CIO."""
 
     @staticmethod
-    def get_bull_prompt(company: str, ticker: str, user_query: str = "", financial_data: dict = None, data_sources: dict = None) -> str:
-        """
-        Advanced Bull Case Analysis Specialist - Hedge Fund Quality
-        """
-        current_date = datetime.now().strftime("%Y-%m-%d")
+    @prompt_registry.register("analyst.bull", version="1")
+    def _bull_prefix(company: str, ticker: str) -> str:
+        """Static sections of the bull prompt (role, style, requirements, output structure)"""
         return f"""# Context
 You are a seasoned Senior Bull Case Analyst with 20+ years of experience at leading hedge funds and investment banks, with deep expertise in constructing compelling long investment theses for {company} and its industry. You possess exceptional ability to identify undervalued opportunities, catalysts for value creation, and asymmetric upside potential. You prepare institutional-quality bull case analysis that drives long investment decisions for sophisticated investors.
 
@@ -539,7 +574,15 @@ Generate comprehensive bull case analysis covering:
 - **Financial Upside Scenarios**: Bull case financial projections and valuation targets
 - **Market Opportunity**: TAM expansion and market share capture potential
 - **Risk/Reward Assessment**: Asymmetric upside potential vs. downside protection
+"""
 
+    @staticmethod
+    def get_bull_prompt(company: str, ticker: str, user_query: str = "", financial_data: dict = None, data_sources: dict = None) -> str:
+        """
+        Advanced Bull Case Analysis Specialist - Hedge Fund Quality
+        """
+        prefix = prompt_registry.render("analyst.bull", company, ticker)
+        return f"""{prefix}
 # User Request
 {user_query if user_query else "Bull case analysis with upside catalysts and investment thesis"}
 
@@ -556,11 +599,9 @@ CRITICAL: Use the COMPLETE raw dataset above for comprehensive bull case analysi
 Provide sophisticated bull case analysis of {company} ({ticker}) with the conviction and analytical rigor expected from a senior hedge fund analyst constructing a compelling long investment thesis for the CIO."""
 
     @staticmethod
-    def get_bear_prompt(company: str, ticker: str, user_query: str = "", financial_data: dict = None, data_sources: dict = None) -> str:
-        """
-        Advanced Bear Case Analysis Specialist - Hedge Fund Quality
-        """
-        current_date = datetime.now().strftime("%Y-%m-%d")
+    @prompt_registry.register("analyst.bear", version="1")
+    def _bear_prefix(company: str, ticker: str) -> str:
+        """Static sections of the bear prompt (role, style, requirements, output structure)"""
         return f"""# Context
 You are a seasoned Senior Bear Case Analyst with 20+ years of experience at leading hedge funds and investment banks, with deep expertise in identifying investment risks and structural challenges affecting {company} and its industry. You possess exceptional ability to uncover hidden risks, identify value traps, and construct compelling short investment theses. You prepare institutional-quality bear case analysis that protects capital and identifies short opportunities for sophisticated investors.
 
@@ -611,7 +652,15 @@ Generate comprehensive bear case analysis covering:
 - **Competitive Threats**: Market share erosion and competitive displacement risks
 - **Regulatory/External Risks**: Policy changes and external threats to business model
 - **Value Trap Assessment**: Reasons why apparent value may be illusory
+"""
 
+    @staticmethod
+    def get_bear_prompt(company: str, ticker: str, user_query: str = "", financial_data: dict = None, data_sources: dict = None) -> str:
+        """
+        Advanced Bear Case Analysis Specialist - Hedge Fund Quality
+        """
+        prefix = prompt_registry.render("analyst.bear", company, ticker)
+        return f"""{prefix}
 {f"""
 🚨🚨🚨 **SUPREME PRIORITY: USER-PROVIDED CONTEXT** 🚨🚨🚨
 ====================================================================================
@@ -648,11 +697,9 @@ CRITICAL: Use the COMPLETE raw dataset above for comprehensive bear case analysi
 Provide sophisticated bear case analysis of {company} ({ticker}) with the analytical rigor and risk assessment expected from a senior hedge fund analyst constructing a compelling short investment thesis for the CIO."""
 
     @staticmethod
-    def get_catalysts_prompt(company: str, ticker: str, user_query: str = "", financial_data: dict = None, data_sources: dict = None) -> str:
-        """
-        Advanced Catalysts Analysis Specialist - Hedge Fund Quality
-        """
-        current_date = datetime.now().strftime("%Y-%m-%d")
+    @prompt_registry.register("analyst.catalysts", version="1")
+    def _catalysts_prefix(company: str, ticker: str) -> str:
+        """Static sections of the catalysts prompt (role, style, requirements, output structure)"""
         return f"""# Context
 You are a seasoned Senior Catalysts Analyst with 20+ years of experience at leading hedge funds and investment banks, with deep expertise in identifying and timing investment catalysts affecting {company} and its industry. You possess exceptional ability to identify near-term and medium-term events that could drive significant price movements. You prepare institutional-quality catalyst analysis that drives tactical positioning and event-driven investment strategies for sophisticated investors.
 
@@ -703,7 +750,15 @@ Generate comprehensive catalyst analysis covering:
 - **Industry & Market Catalysts**: Sector-wide events affecting {company}
 - **Catalyst Risk Assessment**: Potential negative catalysts and risk mitigation
 - **Trading Strategy Implications**: Tactical positioning recommendations based on catalyst timeline
+"""
 
+    @staticmethod
+    def get_catalysts_prompt(company: str, ticker: str, user_query: str = "", financial_data: dict = None, data_sources: dict = None) -> str:
+        """
+        Advanced Catalysts Analysis Specialist - Hedge Fund Quality
+        """
+        prefix = prompt_registry.render("analyst.catalysts", company, ticker)
+        return f"""{prefix}
 # User Request
 {user_query if user_query else "Catalyst analysis with timeline and impact assessment"}
 
@@ -720,11 +775,9 @@ CRITICAL: Use the COMPLETE raw dataset above for comprehensive catalyst analysis
 Provide sophisticated catalyst analysis of {company} ({ticker}) with the precision and timing insight expected from a senior hedge fund analyst specializing in event-driven investment strategies for the CIO."""
 
     @staticmethod
-    def get_drivers_prompt(company: str, ticker: str, user_query: str = "", financial_data: dict = None, data_sources: dict = None) -> str:
-        """
-        Advanced Business Drivers & Recent Developments Analysis Specialist - Hedge Fund Quality
-        """
-        current_date = datetime.now().strftime("%Y-%m-%d")
+    @prompt_registry.register("analyst.drivers", version="1")
+    def _drivers_prefix(company: str, ticker: str) -> str:
+        """Static sections of the drivers prompt (role, style, requirements, output structure)"""
         return f"""# Context
 You are a seasoned Senior Business Drivers & Recent Developments Analyst with 20+ years of experience at leading hedge funds and investment banks, with deep expertise in analyzing key business drivers and recent developments affecting {company} and its industry. You possess exceptional ability to identify and analyze the most important factors driving business performance and recent events that could impact investment thesis. You prepare institutional-quality driver analysis that provides crucial business intelligence for sophisticated investors.
 
@@ -775,7 +828,15 @@ Generate comprehensive business driver and recent development analysis covering:
 - **Market Position Changes**: Shifts in competitive positioning or market dynamics
 - **Financial Driver Analysis**: How key drivers translate to financial performance
 - **Forward-Looking Implications**: What current drivers suggest for future performance
+"""
 
+    @staticmethod
+    def get_drivers_prompt(company: str, ticker: str, user_query: str = "", financial_data: dict = None, data_sources: dict = None) -> str:
+        """
+        Advanced Business Drivers & Recent Developments Analysis Specialist - Hedge Fund Quality
+        """
+        prefix = prompt_registry.render("analyst.drivers", company, ticker)
+        return f"""{prefix}
 # User Request
 {user_query if user_query else "Business drivers and recent developments analysis"}
 
@@ -792,11 +853,9 @@ CRITICAL: Use the COMPLETE raw dataset above for comprehensive business drivers
 Provide sophisticated business drivers and recent developments analysis of {company} ({ticker}) with the business intelligence and operational insights expected from a senior hedge fund analyst reporting to the CIO."""
 
     @staticmethod
-    def get_consensus_prompt(company: str, ticker: str, user_query: str = "", financial_data: dict = None, data_sources: dict = None) -> str:
-        """
-        Advanced Consensus Analysis Specialist - Hedge Fund Quality
-        """
-        current_date = datetime.now().strftime("%Y-%m-%d")
+    @prompt_registry.register("analyst.consensus", version="1")
+    def _consensus_prefix(company: str, ticker: str) -> str:
+        """Static sections of the consensus prompt (role, style, requirements, output structure)"""
         return f"""# Context
 You are a seasoned Senior Consensus Analyst with 20+ years of experience at leading hedge funds and investment banks, with deep expertise in analyzing market consensus, analyst estimates, and institutional sentiment for {company} and its industry. You possess exceptional ability to synthesize market expectations, identify consensus views, and assess the accuracy and reliability of prevailing market opinion. You prepare institutional-quality consensus analysis that provides crucial market intelligence for sophisticated investors.
 
@@ -847,7 +906,15 @@ Generate comprehensive consensus analysis covering:
 - **Key Consensus Assumptions**: Critical assumptions underlying market expectations
 - **Consensus Reliability Assessment**: Track record and accuracy of prevailing views
 - **Positioning Implications**: How consensus translates to institutional positioning
+"""
 
+    @staticmethod
+    def get_consensus_prompt(company: str, ticker: str, user_query: str = "", financial_data: dict = None, data_sources: dict = None) -> str:
+        """
+        Advanced Consensus Analysis Specialist - Hedge Fund Quality
+        """
+        prefix = prompt_registry.render("analyst.consensus", company, ticker)
+        return f"""{prefix}
 {f"""
 🚨🚨🚨 **SUPREME PRIORITY: USER-PROVIDED CONTEXT** 🚨🚨🚨
 ====================================================================================
@@ -884,11 +951,9 @@ CRITICAL: Use the COMPLETE raw dataset above for comprehensive consensus analysi
 Provide sophisticated consensus analysis of {company} ({ticker}) with the market intelligence and sentiment assessment expected from a senior hedge fund analyst reporting to the CIO."""
 
     @staticmethod
-    def get_anti_consensus_prompt(company: str, ticker: str, user_query: str = "", financial_data: dict = None, data_sources: dict = None) -> str:
-        """
-        Advanced Anti-Consensus Analysis Specialist - Hedge Fund Quality
-        """
-        current_date = datetime.now().strftime("%Y-%m-%d")
+    @prompt_registry.register("analyst.anti_consensus", version="1")
+    def _anti_consensus_prefix(company: str, ticker: str) -> str:
+        """Static sections of the anti consensus prompt (role, style, requirements, output structure)"""
         return f"""# Context
 You are a seasoned Senior Anti-Consensus Analyst with 20+ years of experience at leading hedge funds and investment banks, with deep expertise in identifying contrarian investment opportunities and challenging prevailing market consensus for {company} and its industry. You possess exceptional ability to identify market inefficiencies, consensus errors, and contrarian investment themes that generate alpha. You prepare institutional-quality anti-consensus analysis that drives contrarian positioning strategies for sophisticated investors.
 
@@ -939,7 +1004,15 @@ Generate comprehensive anti-consensus analysis covering:
 - **Independent Research Insights**: Proprietary analysis challenging conventional views
 - **Contrarian Positioning Strategy**: How to capitalize on anti-consensus opportunities
 - **Risk/Reward Asymmetry**: Why contrarian position offers attractive risk-adjusted returns
+"""
 
+    @staticmethod
+    def get_anti_consensus_prompt(company: str, ticker: str, user_query: str = "", financial_data: dict = None, data_sources: dict = None) -> str:
+        """
+        Advanced Anti-Consensus Analysis Specialist - Hedge Fund Quality
+        """
+        prefix = prompt_registry.render("analyst.anti_consensus", company, ticker)
+        return f"""{prefix}
 # User Request
 {user_query if user_query else "Anti-consensus analysis and contrarian investment opportunities"}
 
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Prompt Registry
+Versioned, memoized static prompt sections
+
+Analyst and report prompts are split into a large static section (role,
+style, methodology, slide templates) and a small dynamic suffix (user
+query, user context, datasets). Static sections are registered here with a
+version and rendered once per distinct set of arguments; repeated builds
+only format their dynamic suffix. Rendered sections are byte-identical for
+identical inputs, so they double as stable prefixes for Gemini context
+caching (see ``fingerprint``).
+"""
+
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Callable, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+
+def current_month() -> str:
+    """Month label used inside report prompts (e.g. "March 2025")"""
+    return datetime.now().strftime("%B %Y")
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    """A registered static prompt section"""
+    name: str
+    version: str
+    builder: Callable[..., str]
+    description: str = ""
+
+
+class PromptRegistry:
+    """
+    Registry of versioned static prompt sections
+
+    Usage:
+        @prompt_registry.register("analyst.fundamentals", version="1")
+        def _fundamentals_prefix(company, ticker):
+            return f"..."
+
+        prefix = prompt_registry.render("analyst.fundamentals", company, ticker)
+
+    Bumping ``version`` when a section's text changes gives it a new
+    fingerprint, so caches keyed on the fingerprint stop matching.
+    """
+
+    def __init__(self, max_cached_renders: int = 256):
+        self.max_cached_renders = max_cached_renders
+        self._templates: Dict[str, PromptTemplate] = {}
+        self._renderers: Dict[str, Callable[..., str]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, version: str, description: str = "") -> Callable:
+        """Decorator registering a static section builder under ``name``"""
+        def decorator(builder: Callable[..., str]) -> Callable[..., str]:
+            with self._lock:
+                if name in self._templates:
+                    logger.warning(f"⚠️ Prompt template '{name}' re-registered (v{self._templates[name].version} -> v{version})")
+                self._templates[name] = PromptTemplate(name, version, builder, description or (builder.__doc__ or "").strip())
+                self._renderers[name] = lru_cache(maxsize=self.max_cached_renders)(builder)
+            return builder
+        return decorator
+
+    def render(self, name: str, *args, **kwargs) -> str:
+        """Rendered static section (memoized on the arguments)"""
+        try:
+            renderer = self._renderers[name]
+        except KeyError:
+            raise KeyError(f"Unknown prompt template: {name}")
+        return renderer(*args, **kwargs)
+
+    def version(self, name: str) -> str:
+        return self._templates[name].version
+
+    def fingerprint(self, name: str, *args, **kwargs) -> str:
+        """Stable identifier of a rendered section: template name, version and text hash"""
+        text = self.render(name, *args, **kwargs)
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+        return f"{name}@v{self.version(name)}:{digest}"
+
+    def templates(self) -> Dict[str, PromptTemplate]:
+        return dict(self._templates)
+
+    def clear(self):
+        """Drop all memoized renders"""
+        for renderer in self._renderers.values():
+            renderer.cache_clear()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        stats = {}
+        for name, renderer in self._renderers.items():
+            info = renderer.cache_info()
+            stats[name] = {
+                "version": self._templates[name].version,
+                "hits": info.hits,
+                "misses": info.misses,
+                "cached_renders": info.currsize
+            }
+        return stats
+
+
+# Global registry shared by the analyst and report prompt builders
+prompt_registry = PromptRegistry()
@@ -0,0 +1,13 @@
+"""
+Shared pytest setup: make the ``robeco`` package under src/ importable
+
+Run from the project root:
+    python -m pytest tests
+"""
+
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
@@ -0,0 +1,116 @@
+"""Gemini context cache: per-entry creation, fallback to the full prompt and failure backoff"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+from robeco.backend.gemini_context_cache import GeminiContextCache
+
+PREFIX = "shared report rules. " * 50
+PROMPT = PREFIX + "Company-specific request for ANET"
+
+
+class FakeCaches:
+    """``client.caches`` stand-in; ``create`` blocks for ``delay`` seconds or raises"""
+
+    def __init__(self, delay=0.0, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.creates = 0
+        self.updates = 0
+        self._lock = threading.Lock()
+
+    def create(self, model, config):
+        with self._lock:
+            self.creates += 1
+            number = self.creates
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("quota exceeded")
+        return SimpleNamespace(name=f"cachedContents/{number}")
+
+    def update(self, name, config):
+        self.updates += 1
+
+
+def _cache(**kwargs):
+    return GeminiContextCache(min_prefix_chars=100, **kwargs)
+
+
+def _prepare(cache, caches, api_key="key-a", prompt=PROMPT, prefix=PREFIX):
+    client = SimpleNamespace(caches=caches)
+    return cache.prepare_request(client, api_key, "gemini-2.5-pro", prompt, "You are an analyst", None, prefix)
+
+
+def _sent_text(contents):
+    return contents[0].parts[0].text
+
+
+def test_cached_request_sends_only_the_remainder():
+    cache, caches = _cache(), FakeCaches()
+
+    contents, config = asyncio.run(_prepare(cache, caches))
+
+    assert config.cached_content == "cachedContents/1"
+    assert config.system_instruction is None
+    assert _sent_text(contents) == "Company-specific request for ANET"
+
+
+def test_failed_create_falls_back_to_full_prompt_and_backs_off():
+    cache, caches = _cache(failure_backoff_seconds=60), FakeCaches(fail=True)
+
+    async def run():
+        return [await _prepare(cache, caches) for _ in range(3)]
+
+    results = asyncio.run(run())
+
+    for contents, config in results:
+        assert config.cached_content is None
+        assert config.system_instruction == "You are an analyst"
+        assert _sent_text(contents) == PROMPT
+    assert caches.creates == 1
+    assert cache.stats["fallbacks"] == 3
+    assert cache.stats["skipped_after_failure"] == 2
+
+
+def test_create_is_retried_after_the_backoff_window():
+    cache, caches = _cache(failure_backoff_seconds=0.05), FakeCaches(fail=True)
+    asyncio.run(_prepare(cache, caches))
+
+    time.sleep(0.1)
+    caches.fail = False
+    contents, config = asyncio.run(_prepare(cache, caches))
+
+    assert caches.creates == 2
+    assert config.cached_content == "cachedContents/2"
+
+
+def test_concurrent_calls_create_one_entry():
+    cache, caches = _cache(), FakeCaches(delay=0.2)
+
+    async def run():
+        return await asyncio.gather(*(_prepare(cache, caches) for _ in range(8)))
+
+    results = asyncio.run(run())
+
+    assert caches.creates == 1
+    assert {config.cached_content for _, config in results} == {"cachedContents/1"}
+    assert cache.stats["hits"] == 7
+
+
+def test_slow_create_does_not_block_other_entries():
+    cache = _cache()
+    slow, fast = FakeCaches(delay=1.0), FakeCaches()
+
+    async def run():
+        slow_call = asyncio.create_task(_prepare(cache, slow, api_key="key-slow"))
+        await asyncio.sleep(0.1)
+        started = time.monotonic()
+        await _prepare(cache, fast, api_key="key-fast")
+        fast_elapsed = time.monotonic() - started
+        await slow_call
+        return fast_elapsed
+
+    assert asyncio.run(run()) < 0.5
+    assert slow.creates == 1 and fast.creates == 1
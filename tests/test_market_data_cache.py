@@ -0,0 +1,116 @@
+"""Snapshot cache of the market data service: LRU / TTL limits and the pinned watchlist"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from robeco.data.market_data_service import MarketDataService
+
+
+class FakeTicker:
+    """Stands in for ``yf.Ticker``; counts the requests it serves"""
+
+    requests = 0
+
+    def __init__(self, symbol):
+        self.symbol = symbol
+
+    @property
+    def info(self):
+        FakeTicker.requests += 1
+        return {"symbol": self.symbol, "regularMarketPrice": 10.0}
+
+    def history(self, period=None, interval="1d", start=None):
+        FakeTicker.requests += 1
+        return _bars(5)
+
+
+def _bars(days):
+    index = pd.date_range("2024-01-01", periods=days, freq="D", tz="UTC")
+    values = np.arange(days, dtype=float) + 1
+    return pd.DataFrame({"Open": values, "High": values, "Low": values, "Close": values,
+                         "Volume": values * 100, "Dividends": 0.0, "Stock Splits": 0.0}, index=index)
+
+
+def fake_download(symbols, **kwargs):
+    frames = {symbol: _bars(5) for symbol in symbols}
+    return pd.concat(frames, axis=1)
+
+
+@pytest.fixture
+def service():
+    FakeTicker.requests = 0
+    service = MarketDataService(cache_duration=300, max_snapshots=10)
+    service.set_data_source(FakeTicker, fake_download)
+    return service
+
+
+def _age(snapshot, seconds):
+    snapshot.created_at = datetime.now() - timedelta(seconds=seconds)
+
+
+def test_lru_evicts_least_recently_used(service):
+    first = service.get_snapshot("AAA")
+    for index in range(10):
+        service.get_snapshot(f"T{index}")
+
+    assert service.get_snapshot("AAA") is not first
+    assert service.get_cache_stats()["evictions"] >= 1
+
+
+def test_expired_snapshot_is_replaced(service):
+    snapshot = service.get_snapshot("AAA")
+    assert service.get_snapshot("aaa ") is snapshot
+
+    _age(snapshot, 301)
+    assert service.get_snapshot("AAA") is not snapshot
+
+
+def test_watchlist_hit_rate_after_warm_up(service):
+    symbols = [f"W{index:03d}" for index in range(200)]
+    summary = asyncio.run(service.warm_watchlist(symbols, ttl=900))
+    assert len(summary["succeeded"]) == 200
+    warm_requests = FakeTicker.requests
+
+    # Ad-hoc lookups beyond max_snapshots must not push the watchlist out
+    for index in range(50):
+        service.get_snapshot(f"ADHOC{index}")
+    service.stats.update(hits=0, misses=0)
+
+    for symbol in symbols:
+        snapshot = service.get_snapshot(symbol)
+        assert snapshot.info["symbol"] == symbol
+        assert not snapshot.history("5y").empty
+
+    stats = service.get_cache_stats()
+    assert stats["hit_rate"] == 1.0
+    assert stats["watchlist_tickers"] == 200
+    assert FakeTicker.requests == warm_requests
+
+
+def test_watchlist_uses_its_own_ttl(service):
+    asyncio.run(service.warm_watchlist(["AAA", "BBB"], ttl=900))
+    snapshot = service.get_snapshot("AAA")
+
+    # Past the ad-hoc TTL but inside the warm-up interval: still served from the warm-up
+    _age(snapshot, 600)
+    assert service.get_snapshot("AAA") is snapshot
+
+    _age(snapshot, 901)
+    replaced = service.get_snapshot("AAA")
+    assert replaced is not snapshot
+    # A ticker on the watchlist stays pinned after it expires
+    assert service.get_cache_stats()["watchlist_tickers"] == 2
+
+
+def test_rewarm_replaces_previous_watchlist(service):
+    asyncio.run(service.warm_watchlist(["AAA", "BBB"]))
+    old = service.get_snapshot("AAA")
+
+    asyncio.run(service.warm_watchlist(["AAA", "CCC"]))
+    assert service.get_snapshot("AAA") is not old
+    assert service.get_cache_stats()["watchlist_tickers"] == 2
+    assert service.get_snapshot("CCC") is service.get_snapshot("CCC")
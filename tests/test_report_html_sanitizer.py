@@ -0,0 +1,108 @@
+"""Single-pass sanitizer: same output as the per-pattern passes it replaced, apart from their two bugs"""
+
+import re
+from pathlib import Path
+
+import pytest
+
+from robeco.backend.report_html_sanitizer import clean_slide_html, convert_markdown_to_html
+
+EXAMPLE_DIR = Path(__file__).resolve().parent.parent / "src" / "robeco" / "Example Output"
+
+
+def old_clean_slide_html(content):
+    """_clean_slide_html before the sanitizer"""
+    clean = content.strip()
+    clean = re.sub(r'<!DOCTYPE[^>]*>', '', clean, flags=re.IGNORECASE)
+    clean = re.sub(r'</?html[^>]*>', '', clean, flags=re.IGNORECASE)
+    clean = re.sub(r'</?head[^>]*>', '', clean, flags=re.IGNORECASE)
+    clean = re.sub(r'</?body[^>]*>', '', clean, flags=re.IGNORECASE)
+    clean = re.sub(r'<style[^>]*>.*?</style>', '', clean, flags=re.IGNORECASE | re.DOTALL)
+    clean = re.sub(r'```html\s*', '', clean, flags=re.IGNORECASE)
+    clean = re.sub(r'```\s*', '', clean, flags=re.IGNORECASE)
+    first_div = clean.find('<div')
+    if first_div > 0:
+        clean = clean[first_div:]
+    return clean.strip()
+
+
+def old_convert_markdown_to_html(content):
+    """_convert_markdown_to_html before the sanitizer"""
+    content = re.sub(r'\*\*\*(.*?)\*\*\*', r'<strong><em>\1</em></strong>', content)
+    content = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', content)
+    content = re.sub(r'(?<!\*)\*([^*\n]+?)\*(?!\*)', r'<em>\1</em>', content)
+    if re.findall(r'^#{1,6}\s+(.+)$', content, re.MULTILINE):
+        content = re.sub(r'^#{1,6}\s+(.+)$', r'<h4>\1</h4>', content, flags=re.MULTILINE)
+    if re.findall(r'^\s*-\s+(.+)$', content, re.MULTILINE):
+        content = re.sub(r'^\s*-\s+(.+)$', r'<li>\1</li>', content, flags=re.MULTILINE)
+        content = re.sub(r'(<li>.*?</li>(?:\s*<li>.*?</li>)*)', r'<ul>\1</ul>', content, flags=re.DOTALL)
+    return content
+
+
+def with_leaked_markdown(html):
+    """Every 5th <strong> as **bold**, plus a header and bullets before each slide"""
+    count = 0
+
+    def to_markdown(match):
+        nonlocal count
+        count += 1
+        return f"**{match.group(1)}**" if count % 5 == 0 else match.group(0)
+
+    html = re.sub(r'<strong>([^<\n]*)</strong>', to_markdown, html)
+    return html.replace('<div class="slide', '\n## Key points\n- first *point*\n- second **point**\n<div class="slide')
+
+
+def _reports_without_old_bugs():
+    """Reports without <header> elements or existing <li> items, where the old passes were right"""
+    for report in sorted(EXAMPLE_DIR.glob("*.html")):
+        html = report.read_text(encoding="utf-8", errors="ignore")
+        if "<header" not in html.lower() and "<li>" not in html:
+            yield report.name
+
+
+def _new_path(content):
+    converted, _ = convert_markdown_to_html(content)
+    return clean_slide_html(converted)
+
+
+def _old_path(content):
+    return old_clean_slide_html(old_convert_markdown_to_html(content))
+
+
+@pytest.mark.parametrize("report", list(_reports_without_old_bugs()))
+@pytest.mark.parametrize("leaked_markdown", [False, True])
+def test_example_reports_match_the_old_passes(report, leaked_markdown):
+    html = (EXAMPLE_DIR / report).read_text(encoding="utf-8", errors="ignore")
+    if leaked_markdown:
+        html = with_leaked_markdown(html)
+
+    assert clean_slide_html(html) == old_clean_slide_html(html)
+    assert _new_path(html) == _old_path(html)
+
+
+@pytest.mark.parametrize("content", [
+    "```html\n<!DOCTYPE html><html><head><title>x</title></head><body><div class=\"slide\">A</div></body></html>\n```",
+    "Here is the report:\n<div class=\"slide\"><style>.a > * { color: red; }</style>B</div>",
+    "<div>***Key*** call: **buy** on *weakness* and a lone * star</div>",
+    "# Thesis\n<div>text</div>\n### Risks\n- one **big** risk\n-   two\n\n<p>after</p>",
+    "<div>No markdown at all, <em>just</em> HTML.</div>",
+])
+def test_snippets_match_the_old_passes(content):
+    assert clean_slide_html(content) == old_clean_slide_html(content)
+    assert convert_markdown_to_html(content)[0] == old_convert_markdown_to_html(content)
+
+
+def test_conversion_count():
+    _, conversions = convert_markdown_to_html("# Title\n**a** and *b*\n- one\n- two")
+    assert conversions == 5
+
+
+def test_header_elements_are_kept():
+    content = '<div class="slide"><header class="report-header">Tesla</header></div>'
+    assert clean_slide_html(content) == content
+
+
+def test_only_converted_bullets_get_a_list():
+    content = "<ul><li>existing</li></ul>\n- leaked"
+    converted, _ = convert_markdown_to_html(content)
+    assert converted == "<ul><li>existing</li></ul>\n<ul><li>leaked</li></ul>"
@@ -0,0 +1,79 @@
+"""Slide diff stream: a client applying the updates ends up with exactly the final report"""
+
+import random
+
+from robeco.backend.report_slide_stream import ReportSlideStream, slide_hash
+
+
+def _slide(page, filler="Analysis"):
+    return (f'<div class="slide" id="page-{page}"><h2>Slide {page}</h2>'
+            f'<p>{filler} {page} ' + "x" * 600 + f'</p><footer>Page {page} / 15</footer></div>\n')
+
+
+def _stream(stream, phase, text, rng):
+    """Updates of ``phase`` while ``text`` arrives in random chunks, then the final call"""
+    updates = []
+    position = 0
+    while position < len(text):
+        position += rng.randint(20, 300)
+        updates.extend(stream.update(phase, text[:position]))
+    updates.extend(stream.update(phase, text, final=True))
+    return updates
+
+
+def _apply(client, updates):
+    """What the workbench does with report_slide_update messages"""
+    for update in updates:
+        index = update["slide_index"]
+        if "append" in update:
+            assert len(client[index]) == update["offset"]
+            client[index] += update["append"]
+        else:
+            client[index] = update["html"]
+
+
+def test_client_rebuilds_both_calls_and_the_manifest_matches():
+    rng = random.Random(43)
+    call1 = "<html><body>" + "".join(_slide(page) for page in range(1, 8))
+    call2 = "".join(_slide(page) for page in range(8, 16)) + "</body></html>"
+    stream, client = ReportSlideStream(min_append_chars=256), {}
+
+    _apply(client, _stream(stream, "call1", call1, rng))
+    _apply(client, _stream(stream, "call2", call2, rng))
+    final_updates = stream.update("final", call1 + call2, final=True)
+    _apply(client, final_updates)
+    manifest = stream.manifest()
+
+    assert final_updates == []
+    assert [slide["slide_index"] for slide in manifest["slides"]] == list(range(1, 16))
+    for slide in manifest["slides"]:
+        html = client[slide["slide_index"]]
+        assert slide["length"] == len(html)
+        assert slide["hash"] == slide_hash(html)
+    assert "".join(client[index] for index in range(1, 16)) == (call1 + call2)[call1.find('<div class="slide'):]
+    # Each slide goes over the wire about once, not once per chunk
+    assert stream.stats["chars_sent"] < 1.5 * len(call1 + call2)
+
+
+def test_final_content_resends_only_changed_slides():
+    rng = random.Random(43)
+    report = "".join(_slide(page) for page in range(1, 16))
+    stream, client = ReportSlideStream(), {}
+    _apply(client, _stream(stream, "call1", report, rng))
+
+    cleaned = report.replace(_slide(9), _slide(9, filler="Revised analysis"))
+    final_updates = stream.update("final", cleaned, final=True)
+    _apply(client, final_updates)
+
+    assert [update["slide_index"] for update in final_updates] == [9]
+    assert "html" in final_updates[0]
+    assert "".join(client[index] for index in range(1, 16)) == cleaned
+
+
+def test_unfinished_slide_is_throttled_until_it_grows():
+    stream = ReportSlideStream(min_append_chars=1024)
+    partial = _slide(1)[:400]
+
+    assert stream.update("call1", partial) == []
+    update, = stream.update("call1", partial + "y" * 1024)
+    assert update["slide_index"] == 1 and update["complete"] is False
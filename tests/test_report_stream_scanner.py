@@ -0,0 +1,75 @@
+"""Report stream scanner: chunked scanning agrees with re-scanning the whole accumulated text"""
+
+import random
+import re
+
+import pytest
+
+from robeco.backend.report_stream_scanner import ReportStreamScanner
+
+WATCH_TERMS = ("Operating Cash Flow", "Page 11", "slide-financial-ratios", "11.")
+
+
+def _report():
+    slides = []
+    for page in range(1, 16):
+        body = "Operating Cash Flow grew 11.2%" if page == 11 else f"Slide {page} body text"
+        slides.append(f'<div class="slide slide-financial-ratios" id="page-{page}"><p>{body}</p>'
+                      f'<footer>Page {page} / 15</footer></div>\n')
+    return "<!DOCTYPE html><html><body>\n" + "".join(slides) + "</BODY></HTML>"
+
+
+def _full_scan(text):
+    """What the generator computed by re-scanning the accumulated response on every chunk"""
+    return {
+        "slides": text.count('<div class="slide'),
+        "pages": {int(page) for page in re.findall(r"Page (\d{1,2}) / 15", text)},
+        "html_end": "</html>" in text.lower(),
+        "body_end": "</body>" in text.lower(),
+        "terms": {term for term in WATCH_TERMS if term in text},
+    }
+
+
+def _chunks(text, sizes):
+    position = 0
+    while position < len(text):
+        size = sizes()
+        yield text[position:position + size]
+        position += size
+
+
+@pytest.mark.parametrize("chunking", ["single chars", "random", "whole"])
+def test_every_chunk_matches_a_full_rescan(chunking):
+    text = _report()
+    rng = random.Random(41)
+    sizes = {"single chars": lambda: 1, "random": lambda: rng.randint(1, 40), "whole": lambda: len(text)}[chunking]
+    scanner = ReportStreamScanner(watch_terms=WATCH_TERMS)
+    accumulated = ""
+    slides, pages, terms = 0, [], []
+
+    for chunk in _chunks(text, sizes):
+        accumulated += chunk
+        update = scanner.feed(chunk)
+        slides += update.new_slides
+        pages.extend(update.new_pages)
+        terms.extend(update.new_terms)
+
+        expected = _full_scan(accumulated)
+        assert scanner.slide_count == slides == expected["slides"]
+        assert scanner.pages_seen == set(pages) == expected["pages"]
+        assert scanner.has_html_end == expected["html_end"]
+        assert scanner.has_body_end == expected["body_end"]
+        assert scanner.terms_seen == set(terms) == expected["terms"]
+
+    assert scanner.slide_count == 15
+    assert scanner.last_page == 15
+    assert len(pages) == len(set(pages))
+    assert scanner.chars == len(text)
+
+
+def test_empty_chunk_changes_nothing():
+    scanner = ReportStreamScanner()
+    scanner.feed('<div class="sl')
+
+    assert scanner.feed("") == (0, [], [])
+    assert scanner.feed('ide">').new_slides == 1
@@ -0,0 +1,72 @@
+"""Word export: the streamed converter writes everything the BeautifulSoup path wrote"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from docx import Document
+from docx.oxml.ns import qn
+
+from robeco.backend import word_report_generator as word
+
+EXAMPLE_DIR = Path(__file__).resolve().parent.parent / "src" / "robeco" / "Example Output"
+
+# A chart drawn by a script in the browser: no SVG in the HTML, only the stockData points
+SCRIPT_CHART = """
+<div class="slide" id="portrait-page-1">
+  <div class="intro-and-chart-container">
+    <div class="intro-text-block"><p>Link REIT owns retail and car park assets across Hong Kong.</p></div>
+    <div class="stock-chart-container" id="stock-price-line-chart">
+      <script>
+        const stockData = [{'date': '2024-01-01', 'price': 38.5}, {'date': '2024-06-01', 'price': 41.4}];
+      </script>
+    </div>
+  </div>
+</div>
+"""
+
+
+@pytest.fixture(autouse=True)
+def offline_images(monkeypatch):
+    def offline(*args, **kwargs):
+        raise word.requests.ConnectionError("image downloads disabled in tests")
+
+    monkeypatch.setattr(word.requests, "get", offline)
+
+
+def _paragraphs(html, streaming, tmp_path):
+    generator = word.RobecoWordReportGenerator()
+    generator.streaming_conversion = streaming
+    output_path = tmp_path / ("stream.docx" if streaming else "soup.docx")
+    asyncio.run(generator.convert_html_to_word(html, "Link REIT", "0823.HK", str(output_path)))
+    body = Document(str(output_path)).element.body
+    texts = []
+    for paragraph in body.iter(qn("w:p")):
+        text = " ".join("".join(node.text or "" for node in paragraph.iter(qn("w:t"))).split())
+        if text:
+            texts.append(text)
+    return texts
+
+
+def _lost(old, new):
+    streamed = "".join("".join(text.split()) for text in new)
+    return [text for text in old if "".join(text.split()) not in streamed]
+
+
+def test_script_drawn_chart_keeps_heading_and_price(tmp_path):
+    streamed = _paragraphs(SCRIPT_CHART, True, tmp_path)
+
+    assert "📈 Stock Price Chart" in streamed
+    assert "$41.40" in streamed
+    assert _lost(_paragraphs(SCRIPT_CHART, False, tmp_path), streamed) == []
+
+
+@pytest.mark.parametrize("report", ["Link2.html", "Link3.html", "Link_0823.html"])
+def test_streamed_report_has_every_soup_paragraph(report, tmp_path):
+    html = (EXAMPLE_DIR / report).read_text(encoding="utf-8", errors="ignore")
+
+    streamed = _paragraphs(html, True, tmp_path)
+
+    assert _lost(_paragraphs(html, False, tmp_path), streamed) == []
+    if report == "Link_0823.html":
+        assert any("Bull Case" in text for text in streamed)
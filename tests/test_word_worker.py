@@ -0,0 +1,37 @@
+"""Word worker pool: jobs that hang are killed after the timeout and the worker is replaced"""
+
+import subprocess
+import sys
+import time
+
+import pytest
+
+from robeco.backend.word_worker import WordWorkerPool, WordWorkerTimeout
+
+# Reads jobs like a worker but never answers them
+HANGING_WORKER = "import sys, time\nfor line in sys.stdin:\n    time.sleep(60)\n"
+
+
+class HangingWorkerPool(WordWorkerPool):
+    def _start_worker(self) -> subprocess.Popen:
+        worker = subprocess.Popen([sys.executable, "-c", HANGING_WORKER], stdin=subprocess.PIPE,
+                                  stdout=subprocess.PIPE, text=True, encoding="utf-8", bufsize=1)
+        self.stats["worker_starts"] += 1
+        return worker
+
+
+def test_hanging_job_is_killed_and_worker_replaced():
+    pool = HangingWorkerPool(size=1, job_timeout=0.5)
+
+    started = time.monotonic()
+    with pytest.raises(WordWorkerTimeout):
+        pool.convert("<html></html>", "Arista Networks", "ANET")
+    assert time.monotonic() - started < 5
+
+    with pytest.raises(WordWorkerTimeout):
+        pool.convert("<html></html>", "Arista Networks", "ANET")
+
+    stats = pool.get_stats()
+    assert stats["timeouts"] == 2
+    assert stats["worker_starts"] == 2
+    assert stats["idle_workers"] == 0